@@ -1,15 +1,17 @@
 import asyncio
-import json
 import time
 import traceback
 import uuid
 from collections.abc import AsyncIterator
+from typing import Any
 
+import orjson
 from fastapi import BackgroundTasks, HTTPException, Response
 from loguru import logger
 from sqlmodel import select
 
 from langflow.api.disconnect import DisconnectHandlerStreamingResponse
+from langflow.api.limited_background_tasks import LimitVertexBuildBackgroundTasks
 from langflow.api.utils import (
     CurrentActiveUser,
     EventDeliveryType,
@@ -32,11 +34,17 @@ from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
+from langflow.serialization import serialize
+from langflow.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
 from langflow.services.database.models.flow import Flow
+from langflow.services.database.models.user.crud import get_user_by_id
 from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
+# Name of the job queue handler running the builds submitted to a shared backend
+BUILD_FLOW_JOB_HANDLER = "build_flow"
+
 
 async def start_flow_build(
     *,
@@ -58,6 +66,25 @@ async def start_flow_build(
         the job_id.
     """
     job_id = str(uuid.uuid4())
+    if queue_service.is_distributed:
+        # The build may run on another worker, so it is submitted as a JSON payload instead of a coroutine
+        payload = {
+            "flow_id": str(flow_id),
+            "inputs": inputs.model_dump(mode="json") if inputs else None,
+            "data": data.model_dump(mode="json") if data else None,
+            "files": files,
+            "stop_component_id": stop_component_id,
+            "start_component_id": start_component_id,
+            "log_builds": log_builds,
+            "user_id": str(current_user.id),
+            "flow_name": flow_name,
+        }
+        try:
+            await queue_service.submit_job(job_id, BUILD_FLOW_JOB_HANDLER, payload, user_id=str(current_user.id))
+        except Exception as e:
+            logger.exception("Failed to submit build job")
+            raise HTTPException(status_code=500, detail=str(e)) from e
+        return job_id
     try:
         _, event_manager = queue_service.create_queue(job_id)
         task_coro = generate_flow_events(
@@ -87,6 +114,10 @@ async def get_flow_events_response(
     event_delivery: EventDeliveryType,
 ):
     """Get events for a specific build job, either as a stream or single event."""
+    if queue_service.is_distributed:
+        return await get_submitted_flow_events_response(
+            job_id=job_id, queue_service=queue_service, event_delivery=event_delivery
+        )
     try:
         main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
@@ -146,6 +177,53 @@ async def get_flow_events_response(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
 
 
+async def get_submitted_flow_events_response(
+    *,
+    job_id: str,
+    queue_service: JobQueueService,
+    event_delivery: EventDeliveryType,
+):
+    """Get events for a build job submitted to a shared backend, which any worker may be running."""
+    try:
+        if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
+            # Fail with 404 before the response starts if the job doesn't exist
+            first_events = await queue_service.read_job_events(job_id)
+
+            async def consume_and_yield() -> AsyncIterator[str]:
+                for _, value in first_events:
+                    if value is None:
+                        return
+                    yield value.decode("utf-8")
+                async for _, value in queue_service.iter_job_events(job_id):
+                    yield value.decode("utf-8")
+
+            def on_disconnect() -> None:
+                logger.debug("Client disconnected, cancelling the build job")
+                asyncio.create_task(queue_service.cancel_submitted_job(job_id))  # noqa: RUF006
+
+            return DisconnectHandlerStreamingResponse(
+                consume_and_yield(),
+                media_type="application/x-ndjson",
+                on_disconnect=on_disconnect,
+            )
+
+        # Polling mode - get all available events, waiting for at least one
+        events = await queue_service.read_job_events(job_id)
+        content = "\n".join(value.decode("utf-8") for _, value in events if value is not None)
+        return Response(content=content, media_type="application/x-ndjson")
+    except JobQueueNotFoundError as exc:
+        logger.error(f"Job not found: {job_id}. Error: {exc!s}")
+        raise HTTPException(status_code=404, detail=f"Job not found: {exc!s}") from exc
+    except asyncio.CancelledError as exc:
+        logger.info(f"Event polling was cancelled for job {job_id}")
+        raise HTTPException(status_code=499, detail="Event polling was cancelled") from exc
+    except Exception as exc:
+        if isinstance(exc, HTTPException):
+            raise
+        logger.exception(f"Unexpected error processing flow events for job {job_id}")
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
+
+
 async def create_flow_response(
     queue: asyncio.Queue,
     event_manager: EventManager,
@@ -331,6 +409,14 @@ async def generate_flow_events(
 
             result_data_response.message = artifacts
 
+            timedelta = time.perf_counter() - start_time
+            duration = format_elapsed_time(timedelta)
+            result_data_response.duration = duration
+            result_data_response.timedelta = timedelta
+            vertex.add_build_time(timedelta)
+            # Serialized once for both the build log and the end_vertex event
+            serialized_data = serialize(result_data_response, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH)
+
             # Log the vertex build
             if not vertex.will_stream and log_builds:
                 background_tasks.add_task(
@@ -339,17 +425,11 @@ async def generate_flow_events(
                     vertex_id=vertex_id,
                     valid=valid,
                     params=params,
-                    data=result_data_response,
+                    data=serialized_data,
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
-
-            timedelta = time.perf_counter() - start_time
-            duration = format_elapsed_time(timedelta)
-            result_data_response.duration = duration
-            result_data_response.timedelta = timedelta
-            vertex.add_build_time(timedelta)
+                await chat_service.set_graph_checkpoint(flow_id_str, graph, vertex_ids=[vertex_id])
             inactivated_vertices = list(graph.inactivated_vertices)
             graph.reset_inactivated_vertices()
             graph.reset_activated_vertices()
@@ -372,6 +452,7 @@ async def generate_flow_events(
                 id=vertex.id,
                 data=result_data_response,
             )
+            build_response.set_serialized_data(serialized_data)
             background_tasks.add_task(
                 telemetry_service.log_package_component,
                 ComponentPayload(
@@ -417,8 +498,8 @@ async def generate_flow_events(
 
         # send built event or error event
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            # Embedded as is in the event instead of being decoded and encoded again
+            build_data = orjson.Fragment(vertex_build_response.model_dump_json())
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
@@ -477,6 +558,36 @@ async def generate_flow_events(
     await event_manager.queue.put((None, None, time.time()))
 
 
+async def run_flow_build_job(payload: dict[str, Any], event_manager: EventManager) -> None:
+    """Run a build submitted to a shared job queue backend, on the worker that claimed it.
+
+    The payload is the one built by `start_flow_build`.
+    """
+    async with session_scope() as session:
+        current_user = await get_user_by_id(session, payload["user_id"])
+    if current_user is None:
+        msg = f"User {payload['user_id']} not found"
+        raise ValueError(msg)
+    background_tasks = LimitVertexBuildBackgroundTasks()
+    try:
+        await generate_flow_events(
+            flow_id=uuid.UUID(payload["flow_id"]),
+            background_tasks=background_tasks,
+            event_manager=event_manager,
+            inputs=InputValueRequest.model_validate(payload["inputs"]) if payload["inputs"] else None,
+            data=FlowDataRequest.model_validate(payload["data"]) if payload["data"] else None,
+            files=payload["files"],
+            stop_component_id=payload["stop_component_id"],
+            start_component_id=payload["start_component_id"],
+            log_builds=payload["log_builds"],
+            current_user=current_user,
+            flow_name=payload["flow_name"],
+        )
+    finally:
+        # There is no response to run them after, so the background tasks run once the build ends
+        await background_tasks()
+
+
 async def cancel_flow_build(
     *,
     job_id: str,
@@ -496,6 +607,11 @@ async def cancel_flow_build(
         ValueError: If the job doesn't exist
         asyncio.CancelledError: If the task cancellation failed
     """
+    if queue_service.is_distributed:
+        if not await queue_service.cancel_submitted_job(job_id):
+            raise JobQueueNotFoundError(job_id)
+        return True
+
     # Get the event task and event manager for the job
     _, _, event_task, _ = queue_service.get_queue_data(job_id)
 
@@ -13,6 +13,7 @@ from langflow.api.v1 import (
     mcp_router,
     monitor_router,
     projects_router,
+    runs_router,
     starter_projects_router,
     store_router,
     users_router,
@@ -47,6 +48,7 @@ router_v1.include_router(files_router)
 router_v1.include_router(monitor_router)
 router_v1.include_router(folders_router)
 router_v1.include_router(projects_router)
+router_v1.include_router(runs_router)
 router_v1.include_router(starter_projects_router)
 router_v1.include_router(voice_mode_router)
 router_v1.include_router(mcp_router)
@@ -9,6 +9,7 @@ from langflow.api.v1.mcp import router as mcp_router
 from langflow.api.v1.mcp_projects import router as mcp_projects_router
 from langflow.api.v1.monitor import router as monitor_router
 from langflow.api.v1.projects import router as projects_router
+from langflow.api.v1.runs import router as runs_router
 from langflow.api.v1.starter_projects import router as starter_projects_router
 from langflow.api.v1.store import router as store_router
 from langflow.api.v1.users import router as users_router
@@ -28,6 +29,7 @@ __all__ = [
     "mcp_router",
     "monitor_router",
     "projects_router",
+    "runs_router",
     "starter_projects_router",
     "store_router",
     "users_router",
@@ -4,7 +4,7 @@ import asyncio
 import time
 from collections.abc import AsyncGenerator
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -28,6 +28,7 @@ from langflow.api.v1.schemas import (
 )
 from langflow.custom.custom_component.component import Component
 from langflow.custom.utils import build_custom_component_template, get_instance_name, update_component_build_config
+from langflow.events.encoder import default_event_encoder
 from langflow.events.event_manager import create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
@@ -44,34 +45,64 @@ from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.flow.model import FlowRead
 from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_queue_service,
+    get_session_service,
+    get_settings_service,
+    get_telemetry_service,
+)
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from langflow.graph.vertex.base import Vertex
     from langflow.services.event_manager import EventManager
     from langflow.services.settings.service import SettingsService
 
 router = APIRouter(tags=["Base"])
 
+OutputStreamFormat = Literal["ndjson", "sse"]
+OUTPUT_STREAM_MEDIA_TYPES: dict[str, str] = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+# Encoded outputs waiting for the client. The flow waits for a slow client instead of buffering more.
+OUTPUT_STREAM_QUEUE_SIZE = 2
+
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
-    """Retrieve all component types with compression for better performance.
+async def get_all(request: Request, category: str | None = None):
+    """Retrieve all component types, or the components of a single category.
 
-    Returns a compressed response containing all available component types.
+    The catalog is serialized and compressed once per version and served with an ETag, so clients
+    sending a matching `If-None-Match` header get an empty 304 response.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.interface.components import get_catalog_payload
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
-
+        payload = await get_catalog_payload(settings_service=get_settings_service(), category=category)
+        if payload is not None:
+            encoding = payload.select_encoding(request.headers.get("accept-encoding"))
+            if payload.matches(request.headers.get("if-none-match")):
+                return payload.to_response(encoding, not_modified=True)
+            if not payload.has_variant(encoding):
+                await asyncio.to_thread(payload.get_variant, encoding)
+            return payload.to_response(encoding)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    raise HTTPException(status_code=404, detail=f"Category {category} not found")
+
+
+@router.get("/all/categories", dependencies=[Depends(get_current_active_user)])
+async def get_all_categories() -> dict[str, int]:
+    """Retrieve the component categories and their number of components.
+
+    Clients can use it to fetch categories lazily with `GET /all?category=<name>`.
+    """
+    from langflow.interface.components import get_and_cache_all_types_dict
+
+    all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
+    return {name: len(components) for name, components in all_types.items()}
 
 
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
@@ -106,6 +137,43 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
             raise InvalidChatInputError(msg)
 
 
+def build_run_graph(
+    flow: Flow, input_request: SimplifiedAPIRequest, *, stream: bool = False, api_key_user: User | None = None
+) -> Graph:
+    """Build the graph of a flow run through the API, with the tweaks of the request applied."""
+    flow_id_str = str(flow.id)
+    if flow.data is None:
+        msg = f"Flow {flow_id_str} has no data"
+        raise ValueError(msg)
+    user_id = api_key_user.id if api_key_user else None
+    graph_data = process_tweaks(flow.data.copy(), input_request.tweaks or {}, stream=stream)
+    return Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+
+
+def get_run_outputs(graph: Graph, input_request: SimplifiedAPIRequest) -> list[str]:
+    """Return the ids or names of the components whose results are returned by a run.
+
+    Raises:
+        ValueError: If some of the requested output components are not in the graph.
+    """
+    if input_request.output_ids:
+        vertex_names = {name for vertex in graph.vertices for name in (vertex.id, vertex.display_name)}
+        if missing := [output_id for output_id in input_request.output_ids if output_id not in vertex_names]:
+            msg = f"Output components not found: {', '.join(missing)}"
+            raise ValueError(msg)
+        return list(input_request.output_ids)
+    if input_request.output_component:
+        return [input_request.output_component]
+    return [
+        vertex.id
+        for vertex in graph.vertices
+        if input_request.output_type == "debug"
+        or (
+            vertex.is_output and (input_request.output_type == "any" or input_request.output_type in vertex.id.lower())  # type: ignore[operator]
+        )
+    ]
+
+
 async def simple_run_flow(
     flow: Flow,
     input_request: SimplifiedAPIRequest,
@@ -113,18 +181,14 @@ async def simple_run_flow(
     stream: bool = False,
     api_key_user: User | None = None,
     event_manager: EventManager | None = None,
+    on_output: Callable[[Vertex], Awaitable[None]] | None = None,
+    graph: Graph | None = None,
 ):
     validate_input_and_tweaks(input_request)
     try:
         task_result: list[RunOutputs] = []
-        user_id = api_key_user.id if api_key_user else None
-        flow_id_str = str(flow.id)
-        if flow.data is None:
-            msg = f"Flow {flow_id_str} has no data"
-            raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        if graph is None:
+            graph = build_run_graph(flow, input_request, stream=stream, api_key_user=api_key_user)
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -134,26 +198,16 @@ async def simple_run_flow(
                     type=input_request.input_type,
                 )
             ]
-        if input_request.output_component:
-            outputs = [input_request.output_component]
-        else:
-            outputs = [
-                vertex.id
-                for vertex in graph.vertices
-                if input_request.output_type == "debug"
-                or (
-                    vertex.is_output
-                    and (input_request.output_type == "any" or input_request.output_type in vertex.id.lower())  # type: ignore[operator]
-                )
-            ]
+        outputs = get_run_outputs(graph, input_request)
         task_result, session_id = await run_graph_internal(
             graph=graph,
-            flow_id=flow_id_str,
+            flow_id=str(flow.id),
             session_id=input_request.session_id,
             inputs=inputs,
             outputs=outputs,
             stream=stream,
             event_manager=event_manager,
+            on_output=on_output,
         )
 
         return RunResponse(outputs=task_result, session_id=session_id)
@@ -267,6 +321,79 @@ async def run_flow_generator(
         await event_manager.queue.put((None, None, time.time))
 
 
+def encode_output_stream_event(output_format: OutputStreamFormat, event_type: str, data: Any) -> bytes:
+    """Encode an event of an output stream as an NDJSON line or a server-sent event."""
+    event = default_event_encoder.encode(event_type, data).rstrip(b"\n")
+    if output_format == "sse":
+        return b"event: " + event_type.encode() + b"\ndata: " + event + b"\n\n"
+    return event + b"\n"
+
+
+async def stream_flow_outputs(
+    flow: Flow,
+    graph: Graph,
+    input_request: SimplifiedAPIRequest,
+    api_key_user: User | None,
+    output_format: OutputStreamFormat,
+) -> AsyncGenerator[bytes, None]:
+    """Runs the graph of a flow and yields the result of each output component as soon as it is built.
+
+    Outputs are sent in order of completion as "output" events, followed by an "end" event with the
+    session id and the ids of the outputs sent, or an "error" event. Each result is released once
+    encoded, and the flow waits while the client is behind, so at most `OUTPUT_STREAM_QUEUE_SIZE`
+    encoded results are held in memory.
+    """
+    telemetry_service = get_telemetry_service()
+    start_time = time.perf_counter()
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=OUTPUT_STREAM_QUEUE_SIZE)
+    output_ids: list[str] = []
+
+    async def send_output(vertex: Vertex) -> None:
+        data = {"id": vertex.id, "display_name": vertex.display_name, "result": vertex.result}
+        # Large results are encoded off the event loop
+        chunk = await asyncio.to_thread(encode_output_stream_event, output_format, "output", data)
+        await queue.put(chunk)
+        output_ids.append(vertex.id)
+
+    async def run() -> None:
+        try:
+            result = await simple_run_flow(
+                flow=flow,
+                input_request=input_request,
+                api_key_user=api_key_user,
+                on_output=send_output,
+                graph=graph,
+            )
+            event = encode_output_stream_event(
+                output_format, "end", {"session_id": result.session_id, "outputs": output_ids}
+            )
+            error_message = ""
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Error running flow: {exc}")
+            event = encode_output_stream_event(output_format, "error", {"error": str(exc)})
+            error_message = str(exc)
+        await telemetry_service.log_package_run(
+            RunPayload(
+                run_is_webhook=False,
+                run_seconds=int(time.perf_counter() - start_time),
+                run_success=not error_message,
+                run_error_message=error_message,
+            )
+        )
+        await queue.put(event)
+        await queue.put(None)
+
+    task = asyncio.create_task(run())
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+    finally:
+        if not task.done():
+            logger.debug("Client disconnected, cancelling the flow run")
+            task.cancel()
+            await asyncio.wait([task])
+
+
 @router.post("/run/{flow_id_or_name}", response_model=None, response_model_exclude_none=True)
 async def simplified_run_flow(
     *,
@@ -274,6 +401,7 @@ async def simplified_run_flow(
     flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
     input_request: SimplifiedAPIRequest | None = None,
     stream: bool = False,
+    output_stream: OutputStreamFormat | None = None,
     api_key_user: Annotated[UserRead, Depends(api_key_security)],
 ):
     """Executes a specified flow by ID with support for streaming and telemetry.
@@ -286,6 +414,8 @@ async def simplified_run_flow(
         flow (FlowRead | None): The flow to execute, loaded via dependency
         input_request (SimplifiedAPIRequest | None): Input parameters for the flow
         stream (bool): Whether to stream the response
+        output_stream (OutputStreamFormat | None): Stream the result of each output component as soon as it
+            is built, as NDJSON ("ndjson") or server-sent events ("sse")
         api_key_user (UserRead): Authenticated user from API key
         request (Request): The incoming HTTP request
 
@@ -306,6 +436,7 @@ async def simplified_run_flow(
             - "add_message": New messages during execution
             - "token": Individual tokens during streaming
             - "end": Final execution result
+        - With output_stream, sends one "output" event per output component, then "end" or "error"
     """
     telemetry_service = get_telemetry_service()
     input_request = input_request if input_request is not None else SimplifiedAPIRequest()
@@ -313,8 +444,38 @@ async def simplified_run_flow(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Flow not found")
     start_time = time.perf_counter()
 
+    if output_stream is not None:
+        if stream:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="stream and output_stream can't be used together"
+            )
+        # Invalid requests are rejected before the response starts, as they are without output_stream
+        try:
+            validate_input_and_tweaks(input_request)
+            graph = build_run_graph(flow, input_request, api_key_user=api_key_user)
+            get_run_outputs(graph, input_request)
+        except InvalidChatInputError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        except ValueError as exc:
+            background_tasks.add_task(
+                telemetry_service.log_package_run,
+                RunPayload(
+                    run_is_webhook=False,
+                    run_seconds=int(time.perf_counter() - start_time),
+                    run_success=False,
+                    run_error_message=str(exc),
+                ),
+            )
+            if "not found" in str(exc):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+            raise APIException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, exception=exc, flow=flow) from exc
+        return StreamingResponse(
+            stream_flow_outputs(flow, graph, input_request, api_key_user, output_stream),
+            media_type=OUTPUT_STREAM_MEDIA_TYPES[output_stream],
+        )
+
     if stream:
-        asyncio_queue: asyncio.Queue = asyncio.Queue()
+        asyncio_queue: asyncio.Queue = get_queue_service().create_event_queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
         event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
         main_task = asyncio.create_task(
@@ -5,21 +5,29 @@ import json
 import re
 import zipfile
 from datetime import datetime, timezone
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 import orjson
 from aiofile import async_open
 from anyio import Path
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import case
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from langflow.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    cascade_delete_flow,
+    infer_is_component,
+    remove_api_keys,
+    validate_is_component,
+)
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
@@ -29,13 +37,19 @@ from langflow.services.database.models.flow.model import AccessTypeEnum, FlowHea
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.services.settings.service import SettingsService
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import compress_response, stream_gzip_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
 
+# Rows fetched from the database at a time when streaming flow headers
+FLOW_HEADERS_BATCH_SIZE = 500
+
 
 async def _verify_fs_path(path: str | None) -> None:
     if path:
@@ -179,6 +193,8 @@ async def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    cursor: UUID | None = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
 ):
     """Retrieve a list of flows with pagination support.
 
@@ -195,6 +211,9 @@ async def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+        cursor (UUID, optional): Only return flow headers with an ID greater than this one.
+            Pass the ID of the last header received to get the next page. Defaults to None.
+        limit (int, optional): The maximum number of flow headers to return. Defaults to None.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
@@ -215,6 +234,7 @@ async def read_flows(
                 detail="Starter project and default project not found. Please create a project and add flows to it.",
             )
 
+        requested_folder_id = folder_id
         if not folder_id:
             folder_id = default_folder_id
 
@@ -232,16 +252,16 @@ async def read_flows(
             stmt = stmt.where(Flow.is_component == True)  # noqa: E712
 
         if get_all:
+            if header_flows:
+                if requested_folder_id:
+                    stmt = stmt.where(Flow.folder_id == requested_folder_id)
+                return _flow_headers_response(stmt, cursor=cursor, limit=limit)
             flows = (await session.exec(stmt)).all()
             flows = validate_is_component(flows)
             if components_only:
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
 
             # Compress the full flows response
             return compress_response(flows)
@@ -253,6 +273,50 @@ async def read_flows(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def _flow_headers_response(stmt, *, cursor: UUID | None, limit: int | None) -> StreamingResponse:
+    """Stream the headers of the flows matched by `stmt` as gzip compressed JSON.
+
+    Only the header columns are selected; the flow data is only loaded for components, which
+    include it in their header. Results are ordered by ID so `cursor` can be used for keyset pagination.
+    """
+    # Flows without an is_component flag need their data to find out whether they are components
+    data = case((col(Flow.is_component).is_not(False), Flow.data), else_=None).label("data")
+    stmt = stmt.with_only_columns(
+        Flow.id,
+        Flow.name,
+        Flow.folder_id,
+        Flow.is_component,
+        Flow.endpoint_name,
+        Flow.description,
+        data,
+        Flow.access_type,
+        Flow.tags,
+        Flow.mcp_enabled,
+        Flow.action_name,
+        Flow.action_description,
+    ).order_by(col(Flow.id))
+    if cursor is not None:
+        stmt = stmt.where(col(Flow.id) > cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    async def flow_headers() -> AsyncIterator[FlowHeader]:
+        # The request session is closed before the response is streamed, so use a dedicated one
+        async with session_scope() as session:
+            result = await session.stream(stmt.execution_options(yield_per=FLOW_HEADERS_BATCH_SIZE))
+            async for row in result:
+                values = row._asdict()
+                if values["is_component"] is None and values["data"]:
+                    values["is_component"] = infer_is_component(values["data"])
+                yield FlowHeader.model_validate(values)
+
+    return StreamingResponse(
+        stream_gzip_json_array(flow_headers()),
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+    )
+
+
 async def _read_flow(
     session: AsyncSession,
     flow_id: UUID,
@@ -8,8 +8,9 @@ from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.api.v1.schemas import CacheStatsResponse
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,6 +19,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_cache_service, get_shared_component_cache_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -174,3 +176,13 @@ async def get_transactions(
         return await paginate(session, stmt, params=params, transformer=transform_transaction_table)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/cache", dependencies=[Depends(get_current_active_superuser)])
+async def get_cache_stats() -> CacheStatsResponse:
+    """Report entries, bytes, hit rate and evictions per namespace of the in-memory caches."""
+    caches = {}
+    for cache_service in (get_cache_service(), get_shared_component_cache_service()):
+        if hasattr(cache_service, "get_stats"):
+            caches[cache_service.name] = cache_service.get_stats()
+    return CacheStatsResponse(caches=caches)
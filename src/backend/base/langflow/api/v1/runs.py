@@ -0,0 +1,188 @@
+"""Asynchronous flow runs: submit a run, poll its status and fetch its result later.
+
+Runs are jobs of the job queue service, so they can be run by any worker sharing its backend. Identical
+runs submitted while one is pending or running share that run instead of running the flow again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+import uuid
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Annotated, Any
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from langflow.api.v1.endpoints import simple_run_flow, validate_input_and_tweaks
+from langflow.api.v1.schemas import AsyncRunResponse, SimplifiedAPIRequest
+from langflow.exceptions.api import InvalidChatInputError
+from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+from langflow.services.auth.utils import api_key_security
+from langflow.services.database.models.flow.model import FlowRead
+from langflow.services.database.models.user.crud import get_user_by_id
+from langflow.services.database.models.user.model import UserRead
+from langflow.services.deps import get_queue_service, get_settings_service, get_telemetry_service, session_scope
+from langflow.services.job_queue.backends import JobRecord, JobStatus
+from langflow.services.telemetry.schema import RunPayload
+
+if TYPE_CHECKING:
+    from langflow.events.event_manager import EventManager
+
+RUN_FLOW_JOB_HANDLER = "run_flow"
+
+router = APIRouter(prefix="/runs", tags=["Runs"])
+
+
+def get_run_dedup_key(flow: FlowRead, user_id: str, input_request: SimplifiedAPIRequest) -> str:
+    """Hash identifying the runs of the same version of a flow, for the same user, with the same inputs and tweaks."""
+    content = {
+        "flow_id": str(flow.id),
+        "flow_updated_at": flow.updated_at.isoformat() if flow.updated_at else None,
+        "user_id": user_id,
+        "request": input_request.model_dump(mode="json"),
+    }
+    return hashlib.sha256(orjson.dumps(content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def to_run_response(job: JobRecord) -> AsyncRunResponse:
+    return AsyncRunResponse(
+        run_id=job.job_id,
+        status=job.status,
+        error=job.error,
+        created_at=datetime.fromtimestamp(job.created_at, tz=timezone.utc),
+        updated_at=datetime.fromtimestamp(job.updated_at, tz=timezone.utc),
+    )
+
+
+async def get_user_run(run_id: str, user: UserRead) -> JobRecord:
+    job = await get_queue_service().get_submitted_job(run_id)
+    # Runs of other users are reported as missing, so their ids can't be probed
+    if job is None or job.handler != RUN_FLOW_JOB_HANDLER or job.user_id != str(user.id):
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=f"Run {run_id} not found")
+    return job
+
+
+async def run_flow_job(payload: dict[str, Any], event_manager: EventManager) -> dict[str, Any]:  # noqa: ARG001
+    """Run a flow submitted with the asynchronous run API, on the worker that claimed it.
+
+    Returns:
+        The JSON encoded `RunResponse`, stored as the result of the run.
+    """
+    async with session_scope() as session:
+        user = await get_user_by_id(session, payload["user_id"])
+    if user is None:
+        msg = f"User {payload['user_id']} not found"
+        raise ValueError(msg)
+    flow = await get_flow_by_id_or_endpoint_name(payload["flow_id"], user.id)
+    start_time = time.perf_counter()
+    error_message = ""
+    try:
+        result = await simple_run_flow(
+            flow=flow,
+            input_request=SimplifiedAPIRequest.model_validate(payload["input_request"]),
+            api_key_user=user,
+        )
+    except Exception as exc:
+        error_message = str(exc)
+        raise
+    finally:
+        await get_telemetry_service().log_package_run(
+            RunPayload(
+                run_is_webhook=False,
+                run_seconds=int(time.perf_counter() - start_time),
+                run_success=not error_message,
+                run_error_message=error_message,
+            )
+        )
+    return jsonable_encoder(result)
+
+
+@router.post("/{flow_id_or_name}", status_code=HTTPStatus.ACCEPTED)
+async def submit_run(
+    *,
+    flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
+    input_request: SimplifiedAPIRequest | None = None,
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+) -> AsyncRunResponse:
+    """Submit a flow run and return its id right away, without waiting for the flow to finish.
+
+    Poll `GET /runs/{run_id}` for its status and fetch its outputs from `GET /runs/{run_id}/result`. If the same
+    version of the flow is already pending or running for this user with the same inputs and tweaks, the id of
+    that run is returned and the flow is not run again.
+    """
+    if flow is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Flow not found")
+    input_request = input_request if input_request is not None else SimplifiedAPIRequest()
+    try:
+        validate_input_and_tweaks(input_request)
+    except InvalidChatInputError as exc:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(exc)) from exc
+
+    user_id = str(api_key_user.id)
+    queue_service = get_queue_service()
+    payload = {"flow_id": str(flow.id), "user_id": user_id, "input_request": input_request.model_dump(mode="json")}
+    run_id = await queue_service.submit_job(
+        str(uuid.uuid4()),
+        RUN_FLOW_JOB_HANDLER,
+        payload,
+        user_id=user_id,
+        dedup_key=get_run_dedup_key(flow, user_id, input_request),
+        ttl=get_settings_service().settings.run_result_ttl,
+    )
+    job = await queue_service.get_submitted_job(run_id)
+    if job is None:
+        # Deleted between the submission and this read, which only happens for a run that just expired
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=f"Run {run_id} not found")
+    return to_run_response(job)
+
+
+@router.get("/{run_id}")
+async def get_run(
+    run_id: str,
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+) -> AsyncRunResponse:
+    """Get the status of a run."""
+    return to_run_response(await get_user_run(run_id, api_key_user))
+
+
+@router.get("/{run_id}/result", response_model=None)
+async def get_run_result(
+    run_id: str,
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+) -> JSONResponse:
+    """Get the outputs of a finished run, in the format returned by `POST /run/{flow_id_or_name}`.
+
+    Responds with 202 and the status of the run while it is pending or running, and with 409 if it failed or was
+    cancelled. Results are kept for `run_result_ttl` seconds after the run ends.
+    """
+    job = await get_user_run(run_id, api_key_user)
+    if not job.status.finished:
+        return JSONResponse(status_code=HTTPStatus.ACCEPTED, content=jsonable_encoder(to_run_response(job)))
+    if job.status != JobStatus.DONE:
+        detail = f"Run {run_id} {job.status.value}" + (f": {job.error}" if job.error else "")
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail=detail)
+    result = await get_queue_service().get_job_result(run_id)
+    if result is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=f"Result of run {run_id} not found")
+    return JSONResponse(content=result)
+
+
+@router.delete("/{run_id}")
+async def cancel_run(
+    run_id: str,
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+) -> AsyncRunResponse:
+    """Cancel a pending or running run. Runs shared by identical submissions are cancelled for every client."""
+    job = await get_user_run(run_id, api_key_user)
+    if not job.status.finished:
+        queue_service = get_queue_service()
+        await queue_service.cancel_submitted_job(run_id)
+        job = await queue_service.get_submitted_job(run_id) or job
+        logger.debug(f"Cancellation of run {run_id} requested")
+    return to_run_response(job)
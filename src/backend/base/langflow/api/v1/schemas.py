@@ -8,6 +8,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     field_serializer,
     field_validator,
     model_serializer,
@@ -24,6 +25,7 @@ from langflow.services.database.models.api_key.model import ApiKeyRead
 from langflow.services.database.models.base import orjson_dumps
 from langflow.services.database.models.flow import FlowCreate, FlowRead
 from langflow.services.database.models.user import UserRead
+from langflow.services.job_queue.backends import JobStatus
 from langflow.services.settings.feature_flags import FeatureFlags
 from langflow.services.tracing.schema import Log
 
@@ -97,6 +99,16 @@ class TaskStatusResponse(BaseModel):
     result: Any | None = None
 
 
+class AsyncRunResponse(BaseModel):
+    """Status of a flow run submitted with the asynchronous run API."""
+
+    run_id: str
+    status: JobStatus
+    error: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
 class ChatMessage(BaseModel):
     """Chat message schema."""
 
@@ -306,9 +318,16 @@ class VertexBuildResponse(BaseModel):
     """Mapping of vertex ids to result dict containing the param name and result value."""
     timestamp: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc))
     """Timestamp of the build."""
+    _serialized_data: Any = PrivateAttr(default=None)
+
+    def set_serialized_data(self, serialized_data: Any) -> None:
+        """Reuse `data` already serialized (e.g. for log_vertex_build) instead of serializing it again."""
+        self._serialized_data = serialized_data
 
     @field_serializer("data")
     def serialize_data(self, data: ResultDataResponse) -> dict:
+        if self._serialized_data is not None:
+            return self._serialized_data
         return serialize(data, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH)
 
 
@@ -359,6 +378,11 @@ class SimplifiedAPIRequest(BaseModel):
         default="",
         description="If there are multiple output components, you can specify the component to get the output from.",
     )
+    output_ids: list[str] | None = Field(
+        default=None,
+        description="The ids or display names of the components to get the outputs from. "
+        "Takes precedence over output_component and output_type.",
+    )
     tweaks: Tweaks | None = Field(default=None, description="The tweaks")
     session_id: str | None = Field(default=None, description="The session id")
 
@@ -397,6 +421,23 @@ class CancelFlowResponse(BaseModel):
     message: str
 
 
+class CacheNamespaceStats(BaseModel):
+    """Memory accounting of one namespace of an in-memory cache."""
+
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+
+
+class CacheStatsResponse(BaseModel):
+    """Memory accounting of the in-memory caches, per cache service and namespace."""
+
+    caches: dict[str, dict[str, CacheNamespaceStats]]
+
+
 class MCPSettings(BaseModel):
     """Model representing MCP settings for a flow."""
 
@@ -1,18 +1,41 @@
+import os
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile, is_zipfile
 
 import pandas as pd
 
+from langflow.base.data.csv_reader import concat_batches, iter_csv_batches
+from langflow.base.data.process_pool import parse_files_in_processes
 from langflow.custom import Component
-from langflow.io import BoolInput, FileInput, HandleInput, Output, StrInput
+from langflow.io import BoolInput, FileInput, FloatInput, HandleInput, IntInput, Output, StrInput
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
 
+# Inputs limiting the parsing of each file in a worker process of the parse pool
+PARSE_LIMIT_INPUTS = [
+    FloatInput(
+        name="parse_timeout",
+        display_name="Parse Timeout",
+        advanced=True,
+        value=300,
+        info="The maximum number of seconds to parse a file in a process. 0 means no limit.",
+    ),
+    IntInput(
+        name="parse_memory_limit",
+        display_name="Parse Memory Limit (MB)",
+        advanced=True,
+        value=0,
+        info="The maximum resident memory of a process parsing a file, checked on Linux. A process exceeding it "
+        "is killed and the file fails to parse. 0 means no limit.",
+    ),
+]
+
 
 class BaseFileComponent(Component, ABC):
     """Base class for handling file processing components.
@@ -173,6 +196,28 @@ class BaseFileComponent(Component, ABC):
         ),
     ]
 
+    # Inputs of components parsing files with `process_files_in_pool`
+    _process_pool_inputs = [
+        BoolInput(
+            name="use_process_pool",
+            display_name="Parse in Processes",
+            advanced=True,
+            value=False,
+            info=(
+                "If true, CPU-bound formats such as PDF and DOCX are parsed in a shared pool of worker processes, "
+                "using all cores, and the other files are read in threads."
+            ),
+        ),
+        IntInput(
+            name="process_pool_size",
+            display_name="Process Pool Size",
+            advanced=True,
+            value=0,
+            info="The number of files parsed at once. 0 parses one file per core.",
+        ),
+        *PARSE_LIMIT_INPUTS,
+    ]
+
     _base_outputs = [
         Output(display_name="Data", name="data", method="load_files"),
         Output(display_name="DataFrame", name="dataframe", method="load_dataframe"),
@@ -190,6 +235,52 @@ class BaseFileComponent(Component, ABC):
             list[BaseFile]: A list of BaseFile objects with updated `data`.
         """
 
+    def process_files_in_pool(
+        self,
+        file_list: list[BaseFile],
+        load_function: Callable[..., Data | None],
+        process_file_types: Iterable[str] | None = None,
+    ) -> list[BaseFile]:
+        """Parses files in the shared parse pool and rolls up their data, in the order of `file_list`.
+
+        Files taking longer than `parse_timeout` or using more than `parse_memory_limit` fail without
+        stopping the others. The parse time of every file is logged.
+
+        Args:
+            file_list (list[BaseFile]): The files to parse.
+            load_function (Callable[..., Data | None]): Parses a file, called with its path and `silent_errors`.
+                It must be picklable, e.g. a module-level function.
+            process_file_types (Iterable[str] | None): The file types parsed in processes, the others being read
+                in threads. None parses all files in processes.
+
+        Returns:
+            list[BaseFile]: A list of BaseFile objects with updated `data`.
+        """
+        file_paths = [str(file.path) for file in file_list]
+        max_workers = self.process_pool_size or os.cpu_count() or 1
+        self.log(f"Starting parsing of {len(file_paths)} files with {max_workers} workers.")
+        memory_limit = (self.parse_memory_limit or 0) * 1024 * 1024
+        results = parse_files_in_processes(
+            file_paths,
+            load_function,
+            max_workers=max_workers,
+            timeout=self.parse_timeout or None,
+            memory_limit=memory_limit or None,
+            silent_errors=self.silent_errors,
+            process_file_types=process_file_types,
+        )
+        for result in results:
+            if result.error is not None:
+                self.log(f"Error parsing {result.path}: {result.error}")
+        self.log(
+            [
+                {"file": Path(result.path).name, "seconds": round(result.seconds, 3), "status": result.status}
+                for result in results
+            ],
+            name="Parse Times",
+        )
+        return self.rollup_data(file_list, [result.data for result in results])
+
     def load_files_base(self) -> list[Data]:
         """Loads and parses file(s), including unpacked file bundles.
 
@@ -248,15 +339,15 @@ class BaseFileComponent(Component, ABC):
         if not data_list:
             return DataFrame()
 
-        # First handle CSV files specially
-        csv_data = []
+        # First handle CSV files specially, reading them in Arrow-backed batches
+        batches: list[pd.DataFrame] = []
         non_csv_rows = []
 
         for data in data_list:
             file_path = data.data.get(self.SERVER_FILE_PATH_FIELDNAME)
             if file_path and str(file_path).lower().endswith(".csv"):
                 try:
-                    csv_data.extend(pd.read_csv(file_path).to_dict("records"))
+                    batches.extend(list(iter_csv_batches(file_path)))
                 except Exception as e:
                     self.log(f"Error processing CSV file {file_path}: {e}")
                     if not self.silent_errors:
@@ -271,8 +362,9 @@ class BaseFileComponent(Component, ABC):
                 non_csv_rows.append(row)
 
         # Combine CSV and non-CSV data
-        all_rows = csv_data + non_csv_rows
-        return DataFrame(all_rows)
+        if non_csv_rows:
+            batches.append(pd.DataFrame(non_csv_rows))
+        return concat_batches(batches)
 
     def load_message(self) -> Message:
         """Load files and return as Message with concatenated content.
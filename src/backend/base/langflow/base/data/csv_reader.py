@@ -0,0 +1,147 @@
+"""Chunked reading of CSV files into Arrow-backed DataFrames.
+
+The rows are parsed in batches straight into columnar buffers, with the column projection and row filter
+applied to every batch as it is read, so reading a large file never builds a Python object per row and only
+the rows kept are held in memory.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from functools import reduce
+from typing import IO, TYPE_CHECKING, Any
+
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype, is_object_dtype
+
+from langflow.schema.dataframe import DataFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def get_dtype_backend() -> str:
+    """Returns the pandas dtype backend for CSV files: Arrow when pyarrow is installed, else nullable NumPy."""
+    return "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "numpy_nullable"
+
+
+def iter_csv_batches(
+    source: str | Path | IO[str],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    columns: list[str] | None = None,
+    dtypes: dict[str, str] | None = None,
+    row_filter: str | None = None,
+    separator: str = ",",
+    encoding: str = "utf-8",
+) -> Iterator[DataFrame]:
+    """Reads a CSV file in batches of DataFrames, keeping the index of the rows in the file.
+
+    The types of the columns not in `dtypes` are inferred from the first batch with values in them. A later
+    batch whose values don't fit the type of a column widens it, from integer to float to string, and the
+    batches after it are converted to the wider type. `concat_batches` converts all the batches to the widest
+    types, the way reading the whole file at once would type the columns.
+
+    Args:
+        source: The path of the file, or a file-like object.
+        batch_size: The number of rows parsed at once.
+        columns: The columns to read. None reads them all.
+        dtypes: The pandas types of columns, e.g. "int64[pyarrow]" or "string".
+        row_filter: A pandas query the rows must match, e.g. "age > 30 and country == 'FR'".
+        separator: The separator of the fields.
+        encoding: The encoding of the file.
+    """
+    schema: dict[str, Any] = {}
+    dtype_backend = get_dtype_backend()
+    with pd.read_csv(
+        source,
+        sep=separator,
+        encoding=encoding,
+        usecols=columns or None,
+        dtype=dtypes or None,
+        dtype_backend=dtype_backend,  # type: ignore[arg-type]
+        chunksize=max(batch_size, 1),
+    ) as reader:
+        for batch in reader:
+            _conform_batch(batch, schema, dtype_backend)
+            filtered = batch.query(row_filter) if row_filter else batch
+            if not filtered.empty:
+                yield DataFrame(filtered)
+
+
+def concat_batches(batches: Iterable[pd.DataFrame]) -> DataFrame:
+    """Concatenates batches of rows into a DataFrame, widening the types of the columns they disagree on.
+
+    The batches may have different columns, e.g. the rows of different files, and the values missing from a
+    batch are left empty. A column typed differently by different batches, e.g. an integer column of a file
+    and a float column of another, is converted to the common type of its values. Columns of Python objects
+    are left as they are.
+    """
+    batches = list(batches)
+    if not batches:
+        return DataFrame()
+    column_dtypes: dict[str, list[Any]] = {}
+    for batch in batches:
+        for column in batch.columns:
+            # A column without values in a batch has no meaningful type there
+            if batch[column].notna().any():
+                column_dtypes.setdefault(column, []).append(batch[column].dtype)
+    dtype_backend = get_dtype_backend()
+    common_dtypes: dict[str, Any] = {}
+    for column, dtypes in column_dtypes.items():
+        if len(set(dtypes)) == 1 or any(is_object_dtype(dtype) for dtype in dtypes):
+            continue
+        common_dtypes[column] = reduce(lambda left, right: _get_common_dtype(left, right, dtype_backend), dtypes)
+    return DataFrame(
+        pd.concat(
+            [
+                batch.astype({column: dtype for column, dtype in common_dtypes.items() if column in batch.columns})
+                for batch in batches
+            ],
+            ignore_index=True,
+        )
+    )
+
+
+def _get_type_kind(dtype: Any) -> str:
+    if is_bool_dtype(dtype):
+        return "boolean"
+    if is_integer_dtype(dtype):
+        return "integer"
+    if is_float_dtype(dtype):
+        return "float"
+    return "string"
+
+
+def _get_common_dtype(expected: Any, actual: Any, dtype_backend: str) -> Any:
+    """Returns the type of a column holding values of both types, widening integers to floats to strings."""
+    kinds = {_get_type_kind(expected), _get_type_kind(actual)}
+    if len(kinds) == 1 and kinds != {"string"}:
+        return expected
+    if kinds == {"integer", "float"}:
+        return pd.api.types.pandas_dtype("double[pyarrow]" if dtype_backend == "pyarrow" else "Float64")
+    return pd.api.types.pandas_dtype("string[pyarrow]" if dtype_backend == "pyarrow" else "string")
+
+
+def _conform_batch(batch: pd.DataFrame, schema: dict[str, Any], dtype_backend: str) -> None:
+    """Converts the columns of a batch to the types in `schema`, widening them when the batch doesn't fit.
+
+    The types of new columns are recorded.
+    """
+    for column in batch.columns:
+        expected = schema.get(column)
+        values = batch[column]
+        if expected is None:
+            # A column without values yet has no meaningful type
+            if values.notna().any():
+                schema[column] = values.dtype
+            continue
+        if values.dtype == expected:
+            continue
+        # Missing values fit any type
+        if values.notna().any():
+            schema[column] = _get_common_dtype(expected, values.dtype, dtype_backend)
+        batch[column] = values.astype(schema[column])
@@ -0,0 +1,190 @@
+"""Manifest of the files loaded by directory scans, for incremental loading.
+
+The manifest records the size, modification time, content hash and loaded data of every file a scan loaded.
+On the next run, files whose size and modification time are unchanged are not read, and files whose content
+hash is unchanged are not parsed: their data is read back from the manifest instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS loaded_file (
+    scan TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (scan, path)
+) WITHOUT ROWID;
+"""
+# SQLite limits the number of parameters of a query
+_QUERY_BATCH_SIZE = 500
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _batched(values: Iterable[str], size: int) -> Iterator[tuple[str, ...]]:
+    iterator = iter(values)
+    while batch := tuple(islice(iterator, size)):
+        yield batch
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class FileState:
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+    @classmethod
+    def read(cls, path: str, content_hash: str | None = None) -> FileState:
+        """Returns the current state of a file, hashing it unless its hash is given."""
+        stat = Path(path).stat()
+        return cls(path, stat.st_size, stat.st_mtime_ns, content_hash or hash_file(path))
+
+
+@dataclass
+class ScanChanges:
+    """The files of a scan to load, and the data stored for the others.
+
+    Attributes:
+        changed: The new or modified files, in the state they are loaded in.
+        unchanged: The data stored for the files that didn't change, by path.
+    """
+
+    changed: list[FileState] = field(default_factory=list)
+    unchanged: dict[str, Any] = field(default_factory=dict)
+
+
+class DirectoryManifest:
+    """The files loaded by directory scans, stored in an SQLite database.
+
+    Args:
+        path: The path of the database.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def get_changes(self, scan: str, file_paths: list[str]) -> ScanChanges:
+        """Returns the files of `file_paths` that are new or modified since the scan last loaded them.
+
+        Each file is hashed at most once, and only if it is new or its size or modification time changed.
+        Files no longer among `file_paths` are forgotten, so they are loaded again if they come back. Files
+        that were touched without being modified are recorded with their new modification time.
+        """
+        with self._lock:
+            connection = self._connect()
+            stored: dict[str, tuple[int, int, str, bytes]] = {}
+            for batch in _batched(file_paths, _QUERY_BATCH_SIZE):
+                placeholders = ", ".join("?" * len(batch))
+                query = (
+                    "SELECT path, size, mtime_ns, content_hash, data FROM loaded_file "  # noqa: S608
+                    f"WHERE scan = ? AND path IN ({placeholders})"
+                )
+                stored.update((row[0], row[1:]) for row in connection.execute(query, (scan, *batch)))
+            missing = [
+                row[0]
+                for row in connection.execute("SELECT path FROM loaded_file WHERE scan = ?", (scan,))
+                if row[0] not in stored
+            ]
+
+        changes = ScanChanges()
+        touched: list[FileState] = []
+        for file_path in file_paths:
+            previous = stored.get(file_path)
+            if previous is None:
+                changes.changed.append(FileState.read(file_path))
+                continue
+            size, mtime_ns, content_hash, data = previous
+            stat = Path(file_path).stat()
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                state = FileState(file_path, stat.st_size, stat.st_mtime_ns, hash_file(file_path))
+                if state.content_hash != content_hash:
+                    changes.changed.append(state)
+                    continue
+                touched.append(state)
+            changes.unchanged[file_path] = orjson.loads(data)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "DELETE FROM loaded_file WHERE scan = ? AND path = ?", [(scan, path) for path in missing]
+                )
+                connection.executemany(
+                    "UPDATE loaded_file SET size = ?, mtime_ns = ? WHERE scan = ? AND path = ?",
+                    [(state.size, state.mtime_ns, scan, state.path) for state in touched],
+                )
+        return changes
+
+    def record(self, scan: str, loaded: Mapping[FileState, Any]) -> None:
+        """Records that the scan loaded files, in the given state, with the JSON data loaded from them."""
+        rows = [
+            (scan, state.path, state.size, state.mtime_ns, state.content_hash, orjson.dumps(data, default=str))
+            for state, data in loaded.items()
+        ]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO loaded_file (scan, path, size, mtime_ns, content_hash, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def reset(self, scan: str) -> None:
+        """Forgets the files of a scan, so they are all loaded on its next run."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM loaded_file WHERE scan = ?", (scan,))
+
+    def count(self, scan: str) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM loaded_file WHERE scan = ?", (scan,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+
+@cache
+def get_directory_manifest(path: str) -> DirectoryManifest:
+    """Returns the directory manifest of the process for a database path."""
+    return DirectoryManifest(path)
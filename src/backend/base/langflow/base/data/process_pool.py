@@ -0,0 +1,301 @@
+"""Parsing of files in a shared pool of worker processes, with per-file timeouts and memory limits.
+
+Each worker process parses one file at a time and is reused for the next files, so parsing doesn't pay for
+spawning processes and importing the parsers on every call. A worker exceeding the timeout or the memory limit
+is killed and replaced, so a single pathological document does not hold the pool or take the server down.
+Files of the types that are not CPU-bound are read in the threads of the pool instead.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent import futures
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import SpawnContext, SpawnProcess
+
+    from langflow.schema import Data
+
+# The number of seconds to wait for a worker to exit before killing it
+_JOIN_TIMEOUT = 5
+# The number of seconds between two checks of the memory of a worker, when it is limited
+_MEMORY_CHECK_INTERVAL = 0.5
+
+
+@dataclass
+class ParseResult:
+    """The result of parsing a file."""
+
+    path: str
+    data: Data | None = None
+    """The data of the file, or None if it could not be parsed."""
+    seconds: float = 0.0
+    """The time spent parsing the file, in seconds."""
+    error: BaseException | None = None
+    """Why the file could not be parsed."""
+
+    @property
+    def status(self) -> str:
+        if self.error is None:
+            return "ok"
+        return "timeout" if isinstance(self.error, TimeoutError) else "error"
+
+
+def _get_rss(pid: int) -> int | None:
+    """Returns the resident memory of a process in bytes, on systems with a /proc filesystem."""
+    try:
+        resident_pages = int(Path(f"/proc/{pid}/statm").read_text(encoding="utf-8").split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _parse(load_function: Callable[..., Data | None], path: str) -> tuple[Data | None, BaseException | None]:
+    try:
+        return load_function(path, silent_errors=False), None
+    except Exception as e:  # noqa: BLE001
+        return None, e
+
+
+def _work(connection: Connection) -> None:
+    """Parses the files whose path is sent through `connection` until it receives None.
+
+    The load function is sent on its own before the paths, and acknowledged once unpickled, so importing its
+    module doesn't count in the timeout of the first file.
+    """
+    load_function: Callable[..., Data | None] | None = None
+    while (task := connection.recv()) is not None:
+        if not isinstance(task, str):
+            load_function = task
+            connection.send(None)
+            continue
+        start = time.perf_counter()
+        data, error = _parse(load_function, task)  # type: ignore[arg-type]
+        try:
+            connection.send((data, time.perf_counter() - start, error))
+        except Exception:  # noqa: BLE001
+            # The exception can't be pickled
+            connection.send((None, time.perf_counter() - start, RuntimeError(repr(error))))
+        if isinstance(error, MemoryError):
+            # The process may be unusable once it ran out of memory
+            return
+
+
+class _Worker:
+    def __init__(self, context: SpawnContext) -> None:
+        self.connection, child_connection = context.Pipe()
+        self.process: SpawnProcess = context.Process(target=_work, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.load_function: Callable[..., Data | None] | None = None
+
+    def parse(
+        self,
+        load_function: Callable[..., Data | None],
+        path: str,
+        *,
+        timeout: float | None,
+        memory_limit: int | None,
+    ) -> ParseResult:
+        """Parses a file in the process, killing it if it exceeds the timeout or the memory limit."""
+        try:
+            if load_function is not self.load_function:
+                self.connection.send(load_function)
+                self.connection.recv()
+                self.load_function = load_function
+            start = time.monotonic()
+            self.connection.send(path)
+        except (EOFError, OSError) as e:
+            self.kill()
+            return ParseResult(path, error=RuntimeError(f"The process parsing {path} exited: {e!r}"))
+        deadline = start + timeout if timeout else None
+        while True:
+            poll_timeout = _MEMORY_CHECK_INTERVAL if memory_limit else None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+                poll_timeout = remaining if poll_timeout is None else min(poll_timeout, remaining)
+            if self.connection.poll(poll_timeout):
+                try:
+                    data, seconds, error = self.connection.recv()
+                except (EOFError, OSError):
+                    # The process died, e.g. killed by the system for using too much memory
+                    self.kill()
+                    error = MemoryError(f"The process parsing {path} exited unexpectedly")
+                    return ParseResult(path, seconds=time.monotonic() - start, error=error)
+                if isinstance(error, MemoryError):
+                    self.kill()
+                return ParseResult(path, data, seconds, error)
+            if deadline is not None and time.monotonic() >= deadline:
+                self.kill()
+                error = TimeoutError(f"Parsing {path} timed out after {timeout} seconds")
+                return ParseResult(path, seconds=time.monotonic() - start, error=error)
+            if memory_limit and (_get_rss(self.process.pid) or 0) > memory_limit:
+                self.kill()
+                error = MemoryError(f"Parsing {path} used more than {memory_limit // (1024 * 1024)} MB of memory")
+                return ParseResult(path, seconds=time.monotonic() - start, error=error)
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.is_alive() and not self.connection.closed
+
+    def stop(self) -> None:
+        with suppress(BrokenPipeError, OSError):
+            self.connection.send(None)
+        self.process.join(_JOIN_TIMEOUT)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class ParsePool:
+    """A pool parsing files in threads, which hand CPU-bound files to reusable worker processes.
+
+    Each thread parses one file at a time, so at most `max_workers` worker processes are running. Workers are
+    spawned when first needed and kept once idle, for the next files.
+
+    Args:
+        max_workers: The maximum number of files parsed at once.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max(max_workers, 1)
+        self._threads = futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="parse")
+        self._context = multiprocessing.get_context("spawn")
+        self._idle_workers: list[_Worker] = []
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        load_function: Callable[..., Data | None],
+        path: str,
+        *,
+        in_process: bool = True,
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+    ) -> futures.Future[ParseResult]:
+        """Parses a file, in a worker process if `in_process` is set, or else in a thread of the pool.
+
+        `load_function` is called with the path and `silent_errors=False`, and its errors are set on the result.
+        It must be picklable to parse files in processes, e.g. a module-level function. The timeout and the
+        memory limit, in bytes, only apply to files parsed in processes, and the memory limit only on systems
+        with a /proc filesystem. None means unlimited.
+        """
+        if not in_process:
+            return self._threads.submit(self._parse_in_thread, load_function, path)
+        return self._threads.submit(
+            self._parse_in_process, load_function, path, timeout=timeout, memory_limit=memory_limit
+        )
+
+    def shutdown(self) -> None:
+        """Waits for the files being parsed, then stops the worker processes."""
+        self._threads.shutdown(wait=True)
+        with self._lock:
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            worker.stop()
+
+    @staticmethod
+    def _parse_in_thread(load_function: Callable[..., Data | None], path: str) -> ParseResult:
+        start = time.perf_counter()
+        data, error = _parse(load_function, path)
+        return ParseResult(path, data, time.perf_counter() - start, error)
+
+    def _parse_in_process(
+        self,
+        load_function: Callable[..., Data | None],
+        path: str,
+        *,
+        timeout: float | None,
+        memory_limit: int | None,
+    ) -> ParseResult:
+        with self._lock:
+            worker = self._idle_workers.pop() if self._idle_workers else None
+        if worker is None or not worker.is_alive:
+            if worker is not None:
+                worker.kill()
+            worker = _Worker(self._context)
+        result = worker.parse(load_function, path, timeout=timeout, memory_limit=memory_limit)
+        if worker.is_alive:
+            with self._lock:
+                self._idle_workers.append(worker)
+        return result
+
+
+@cache
+def get_parse_pool(max_workers: int) -> ParsePool:
+    """Returns the parse pool of the process with `max_workers` workers, so its workers are reused."""
+    return ParsePool(max_workers)
+
+
+def parse_files_in_processes(
+    paths: list[str],
+    load_function: Callable[..., Data | None],
+    *,
+    max_workers: int,
+    timeout: float | None = None,
+    memory_limit: int | None = None,
+    silent_errors: bool = False,
+    process_file_types: Iterable[str] | None = None,
+) -> list[ParseResult]:
+    """Parses files in the shared parse pool, returning their results in the order of `paths`.
+
+    Args:
+        paths: The paths of the files.
+        load_function: Parses a file, called with its path and `silent_errors=False`. It must be picklable,
+            e.g. a module-level function.
+        max_workers: The maximum number of files parsed at once.
+        timeout: The maximum number of seconds to parse a file in a process. None means unlimited.
+        memory_limit: The maximum resident memory of a process in bytes, on systems with a /proc filesystem.
+            None means unlimited.
+        silent_errors: If true, files failing to parse have a result with an error instead of raising it.
+        process_file_types: The file types parsed in processes, the others being read in threads. None means
+            all files are parsed in processes.
+
+    Raises:
+        The error of the first file failing to parse, unless `silent_errors` is set.
+    """
+    pool = get_parse_pool(max(max_workers, 1))
+    suffixes = (
+        None if process_file_types is None else tuple(f".{file_type.lower()}" for file_type in process_file_types)
+    )
+    pending = [
+        pool.submit(
+            load_function,
+            path,
+            in_process=suffixes is None or path.lower().endswith(suffixes),
+            timeout=timeout,
+            memory_limit=memory_limit,
+        )
+        for path in paths
+    ]
+    results: list[ParseResult] = []
+    try:
+        for future in pending:
+            result = future.result()
+            get_parsed_data(result, silent_errors=silent_errors)
+            results.append(result)
+    finally:
+        for future in pending:
+            future.cancel()
+    return results
+
+
+def get_parsed_data(result: ParseResult, *, silent_errors: bool) -> Data | None:
+    """Returns the data of a parse result, raising its error unless `silent_errors` is set."""
+    if result.error is not None and not silent_errors:
+        raise result.error
+    return result.data
@@ -1,5 +1,6 @@
 import unicodedata
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from concurrent import futures
 from pathlib import Path
 
@@ -8,6 +9,7 @@ import orjson
 import yaml
 from defusedxml import ElementTree
 
+from langflow.base.data.process_pool import ParseResult, get_parse_pool, get_parsed_data
 from langflow.schema import Data
 
 # Types of files that can be read simply by file.read()
@@ -35,6 +37,9 @@ TEXT_FILE_TYPES = [
 
 IMG_FILE_TYPES = ["jpg", "jpeg", "png", "bmp", "image"]
 
+# Types of files whose parsing is CPU-bound, so they are parsed in processes rather than threads
+PROCESS_FILE_TYPES = ["pdf", "docx"]
+
 
 def normalize_text(text):
     return unicodedata.normalize("NFKD", text)
@@ -197,3 +202,45 @@ def parallel_load_data(
         )
     # loaded_files is an iterator, so we need to convert it to a list
     return list(loaded_files)
+
+
+def iter_load_data(
+    file_paths: Iterable[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable = parse_text_file_to_data,
+    process_file_types: Iterable[str] = (),
+    timeout: float | None = None,
+    memory_limit: int | None = None,
+) -> Iterator[Data | None]:
+    """Loads files concurrently in the shared parse pool, yielding their data in the order of `file_paths`.
+
+    Files of `process_file_types` are parsed in the worker processes of the pool, so CPU-bound parsers use all
+    cores, with at most `timeout` seconds and `memory_limit` bytes of resident memory per file. The others are
+    read in the threads of the pool. `load_function` must be picklable to parse files in processes. At most
+    twice `max_concurrency` files are loaded ahead of the one being yielded, so the data of the files is not
+    all held in memory at once.
+    """
+    max_concurrency = max(max_concurrency, 1)
+    pool = get_parse_pool(max_concurrency)
+    suffixes = tuple(f".{file_type.lower()}" for file_type in process_file_types)
+    pending: deque[futures.Future[ParseResult]] = deque()
+    try:
+        for file_path in file_paths:
+            pending.append(
+                pool.submit(
+                    load_function,
+                    file_path,
+                    in_process=bool(suffixes) and file_path.lower().endswith(suffixes),
+                    timeout=timeout,
+                    memory_limit=memory_limit,
+                )
+            )
+            if len(pending) >= 2 * max_concurrency:
+                yield get_parsed_data(pending.popleft().result(), silent_errors=silent_errors)
+        while pending:
+            yield get_parsed_data(pending.popleft().result(), silent_errors=silent_errors)
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,458 @@
+"""On-disk cache of the vectors computed by embedding models, keyed by model and text.
+
+Vectors are stored per embedding model as float32 rows of a file read through a memory map, with an SQLite
+index from the hash of each text to its row. The most recently used vectors are also kept in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import re
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from functools import cache, wraps
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import orjson
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+from pydantic import BaseModel
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+# Attributes of embeddings objects naming the model computing the vectors. Embeddings without any of them,
+# e.g. fake embeddings, are not cached.
+MODEL_ATTRIBUTES = ("model", "model_name", "model_id", "repo_id", "deployment")
+# Settings holding credentials, which are not part of the identity written to the cache
+_CREDENTIAL_ATTRIBUTE = re.compile(r"(key|token|secret|password|credentials?|headers|auth)$", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS vector (key TEXT PRIMARY KEY, row INTEGER NOT NULL) WITHOUT ROWID;
+"""
+# SQLite limits the number of parameters of a query
+_QUERY_BATCH_SIZE = 500
+_FLOAT32_BYTES = 4
+
+
+def get_embeddings_identity(embeddings: Embeddings, user_id: str | None = None) -> dict[str, Any] | None:
+    """Returns what identifies the vectors computed by `embeddings`, or None if the model can't be told apart.
+
+    The identity holds every setting of the embeddings that can be written as JSON, e.g. the model, its
+    dimensions or `encode_kwargs`, except credentials, so changing any of them doesn't return stale vectors.
+    Vectors are cached apart for each user.
+    """
+    names = type(embeddings).model_fields if isinstance(embeddings, BaseModel) else vars(embeddings)
+    identity: dict[str, Any] = {}
+    for name in names:
+        if name.startswith("_") or _CREDENTIAL_ATTRIBUTE.search(name):
+            continue
+        value = getattr(embeddings, name, None)
+        if value is not None and _is_json_value(value):
+            identity[name] = copy.deepcopy(value)
+    if not any(isinstance(identity.get(attribute), str) for attribute in MODEL_ATTRIBUTES):
+        return None
+    identity["provider"] = f"{type(embeddings).__module__}.{type(embeddings).__qualname__}"
+    identity["user_id"] = str(user_id) if user_id else None
+    return identity
+
+
+def _is_json_value(value: Any) -> bool:
+    if value is None or isinstance(value, str | int | float | bool):
+        return True
+    if isinstance(value, list | tuple):
+        return all(_is_json_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_value(item) for key, item in value.items())
+    return False
+
+
+def _batched(keys: Iterable[str], size: int) -> Iterator[tuple[str, ...]]:
+    iterator = iter(keys)
+    while batch := tuple(islice(iterator, size)):
+        yield batch
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class EmbeddingStore:
+    """The vectors of one embedding model, stored on disk.
+
+    Rows are only appended, in a write transaction of the index, so several processes can share a store.
+    Once the vectors reach `max_bytes`, new vectors are no longer stored.
+
+    Args:
+        directory: The directory of the store.
+        identity: What identifies the vectors of the store, written to the index for inspection.
+        max_bytes: The maximum size of the vectors. None means unlimited.
+    """
+
+    def __init__(self, directory: Path, identity: dict[str, Any], max_bytes: int | None = None) -> None:
+        self.directory = directory
+        self.identity = identity
+        self.max_bytes = max_bytes
+        self.vectors_path = directory / "vectors.f32"
+        self._connection: sqlite3.Connection | None = None
+        self._vectors: np.memmap | None = None
+        self._lock = threading.Lock()
+        self._full = False
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Returns the stored vectors of the given text hashes."""
+        with self._lock:
+            connection = self._connect()
+            rows: dict[str, int] = {}
+            for batch in _batched(keys, _QUERY_BATCH_SIZE):
+                placeholders = ", ".join("?" * len(batch))
+                query = f"SELECT key, row FROM vector WHERE key IN ({placeholders})"  # noqa: S608
+                rows.update(connection.execute(query, batch).fetchall())
+            if not rows:
+                return {}
+            vectors = self._get_vectors(connection, max(rows.values()))
+            # Copies, so the vectors don't keep the memory map alive
+            return {key: np.array(vectors[row]) for key, row in rows.items()}
+
+    def put_many(self, vectors: dict[str, np.ndarray]) -> int:
+        """Stores vectors under their text hash, skipping the ones already stored.
+
+        Returns:
+            The number of bytes written.
+        """
+        if not vectors:
+            return 0
+        with self._lock:
+            connection = self._connect()
+            # Taking the write lock up front serializes the writers of all processes
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                written = self._append(connection, vectors)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return written
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._vectors = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Transactions are handled explicitly, hence isolation_level=None
+            connection = sqlite3.connect(
+                self.directory / "index.db", timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('identity', ?)",
+                (orjson.dumps(self.identity, option=orjson.OPT_SORT_KEYS).decode(),),
+            )
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _get_meta(connection: sqlite3.Connection, key: str) -> int | None:
+        row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return int(row[0]) if row else None
+
+    def _get_vectors(self, connection: sqlite3.Connection, row: int) -> np.memmap:
+        # The memory map covers the rows stored when it was created, so it is recreated when the store grew
+        if self._vectors is None or self._vectors.shape[0] <= row:
+            dimensions = self._get_meta(connection, "dimensions")
+            rows = self._get_meta(connection, "rows")
+            if dimensions is None or rows is None or rows <= row:
+                msg = f"Embedding store {self.directory} is inconsistent"
+                raise sqlite3.DatabaseError(msg)
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, dimensions))
+        return self._vectors
+
+    def _append(self, connection: sqlite3.Connection, vectors: dict[str, np.ndarray]) -> int:
+        dimensions = self._get_meta(connection, "dimensions")
+        if dimensions is None:
+            dimensions = len(next(iter(vectors.values())))
+            connection.execute("INSERT INTO meta (key, value) VALUES ('dimensions', ?)", (str(dimensions),))
+        existing: set[str] = set()
+        for batch in _batched(vectors, _QUERY_BATCH_SIZE):
+            placeholders = ", ".join("?" * len(batch))
+            query = f"SELECT key FROM vector WHERE key IN ({placeholders})"  # noqa: S608
+            existing.update(row[0] for row in connection.execute(query, batch))
+        new = {key: vector for key, vector in vectors.items() if key not in existing and len(vector) == dimensions}
+        if not new:
+            return 0
+        rows = self._get_meta(connection, "rows") or 0
+        if self.max_bytes is not None and (rows + len(new)) * dimensions * _FLOAT32_BYTES > self.max_bytes:
+            if not self._full:
+                logger.info(f"Embedding store {self.directory} is full, new vectors of its model are not cached")
+                self._full = True
+            return 0
+        data = np.asarray(list(new.values()), dtype=np.float32)
+        # Rows written by a transaction that was rolled back are overwritten
+        with self.vectors_path.open("r+b" if self.vectors_path.exists() else "w+b") as file:
+            file.seek(rows * dimensions * _FLOAT32_BYTES)
+            file.write(data.tobytes())
+        connection.executemany(
+            "INSERT INTO vector (key, row) VALUES (?, ?)", [(key, rows + index) for index, key in enumerate(new)]
+        )
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('rows', ?)", (str(rows + len(new)),))
+        return data.nbytes
+
+
+class EmbeddingCache:
+    """Embedding vectors stored on disk per embedding model, with the most recently used ones in memory.
+
+    Errors reading or writing the disk are logged and treated as cache misses, so the cache never makes
+    embedding fail.
+
+    Args:
+        directory: The directory holding a store per embedding model.
+        hot_size: The number of vectors kept in memory.
+        max_bytes: The maximum size of the vectors of each store. None means unlimited.
+    """
+
+    def __init__(self, directory: str | Path, hot_size: int = 10_000, max_bytes: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.hot_size = hot_size
+        self.max_bytes = max_bytes
+        self._stores: dict[str, EmbeddingStore] = {}
+        self._hot: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Counter[str] = Counter()
+
+    def __reduce__(self):
+        # Cached graphs holding cached embeddings are pickled, the cache of the process is used when loading them
+        return get_embedding_cache, (str(self.directory), self.hot_size, self.max_bytes)
+
+    @staticmethod
+    def get_namespace(identity: dict[str, Any]) -> str:
+        return hashlib.sha256(orjson.dumps(identity, option=orjson.OPT_SORT_KEYS)).hexdigest()[:32]
+
+    def get_many(self, identity: dict[str, Any], keys: list[str]) -> dict[str, np.ndarray]:
+        """Returns the cached vectors of the given text hashes, computed by the model of `identity`."""
+        namespace = self.get_namespace(identity)
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._hot.get((namespace, key))
+                if vector is not None:
+                    self._hot.move_to_end((namespace, key))
+                    found[key] = vector
+        hot_hits = len(found)
+        missing = [key for key in keys if key not in found]
+        from_disk: dict[str, np.ndarray] = {}
+        if missing:
+            try:
+                from_disk = self._get_store(namespace, identity).get_many(missing)
+            except (OSError, sqlite3.Error, ValueError) as exc:
+                logger.warning(f"Error reading the embedding cache: {exc}")
+            self._remember(namespace, from_disk)
+            found.update(from_disk)
+        self._record(
+            identity,
+            hot=hot_hits,
+            disk=len(from_disk),
+            miss=len(keys) - len(found),
+            bytes_read=sum(vector.nbytes for vector in from_disk.values()),
+        )
+        return found
+
+    def put_many(self, identity: dict[str, Any], vectors: dict[str, list[float]]) -> None:
+        """Caches vectors computed by the model of `identity` under the hash of their text."""
+        if not vectors:
+            return
+        namespace = self.get_namespace(identity)
+        arrays = {key: np.asarray(vector, dtype=np.float32) for key, vector in vectors.items()}
+        self._remember(namespace, arrays)
+        try:
+            written = self._get_store(namespace, identity).put_many(arrays)
+        except (OSError, sqlite3.Error, ValueError) as exc:
+            logger.warning(f"Error writing the embedding cache: {exc}")
+            return
+        self._record(identity, bytes_written=written)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            stats: dict[str, float] = dict.fromkeys(("hot", "disk", "miss", "bytes_read", "bytes_written"), 0)
+            stats.update(self._stats)
+        lookups = stats["hot"] + stats["disk"] + stats["miss"]
+        stats["hit_rate"] = (stats["hot"] + stats["disk"]) / lookups if lookups else 0.0
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            stores = list(self._stores.values())
+            self._stores.clear()
+            self._hot.clear()
+        for store in stores:
+            store.close()
+
+    def _get_store(self, namespace: str, identity: dict[str, Any]) -> EmbeddingStore:
+        with self._lock:
+            store = self._stores.get(namespace)
+            if store is None:
+                store = EmbeddingStore(self.directory / namespace, identity, self.max_bytes)
+                self._stores[namespace] = store
+            return store
+
+    def _remember(self, namespace: str, vectors: dict[str, np.ndarray]) -> None:
+        if self.hot_size <= 0:
+            return
+        with self._lock:
+            for key, vector in vectors.items():
+                self._hot[namespace, key] = vector
+                self._hot.move_to_end((namespace, key))
+            while len(self._hot) > self.hot_size:
+                self._hot.popitem(last=False)
+
+    def _record(self, identity: dict[str, Any], **values: int) -> None:
+        with self._lock:
+            self._stats.update(values)
+        try:
+            from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+            ot = OpenTelemetry()
+            provider = identity["provider"].rsplit(".", 1)[-1]
+            for result in ("hot", "disk", "miss"):
+                if values.get(result):
+                    labels = {"provider": provider, "result": result}
+                    ot.increment_counter("embedding_cache_lookups", labels, values[result])
+            for operation, key in (("read", "bytes_read"), ("write", "bytes_written")):
+                if values.get(key):
+                    labels = {"provider": provider, "operation": operation}
+                    ot.increment_counter("embedding_cache_bytes", labels, values[key])
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).trace("Error recording embedding cache metrics")
+
+
+@cache
+def get_embedding_cache(directory: str, hot_size: int, max_bytes: int | None) -> EmbeddingCache:
+    """Returns the embedding cache of the process for a directory."""
+    return EmbeddingCache(directory, hot_size, max_bytes)
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings computing vectors only for the texts the wrapped model has not embedded before.
+
+    Documents and queries are cached separately, since some models embed them differently. Other attributes
+    are read from the wrapped embeddings.
+
+    Args:
+        embeddings: The embeddings computing the vectors missing from the cache.
+        cache: The cache of the vectors.
+        identity: What identifies the vectors computed by `embeddings`, see `get_embeddings_identity`.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, identity: dict[str, Any]) -> None:
+        self.embeddings = embeddings
+        self.cache = cache
+        self.identity = identity
+
+    def __getattr__(self, name: str) -> Any:
+        # Special and own attributes are looked up before __init__ ran when unpickling
+        if name.startswith("__") or name in {"embeddings", "cache", "identity"}:
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, found, missing = self._lookup("document", texts)
+        embedded = self.embeddings.embed_documents(list(missing.values())) if missing else []
+        return self._store("document", keys, found, missing, embedded)
+
+    def embed_query(self, text: str) -> list[float]:
+        keys, found, missing = self._lookup("query", [text])
+        embedded = [self.embeddings.embed_query(text)] if missing else []
+        return self._store("query", keys, found, missing, embedded)[0]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, "document", texts)
+        embedded = await self.embeddings.aembed_documents(list(missing.values())) if missing else []
+        return await asyncio.to_thread(self._store, "document", keys, found, missing, embedded)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, "query", [text])
+        embedded = [await self.embeddings.aembed_query(text)] if missing else []
+        return (await asyncio.to_thread(self._store, "query", keys, found, missing, embedded))[0]
+
+    def _lookup(self, kind: str, texts: list[str]) -> tuple[list[str], dict[str, np.ndarray], dict[str, str]]:
+        keys = [hash_text(text) for text in texts]
+        found = self.cache.get_many({**self.identity, "kind": kind}, list(dict.fromkeys(keys)))
+        # Texts repeated in the batch are embedded once
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in found}
+        return keys, found, missing
+
+    def _store(
+        self,
+        kind: str,
+        keys: list[str],
+        found: dict[str, np.ndarray],
+        missing: dict[str, str],
+        embedded: list[list[float]],
+    ) -> list[list[float]]:
+        if len(embedded) != len(missing):
+            msg = f"The embedding model returned {len(embedded)} vectors for {len(missing)} texts"
+            raise ValueError(msg)
+        computed = dict(zip(missing, embedded, strict=True))
+        self.cache.put_many({**self.identity, "kind": kind}, computed)
+        return [computed[key] if key in computed else found[key].tolist() for key in keys]
+
+
+def with_embedding_cache(embeddings: Any, user_id: str | None = None) -> Any:
+    """Wraps `embeddings` in `CachedEmbeddings` when the embedding cache is enabled and can tell its model apart.
+
+    Other values, e.g. the options of server-side embeddings, are returned as is.
+
+    Args:
+        embeddings: The embeddings to cache the vectors of.
+        user_id: The user the vectors are cached for. Users don't share cached vectors.
+    """
+    if isinstance(embeddings, CachedEmbeddings) or not isinstance(embeddings, Embeddings):
+        return embeddings
+    settings = get_settings_service().settings
+    if not settings.embedding_cache:
+        return embeddings
+    directory = settings.embedding_cache_dir or (
+        Path(settings.config_dir) / "embedding_cache" if settings.config_dir else None
+    )
+    identity = get_embeddings_identity(embeddings, user_id)
+    if directory is None or identity is None:
+        return embeddings
+    cache = get_embedding_cache(str(directory), settings.embedding_cache_hot_size, settings.embedding_cache_max_bytes)
+    return CachedEmbeddings(embeddings, cache, identity)
+
+
+def get_component_user_id(component: Any) -> str | None:
+    """Returns the id of the user running a component, or None when it doesn't run in a graph."""
+    try:
+        user_id = component.user_id
+    except AttributeError:
+        return None
+    return str(user_id) if user_id else None
+
+
+def use_embedding_cache(build_embeddings: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator caching the vectors of the embeddings returned by a `build_embeddings` method.
+
+    Applied automatically to the `build_embeddings` method of `LCEmbeddingsModel` subclasses.
+    """
+
+    @wraps(build_embeddings)
+    def build_cached_embeddings(self, *args, **kwargs):
+        return with_embedding_cache(build_embeddings(self, *args, **kwargs), get_component_user_id(self))
+
+    build_cached_embeddings.is_embedding_cache_applied = True  # type: ignore[attr-defined]
+    return build_cached_embeddings
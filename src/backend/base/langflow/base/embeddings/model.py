@@ -1,3 +1,4 @@
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.custom import Component
 from langflow.field_typing import Embeddings
 from langflow.io import Output
@@ -10,6 +11,13 @@ class LCEmbeddingsModel(Component):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    def __init_subclass__(cls, **kwargs):
+        """Caches the vectors of the embeddings built by subclasses."""
+        super().__init_subclass__(**kwargs)
+        build_embeddings = cls.__dict__.get("build_embeddings")
+        if build_embeddings is not None and not getattr(build_embeddings, "is_embedding_cache_applied", False):
+            cls.build_embeddings = use_embedding_cache(build_embeddings)
+
     def _validate_outputs(self) -> None:
         required_output_methods = ["build_embeddings"]
         output_names = [output.name for output in self.outputs]
@@ -12,7 +12,15 @@ from langflow.base.constants import STREAM_INFO_TEXT
 from langflow.custom import Component
 from langflow.field_typing import LanguageModel
 from langflow.inputs import MessageInput
-from langflow.inputs.inputs import BoolInput, InputTypes, MultilineInput
+from langflow.inputs.inputs import (
+    BoolInput,
+    DropdownInput,
+    FloatInput,
+    HandleInput,
+    InputTypes,
+    IntInput,
+    MultilineInput,
+)
 from langflow.schema.message import Message
 from langflow.template.field.base import Output
 
@@ -21,6 +29,42 @@ from langflow.template.field.base import Output
 # Models are trained with this exact string. Do not update.
 DETAILED_THINKING_PREFIX = "detailed thinking on\n\n"
 
+# Inputs of the model components whose `build_model` method is decorated with `use_response_cache`
+RESPONSE_CACHE_INPUTS: list[InputTypes] = [
+    DropdownInput(
+        name="response_cache",
+        display_name="Response Cache",
+        options=["Off", "Exact", "Semantic"],
+        value="Off",
+        advanced=True,
+        info="Reuse the responses of the model stored on disk. Exact reuses the response to the same messages with "
+        "the same model settings, Semantic also the response to similar messages. Streamed responses are not "
+        "cached. Best suited to deterministic models, with a temperature of 0.",
+    ),
+    HandleInput(
+        name="response_cache_embedding",
+        display_name="Response Cache Embedding",
+        input_types=["Embeddings"],
+        required=False,
+        advanced=True,
+        info="The embedding model comparing messages for the Semantic response cache.",
+    ),
+    FloatInput(
+        name="response_cache_similarity",
+        display_name="Response Cache Similarity",
+        value=0.95,
+        advanced=True,
+        info="The minimum cosine similarity of messages for the Semantic response cache to reuse a response.",
+    ),
+    IntInput(
+        name="response_cache_ttl",
+        display_name="Response Cache TTL",
+        value=0,
+        advanced=True,
+        info="The number of seconds after which a cached response is no longer reused. 0 means never.",
+    ),
+]
+
 
 class LCModelComponent(Component):
     display_name: str = "Model Name"
@@ -102,6 +146,7 @@ class LCModelComponent(Component):
                 result = runnable.stream(input_value)
             else:
                 message = runnable.invoke(input_value)
+                self._log_response_cache_stats()
                 result = message.content if hasattr(message, "content") else message
                 self.status = result
         except Exception as e:
@@ -227,6 +272,7 @@ class LCModelComponent(Component):
             if stream:
                 return runnable.stream(inputs)
             message = runnable.invoke(inputs)
+            self._log_response_cache_stats()
             result = message.content if hasattr(message, "content") else message
             if isinstance(message, AIMessage):
                 status_message = self.build_status_message(message)
@@ -243,6 +289,16 @@ class LCModelComponent(Component):
 
         return result
 
+    def _log_response_cache_stats(self) -> None:
+        """Logs the lookups of the response cache of the model, so they show in the build result."""
+        llm_cache = getattr(self, "_llm_response_cache", None)
+        if llm_cache is None or not llm_cache.stats:
+            return
+        self.log(
+            {"mode": llm_cache.mode, **{result: llm_cache.stats[result] for result in ("hit", "semantic_hit", "miss")}},
+            name="Response Cache",
+        )
+
     @abstractmethod
     def build_model(self) -> LanguageModel:  # type: ignore[type-var]
         """Implement this method to build the model."""
@@ -0,0 +1,160 @@
+"""Rate limiting, adaptive concurrency and retries for the requests sent to language models."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any
+
+# Status codes of responses worth retrying: timeouts, rate limits and server errors
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504, 529})
+# Parts of the names of the exceptions raised by model providers for transient errors
+TRANSIENT_ERROR_NAMES = ("RateLimit", "Timeout", "Overloaded", "ServiceUnavailable", "APIConnection", "InternalServer")
+RATE_LIMIT_STATUS_CODE = 429
+# The average number of characters of a token, to estimate the tokens of a prompt before sending it
+CHARACTERS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return max(len(text) // CHARACTERS_PER_TOKEN, 1)
+
+
+def get_reported_tokens(response: Any) -> int | None:
+    """Returns the number of tokens a model reports a response used, if it does."""
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict) and isinstance(usage.get("total_tokens"), int):
+        return usage["total_tokens"]
+    return None
+
+
+def _get_status_code(error: BaseException) -> int | None:
+    for source in (error, getattr(error, "response", None)):
+        status_code = getattr(source, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+    return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    return _get_status_code(error) == RATE_LIMIT_STATUS_CODE or any(
+        "RateLimit" in cls.__name__ for cls in type(error).__mro__
+    )
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Returns whether an error may not happen again if the request is retried."""
+    if isinstance(error, TimeoutError | ConnectionError):
+        return True
+    if _get_status_code(error) in TRANSIENT_STATUS_CODES:
+        return True
+    return any(name in cls.__name__ for cls in type(error).__mro__ for name in TRANSIENT_ERROR_NAMES)
+
+
+def get_retry_delay(error: BaseException, attempt: int, *, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+    """Returns the number of seconds to wait before retrying a failed request.
+
+    The delay the provider asks for with a Retry-After header is used if there is one, otherwise an
+    exponential backoff with jitter, so concurrent requests don't retry all at once.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    retry_after = headers.get("retry-after") if headers is not None and hasattr(headers, "get") else None
+    try:
+        if retry_after is not None:
+            return min(float(retry_after), max_delay)
+    except ValueError:
+        pass
+    return random.uniform(0, min(base_delay * 2**attempt, max_delay))  # noqa: S311
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.rate = per_minute / 60
+        self.updated = time.monotonic()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def take(self, amount: float) -> None:
+        # Larger requests than the limit wait for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        self.refill()
+        if self.level < amount:
+            await asyncio.sleep((amount - self.level) / self.rate)
+            self.refill()
+        self.level -= amount
+
+
+class RateLimiter:
+    """Limits the requests and tokens sent per minute by all the tasks sharing it.
+
+    Token counts are estimated before a request is sent, and corrected with the usage the model reports.
+
+    Args:
+        requests_per_minute: The maximum number of requests per minute. 0 or None means unlimited.
+        tokens_per_minute: The maximum number of tokens per minute. 0 or None means unlimited.
+    """
+
+    def __init__(self, requests_per_minute: int | None = None, tokens_per_minute: int | None = None) -> None:
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        # Waiters are served in order, so large requests are not starved by small ones
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Waits until a request of about `tokens` tokens can be sent."""
+        if self._requests is None and self._tokens is None:
+            return
+        async with self._lock:
+            if self._requests is not None:
+                await self._requests.take(1)
+            if self._tokens is not None and tokens:
+                await self._tokens.take(tokens)
+
+    def record(self, tokens: int) -> None:
+        """Records tokens used beyond the estimate of a request, or returns the unused ones if negative."""
+        if self._tokens is not None:
+            self._tokens.refill()
+            self._tokens.level = min(self._tokens.capacity, self._tokens.level - tokens)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent requests, lowering the limit when the model is rate limited.
+
+    The limit is halved on every rate limit error, and raised by one after as many successful requests as
+    the limit, up to `max_concurrency`.
+
+    Args:
+        max_concurrency: The maximum number of concurrent requests.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max(max_concurrency, 1)
+        self.limit = self.max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+
+    def record_rate_limit(self) -> None:
+        self.limit = max(self.limit // 2, 1)
+        self._successes = 0
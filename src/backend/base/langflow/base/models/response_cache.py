@@ -0,0 +1,483 @@
+"""Persistent cache of language model responses, keyed by model configuration, instructions and prompt.
+
+Responses are stored in an SQLite database shared by the processes of all workers, so a run that stopped
+midway resumes without sending the prompts already answered to the model again. Model components use it
+through `LLMResponseCache`, a LangChain cache which can also reuse the responses of similar prompts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import warnings
+from collections import Counter
+from functools import cache, wraps
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import orjson
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.load import dumpd, load
+from loguru import logger
+from pydantic import SecretStr
+
+from langflow.base.embeddings.cache import CachedEmbeddings, get_component_user_id, get_embeddings_identity
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+    from langchain_core.embeddings import Embeddings
+
+# Attributes of language models changing their responses, read in addition to their identifying parameters
+IDENTITY_ATTRIBUTES = (
+    "model",
+    "model_name",
+    "model_id",
+    "deployment_name",
+    "repo_id",
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "max_output_tokens",
+    "seed",
+    "base_url",
+    "openai_api_base",
+    "azure_endpoint",
+    "endpoint_url",
+)
+# Parameters holding secrets, which are never part of a key. Names are matched by their end, so settings such as
+# `max_tokens` still identify the model.
+_SECRET_NAME = re.compile(r"(key|token|secret|password|credentials?|headers|auth)$", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS response (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    created_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_response_created_at ON response (created_at);
+CREATE TABLE IF NOT EXISTS prompt_vector (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (scope, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_prompt_vector_scope_created_at ON prompt_vector (scope, created_at);
+"""
+# SQLite limits the number of parameters of a query
+_QUERY_BATCH_SIZE = 500
+# The number of writes between two checks of the size of a cache
+_PRUNE_INTERVAL = 100
+# The number of most recent prompts a semantic lookup compares a prompt with
+SIMILAR_PROMPTS_LIMIT = 10_000
+
+
+def _batched(keys: Iterable[str], size: int) -> Iterator[tuple[str, ...]]:
+    iterator = iter(keys)
+    while batch := tuple(islice(iterator, size)):
+        yield batch
+
+
+def _get_identity_value(value: Any) -> Any:
+    """Returns a JSON value standing for a parameter, or None for values that don't identify a model.
+
+    Objects such as HTTP clients have no stable representation, so they are left out.
+    """
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, list | tuple):
+        return [_get_identity_value(item) for item in value]
+    if isinstance(value, dict):
+        return _get_public_params(value)
+    return None
+
+
+def _get_public_params(params: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        str(name): _get_identity_value(value)
+        for name, value in params.items()
+        if not _SECRET_NAME.search(str(name)) and not isinstance(value, SecretStr)
+    }
+
+
+def get_model_identity(model: Any) -> dict[str, Any]:
+    """Returns what identifies the responses of a language model, without its secrets."""
+    identity: dict[str, Any] = {}
+    # Models configured with `bind` or `with_config` wrap the model, with the bound arguments, e.g. tools
+    while hasattr(model, "bound"):
+        kwargs = getattr(model, "kwargs", None)
+        if isinstance(kwargs, dict):
+            identity = {**_get_public_params(kwargs), **identity}
+        model = model.bound
+    try:
+        params = dict(getattr(model, "_identifying_params", None) or {})
+    except (TypeError, ValueError):
+        params = {}
+    for attribute in IDENTITY_ATTRIBUTES:
+        value = getattr(model, attribute, None)
+        if isinstance(value, str | int | float | bool):
+            params.setdefault(attribute, value)
+    identity.update(_get_public_params(params))
+    identity["provider"] = f"{type(model).__module__}.{type(model).__qualname__}"
+    return identity
+
+
+def get_response_key(identity: Mapping[str, Any], system_message: str, prompt: Any) -> str:
+    """Returns the cache key of the response of a model to a prompt, given the model's identity."""
+    data = orjson.dumps(
+        [identity, system_message, prompt], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+    )
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResponseCache:
+    """Language model responses stored in an SQLite database.
+
+    Responses are stored as JSON, so any JSON value can be cached. Prompts can also be stored with their
+    embedding, to find the responses of similar prompts.
+
+    Args:
+        path: The path of the database.
+        max_entries: The maximum number of responses. The oldest ones are deleted beyond it. None means
+            unlimited.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int | None = None) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get_many(self, keys: Iterable[str], *, max_age: float | None = None) -> dict[str, Any]:
+        """Returns the cached responses of the given keys, if they are at most `max_age` seconds old."""
+        min_created_at = time.time() - max_age if max_age else 0
+        responses: dict[str, Any] = {}
+        with self._lock:
+            connection = self._connect()
+            for batch in _batched(keys, _QUERY_BATCH_SIZE):
+                placeholders = ", ".join("?" * len(batch))
+                query = f"SELECT key, value FROM response WHERE key IN ({placeholders}) AND created_at >= ?"  # noqa: S608
+                rows = connection.execute(query, (*batch, min_created_at))
+                responses.update((key, orjson.loads(value)) for key, value in rows)
+        return responses
+
+    def put_many(self, responses: Mapping[str, Any]) -> None:
+        """Stores responses under their key, replacing the ones already stored."""
+        if not responses:
+            return
+        now = time.time()
+        rows = [(key, orjson.dumps(value, default=str), now) for key, value in responses.items()]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO response (key, value, created_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._writes += len(rows)
+                if self.max_entries is not None and self._writes >= _PRUNE_INTERVAL:
+                    self._prune(connection)
+
+    def put_vector(self, scope: str, key: str, vector: np.ndarray) -> None:
+        """Stores the embedding of the prompt of the response stored under `key`."""
+        data = np.asarray(vector, dtype=np.float32).tobytes()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO prompt_vector (scope, key, vector, created_at) VALUES (?, ?, ?, ?)",
+                    (scope, key, data, time.time()),
+                )
+
+    def find_similar(
+        self,
+        scope: str,
+        vector: np.ndarray,
+        threshold: float,
+        *,
+        max_age: float | None = None,
+        limit: int = SIMILAR_PROMPTS_LIMIT,
+    ) -> str | None:
+        """Returns the key of the response to the prompt most similar to `vector`, if similar enough.
+
+        Prompts are compared by cosine similarity, which must be at least `threshold`. Only the `limit` most
+        recent prompts of the scope are compared, so lookups don't slow down as the cache grows.
+        """
+        min_created_at = time.time() - max_age if max_age else 0
+        query = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT key, vector FROM prompt_vector WHERE scope = ? AND created_at >= ? AND length(vector) = ? "
+                    "ORDER BY created_at DESC LIMIT ?",
+                    (scope, min_created_at, query.nbytes, limit),
+                )
+                .fetchall()
+            )
+        if not rows:
+            return None
+        vectors = np.frombuffer(b"".join(data for _, data in rows), dtype=np.float32).reshape(len(rows), -1)
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        similarities = (vectors @ query) / np.where(norms == 0, 1, norms)
+        best = int(np.argmax(similarities))
+        return rows[best][0] if similarities[best] >= threshold else None
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM response")
+                connection.execute("DELETE FROM prompt_vector")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM response").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        self._writes = 0
+        connection.execute(
+            "DELETE FROM response WHERE key IN (SELECT key FROM response ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        connection.execute("DELETE FROM prompt_vector WHERE key NOT IN (SELECT key FROM response)")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+
+@cache
+def get_response_cache(path: str, max_entries: int | None = None) -> ResponseCache:
+    """Returns the response cache of the process for a database path."""
+    return ResponseCache(path, max_entries)
+
+
+def get_default_response_cache() -> ResponseCache | None:
+    """Returns the response cache configured in the settings, or None if there is no directory to store it."""
+    settings = get_settings_service().settings
+    directory = settings.llm_response_cache_dir or (
+        Path(settings.config_dir) / "llm_response_cache" if settings.config_dir else None
+    )
+    if directory is None:
+        return None
+    return get_response_cache(str(Path(directory) / "responses.db"), settings.llm_response_cache_max_entries)
+
+
+class LLMResponseCache(BaseCache):
+    """LangChain cache of the responses of a model, stored in a response cache.
+
+    Responses are reused for the same prompt to the same model configuration. With `embeddings`, they are also
+    reused for prompts whose embedding is at least `similarity_threshold` similar to a cached prompt's. Lookups
+    are counted in `stats`, so components can report them. Responses are only reused within the same `scope`.
+
+    Args:
+        store: The response cache storing the responses.
+        scope: The user and flow the responses are cached for, so they are never shared with others.
+        ttl: The number of seconds after which a response is no longer reused. None means never.
+        embeddings: The embeddings of the prompts, for semantic lookups.
+        similarity_threshold: The minimum cosine similarity of the prompts of a semantic lookup.
+        provider: The model the cache is used by, to label metrics.
+    """
+
+    def __init__(
+        self,
+        store: ResponseCache,
+        *,
+        scope: Mapping[str, str | None] | None = None,
+        ttl: float | None = None,
+        embeddings: Embeddings | None = None,
+        similarity_threshold: float = 0.95,
+        provider: str = "",
+    ) -> None:
+        self.store = store
+        self.scope = dict(scope or {})
+        self.ttl = ttl
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.provider = provider
+        self.stats: Counter[str] = Counter()
+        # The embeddings of the prompts looked up, so they are not embedded again when their response is stored
+        self._vectors: dict[str, np.ndarray] = {}
+
+    @property
+    def mode(self) -> str:
+        return "semantic" if self.embeddings is not None else "exact"
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        key = self._get_key(prompt, llm_string)
+        value = self.store.get_many([key], max_age=self.ttl).get(key)
+        result = "hit"
+        if value is None and self.embeddings is not None:
+            vector = np.asarray(self.embeddings.embed_query(get_prompt_text(prompt)), dtype=np.float32)
+            self._vectors[key] = vector
+            similar_key = self.store.find_similar(
+                self._get_scope(llm_string), vector, self.similarity_threshold, max_age=self.ttl
+            )
+            if similar_key is not None:
+                value = self.store.get_many([similar_key], max_age=self.ttl).get(similar_key)
+                result = "semantic_hit"
+        generations = self._load(value) if value is not None else None
+        self._record(result if generations is not None else "miss")
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = self._get_key(prompt, llm_string)
+        self.store.put_many({key: [dumpd(generation) for generation in return_val]})
+        if self.embeddings is not None:
+            vector = self._vectors.pop(key, None)
+            if vector is None:
+                vector = np.asarray(self.embeddings.embed_query(get_prompt_text(prompt)), dtype=np.float32)
+            self.store.put_vector(self._get_scope(llm_string), key, vector)
+
+    def clear(self, **kwargs: Any) -> None:  # noqa: ARG002
+        """Deletes all the responses of the store, including the ones of other models."""
+        self.store.clear()
+
+    def _get_key(self, prompt: str, llm_string: str) -> str:
+        scope = orjson.dumps(self.scope, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(scope + f"\0{llm_string}\0{prompt}".encode("utf-8", "surrogatepass")).hexdigest()
+
+    def _get_scope(self, llm_string: str) -> str:
+        """Returns the scope of the prompt embeddings.
+
+        Only prompts of the same cache scope to the same model, embedded by the same embedding model, are compared.
+        """
+        if isinstance(self.embeddings, CachedEmbeddings):
+            identity = self.embeddings.identity
+        else:
+            identity = get_embeddings_identity(self.embeddings) or {
+                "provider": f"{type(self.embeddings).__module__}.{type(self.embeddings).__qualname__}"
+            }
+        return get_response_key({"embeddings": identity, **self.scope}, llm_string, "")
+
+    @staticmethod
+    def _load(value: list[dict[str, Any]]) -> RETURN_VAL_TYPE | None:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                return [load(generation) for generation in value]
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error loading a cached response")
+            return None
+
+    def _record(self, result: str) -> None:
+        self.stats[result] += 1
+        try:
+            from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+            labels = {"provider": self.provider, "mode": self.mode, "result": result}
+            OpenTelemetry().increment_counter("llm_cache_lookups", labels, 1)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).trace("Error recording LLM cache metrics")
+
+
+def get_prompt_text(prompt: str) -> str:
+    """Returns the text of the messages of a prompt serialized by LangChain, to embed it."""
+    try:
+        messages = orjson.loads(prompt)
+    except orjson.JSONDecodeError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+    texts = []
+    for message in messages:
+        content = message.get("kwargs", {}).get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            texts.append(content)
+        elif isinstance(content, list):
+            texts.extend(part["text"] for part in content if isinstance(part, dict) and "text" in part)
+    return "\n\n".join(texts) if texts else prompt
+
+
+def with_llm_response_cache(
+    model: Any,
+    *,
+    scope: Mapping[str, str | None] | None = None,
+    semantic: bool = False,
+    embeddings: Embeddings | None = None,
+    ttl: float | None = None,
+    similarity_threshold: float = 0.95,
+) -> LLMResponseCache | None:
+    """Sets the cache of `model`, and of the model it wraps if it is bound, to a new `LLMResponseCache`.
+
+    Returns:
+        The cache, or None if the model can't be cached or there is no directory to store the cache.
+    """
+    while not isinstance(model, BaseLanguageModel) and hasattr(model, "bound"):
+        model = model.bound
+    if not isinstance(model, BaseLanguageModel):
+        return None
+    if semantic and embeddings is None:
+        msg = "Semantic response caching requires an embedding model."
+        raise ValueError(msg)
+    store = get_default_response_cache()
+    if store is None:
+        return None
+    llm_cache = LLMResponseCache(
+        store,
+        scope=scope,
+        ttl=ttl,
+        embeddings=embeddings if semantic else None,
+        similarity_threshold=similarity_threshold,
+        provider=type(model).__name__,
+    )
+    model.cache = llm_cache
+    return llm_cache
+
+
+def get_component_cache_scope(component: Any) -> dict[str, str | None]:
+    """Returns the user and flow of a component, which the responses it caches are scoped to."""
+    try:
+        flow_id = component.flow_id
+    except AttributeError:
+        flow_id = None
+    return {"user_id": get_component_user_id(component), "flow_id": str(flow_id) if flow_id else None}
+
+
+def use_response_cache(build_model: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator caching the responses of the model returned by a `build_model` method.
+
+    The cache is configured by the response cache inputs of the component, which components opting in add
+    with `RESPONSE_CACHE_INPUTS`.
+    """
+
+    @wraps(build_model)
+    def build_cached_model(self, *args, **kwargs):
+        model = build_model(self, *args, **kwargs)
+        self._llm_response_cache = None
+        mode = getattr(self, "response_cache", None) or "Off"
+        if mode == "Off":
+            return model
+        self._llm_response_cache = with_llm_response_cache(
+            model,
+            scope=get_component_cache_scope(self),
+            semantic=mode == "Semantic",
+            embeddings=getattr(self, "response_cache_embedding", None),
+            ttl=getattr(self, "response_cache_ttl", None) or None,
+            similarity_threshold=getattr(self, "response_cache_similarity", None) or 0.95,
+        )
+        return model
+
+    return build_cached_model
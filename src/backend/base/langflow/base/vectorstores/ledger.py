@@ -0,0 +1,211 @@
+"""Ledger of the chunks ingested into vector store collections, for incremental ingestion.
+
+The ledger records the id, source and content hash of every chunk added to a collection. Before ingesting,
+documents are compared with it so only new or changed chunks are embedded and added, and chunks that were
+removed from their source are deleted. A chunk produced by several sources is stored once and deleted when
+none of them produces it anymore.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from langchain_core.documents import Document
+
+# Metadata keys naming the source of a document, in order of preference
+SOURCE_METADATA_KEYS = ("source", "file_path", "url")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunk (
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (collection, id, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_chunk_source ON chunk (collection, source);
+"""
+# SQLite limits the number of parameters of a query
+_QUERY_BATCH_SIZE = 500
+
+
+def _batched(values: Iterable[str], size: int) -> Iterator[tuple[str, ...]]:
+    iterator = iter(values)
+    while batch := tuple(islice(iterator, size)):
+        yield batch
+
+
+def get_document_source(document: Document) -> str:
+    """Returns the source of a document, or an empty string for documents without a source."""
+    for key in SOURCE_METADATA_KEYS:
+        value = document.metadata.get(key)
+        if value:
+            return str(value)
+    return ""
+
+
+def get_document_hash(document: Document) -> str:
+    """Returns a hash of the text and metadata of a document."""
+    metadata = orjson.dumps(document.metadata, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(document.page_content.encode("utf-8", "surrogatepass") + b"\0" + metadata).hexdigest()
+
+
+def get_collection_key(*parts: str) -> str:
+    """Returns the ledger key of a collection, a hash so connection strings are not stored."""
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+@dataclass
+class IngestionPlan:
+    """The changes to make to a collection to ingest documents."""
+
+    documents: list[Document] = field(default_factory=list)
+    """The new or changed documents to add, without duplicates."""
+    ids: list[str] = field(default_factory=list)
+    """The ids to add the documents under, derived from their content hash."""
+    stale_ids: list[str] = field(default_factory=list)
+    """The ids of the chunks to delete, no longer produced by any source."""
+    unchanged: int = 0
+    """The number of documents skipped because they are already in the collection or repeated."""
+    new_references: list[tuple[str, str, str]] = field(default_factory=list)
+    """The id, source and content hash of the chunks sources now produce, to record in the ledger."""
+    stale_references: list[tuple[str, str]] = field(default_factory=list)
+    """The id and source of the chunks sources no longer produce, to remove from the ledger."""
+
+
+class IngestionLedger:
+    """The chunks ingested into vector store collections, stored in an SQLite database.
+
+    Args:
+        path: The path of the database.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def plan(
+        self, collection: str, documents: list[Document], *, delete_missing_sources: bool = False
+    ) -> IngestionPlan:
+        """Compares documents with the chunks of a collection.
+
+        Chunks of the sources of `documents` that are no longer among them are stale. With
+        `delete_missing_sources`, the documents are the whole collection and any chunk not among them is stale.
+        A stale chunk is only deleted once no other source produces it.
+        """
+        documents_by_id: dict[str, Document] = {}
+        references: dict[tuple[str, str], str] = {}
+        for document in documents:
+            content_hash = get_document_hash(document)
+            # The same hash always gets the same id, so identical documents are ingested once
+            chunk_id = str(uuid.UUID(content_hash[:32]))
+            documents_by_id.setdefault(chunk_id, document)
+            references.setdefault((chunk_id, get_document_source(document)), content_hash)
+
+        with self._lock:
+            connection = self._connect()
+            stored = set(self._select_references(connection, collection, "id", documents_by_id))
+            if delete_missing_sources:
+                candidates = connection.execute("SELECT id, source FROM chunk WHERE collection = ?", (collection,))
+            else:
+                sources = {source for _, source in references if source}
+                candidates = self._select_references(connection, collection, "source", sources)
+            stale_references = [reference for reference in candidates if reference not in references]
+            # Chunks still produced by another source are kept
+            stale_ids = {chunk_id for chunk_id, _ in stale_references if chunk_id not in documents_by_id}
+            stale_set = set(stale_references)
+            kept_ids = {
+                chunk_id
+                for chunk_id, source in self._select_references(connection, collection, "id", stale_ids)
+                if (chunk_id, source) not in stale_set
+            }
+
+        stored_ids = {chunk_id for chunk_id, _ in stored}
+        plan = IngestionPlan(
+            stale_ids=sorted(stale_ids - kept_ids),
+            new_references=[
+                (chunk_id, source, content_hash)
+                for (chunk_id, source), content_hash in references.items()
+                if (chunk_id, source) not in stored
+            ],
+            stale_references=stale_references,
+        )
+        for chunk_id, document in documents_by_id.items():
+            if chunk_id not in stored_ids:
+                plan.documents.append(document)
+                plan.ids.append(chunk_id)
+        plan.unchanged = len(documents) - len(plan.documents)
+        return plan
+
+    def record(self, collection: str, plan: IngestionPlan) -> None:
+        """Records that the changes of a plan were made to a collection."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "DELETE FROM chunk WHERE collection = ? AND id = ? AND source = ?",
+                    [(collection, chunk_id, source) for chunk_id, source in plan.stale_references],
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO chunk (collection, id, source, content_hash) VALUES (?, ?, ?, ?)",
+                    [(collection, *reference) for reference in plan.new_references],
+                )
+
+    def reset(self, collection: str) -> None:
+        """Forgets the chunks of a collection, e.g. when the collection was deleted."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM chunk WHERE collection = ?", (collection,))
+
+    def count(self, collection: str) -> int:
+        """Returns the number of chunks in a collection."""
+        with self._lock:
+            query = "SELECT COUNT(DISTINCT id) FROM chunk WHERE collection = ?"
+            return self._connect().execute(query, (collection,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def _select_references(
+        connection: sqlite3.Connection, collection: str, column: str, values: Iterable[str]
+    ) -> list[tuple[str, str]]:
+        references = []
+        for batch in _batched(values, _QUERY_BATCH_SIZE):
+            placeholders = ", ".join("?" * len(batch))
+            query = f"SELECT id, source FROM chunk WHERE collection = ? AND {column} IN ({placeholders})"  # noqa: S608
+            references.extend(connection.execute(query, (collection, *batch)))
+        return references
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+
+@cache
+def get_ingestion_ledger(path: str) -> IngestionLedger:
+    """Returns the ingestion ledger of the process for a database path."""
+    return IngestionLedger(path)
@@ -0,0 +1,587 @@
+"""Local vector store keeping float32 embeddings in a memory-mapped file, searched with NumPy.
+
+A collection is a directory holding:
+
+- ``vectors.f32``: the normalized embeddings, one float32 row per chunk, only ever appended.
+- ``store.db``: an SQLite sidecar with the id, text and metadata of every row. Deleted rows are marked and
+  skipped until the collection is compacted.
+- ``ivf.npz``: the inverted file index, once the collection is large enough to need one.
+- ``store.lock``: the lock held while the collection is read or written, so several processes can share it.
+
+Small collections, and searches whose metadata filter leaves few rows, are searched exactly. Larger ones
+use an IVF index: the rows are clustered with k-means and a search only scans the clusters whose centroids
+are closest to the query.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import orjson
+from filelock import FileLock
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from langchain_core.embeddings import Embeddings
+
+INDEX_TYPES = ("auto", "flat", "ivf")
+# With the "auto" index type, the number of rows from which an IVF index is built
+IVF_THRESHOLD = 50_000
+# Searches over at most this many rows are exact
+EXACT_SEARCH_LIMIT = 20_000
+# The number of rows scored at once by exact searches
+BLOCK_SIZE = 65_536
+# The IVF index is trained again when the collection grew by this factor since the last training
+IVF_RETRAIN_GROWTH = 2.0
+KMEANS_ITERATIONS = 10
+# The maximum size of the sample k-means is trained on
+KMEANS_SAMPLE_BYTES = 256 * 1024 * 1024
+# Deleted rows are removed once they are more than this share of the rows
+COMPACT_RATIO = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS chunk (
+    id TEXT PRIMARY KEY,
+    row INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_chunk_row ON chunk (row);
+"""
+_QUERY_BATCH_SIZE = 500
+_FLOAT32_BYTES = 4
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _merge_top_k(
+    best_scores: np.ndarray, best_rows: np.ndarray, scores: np.ndarray, rows: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merges the scores of rows into the best scores found so far, for each query."""
+    scores = np.concatenate([best_scores, scores], axis=1)
+    rows = np.concatenate([best_rows, rows], axis=1)
+    if scores.shape[1] > k:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, top, axis=1)
+        rows = np.take_along_axis(rows, top, axis=1)
+    return scores, rows
+
+
+class MemmapIndex:
+    """The embeddings, texts and metadata of a collection, with exact and IVF search.
+
+    Methods are thread safe, and hold a file lock so the collection can be shared by several processes. The
+    state kept in memory is reloaded when another process changed the collection.
+
+    Args:
+        directory: The directory of the collection.
+        index_type: "flat" for exact search only, "ivf" to always use an IVF index once the collection has
+            enough rows to cluster, "auto" to use one from `IVF_THRESHOLD` rows.
+    """
+
+    def __init__(self, directory: str | Path, index_type: str = "auto") -> None:
+        if index_type not in INDEX_TYPES:
+            msg = f"Unknown index type {index_type!r}, expected one of {', '.join(INDEX_TYPES)}"
+            raise ValueError(msg)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_type = index_type
+        self.vectors_path = self.directory / "vectors.f32"
+        self.ivf_path = self.directory / "ivf.npz"
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(self.directory / "store.lock")
+        self._connection = sqlite3.connect(self.directory / "store.db", timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        with self._lock, self._file_lock:
+            self._load()
+
+    def __len__(self) -> int:
+        with self._locked():
+            return len(self._row_by_id)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+            self._vectors = None
+
+    def add(
+        self,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        metadatas: Sequence[dict[str, Any]],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+    ) -> None:
+        """Adds chunks to the collection, replacing the chunks with the same ids."""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if not len(vectors):
+            return
+        if not len(ids) == len(texts) == len(metadatas) == len(vectors):
+            msg = "Expected as many ids, texts, metadatas and embeddings"
+            raise ValueError(msg)
+        # Ids repeated in the batch keep their last chunk
+        last = {chunk_id: index for index, chunk_id in enumerate(ids)}
+        keep = sorted(last.values())
+        vectors = _normalize(vectors[keep])
+
+        with self._locked():
+            if self.dimensions is None:
+                self.dimensions = vectors.shape[1]
+                self._set_meta("dimensions", self.dimensions)
+            elif vectors.shape[1] != self.dimensions:
+                msg = f"Expected embeddings of {self.dimensions} dimensions, got {vectors.shape[1]}"
+                raise ValueError(msg)
+
+            start = self._rows
+            replaced = [self._row_by_id[ids[index]] for index in keep if ids[index] in self._row_by_id]
+            # Replaced chunks keep their id, so their record now points at the new row
+            with self._connection:
+                with self.vectors_path.open("r+b" if self.vectors_path.exists() else "w+b") as file:
+                    file.seek(start * self.dimensions * _FLOAT32_BYTES)
+                    file.write(vectors.tobytes())
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO chunk (id, row, text, metadata) VALUES (?, ?, ?, ?)",
+                    [
+                        (ids[index], start + offset, texts[index], orjson.dumps(metadatas[index], default=str).decode())
+                        for offset, index in enumerate(keep)
+                    ],
+                )
+                self._set_meta("rows", start + len(keep))
+
+            self._rows = start + len(keep)
+            self._deleted = np.concatenate([self._deleted, np.zeros(len(keep), dtype=bool)])
+            self._deleted[replaced] = True
+            for offset, index in enumerate(keep):
+                self._row_by_id[ids[index]] = start + offset
+            self._vectors = None
+            self._columns.clear()
+            self._update_ivf(vectors)
+            self._bump_version()
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Deletes chunks by id.
+
+        Returns:
+            The number of chunks deleted.
+        """
+        with self._locked():
+            ids = [chunk_id for chunk_id in dict.fromkeys(ids) if chunk_id in self._row_by_id]
+            if not ids:
+                return 0
+            with self._connection:
+                self._mark_deleted(ids)
+            self._deleted[[self._row_by_id.pop(chunk_id) for chunk_id in ids]] = True
+            self._columns.clear()
+            self._bump_version()
+            if self._rows and self._deleted.sum() > self._rows * COMPACT_RATIO:
+                self.compact()
+            return len(ids)
+
+    def get(self, ids: Sequence[str]) -> list[Document]:
+        """Returns the chunks with the given ids, in the same order, skipping missing ids."""
+        with self._locked():
+            rows = [self._row_by_id[chunk_id] for chunk_id in ids if chunk_id in self._row_by_id]
+            return self._get_documents(rows)
+
+    def search(
+        self,
+        queries: Sequence[Sequence[float]] | np.ndarray,
+        k: int = 4,
+        *,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+        n_probe: int = 16,
+    ) -> list[list[tuple[Document, float]]]:
+        """Returns the `k` chunks most similar to each query, with their cosine similarity.
+
+        Args:
+            queries: The query embeddings.
+            k: The number of chunks to return for each query.
+            filter: Metadata values the chunks must have. A list of values matches any of them.
+            n_probe: The number of IVF clusters scanned for each query.
+        """
+        queries = _normalize(np.atleast_2d(np.asarray(queries, dtype=np.float32)))
+        with self._locked():
+            if not self._row_by_id or k <= 0:
+                return [[] for _ in queries]
+            if queries.shape[1] != self.dimensions:
+                msg = f"Expected query embeddings of {self.dimensions} dimensions, got {queries.shape[1]}"
+                raise ValueError(msg)
+            vectors = self._get_vectors()
+            mask = ~self._deleted
+            if filter:
+                mask &= self._get_filter_mask(filter)
+            candidates = np.flatnonzero(mask)
+            use_ivf = self.index_type != "flat" and self._centroids is not None
+            if use_ivf and len(candidates) > EXACT_SEARCH_LIMIT:
+                results = self._search_ivf(vectors, queries, k, mask, n_probe)
+            else:
+                results = self._search_exact(vectors, queries, k, candidates)
+            rows = sorted({row for rows, _ in results for row in rows})
+            by_row = dict(zip(rows, self._get_documents(rows), strict=True))
+        return [
+            [(by_row[row], float(score)) for row, score in zip(rows, scores, strict=True)] for rows, scores in results
+        ]
+
+    def compact(self) -> None:
+        """Removes the deleted rows from the vectors file and the sidecar."""
+        with self._locked():
+            live = np.flatnonzero(~self._deleted)
+            vectors = self._get_vectors()
+            temporary_path = self.vectors_path.with_suffix(".tmp")
+            with temporary_path.open("wb") as file:
+                for start in range(0, len(live), BLOCK_SIZE):
+                    file.write(np.ascontiguousarray(vectors[live[start : start + BLOCK_SIZE]]).tobytes())
+            self._vectors = None
+            new_rows = {int(old): new for new, old in enumerate(live)}
+            with self._connection:
+                self._connection.execute("DELETE FROM chunk WHERE deleted = 1")
+                # Rows only move down, in order, so they never collide
+                self._connection.executemany(
+                    "UPDATE chunk SET row = ? WHERE row = ?", [(new, old) for old, new in new_rows.items()]
+                )
+                self._set_meta("rows", len(live))
+                temporary_path.replace(self.vectors_path)
+            self._rows = len(live)
+            self._deleted = np.zeros(self._rows, dtype=bool)
+            self._row_by_id = {chunk_id: new_rows[row] for chunk_id, row in self._row_by_id.items()}
+            self._columns.clear()
+            if self._assignments is not None:
+                self._assignments = self._assignments[live]
+                self._lists = None
+                self._save_ivf()
+            self._bump_version()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Locks the collection, reloading it first if another process changed it."""
+        with self._lock, self._file_lock:
+            if (self._get_meta("version") or 0) != self._version:
+                self._load()
+            yield
+
+    def _load(self) -> None:
+        self._version = self._get_meta("version") or 0
+        self.dimensions = self._get_meta("dimensions")
+        self._rows = self._get_meta("rows") or 0
+        self._deleted = np.ones(self._rows, dtype=bool)
+        self._row_by_id: dict[str, int] = {}
+        for chunk_id, row in self._connection.execute("SELECT id, row FROM chunk WHERE deleted = 0"):
+            self._row_by_id[chunk_id] = row
+            self._deleted[row] = False
+        self._vectors: np.memmap | None = None
+        self._columns: dict[str, np.ndarray] = {}
+
+        self._centroids: np.ndarray | None = None
+        self._assignments: np.ndarray | None = None
+        self._trained_rows = 0
+        self._lists: tuple[np.ndarray, np.ndarray] | None = None
+        if self.ivf_path.exists():
+            with np.load(self.ivf_path) as ivf:
+                self._centroids = ivf["centroids"]
+                self._assignments = ivf["assignments"]
+                self._trained_rows = int(ivf["trained_rows"])
+            if len(self._assignments) != self._rows:
+                # Written before the assignments of all the rows were kept, so it can't be used
+                self._centroids = self._assignments = None
+
+    def _bump_version(self) -> None:
+        """Records a change of the collection, so the other processes reload it."""
+        with self._connection:
+            self._set_meta("version", self._version + 1)
+        self._version += 1
+
+    def _get_meta(self, key: str) -> int | None:
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return int(row[0]) if row else None
+
+    def _set_meta(self, key: str, value: int) -> None:
+        self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _mark_deleted(self, ids: list[str]) -> None:
+        self._connection.executemany("UPDATE chunk SET deleted = 1 WHERE id = ?", [(chunk_id,) for chunk_id in ids])
+
+    def _get_vectors(self) -> np.ndarray:
+        if self._vectors is None:
+            if not self._rows:
+                return np.empty((0, self.dimensions or 0), dtype=np.float32)
+            self._vectors = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(self._rows, self.dimensions)
+            )
+        return self._vectors
+
+    def _get_documents(self, rows: list[int]) -> list[Document]:
+        found: dict[int, Document] = {}
+        for start in range(0, len(rows), _QUERY_BATCH_SIZE):
+            batch = rows[start : start + _QUERY_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            query = f"SELECT row, id, text, metadata FROM chunk WHERE deleted = 0 AND row IN ({placeholders})"  # noqa: S608
+            for row, chunk_id, text, metadata in self._connection.execute(query, batch):
+                found[row] = Document(id=chunk_id, page_content=text, metadata=orjson.loads(metadata))
+        return [found[row] for row in rows if row in found]
+
+    def _get_column(self, key: str) -> np.ndarray:
+        """Returns the values of a metadata key for every row, loaded from the sidecar once per change."""
+        column = self._columns.get(key)
+        if column is None:
+            column = np.full(self._rows, None, dtype=object)
+            path = "$." + orjson.dumps(key).decode()
+            query = "SELECT row, json_extract(metadata, ?) FROM chunk WHERE deleted = 0"
+            for row, value in self._connection.execute(query, (path,)):
+                column[row] = value
+            self._columns[key] = column
+        return column
+
+    def _get_filter_mask(self, filter: dict[str, Any]) -> np.ndarray:  # noqa: A002
+        mask = np.ones(self._rows, dtype=bool)
+        for key, value in filter.items():
+            column = self._get_column(key)
+            if isinstance(value, list | tuple | set):
+                mask &= np.isin(column, list(value))
+            else:
+                mask &= column == value
+        return mask
+
+    def _search_exact(
+        self, vectors: np.ndarray, queries: np.ndarray, k: int, candidates: np.ndarray
+    ) -> list[tuple[list[int], list[float]]]:
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        all_rows = len(candidates) == len(vectors)
+        for start in range(0, len(candidates), BLOCK_SIZE):
+            rows = candidates[start : start + BLOCK_SIZE]
+            # Contiguous slices of the memory map avoid copying the rows
+            block = vectors[rows[0] : rows[-1] + 1] if all_rows else vectors[rows]
+            scores = queries @ block.T
+            best_scores, best_rows = _merge_top_k(
+                best_scores, best_rows, scores, np.broadcast_to(rows, scores.shape), k
+            )
+        return self._sort_results(best_scores, best_rows)
+
+    def _search_ivf(
+        self, vectors: np.ndarray, queries: np.ndarray, k: int, mask: np.ndarray, n_probe: int
+    ) -> list[tuple[list[int], list[float]]]:
+        order, offsets = self._get_lists()
+        n_probe = min(max(n_probe, 1), len(self._centroids))
+        probes = np.argpartition(-(queries @ self._centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+        results = []
+        for query, clusters in zip(queries, probes, strict=True):
+            rows = np.concatenate([order[offsets[cluster] : offsets[cluster + 1]] for cluster in clusters])
+            rows = np.sort(rows[mask[rows]])
+            scores = vectors[rows] @ query if len(rows) else np.empty(0, dtype=np.float32)
+            best_scores, best_rows = _merge_top_k(
+                np.empty((1, 0), dtype=np.float32), np.empty((1, 0), dtype=np.int64), scores[None], rows[None], k
+            )
+            results.extend(self._sort_results(best_scores, best_rows))
+        return results
+
+    @staticmethod
+    def _sort_results(scores: np.ndarray, rows: np.ndarray) -> list[tuple[list[int], list[float]]]:
+        order = np.argsort(-scores, axis=1, kind="stable")
+        scores = np.take_along_axis(scores, order, axis=1)
+        rows = np.take_along_axis(rows, order, axis=1)
+        return [(row.tolist(), score.tolist()) for row, score in zip(rows, scores, strict=True)]
+
+    def _get_lists(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the rows of the IVF clusters, sorted by cluster, and where each cluster starts."""
+        if self._lists is None:
+            order = np.argsort(self._assignments, kind="stable")
+            offsets = np.searchsorted(self._assignments[order], np.arange(len(self._centroids) + 1))
+            self._lists = (order, offsets)
+        return self._lists
+
+    def _update_ivf(self, added: np.ndarray) -> None:
+        live = len(self._row_by_id)
+        if self._centroids is None:
+            if self.index_type == "ivf" or (self.index_type == "auto" and live >= IVF_THRESHOLD):
+                self._train_ivf()
+            return
+        # A trained index is kept in line with the rows whatever the index type it is opened with, since it is
+        # used again once the collection is opened with another index type
+        retrain = self.index_type != "flat" and live >= self._trained_rows * IVF_RETRAIN_GROWTH
+        if not retrain or not self._train_ivf():
+            self._assignments = np.concatenate([self._assignments, self._assign(added)])
+            self._lists = None
+            self._save_ivf()
+
+    def _train_ivf(self) -> bool:
+        """Trains the IVF index on the live rows, returning False if there are too few rows to cluster."""
+        live = np.flatnonzero(~self._deleted)
+        n_lists = int(np.clip(2 * np.sqrt(len(live)), 1, 16_384))
+        if len(live) < n_lists * 4:
+            return False
+        vectors = self._get_vectors()
+        rng = np.random.default_rng(0)
+        sample_size = min(n_lists * 64, KMEANS_SAMPLE_BYTES // (self.dimensions * _FLOAT32_BYTES))
+        sample_size = min(max(sample_size, n_lists), len(live))
+        sample = np.asarray(vectors[np.sort(rng.choice(live, size=sample_size, replace=False))])
+        # Spherical k-means, since vectors are normalized and compared by inner product
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            assignments = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=n_lists)
+            # Empty clusters keep their centroid
+            centroids = np.where(counts[:, None] > 0, _normalize(sums), centroids)
+        self._centroids = centroids.astype(np.float32)
+        self._assignments = np.concatenate(
+            [
+                self._assign(np.asarray(vectors[start : start + BLOCK_SIZE]))
+                for start in range(0, self._rows, BLOCK_SIZE)
+            ]
+        )
+        self._trained_rows = len(live)
+        self._lists = None
+        self._save_ivf()
+        return True
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray | None = None) -> np.ndarray:
+        centroids = self._centroids if centroids is None else centroids
+        return np.concatenate(
+            [
+                np.argmax(vectors[start : start + BLOCK_SIZE] @ centroids.T, axis=1).astype(np.int32)
+                for start in range(0, len(vectors), BLOCK_SIZE)
+            ]
+            or [np.empty(0, dtype=np.int32)]
+        )
+
+    def _save_ivf(self) -> None:
+        temporary_path = self.ivf_path.with_suffix(".tmp")
+        with temporary_path.open("wb") as file:
+            np.savez(file, centroids=self._centroids, assignments=self._assignments, trained_rows=self._trained_rows)
+        temporary_path.replace(self.ivf_path)
+
+
+class MemmapVectorStore(VectorStore):
+    """LangChain vector store over a `MemmapIndex`.
+
+    Args:
+        index: The collection.
+        embedding: The embeddings of the texts and queries.
+        n_probe: The number of IVF clusters scanned for each query.
+    """
+
+    def __init__(self, index: MemmapIndex, embedding: Embeddings, *, n_probe: int = 16) -> None:
+        self.index = index
+        self.embedding = embedding
+        self.n_probe = n_probe
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,  # noqa: ARG002
+    ) -> list[str]:
+        texts = list(texts)
+        return self.add_embeddings(texts, self.embedding.embed_documents(texts), metadatas, ids)
+
+    def add_embeddings(
+        self,
+        texts: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict] | None = None,
+        ids: list[str] | None = None,
+    ) -> list[str]:
+        """Adds texts with precomputed embeddings."""
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+        self.index.add(ids, texts, metadatas or [{} for _ in texts], embeddings)
+        return ids
+
+    def delete(self, ids: list[str] | None = None, **kwargs: Any) -> bool | None:  # noqa: ARG002
+        if ids is None:
+            return False
+        self.index.delete(ids)
+        return True
+
+    def get_by_ids(self, ids: Sequence[str], /) -> list[Document]:
+        return self.index.get(ids)
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> list[Document]:
+        return [document for document, _ in self.similarity_search_with_score(query, k, filter=filter)]
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> list[tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self.embedding.embed_query(query), k, filter=filter)
+
+    def similarity_search_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> list[Document]:
+        return [document for document, _ in self.similarity_search_with_score_by_vector(embedding, k, filter=filter)]
+
+    def similarity_search_with_score_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+    ) -> list[tuple[Document, float]]:
+        return self.index.search([embedding], k, filter=filter, n_probe=self.n_probe)[0]
+
+    def batch_similarity_search(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+    ) -> list[list[Document]]:
+        """Searches for several queries at once, scoring the rows of the collection once for all of them."""
+        embeddings = [self.embedding.embed_query(query) for query in queries]
+        results = self.index.search(embeddings, k, filter=filter, n_probe=self.n_probe)
+        return [[document for document, _ in result] for result in results]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Maps the cosine similarity to [0, 1]
+        return lambda score: (score + 1) / 2
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        persist_directory: str | Path | None = None,
+        index_type: str = "auto",
+        **kwargs: Any,
+    ) -> MemmapVectorStore:
+        if persist_directory is None:
+            msg = "persist_directory is required"
+            raise ValueError(msg)
+        vector_store = cls(MemmapIndex(persist_directory, index_type), embedding, **kwargs)
+        vector_store.add_texts(texts, metadatas, ids=ids)
+        return vector_store
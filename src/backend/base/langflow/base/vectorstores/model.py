@@ -1,18 +1,59 @@
 from abc import abstractmethod
+from concurrent import futures
 from functools import wraps
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from langflow.base.vectorstores.ledger import IngestionLedger, get_ingestion_ledger
 from langflow.custom import Component
 from langflow.field_typing import Text, VectorStore
 from langflow.helpers.data import docs_to_data
 from langflow.inputs.inputs import BoolInput
-from langflow.io import HandleInput, Output, QueryInput
+from langflow.io import HandleInput, IntInput, Output, QueryInput
 from langflow.schema import Data, DataFrame
+from langflow.services.deps import get_settings_service
 
 if TYPE_CHECKING:
     from langchain_core.documents import Document
 
 
+INGESTION_LEDGER_FILE = "ingestion_ledger.db"
+
+# Inputs of the vector store components supporting incremental ingestion
+INCREMENTAL_INGESTION_INPUTS = [
+    BoolInput(
+        name="incremental_ingestion",
+        display_name="Incremental Ingestion",
+        value=False,
+        advanced=True,
+        info="If True, a ledger of the ingested chunks is kept so only new or changed chunks are embedded and added, "
+        "and the chunks no longer produced by their source are deleted.",
+    ),
+    BoolInput(
+        name="delete_missing_sources",
+        display_name="Delete Missing Sources",
+        value=False,
+        advanced=True,
+        info="With incremental ingestion, treat the ingested data as the whole collection and delete the chunks "
+        "of sources missing from it.",
+    ),
+    IntInput(
+        name="ingest_batch_size",
+        display_name="Ingest Batch Size",
+        value=64,
+        advanced=True,
+        info="With incremental ingestion, the number of chunks embedded and added to the vector store at once.",
+    ),
+    IntInput(
+        name="ingest_max_workers",
+        display_name="Ingest Workers",
+        value=4,
+        advanced=True,
+        info="With incremental ingestion, the number of batches embedded in parallel.",
+    ),
+]
+
+
 def check_cached_vector_store(f):
     """Decorator to check for cached vector stores, and returns them if they exist.
 
@@ -55,6 +96,9 @@ class LCVectorStoreComponent(Component):
 
     trace_type = "retriever"
 
+    accepts_embeddings: bool = False
+    """Whether `add_embedded_documents` is implemented, so ingested documents are embedded in parallel batches."""
+
     inputs = [
         HandleInput(
             name="ingest_data",
@@ -121,6 +165,104 @@ class LCVectorStoreComponent(Component):
                 result.append(_input)
         return result
 
+    def get_ingestion_collection(self) -> str | None:
+        """Returns the ledger key of the collection documents are ingested into, see `get_collection_key`.
+
+        Components supporting incremental ingestion override this. None disables incremental ingestion.
+        """
+        return None
+
+    def add_embedded_documents(
+        self,
+        vector_store: VectorStore | None,
+        documents: list["Document"],
+        embeddings: list[list[float]],
+        ids: list[str] | None,
+    ) -> VectorStore:
+        """Adds documents with their embeddings to a vector store, creating it if it is None.
+
+        Components whose vector store accepts precomputed embeddings override this and set `accepts_embeddings`,
+        so ingested documents are embedded in parallel batches. Otherwise batches are added with `add_documents`.
+        """
+        msg = f"{type(self).__name__} does not accept precomputed embeddings."
+        raise NotImplementedError(msg)
+
+    def persist_vector_store(self, vector_store: VectorStore) -> None:
+        """Saves a vector store after documents were ingested, before the ingestion ledger is updated."""
+
+    def reset_ingestion_ledger(self) -> None:
+        """Forgets the chunks ingested into the collection, e.g. when it was deleted or rebuilt."""
+        collection = self.get_ingestion_collection()
+        ledger = self._get_ingestion_ledger()
+        if collection is not None and ledger is not None and ledger.path.exists():
+            ledger.reset(collection)
+
+    def ingest_documents(self, vector_store: VectorStore | None, documents: list["Document"]) -> VectorStore | None:
+        """Adds documents to a vector store.
+
+        With incremental ingestion, only the documents missing from the ingestion ledger of the collection are
+        added in batches, under ids derived from their content, and the stale chunks are deleted. Otherwise the
+        documents are added at once.
+
+        Returns:
+            The vector store, created by `add_embedded_documents` if `vector_store` was None.
+        """
+        if not getattr(self, "incremental_ingestion", False):
+            if documents and vector_store is not None:
+                vector_store.add_documents(documents)
+                self.persist_vector_store(vector_store)
+            return vector_store
+
+        collection = self.get_ingestion_collection()
+        ledger = self._get_ingestion_ledger() if collection is not None else None
+        if collection is None or ledger is None:
+            if documents:
+                vector_store = self._add_documents(vector_store, documents, None)
+                self.persist_vector_store(vector_store)
+            return vector_store
+
+        plan = ledger.plan(collection, documents, delete_missing_sources=getattr(self, "delete_missing_sources", False))
+        if plan.stale_ids and vector_store is not None:
+            vector_store.delete(ids=plan.stale_ids)
+        if plan.documents:
+            vector_store = self._add_documents(vector_store, plan.documents, plan.ids)
+        if vector_store is not None and (plan.documents or plan.stale_ids):
+            self.persist_vector_store(vector_store)
+        ledger.record(collection, plan)
+        self.log(
+            f"Added {len(plan.documents)} new or changed chunks, deleted {len(plan.stale_ids)} stale chunks "
+            f"and skipped {plan.unchanged} unchanged chunks."
+        )
+        return vector_store
+
+    def _get_ingestion_ledger(self) -> IngestionLedger | None:
+        config_dir = get_settings_service().settings.config_dir
+        if not config_dir:
+            return None
+        return get_ingestion_ledger(str(Path(config_dir) / INGESTION_LEDGER_FILE))
+
+    def _add_documents(
+        self, vector_store: VectorStore | None, documents: list["Document"], ids: list[str] | None
+    ) -> VectorStore:
+        batch_size = max(getattr(self, "ingest_batch_size", 0) or len(documents), 1)
+        batches = [slice(start, start + batch_size) for start in range(0, len(documents), batch_size)]
+        if not self.accepts_embeddings:
+            for batch in batches:
+                vector_store.add_documents(documents[batch], ids=ids[batch] if ids else None)
+            return vector_store
+
+        embedding = self.embedding
+        texts = [document.page_content for document in documents]
+        max_workers = max(getattr(self, "ingest_max_workers", 1) or 1, 1)
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Batches are embedded in parallel and added in order, since vector stores aren't thread safe
+            embedded_batches = executor.map(lambda batch: embedding.embed_documents(texts[batch]), batches)
+            for batch, embeddings in zip(batches, embedded_batches, strict=True):
+                vector_store = self.add_embedded_documents(
+                    vector_store, documents[batch], embeddings, ids[batch] if ids else None
+                )
+        return vector_store
+
     def search_with_vector_store(
         self,
         input_value: Text,
@@ -0,0 +1,264 @@
+"""Pool of vector store clients shared by the builds of all flows.
+
+Clients are keyed by the kind of vector store and a hash of the parameters they were created with, so
+secrets in the parameters are never kept in the keys. Clients idle for longer than the idle timeout are
+closed, as are the least recently used ones when the pool is full. A client failing its health check is
+closed and created again.
+
+A client is used by its owners, e.g. the components that got it, until they are garbage collected. Evicting
+a client in use removes it from the pool, and it is only closed once its last owner is gone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import orjson
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+ClientT = TypeVar("ClientT")
+
+
+def get_client_key(kind: str, params: Mapping[str, Any]) -> str:
+    """Returns the pool key of a client created with `params`."""
+    data = orjson.dumps(dict(params), option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return f"{kind}:{hashlib.sha256(data).hexdigest()}"
+
+
+def close_client(client: Any) -> None:
+    """Closes a client with its `close` method, if it has one."""
+    close = getattr(client, "close", None)
+    if callable(close):
+        close()
+
+
+@dataclass
+class PooledClient:
+    client: Any
+    close: Callable[[Any], Any] | None = None
+    health_check: Callable[[Any], Any] | None = None
+    last_used: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+    leases: dict[int, weakref.finalize] = field(default_factory=dict)
+    """The finalizers of the owners using the client, by owner id."""
+    users: int = 0
+    """The number of calls getting the client that have not returned it yet."""
+    evicted: bool = False
+    """Whether the client was removed from the pool, to be closed when it is no longer used."""
+
+    @property
+    def in_use(self) -> bool:
+        return self.users > 0 or bool(self.leases)
+
+
+class VectorStoreClientPool:
+    """A bounded pool of vector store clients.
+
+    Args:
+        max_size: The maximum number of clients in the pool.
+        idle_timeout: The number of seconds after which an unused client is closed.
+        health_check_interval: The minimum number of seconds between health checks of a client.
+    """
+
+    def __init__(self, max_size: int = 32, idle_timeout: float = 600, health_check_interval: float = 30) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._clients: OrderedDict[str, PooledClient] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(
+        self,
+        kind: str,
+        params: Mapping[str, Any],
+        factory: Callable[[], ClientT],
+        *,
+        owner: object | None = None,
+        health_check: Callable[[ClientT], Any] | None = None,
+        close: Callable[[ClientT], Any] | None = close_client,
+    ) -> ClientT:
+        """Returns the pooled client created with `params`, creating it with `factory` if needed.
+
+        Args:
+            kind: The kind of vector store, so clients of different stores never share a key.
+            params: The parameters the client is created with, including secrets.
+            factory: Creates the client.
+            owner: The object using the client. The client isn't closed until the owner is garbage collected.
+                Without an owner, the client may be closed as soon as it is evicted.
+            health_check: Checks a pooled client before reusing it. Raising or returning False means it
+                is unhealthy.
+            close: Closes the client when it is evicted.
+        """
+        key = get_client_key(kind, params)
+        now = time.monotonic()
+        with self._lock:
+            closed = self._retire(self._pop_idle(now))
+            pooled = self._clients.get(key)
+            if pooled is not None:
+                self._clients.move_to_end(key)
+                pooled.last_used = now
+                pooled.users += 1
+        self._close(closed)
+
+        if pooled is not None:
+            if pooled.health_check is None or now - pooled.last_checked < self.health_check_interval:
+                return self._lend(pooled, owner)
+            if self._is_healthy(pooled):
+                pooled.last_checked = now
+                return self._lend(pooled, owner)
+            logger.debug(f"Closing unhealthy {kind} client")
+            with self._lock:
+                if self._clients.get(key) is pooled:
+                    del self._clients[key]
+                    pooled.evicted = True
+            self._release(pooled)
+
+        # Clients are created outside the lock, so a slow connection doesn't block the other stores
+        client = factory()
+        pooled = PooledClient(client=client, close=close, health_check=health_check)
+        closed = []
+        with self._lock:
+            existing = self._clients.get(key)
+            if existing is None:
+                self._clients[key] = pooled
+                closed = self._retire(self._pop_oldest())
+            else:
+                # Another build created the same client meanwhile
+                closed = [pooled]
+                pooled = existing
+            pooled.users += 1
+        self._close(closed)
+        return self._lend(pooled, owner)
+
+    def evict(self, kind: str, params: Mapping[str, Any], *, owner: object | None = None) -> None:
+        """Removes the client created with `params`, closing it once it is no longer used.
+
+        Args:
+            kind: The kind of vector store.
+            params: The parameters the client was created with.
+            owner: An owner of the client that no longer uses it.
+        """
+        with self._lock:
+            pooled = self._clients.pop(get_client_key(kind, params), None)
+            if pooled is not None and owner is not None and (lease := pooled.leases.pop(id(owner), None)):
+                lease.detach()
+            closed = self._retire([pooled] if pooled else [])
+        self._close(closed)
+
+    def clear(self) -> None:
+        with self._lock:
+            closed = self._retire(list(self._clients.values()))
+            self._clients.clear()
+        self._close(closed)
+
+    def _lend(self, pooled: PooledClient, owner: object | None) -> Any:
+        if owner is not None:
+            with self._lock:
+                if id(owner) not in pooled.leases:
+                    pooled.leases[id(owner)] = weakref.finalize(owner, self._release, pooled, id(owner))
+        self._release(pooled)
+        return pooled.client
+
+    def _release(self, pooled: PooledClient, owner_id: int | None = None) -> None:
+        with self._lock:
+            if owner_id is None:
+                pooled.users -= 1
+            else:
+                pooled.leases.pop(owner_id, None)
+            unused = pooled.evicted and not pooled.in_use
+        if unused:
+            self._close([pooled])
+
+    @staticmethod
+    def _retire(evicted: list[PooledClient]) -> list[PooledClient]:
+        """Marks clients removed from the pool as evicted, and returns those that can be closed now."""
+        for pooled in evicted:
+            pooled.evicted = True
+        return [pooled for pooled in evicted if not pooled.in_use]
+
+    def _pop_idle(self, now: float) -> list[PooledClient]:
+        idle = [
+            key
+            for key, pooled in self._clients.items()
+            if not pooled.in_use and now - pooled.last_used > self.idle_timeout
+        ]
+        return [self._clients.pop(key) for key in idle]
+
+    def _pop_oldest(self) -> list[PooledClient]:
+        evicted = []
+        while len(self._clients) > max(self.max_size, 1):
+            evicted.append(self._clients.popitem(last=False)[1])
+        return evicted
+
+    @staticmethod
+    def _is_healthy(pooled: PooledClient) -> bool:
+        try:
+            return pooled.health_check(pooled.client) is not False
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Vector store client health check failed")
+            return False
+
+    @staticmethod
+    def _close(evicted: list[PooledClient]) -> None:
+        for pooled in evicted:
+            if pooled.close is None:
+                continue
+            try:
+                pooled.close(pooled.client)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error closing vector store client")
+
+
+@cache
+def _get_pool(max_size: int, idle_timeout: float, health_check_interval: float) -> VectorStoreClientPool:
+    return VectorStoreClientPool(max_size, idle_timeout, health_check_interval)
+
+
+def get_vector_store_client_pool() -> VectorStoreClientPool | None:
+    """Returns the vector store client pool of the process, or None if pooling is disabled."""
+    settings = get_settings_service().settings
+    if not settings.vector_store_client_pool:
+        return None
+    return _get_pool(
+        settings.vector_store_client_pool_size,
+        settings.vector_store_client_idle_timeout,
+        settings.vector_store_client_health_check_interval,
+    )
+
+
+def get_pooled_client(
+    kind: str,
+    params: Mapping[str, Any],
+    factory: Callable[[], ClientT],
+    *,
+    owner: object | None = None,
+    health_check: Callable[[ClientT], Any] | None = None,
+    close: Callable[[ClientT], Any] | None = close_client,
+) -> ClientT:
+    """Returns a client from the vector store client pool, or a new client if pooling is disabled."""
+    pool = get_vector_store_client_pool()
+    if pool is None:
+        return factory()
+    return pool.get(kind, params, factory, owner=owner, health_check=health_check, close=close)
+
+
+def evict_pooled_client(kind: str, params: Mapping[str, Any], *, owner: object | None = None) -> None:
+    """Removes the pooled client created with `params`, if any, closing it once it is no longer used."""
+    pool = get_vector_store_client_pool()
+    if pool is not None:
+        pool.evict(kind, params, owner=owner)
@@ -1,11 +1,29 @@
-from .add_content_to_page import AddContentToPage
-from .create_page import NotionPageCreator
-from .list_database_properties import NotionDatabaseProperties
-from .list_pages import NotionListPages
-from .list_users import NotionUserList
-from .page_content_viewer import NotionPageContent
-from .search import NotionSearch
-from .update_page_property import NotionPageUpdate
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .add_content_to_page import AddContentToPage
+    from .create_page import NotionPageCreator
+    from .list_database_properties import NotionDatabaseProperties
+    from .list_pages import NotionListPages
+    from .list_users import NotionUserList
+    from .page_content_viewer import NotionPageContent
+    from .search import NotionSearch
+    from .update_page_property import NotionPageUpdate
+
+_dynamic_imports = {
+    "AddContentToPage": "add_content_to_page",
+    "NotionDatabaseProperties": "list_database_properties",
+    "NotionListPages": "list_pages",
+    "NotionPageContent": "page_content_viewer",
+    "NotionPageCreator": "create_page",
+    "NotionPageUpdate": "update_page_property",
+    "NotionSearch": "search",
+    "NotionUserList": "list_users",
+}
 
 __all__ = [
     "AddContentToPage",
@@ -17,3 +35,11 @@ __all__ = [
     "NotionSearch",
     "NotionUserList",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,3 +1,24 @@
-from .agentql_api import AgentQL
+from __future__ import annotations
 
-__all__ = ["AgentQL"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .agentql_api import AgentQL
+
+_dynamic_imports = {
+    "AgentQL": "agentql_api",
+}
+
+__all__ = [
+    "AgentQL",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,5 +1,30 @@
-from .amazon_bedrock_embedding import AmazonBedrockEmbeddingsComponent
-from .amazon_bedrock_model import AmazonBedrockComponent
-from .s3_bucket_uploader import S3BucketUploaderComponent
+from __future__ import annotations
 
-__all__ = ["AmazonBedrockComponent", "AmazonBedrockEmbeddingsComponent", "S3BucketUploaderComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .amazon_bedrock_embedding import AmazonBedrockEmbeddingsComponent
+    from .amazon_bedrock_model import AmazonBedrockComponent
+    from .s3_bucket_uploader import S3BucketUploaderComponent
+
+_dynamic_imports = {
+    "AmazonBedrockComponent": "amazon_bedrock_model",
+    "AmazonBedrockEmbeddingsComponent": "amazon_bedrock_embedding",
+    "S3BucketUploaderComponent": "s3_bucket_uploader",
+}
+
+__all__ = [
+    "AmazonBedrockComponent",
+    "AmazonBedrockEmbeddingsComponent",
+    "S3BucketUploaderComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
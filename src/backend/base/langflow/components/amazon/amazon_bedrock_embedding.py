@@ -1,3 +1,4 @@
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.aws_constants import AWS_EMBEDDING_MODEL_IDS, AWS_REGIONS
 from langflow.base.models.model import LCModelComponent
 from langflow.field_typing import Embeddings
@@ -71,6 +72,7 @@ class AmazonBedrockEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         try:
             from langchain_aws import BedrockEmbeddings
@@ -1,5 +1,24 @@
-from .apify_actor import ApifyActorsComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .apify_actor import ApifyActorsComponent
+
+_dynamic_imports = {
+    "ApifyActorsComponent": "apify_actor",
+}
 
 __all__ = [
     "ApifyActorsComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
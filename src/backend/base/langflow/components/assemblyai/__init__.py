@@ -1,8 +1,23 @@
-from .assemblyai_get_subtitles import AssemblyAIGetSubtitles
-from .assemblyai_lemur import AssemblyAILeMUR
-from .assemblyai_list_transcripts import AssemblyAIListTranscripts
-from .assemblyai_poll_transcript import AssemblyAITranscriptionJobPoller
-from .assemblyai_start_transcript import AssemblyAITranscriptionJobCreator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .assemblyai_get_subtitles import AssemblyAIGetSubtitles
+    from .assemblyai_lemur import AssemblyAILeMUR
+    from .assemblyai_list_transcripts import AssemblyAIListTranscripts
+    from .assemblyai_poll_transcript import AssemblyAITranscriptionJobPoller
+    from .assemblyai_start_transcript import AssemblyAITranscriptionJobCreator
+
+_dynamic_imports = {
+    "AssemblyAIGetSubtitles": "assemblyai_get_subtitles",
+    "AssemblyAILeMUR": "assemblyai_lemur",
+    "AssemblyAIListTranscripts": "assemblyai_list_transcripts",
+    "AssemblyAITranscriptionJobCreator": "assemblyai_start_transcript",
+    "AssemblyAITranscriptionJobPoller": "assemblyai_poll_transcript",
+}
 
 __all__ = [
     "AssemblyAIGetSubtitles",
@@ -11,3 +26,11 @@ __all__ = [
     "AssemblyAITranscriptionJobCreator",
     "AssemblyAITranscriptionJobPoller",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,11 +1,29 @@
-from .astra_assistant_manager import AstraAssistantManager
-from .create_assistant import AssistantsCreateAssistant
-from .create_thread import AssistantsCreateThread
-from .dotenv import Dotenv
-from .get_assistant import AssistantsGetAssistantName
-from .getenvvar import GetEnvVar
-from .list_assistants import AssistantsListAssistants
-from .run import AssistantsRun
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .astra_assistant_manager import AstraAssistantManager
+    from .create_assistant import AssistantsCreateAssistant
+    from .create_thread import AssistantsCreateThread
+    from .dotenv import Dotenv
+    from .get_assistant import AssistantsGetAssistantName
+    from .getenvvar import GetEnvVar
+    from .list_assistants import AssistantsListAssistants
+    from .run import AssistantsRun
+
+_dynamic_imports = {
+    "AssistantsCreateAssistant": "create_assistant",
+    "AssistantsCreateThread": "create_thread",
+    "AssistantsGetAssistantName": "get_assistant",
+    "AssistantsListAssistants": "list_assistants",
+    "AssistantsRun": "run",
+    "AstraAssistantManager": "astra_assistant_manager",
+    "Dotenv": "dotenv",
+    "GetEnvVar": "getenvvar",
+}
 
 __all__ = [
     "AssistantsCreateAssistant",
@@ -17,3 +35,11 @@ __all__ = [
     "Dotenv",
     "GetEnvVar",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,3 +1,24 @@
-from .cohere_rerank import CohereRerankComponent
+from __future__ import annotations
 
-__all__ = ["CohereRerankComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .cohere_rerank import CohereRerankComponent
+
+_dynamic_imports = {
+    "CohereRerankComponent": "cohere_rerank",
+}
+
+__all__ = [
+    "CohereRerankComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
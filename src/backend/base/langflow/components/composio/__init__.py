@@ -1,7 +1,21 @@
-from .composio_api import ComposioAPIComponent
-from .gmail_composio import ComposioGmailAPIComponent
-from .googlecalendar_composio import ComposioGoogleCalendarAPIComponent
-from .slack_composio import ComposioSlackAPIComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .composio_api import ComposioAPIComponent
+    from .gmail_composio import ComposioGmailAPIComponent
+    from .googlecalendar_composio import ComposioGoogleCalendarAPIComponent
+    from .slack_composio import ComposioSlackAPIComponent
+
+_dynamic_imports = {
+    "ComposioAPIComponent": "composio_api",
+    "ComposioGmailAPIComponent": "gmail_composio",
+    "ComposioGoogleCalendarAPIComponent": "googlecalendar_composio",
+    "ComposioSlackAPIComponent": "slack_composio",
+}
 
 __all__ = [
     "ComposioAPIComponent",
@@ -9,3 +23,11 @@ __all__ = [
     "ComposioGoogleCalendarAPIComponent",
     "ComposioSlackAPIComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,9 +1,25 @@
-from .crewai import CrewAIAgentComponent
-from .hierarchical_crew import HierarchicalCrewComponent
-from .hierarchical_task import HierarchicalTaskComponent
-from .sequential_crew import SequentialCrewComponent
-from .sequential_task import SequentialTaskComponent
-from .sequential_task_agent import SequentialTaskAgentComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .crewai import CrewAIAgentComponent
+    from .hierarchical_crew import HierarchicalCrewComponent
+    from .hierarchical_task import HierarchicalTaskComponent
+    from .sequential_crew import SequentialCrewComponent
+    from .sequential_task import SequentialTaskComponent
+    from .sequential_task_agent import SequentialTaskAgentComponent
+
+_dynamic_imports = {
+    "CrewAIAgentComponent": "crewai",
+    "HierarchicalCrewComponent": "hierarchical_crew",
+    "HierarchicalTaskComponent": "hierarchical_task",
+    "SequentialCrewComponent": "sequential_crew",
+    "SequentialTaskAgentComponent": "sequential_task_agent",
+    "SequentialTaskComponent": "sequential_task",
+}
 
 __all__ = [
     "CrewAIAgentComponent",
@@ -13,3 +29,11 @@ __all__ = [
     "SequentialTaskAgentComponent",
     "SequentialTaskComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
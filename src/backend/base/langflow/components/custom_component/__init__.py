@@ -1,5 +1,24 @@
-from .custom_component import CustomComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .custom_component import CustomComponent
+
+_dynamic_imports = {
+    "CustomComponent": "custom_component",
+}
 
 __all__ = [
     "CustomComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,11 +1,29 @@
-from .api_request import APIRequestComponent
-from .csv_to_data import CSVToDataComponent
-from .directory import DirectoryComponent
-from .file import FileComponent
-from .json_to_data import JSONToDataComponent
-from .sql_executor import SQLComponent
-from .url import URLComponent
-from .webhook import WebhookComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .api_request import APIRequestComponent
+    from .csv_to_data import CSVToDataComponent
+    from .directory import DirectoryComponent
+    from .file import FileComponent
+    from .json_to_data import JSONToDataComponent
+    from .sql_executor import SQLComponent
+    from .url import URLComponent
+    from .webhook import WebhookComponent
+
+_dynamic_imports = {
+    "APIRequestComponent": "api_request",
+    "CSVToDataComponent": "csv_to_data",
+    "DirectoryComponent": "directory",
+    "FileComponent": "file",
+    "JSONToDataComponent": "json_to_data",
+    "SQLComponent": "sql_executor",
+    "URLComponent": "url",
+    "WebhookComponent": "webhook",
+}
 
 __all__ = [
     "APIRequestComponent",
@@ -17,3 +35,11 @@ __all__ = [
     "URLComponent",
     "WebhookComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
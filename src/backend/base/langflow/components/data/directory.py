@@ -1,10 +1,27 @@
-from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data, retrieve_file_paths
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+
+from langflow.base.data.base_file import PARSE_LIMIT_INPUTS
+from langflow.base.data.manifest import DirectoryManifest, FileState, get_directory_manifest
+from langflow.base.data.utils import (
+    PROCESS_FILE_TYPES,
+    TEXT_FILE_TYPES,
+    iter_load_data,
+    parallel_load_data,
+    parse_text_file_to_data,
+    retrieve_file_paths,
+)
+from langflow.base.vectorstores.ledger import get_collection_key
 from langflow.custom import Component
 from langflow.io import BoolInput, IntInput, MessageTextInput, MultiselectInput
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
+from langflow.services.deps import get_settings_service
 from langflow.template import Output
 
+DIRECTORY_MANIFEST_FILE = "directory_manifest.db"
+
 
 class DirectoryComponent(Component):
     display_name = "Directory"
@@ -64,6 +81,30 @@ class DirectoryComponent(Component):
             advanced=True,
             info="If true, multithreading will be used.",
         ),
+        BoolInput(
+            name="use_process_pool",
+            display_name="Parse Documents in Processes",
+            advanced=True,
+            info="If true, PDF and DOCX files are parsed in a shared pool of worker processes, using all cores, and "
+            "the other files are read in threads. Up to 'Max Concurrency' files are loaded at once.",
+        ),
+        *PARSE_LIMIT_INPUTS,
+        BoolInput(
+            name="incremental",
+            display_name="Incremental",
+            advanced=True,
+            info="If true, only the files that are new or were modified since the last run of this component are "
+            "parsed, and the data of the others is read from a manifest of their size, modification time, hash "
+            "and data. All the files of the directory are still output.",
+        ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            advanced=True,
+            info="The number of files loaded at a time. Only the data of one batch is held while files are loaded "
+            "in parallel, and the progress is logged after each batch.",
+            value=256,
+        ),
     ]
 
     outputs = [
@@ -99,15 +140,82 @@ class DirectoryComponent(Component):
             resolved_path, load_hidden=load_hidden, recursive=recursive, depth=depth, types=valid_types
         )
 
-        loaded_data = []
-        if use_multithreading:
-            loaded_data = parallel_load_data(file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency)
+        if self.incremental or self.use_process_pool:
+            valid_data = [data for batch in self.iter_batches(file_paths, resolved_path) for data in batch]
         else:
-            loaded_data = [parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in file_paths]
+            loaded_data = []
+            if use_multithreading:
+                loaded_data = parallel_load_data(
+                    file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency
+                )
+            else:
+                loaded_data = [
+                    parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in file_paths
+                ]
 
-        valid_data = [x for x in loaded_data if x is not None and isinstance(x, Data)]
+            valid_data = [x for x in loaded_data if x is not None and isinstance(x, Data)]
         self.status = valid_data
         return valid_data
 
+    def iter_batches(self, file_paths: list[str], resolved_path: str) -> Iterator[list[Data]]:
+        """Loads files, yielding their data a batch of files at a time.
+
+        With the incremental option, only new or modified files are parsed, and the files of each batch are
+        recorded in the manifest once the batch is yielded. The data of the other files is read from the
+        manifest, so every file of `file_paths` is yielded.
+        """
+        manifest = self._get_manifest() if self.incremental else None
+        scan = self._get_scan_key(resolved_path)
+        states: list[FileState | None] = [None] * len(file_paths)
+        if manifest is not None:
+            changes = manifest.get_changes(scan, file_paths)
+            stored = [Data(**data) for data in changes.unchanged.values()]
+            batch_size = max(self.batch_size or len(stored), 1)
+            for start in range(0, len(stored), batch_size):
+                yield stored[start : start + batch_size]
+            states = list(changes.changed)
+            file_paths = [state.path for state in changes.changed]
+
+        if self.use_process_pool or self.use_multithreading:
+            loaded_data = iter_load_data(
+                file_paths,
+                silent_errors=self.silent_errors,
+                max_concurrency=self.max_concurrency,
+                process_file_types=PROCESS_FILE_TYPES if self.use_process_pool else (),
+                timeout=self.parse_timeout or None,
+                memory_limit=(self.parse_memory_limit or 0) * 1024 * 1024 or None,
+            )
+        else:
+            loaded_data = (
+                parse_text_file_to_data(file_path, silent_errors=self.silent_errors) for file_path in file_paths
+            )
+
+        batch_size = max(self.batch_size or len(file_paths), 1)
+        files = zip(states, loaded_data, strict=True)
+        loaded = 0
+        while batch := list(islice(files, batch_size)):
+            loaded += len(batch)
+            self.log(f"Loaded {loaded}/{len(file_paths)} files", name="Progress")
+            yield [data for _, data in batch if isinstance(data, Data)]
+            if manifest is not None:
+                manifest.record(
+                    scan,
+                    {state: data.model_dump() for state, data in batch if state is not None and isinstance(data, Data)},
+                )
+
+    def _get_manifest(self) -> DirectoryManifest | None:
+        config_dir = get_settings_service().settings.config_dir
+        if not config_dir:
+            return None
+        return get_directory_manifest(str(Path(config_dir) / DIRECTORY_MANIFEST_FILE))
+
+    def _get_scan_key(self, resolved_path: str) -> str:
+        """Returns the manifest key of the files of this component.
+
+        Other components scan the directory on their own.
+        """
+        flow_id = getattr(self.graph, "flow_id", None)
+        return get_collection_key(str(flow_id or ""), self._id, str(Path(resolved_path).resolve()))
+
     def as_dataframe(self) -> DataFrame:
         return DataFrame(self.load_directory())
@@ -1,5 +1,10 @@
 from langflow.base.data import BaseFileComponent
-from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
+from langflow.base.data.utils import (
+    PROCESS_FILE_TYPES,
+    TEXT_FILE_TYPES,
+    parallel_load_data,
+    parse_text_file_to_data,
+)
 from langflow.io import BoolInput, IntInput
 from langflow.schema import Data
 
@@ -20,6 +25,7 @@ class FileComponent(BaseFileComponent):
 
     inputs = [
         *BaseFileComponent._base_inputs,
+        *BaseFileComponent._process_pool_inputs,
         BoolInput(
             name="use_multithreading",
             display_name="[Deprecated] Use Multithreading",
@@ -41,7 +47,7 @@ class FileComponent(BaseFileComponent):
     ]
 
     def process_files(self, file_list: list[BaseFileComponent.BaseFile]) -> list[BaseFileComponent.BaseFile]:
-        """Processes files either sequentially or in parallel, depending on concurrency settings.
+        """Processes files sequentially, in threads or in processes, depending on concurrency settings.
 
         Args:
             file_list (list[BaseFileComponent.BaseFile]): List of files to process.
@@ -71,6 +77,9 @@ class FileComponent(BaseFileComponent):
             msg = "No files to process."
             raise ValueError(msg)
 
+        if self.use_process_pool:
+            return self.process_files_in_pool(file_list, parse_text_file_to_data, process_file_types=PROCESS_FILE_TYPES)
+
         concurrency = 1 if not self.use_multithreading else max(1, self.concurrency_multithreading)
         file_count = len(file_list)
 
@@ -1,20 +1,47 @@
-from .aiml import AIMLEmbeddingsComponent
-from .astra_vectorize import AstraVectorizeComponent
-from .azure_openai import AzureOpenAIEmbeddingsComponent
-from .cloudflare import CloudflareWorkersAIEmbeddingsComponent
-from .cohere import CohereEmbeddingsComponent
-from .embedding_model import EmbeddingModelComponent
-from .google_generative_ai import GoogleGenerativeAIEmbeddingsComponent
-from .huggingface_inference_api import HuggingFaceInferenceAPIEmbeddingsComponent
-from .lmstudioembeddings import LMStudioEmbeddingsComponent
-from .mistral import MistralAIEmbeddingsComponent
-from .nvidia import NVIDIAEmbeddingsComponent
-from .ollama import OllamaEmbeddingsComponent
-from .openai import OpenAIEmbeddingsComponent
-from .similarity import EmbeddingSimilarityComponent
-from .text_embedder import TextEmbedderComponent
-from .vertexai import VertexAIEmbeddingsComponent
-from .watsonx import WatsonxEmbeddingsComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .aiml import AIMLEmbeddingsComponent
+    from .astra_vectorize import AstraVectorizeComponent
+    from .azure_openai import AzureOpenAIEmbeddingsComponent
+    from .cloudflare import CloudflareWorkersAIEmbeddingsComponent
+    from .cohere import CohereEmbeddingsComponent
+    from .embedding_model import EmbeddingModelComponent
+    from .google_generative_ai import GoogleGenerativeAIEmbeddingsComponent
+    from .huggingface_inference_api import HuggingFaceInferenceAPIEmbeddingsComponent
+    from .lmstudioembeddings import LMStudioEmbeddingsComponent
+    from .mistral import MistralAIEmbeddingsComponent
+    from .nvidia import NVIDIAEmbeddingsComponent
+    from .ollama import OllamaEmbeddingsComponent
+    from .openai import OpenAIEmbeddingsComponent
+    from .similarity import EmbeddingSimilarityComponent
+    from .text_embedder import TextEmbedderComponent
+    from .vertexai import VertexAIEmbeddingsComponent
+    from .watsonx import WatsonxEmbeddingsComponent
+
+_dynamic_imports = {
+    "AIMLEmbeddingsComponent": "aiml",
+    "AstraVectorizeComponent": "astra_vectorize",
+    "AzureOpenAIEmbeddingsComponent": "azure_openai",
+    "CloudflareWorkersAIEmbeddingsComponent": "cloudflare",
+    "CohereEmbeddingsComponent": "cohere",
+    "EmbeddingModelComponent": "embedding_model",
+    "EmbeddingSimilarityComponent": "similarity",
+    "GoogleGenerativeAIEmbeddingsComponent": "google_generative_ai",
+    "HuggingFaceInferenceAPIEmbeddingsComponent": "huggingface_inference_api",
+    "LMStudioEmbeddingsComponent": "lmstudioembeddings",
+    "MistralAIEmbeddingsComponent": "mistral",
+    "NVIDIAEmbeddingsComponent": "nvidia",
+    "OllamaEmbeddingsComponent": "ollama",
+    "OpenAIEmbeddingsComponent": "openai",
+    "TextEmbedderComponent": "text_embedder",
+    "VertexAIEmbeddingsComponent": "vertexai",
+    "WatsonxEmbeddingsComponent": "watsonx",
+}
 
 __all__ = [
     "AIMLEmbeddingsComponent",
@@ -35,3 +62,11 @@ __all__ = [
     "VertexAIEmbeddingsComponent",
     "WatsonxEmbeddingsComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,5 +1,6 @@
 from langchain_openai import AzureOpenAIEmbeddings
 
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.model import LCModelComponent
 from langflow.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from langflow.field_typing import Embeddings
@@ -66,6 +67,7 @@ class AzureOpenAIEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         try:
             embeddings = AzureOpenAIEmbeddings(
@@ -1,5 +1,6 @@
 from langchain_community.embeddings.cloudflare_workersai import CloudflareWorkersAIEmbeddings
 
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.model import LCModelComponent
 from langflow.field_typing import Embeddings
 from langflow.io import BoolInput, DictInput, IntInput, MessageTextInput, Output, SecretStrInput
@@ -63,6 +64,7 @@ class CloudflareWorkersAIEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         try:
             embeddings = CloudflareWorkersAIEmbeddings(
@@ -3,6 +3,7 @@ from typing import Any
 import cohere
 from langchain_cohere import CohereEmbeddings
 
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.model import LCModelComponent
 from langflow.field_typing import Embeddings
 from langflow.io import DropdownInput, FloatInput, IntInput, MessageTextInput, Output, SecretStrInput
@@ -42,6 +43,7 @@ class CohereEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         data = None
         try:
@@ -6,6 +6,7 @@ from langchain_core.embeddings import Embeddings
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_google_genai._common import GoogleGenerativeAIError
 
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.custom import Component
 from langflow.io import MessageTextInput, Output, SecretStrInput
 
@@ -36,6 +37,7 @@ class GoogleGenerativeAIEmbeddingsComponent(Component):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         if not self.api_key:
             msg = "API Key is required"
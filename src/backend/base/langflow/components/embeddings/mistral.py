@@ -1,6 +1,7 @@
 from langchain_mistralai.embeddings import MistralAIEmbeddings
 from pydantic.v1 import SecretStr
 
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.model import LCModelComponent
 from langflow.field_typing import Embeddings
 from langflow.io import DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
@@ -41,6 +42,7 @@ class MistralAIEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         if not self.mistral_api_key:
             msg = "Mistral API Key is required"
@@ -4,6 +4,7 @@ from urllib.parse import urljoin
 import httpx
 from langchain_ollama import OllamaEmbeddings
 
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.model import LCModelComponent
 from langflow.base.models.ollama_constants import OLLAMA_EMBEDDING_MODELS, URL_LIST
 from langflow.field_typing import Embeddings
@@ -42,6 +43,7 @@ class OllamaEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         try:
             output = OllamaEmbeddings(model=self.model_name, base_url=self.base_url)
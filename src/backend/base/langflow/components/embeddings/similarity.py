@@ -1,20 +1,28 @@
 import numpy as np
 
 from langflow.custom import Component
-from langflow.io import DataInput, DropdownInput, Output
-from langflow.schema import Data
+from langflow.io import DataInput, DropdownInput, IntInput, MessageTextInput, Output
+from langflow.schema import Data, DataFrame
+
+# The number of float32 values a chunk of the Manhattan distance computation may hold at once
+MANHATTAN_CHUNK_ELEMENTS = 16 * 1024 * 1024
 
 
 class EmbeddingSimilarityComponent(Component):
     display_name: str = "Embedding Similarity"
-    description: str = "Compute selected form of similarity between two embedding vectors."
+    description: str = (
+        "Compute selected form of similarity between two embedding vectors, "
+        "or between all the vectors of a batch at once."
+    )
     icon = "equal"
 
     inputs = [
         DataInput(
             name="embedding_vectors",
             display_name="Embedding Vectors",
-            info="A list containing exactly two data objects with embedding vectors to compare.",
+            info="A list containing exactly two data objects with embedding vectors to compare. "
+            "The Similarity Matrix output accepts any number of vectors, or a DataFrame.",
+            input_types=["Data", "DataFrame"],
             is_list=True,
             required=True,
         ),
@@ -25,22 +33,55 @@ class EmbeddingSimilarityComponent(Component):
             options=["Cosine Similarity", "Euclidean Distance", "Manhattan Distance"],
             value="Cosine Similarity",
         ),
+        DataInput(
+            name="query_vectors",
+            display_name="Query Vectors",
+            info="For the Similarity Matrix output, compare these vectors with the Embedding Vectors instead of "
+            "comparing all pairs of Embedding Vectors.",
+            input_types=["Data", "DataFrame"],
+            is_list=True,
+            advanced=True,
+        ),
+        IntInput(
+            name="top_k",
+            display_name="Top K",
+            info="For the Similarity Matrix output, only keep the K most similar vectors of each vector. "
+            "0 keeps every pair.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="For the Similarity Matrix output, the number of vectors compared at once, to bound memory use.",
+            value=1024,
+            advanced=True,
+        ),
+        MessageTextInput(
+            name="embeddings_key",
+            display_name="Embeddings Key",
+            info="The key or column of the embedding vectors.",
+            value="embeddings",
+            advanced=True,
+        ),
     ]
 
     outputs = [
         Output(display_name="Similarity Data", name="similarity_data", method="compute_similarity"),
+        Output(display_name="Similarity Matrix", name="similarity_matrix", method="compute_similarity_matrix"),
     ]
 
     def compute_similarity(self) -> Data:
-        embedding_vectors: list[Data] = self.embedding_vectors
+        embedding_vectors: list[Data] = self._to_data_list(self.embedding_vectors)
 
         # Assert that the list contains exactly two Data objects
         if len(embedding_vectors) != 2:  # noqa: PLR2004
             msg = "Exactly two embedding vectors are required."
             raise ValueError(msg)
 
-        embedding_1 = np.array(embedding_vectors[0].data["embeddings"])
-        embedding_2 = np.array(embedding_vectors[1].data["embeddings"])
+        embeddings_key = self.embeddings_key or "embeddings"
+        embedding_1 = np.array(embedding_vectors[0].data[embeddings_key])
+        embedding_2 = np.array(embedding_vectors[1].data[embeddings_key])
 
         if embedding_1.shape != embedding_2.shape:
             similarity_score = {"error": "Embeddings must have the same dimensions."}
@@ -62,8 +103,8 @@ class EmbeddingSimilarityComponent(Component):
         # Create a Data object to encapsulate the similarity score and additional information
         similarity_data = Data(
             data={
-                "embedding_1": embedding_vectors[0].data["embeddings"],
-                "embedding_2": embedding_vectors[1].data["embeddings"],
+                "embedding_1": embedding_vectors[0].data[embeddings_key],
+                "embedding_2": embedding_vectors[1].data[embeddings_key],
                 "similarity_score": similarity_score,
             },
             text_key="similarity_score",
@@ -71,3 +112,122 @@ class EmbeddingSimilarityComponent(Component):
 
         self.status = similarity_data
         return similarity_data
+
+    def compute_similarity_matrix(self) -> DataFrame:
+        """Computes the similarity of all pairs of vectors, or of each query vector with every vector.
+
+        Scores are computed in float32, a chunk of vectors at a time.
+        """
+        corpus = self._to_data_list(self.embedding_vectors)
+        queries = self._to_data_list(self.query_vectors) if self.query_vectors else None
+        all_pairs = queries is None
+        queries = corpus if queries is None else queries
+
+        corpus_vectors = self._get_vectors(corpus)
+        query_vectors = self._get_vectors(queries)
+        if corpus_vectors.shape[1] != query_vectors.shape[1]:
+            msg = "Embeddings must have the same dimensions."
+            raise ValueError(msg)
+
+        metric = self.similarity_metric
+        column = metric.lower().replace(" ", "_")
+        # Higher cosine similarities and lower distances are more similar
+        higher_is_closer = metric == "Cosine Similarity"
+        if higher_is_closer:
+            corpus_vectors = self._normalize(corpus_vectors)
+            query_vectors = self._normalize(query_vectors)
+        top_k = min(self.top_k or 0, len(corpus) - (1 if all_pairs else 0))
+        chunk_size = max(self.chunk_size or 1, 1)
+
+        sources, targets, scores = [], [], []
+        for start in range(0, len(query_vectors), chunk_size):
+            chunk_scores = self._score(query_vectors[start : start + chunk_size], corpus_vectors, metric)
+            rows = np.arange(start, start + len(chunk_scores))
+            if top_k > 0:
+                if all_pairs:
+                    # A vector is not its own neighbor
+                    chunk_scores[np.arange(len(rows)), rows] = -np.inf if higher_is_closer else np.inf
+                ordered = -chunk_scores if higher_is_closer else chunk_scores
+                top = np.argpartition(ordered, top_k - 1, axis=1)[:, :top_k]
+                top = np.take_along_axis(top, np.argsort(np.take_along_axis(ordered, top, axis=1), axis=1), axis=1)
+                chunk_sources = np.repeat(rows, top_k)
+                chunk_targets = top.ravel()
+            elif all_pairs:
+                # Each pair once
+                chunk_sources, chunk_targets = np.nonzero(np.arange(len(corpus))[None, :] > rows[:, None])
+                chunk_sources = chunk_sources + start
+            else:
+                chunk_sources = np.repeat(rows, len(corpus))
+                chunk_targets = np.tile(np.arange(len(corpus)), len(rows))
+            sources.append(chunk_sources)
+            targets.append(chunk_targets)
+            scores.append(chunk_scores[chunk_sources - start, chunk_targets])
+
+        sources = np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+        targets = np.concatenate(targets) if targets else np.empty(0, dtype=np.int64)
+        result = DataFrame(
+            {
+                "source_index": sources,
+                "target_index": targets,
+                "source_text": [queries[index].get_text() for index in sources],
+                "target_text": [corpus[index].get_text() for index in targets],
+                column: np.concatenate(scores) if scores else np.empty(0, dtype=np.float32),
+            }
+        )
+        self.status = f"{len(result)} scores"
+        return result
+
+    @staticmethod
+    def _to_data_list(value) -> list[Data]:
+        if not isinstance(value, list):
+            value = [value]
+        data_list = []
+        for item in value:
+            if isinstance(item, DataFrame):
+                data_list.extend(item.to_data_list())
+            elif item is not None:
+                data_list.append(item)
+        return data_list
+
+    def _get_vectors(self, data_list: list[Data]) -> np.ndarray:
+        embeddings_key = self.embeddings_key or "embeddings"
+        if not data_list:
+            msg = "At least one embedding vector is required."
+            raise ValueError(msg)
+        try:
+            vectors = np.asarray([data.data[embeddings_key] for data in data_list], dtype=np.float32)
+        except KeyError as e:
+            msg = f"Data without the '{embeddings_key}' key."
+            raise ValueError(msg) from e
+        except ValueError as e:
+            msg = "Embeddings must have the same dimensions."
+            raise ValueError(msg) from e
+        if vectors.ndim != 2:  # noqa: PLR2004
+            msg = "Embeddings must be lists of numbers."
+            raise ValueError(msg)
+        return vectors
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
+
+    @staticmethod
+    def _score(queries: np.ndarray, corpus: np.ndarray, metric: str) -> np.ndarray:
+        """Returns the scores of each query with each vector of the corpus, as a matrix."""
+        if metric == "Cosine Similarity":
+            # Vectors are normalized
+            return queries @ corpus.T
+        if metric == "Euclidean Distance":
+            squared = (queries**2).sum(axis=1)[:, None] + (corpus**2).sum(axis=1)[None, :] - 2 * (queries @ corpus.T)
+            return np.sqrt(np.maximum(squared, 0))
+        # The difference of every pair is materialized, so the corpus is split to bound memory use
+        step = max(MANHATTAN_CHUNK_ELEMENTS // max(len(queries) * corpus.shape[1], 1), 1)
+        return np.concatenate(
+            [
+                np.abs(queries[:, None, :] - corpus[None, start : start + step, :]).sum(axis=2)
+                for start in range(0, len(corpus), step)
+            ],
+            axis=1,
+        )
@@ -1,6 +1,7 @@
 import logging
 from typing import TYPE_CHECKING
 
+from langflow.base.embeddings.cache import get_component_user_id, with_embedding_cache
 from langflow.custom import Component
 from langflow.io import HandleInput, MessageInput, Output
 from langflow.schema import Data
@@ -35,7 +36,8 @@ class TextEmbedderComponent(Component):
 
     def generate_embeddings(self) -> Data:
         try:
-            embedding_model: Embeddings = self.embedding_model
+            # Embeddings built by embedding components are already cached
+            embedding_model: Embeddings = with_embedding_cache(self.embedding_model, get_component_user_id(self))
             message: Message = self.message
 
             # Combine validation checks to reduce nesting
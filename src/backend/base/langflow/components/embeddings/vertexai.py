@@ -1,3 +1,4 @@
+from langflow.base.embeddings.cache import use_embedding_cache
 from langflow.base.models.model import LCModelComponent
 from langflow.field_typing import Embeddings
 from langflow.io import BoolInput, FileInput, FloatInput, IntInput, MessageTextInput, Output
@@ -36,6 +37,7 @@ class VertexAIEmbeddingsComponent(LCModelComponent):
         Output(display_name="Embeddings", name="embeddings", method="build_embeddings"),
     ]
 
+    @use_embedding_cache
     def build_embeddings(self) -> Embeddings:
         try:
             from langchain_google_vertexai import VertexAIEmbeddings
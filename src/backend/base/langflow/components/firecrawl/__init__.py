@@ -1,6 +1,33 @@
-from .firecrawl_crawl_api import FirecrawlCrawlApi
-from .firecrawl_extract_api import FirecrawlExtractApi
-from .firecrawl_map_api import FirecrawlMapApi
-from .firecrawl_scrape_api import FirecrawlScrapeApi
+from __future__ import annotations
 
-__all__ = ["FirecrawlCrawlApi", "FirecrawlExtractApi", "FirecrawlMapApi", "FirecrawlScrapeApi"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .firecrawl_crawl_api import FirecrawlCrawlApi
+    from .firecrawl_extract_api import FirecrawlExtractApi
+    from .firecrawl_map_api import FirecrawlMapApi
+    from .firecrawl_scrape_api import FirecrawlScrapeApi
+
+_dynamic_imports = {
+    "FirecrawlCrawlApi": "firecrawl_crawl_api",
+    "FirecrawlExtractApi": "firecrawl_extract_api",
+    "FirecrawlMapApi": "firecrawl_map_api",
+    "FirecrawlScrapeApi": "firecrawl_scrape_api",
+}
+
+__all__ = [
+    "FirecrawlCrawlApi",
+    "FirecrawlExtractApi",
+    "FirecrawlMapApi",
+    "FirecrawlScrapeApi",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,5 +1,24 @@
-from .forecast_epidemiology_TB import ForecastEpidemiologyTB
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .forecast_epidemiology_TB import ForecastEpidemiologyTB
+
+_dynamic_imports = {
+    "ForecastEpidemiologyTB": "forecast_epidemiology_TB",
+}
 
 __all__ = [
     "ForecastEpidemiologyTB",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -51,6 +51,7 @@ class ForecastEpidemiologyTB(Component):
     description: str = "Build an epidemiology stream of patients using a TIME BASED model."
     icon = "Globe"
     name: str = "EpidemiologyTB"
+    memoizable = True
 
 
     # COMPONENT INPUTS
@@ -51,6 +51,7 @@ class ForecastPopulationCutTB(Component):
     description: str = "Apply a timescale specific % decrease critera from the population flow input."
     icon = "Scissors"
     name: str = "PopulationCutTB"
+    memoizable = True
 
 
     # COMPONENT INPUTS
@@ -50,6 +50,7 @@ class ForecastPricingTB(Component):
     description: str = "Apply a timescale specific price to a series of Product/SKU Rx/orders to return a revenue stream."
     icon = "DollarSign"
     name: str = "PricingTB"
+    memoizable = True
 
 
     # COMPONENT INPUTS
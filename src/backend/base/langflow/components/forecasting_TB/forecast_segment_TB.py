@@ -50,6 +50,7 @@ class ForecastSegmentTB(Component):
     description: str = "Apply a timescale specific % split critera each branch (segement, remainder) of which can be linked to a different flow."
     icon = "Puzzle"
     name: str = "SegmentTB"
+    memoizable = True
 
 
     # COMPONENT INPUTS
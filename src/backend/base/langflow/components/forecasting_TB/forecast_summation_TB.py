@@ -49,6 +49,7 @@ class ForecastSummationTB(Component):
     description: str = "Sum up all the inputs provided and create a new totals line in the output."
     icon = "Sigma"
     name: str = "SummationTB"
+    memoizable = True
 
 
     # COMPONENT INPUTS
@@ -56,6 +56,7 @@ class ForecastTreatmentTB(Component):
     description: str = "Apply a treatment regiment of products to an incoming patient flow"
     icon = "Syringe"
     name: str = "TreatmentTB"
+    memoizable = True
 
 
     # COMPONENT INPUTS
@@ -1,4 +1,27 @@
-from .git import GitLoaderComponent
-from .gitextractor import GitExtractorComponent
+from __future__ import annotations
 
-__all__ = ["GitExtractorComponent", "GitLoaderComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .git import GitLoaderComponent
+    from .gitextractor import GitExtractorComponent
+
+_dynamic_imports = {
+    "GitExtractorComponent": "gitextractor",
+    "GitLoaderComponent": "git",
+}
+
+__all__ = [
+    "GitExtractorComponent",
+    "GitLoaderComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,8 +1,23 @@
-from .gmail import GmailLoaderComponent
-from .google_bq_sql_executor import BigQueryExecutorComponent
-from .google_drive import GoogleDriveComponent
-from .google_drive_search import GoogleDriveSearchComponent
-from .google_oauth_token import GoogleOAuthToken
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .gmail import GmailLoaderComponent
+    from .google_bq_sql_executor import BigQueryExecutorComponent
+    from .google_drive import GoogleDriveComponent
+    from .google_drive_search import GoogleDriveSearchComponent
+    from .google_oauth_token import GoogleOAuthToken
+
+_dynamic_imports = {
+    "BigQueryExecutorComponent": "google_bq_sql_executor",
+    "GmailLoaderComponent": "gmail",
+    "GoogleDriveComponent": "google_drive",
+    "GoogleDriveSearchComponent": "google_drive_search",
+    "GoogleOAuthToken": "google_oauth_token",
+}
 
 __all__ = [
     "BigQueryExecutorComponent",
@@ -11,3 +26,11 @@ __all__ = [
     "GoogleDriveSearchComponent",
     "GoogleOAuthToken",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
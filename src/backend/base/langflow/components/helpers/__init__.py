@@ -1,10 +1,29 @@
-from .create_list import CreateListComponent
-from .current_date import CurrentDateComponent
-from .id_generator import IDGeneratorComponent
-from .memory import MemoryComponent
-from .output_parser import OutputParserComponent
-from .store_message import MessageStoreComponent
-from .structured_output import StructuredOutputComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .batch_run import BatchRunComponent
+    from .create_list import CreateListComponent
+    from .current_date import CurrentDateComponent
+    from .id_generator import IDGeneratorComponent
+    from .memory import MemoryComponent
+    from .output_parser import OutputParserComponent
+    from .store_message import MessageStoreComponent
+    from .structured_output import StructuredOutputComponent
+
+_dynamic_imports = {
+    "BatchRunComponent": "batch_run",
+    "CreateListComponent": "create_list",
+    "CurrentDateComponent": "current_date",
+    "IDGeneratorComponent": "id_generator",
+    "MemoryComponent": "memory",
+    "MessageStoreComponent": "store_message",
+    "OutputParserComponent": "output_parser",
+    "StructuredOutputComponent": "structured_output",
+}
 
 __all__ = [
     "BatchRunComponent",
@@ -16,3 +35,11 @@ __all__ = [
     "OutputParserComponent",
     "StructuredOutputComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any, cast
 
 import toml  # type: ignore[import-untyped]
 from loguru import logger
 
+from langflow.base.models.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    estimate_tokens,
+    get_reported_tokens,
+    get_retry_delay,
+    is_rate_limit_error,
+    is_transient_error,
+)
+from langflow.base.models.response_cache import (
+    ResponseCache,
+    get_component_cache_scope,
+    get_default_response_cache,
+    get_model_identity,
+    get_response_key,
+)
 from langflow.custom import Component
-from langflow.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from langflow.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from langflow.schema import DataFrame
 
 if TYPE_CHECKING:
@@ -65,6 +82,52 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="The maximum number of rows sent to the model at once. "
+            "It is lowered automatically while the model is rate limited.",
+            value=8,
+            advanced=True,
+        ),
+        IntInput(
+            name="requests_per_minute",
+            display_name="Requests per Minute",
+            info="The maximum number of requests sent to the model per minute. 0 means unlimited.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="tokens_per_minute",
+            display_name="Tokens per Minute",
+            info="The maximum number of tokens sent to the model per minute, estimated from the length of the "
+            "rows and corrected with the usage the model reports. 0 means unlimited.",
+            value=0,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="The number of times a row is retried after a transient error, such as a rate limit or timeout.",
+            value=3,
+            advanced=True,
+        ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="The number of rows processed at a time. The results of each chunk are logged as it completes.",
+            value=100,
+            advanced=True,
+        ),
+        BoolInput(
+            name="use_cache",
+            display_name="Cache Responses",
+            info="Store the responses on disk under a hash of the user, flow, model configuration, instructions and "
+            "row, so rows already answered are not sent to the model again, e.g. when running again after a failure. "
+            "Best suited to deterministic models, with a temperature of 0.",
+            value=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -91,7 +154,13 @@ class BatchRunComponent(Component):
         return row
 
     def _add_metadata(
-        self, row: dict[str, Any], *, success: bool = True, system_msg: str = "", error: str | None = None
+        self,
+        row: dict[str, Any],
+        *,
+        success: bool = True,
+        system_msg: str = "",
+        error: str | None = None,
+        cached: bool = False,
     ) -> None:
         """Add metadata to a row if enabled."""
         if not self.enable_metadata:
@@ -103,6 +172,7 @@ class BatchRunComponent(Component):
                 "input_length": len(row.get("text_input", "")),
                 "response_length": len(row[self.output_column_name]),
                 "processing_status": "success",
+                "cached": cached,
             }
         else:
             row["metadata"] = {
@@ -140,12 +210,11 @@ class BatchRunComponent(Component):
 
         try:
             # Determine text input for each row
+            original_rows = df.to_dict(orient="records")
             if col_name:
                 user_texts = df[col_name].astype(str).tolist()
             else:
-                user_texts = [
-                    self._format_row_as_toml(cast(dict[str, Any], row)) for row in df.to_dict(orient="records")
-                ]
+                user_texts = [self._format_row_as_toml(cast(dict[str, Any], row)) for row in original_rows]
 
             total_rows = len(user_texts)
             logger.info(f"Processing {total_rows} rows with batch run")
@@ -157,6 +226,9 @@ class BatchRunComponent(Component):
                 else [{"role": "user", "content": text}]
                 for text in user_texts
             ]
+            identity = {**get_model_identity(model), **get_component_cache_scope(self)}
+            keys = [get_response_key(identity, system_msg, text) for text in user_texts]
+            cache = get_default_response_cache() if self.use_cache else None
 
             # Configure the model with project info and callbacks
             model = model.with_config(
@@ -166,33 +238,39 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
-
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            rate_limiter = RateLimiter(self.requests_per_minute, self.tokens_per_minute)
+            concurrency_limiter = AdaptiveConcurrencyLimiter(self.max_concurrency or 1)
+            chunk_size = max(self.chunk_size or total_rows, 1)
 
-            # Build the final data with enhanced metadata
+            # Build the final data with enhanced metadata, a chunk at a time
             rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
-                row = self._create_base_row(
-                    cast(dict[str, Any], original_row), model_response=response_text, batch_index=idx
+            cached_rows = 0
+            for start in range(0, total_rows, chunk_size):
+                end = min(start + chunk_size, total_rows)
+                responses, cached_keys = await self._run_chunk(
+                    model,
+                    conversations[start:end],
+                    keys[start:end],
+                    cache,
+                    rate_limiter,
+                    concurrency_limiter,
                 )
-                self._add_metadata(row, success=True, system_msg=system_msg)
-                rows.append(row)
+                chunk_rows = []
+                for idx in range(start, end):
+                    row = self._create_base_row(
+                        cast(dict[str, Any], original_rows[idx]),
+                        model_response=responses[keys[idx]],
+                        batch_index=idx,
+                    )
+                    self._add_metadata(row, success=True, system_msg=system_msg, cached=keys[idx] in cached_keys)
+                    chunk_rows.append(row)
+                rows.extend(chunk_rows)
+                cached_rows += sum(key in cached_keys for key in keys[start:end])
 
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    logger.info(f"Processed {idx + 1}/{total_rows} rows")
+                # Stream the partial results
+                logger.info(f"Processed {end}/{total_rows} rows ({cached_rows} from the cache)")
+                if chunk_size < total_rows:
+                    self.log(chunk_rows, name=f"Rows {start + 1}-{end} of {total_rows}")
 
             logger.info("Batch processing completed successfully")
             return DataFrame(rows)
@@ -203,3 +281,75 @@ class BatchRunComponent(Component):
             error_row = self._create_base_row({col: "" for col in df.columns}, model_response="", batch_index=-1)
             self._add_metadata(error_row, success=False, error=str(e))
             return DataFrame([error_row])
+
+    async def _run_chunk(
+        self,
+        model: Runnable,
+        conversations: list[list[dict[str, str]]],
+        keys: list[str],
+        cache: ResponseCache | None,
+        rate_limiter: RateLimiter,
+        concurrency_limiter: AdaptiveConcurrencyLimiter,
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Returns the responses to the conversations of a chunk by key, and the keys answered from the cache.
+
+        New responses are cached as soon as the chunk completes, including when another row of the chunk fails,
+        so running the batch again only sends the rows that were not answered.
+        """
+        responses = await asyncio.to_thread(cache.get_many, keys) if cache is not None else {}
+        cached_keys = set(responses)
+        # Rows with the same content are sent once
+        pending = dict(zip(keys, conversations, strict=True))
+        tasks = {
+            key: asyncio.ensure_future(self._invoke(model, conversation, rate_limiter, concurrency_limiter))
+            for key, conversation in pending.items()
+            if key not in responses
+        }
+        if not tasks:
+            return responses, cached_keys
+
+        done, not_done = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+        for task in not_done:
+            task.cancel()
+        await asyncio.gather(*not_done, return_exceptions=True)
+
+        answered = {key: task.result() for key, task in tasks.items() if task in done and task.exception() is None}
+        if cache is not None and answered:
+            await asyncio.to_thread(cache.put_many, answered)
+        errors = [task.exception() for task in done if task.exception() is not None]
+        if errors:
+            raise errors[0]
+        responses.update(answered)
+        return responses, cached_keys
+
+    async def _invoke(
+        self,
+        model: Runnable,
+        conversation: list[dict[str, str]],
+        rate_limiter: RateLimiter,
+        concurrency_limiter: AdaptiveConcurrencyLimiter,
+    ) -> Any:
+        """Returns the response of the model to a conversation, retrying transient errors with backoff."""
+        tokens = estimate_tokens("".join(message["content"] for message in conversation))
+        attempt = 0
+        while True:
+            async with concurrency_limiter:
+                await rate_limiter.acquire(tokens)
+                try:
+                    # Each conversation is sent on its own, so it is rate limited and retried separately
+                    response = (await model.abatch([conversation]))[0]
+                except Exception as e:
+                    if attempt >= (self.max_retries or 0) or not is_transient_error(e):
+                        raise
+                    if is_rate_limit_error(e):
+                        concurrency_limiter.record_rate_limit()
+                    delay = get_retry_delay(e, attempt)
+                    logger.debug(f"Retrying a row in {delay:.1f}s after a transient error: {e}")
+                else:
+                    concurrency_limiter.record_success()
+                    reported_tokens = get_reported_tokens(response)
+                    if reported_tokens is not None:
+                        rate_limiter.record(reported_tokens - tokens)
+                    return response.content if hasattr(response, "content") else str(response)
+            attempt += 1
+            await asyncio.sleep(delay)
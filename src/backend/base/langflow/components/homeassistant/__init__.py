@@ -1,7 +1,27 @@
-from .home_assistant_control import HomeAssistantControl
-from .list_home_assistant_states import ListHomeAssistantStates
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .home_assistant_control import HomeAssistantControl
+    from .list_home_assistant_states import ListHomeAssistantStates
+
+_dynamic_imports = {
+    "HomeAssistantControl": "home_assistant_control",
+    "ListHomeAssistantStates": "list_home_assistant_states",
+}
 
 __all__ = [
     "HomeAssistantControl",
     "ListHomeAssistantStates",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,5 +1,24 @@
-from .combinatorial_reasoner import CombinatorialReasonerComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .combinatorial_reasoner import CombinatorialReasonerComponent
+
+_dynamic_imports = {
+    "CombinatorialReasonerComponent": "combinatorial_reasoner",
+}
 
 __all__ = [
     "CombinatorialReasonerComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
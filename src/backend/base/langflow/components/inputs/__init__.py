@@ -1,4 +1,27 @@
-from .chat import ChatInput
-from .text import TextInputComponent
+from __future__ import annotations
 
-__all__ = ["ChatInput", "TextInputComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .chat import ChatInput
+    from .text import TextInputComponent
+
+_dynamic_imports = {
+    "ChatInput": "chat",
+    "TextInputComponent": "text",
+}
+
+__all__ = [
+    "ChatInput",
+    "TextInputComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
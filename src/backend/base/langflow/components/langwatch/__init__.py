@@ -1,3 +1,24 @@
-from .langwatch import LangWatchComponent
+from __future__ import annotations
 
-__all__ = ["LangWatchComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .langwatch import LangWatchComponent
+
+_dynamic_imports = {
+    "LangWatchComponent": "langwatch",
+}
+
+__all__ = [
+    "LangWatchComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
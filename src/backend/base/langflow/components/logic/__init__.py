@@ -1,12 +1,31 @@
-from .conditional_router import ConditionalRouterComponent
-from .data_conditional_router import DataConditionalRouterComponent
-from .flow_tool import FlowToolComponent
-from .listen import ListenComponent
-from .loop import LoopComponent
-from .notify import NotifyComponent
-from .pass_message import PassMessageComponent
-from .run_flow import RunFlowComponent
-from .sub_flow import SubFlowComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .conditional_router import ConditionalRouterComponent
+    from .data_conditional_router import DataConditionalRouterComponent
+    from .flow_tool import FlowToolComponent
+    from .listen import ListenComponent
+    from .loop import LoopComponent
+    from .notify import NotifyComponent
+    from .pass_message import PassMessageComponent
+    from .run_flow import RunFlowComponent
+    from .sub_flow import SubFlowComponent
+
+_dynamic_imports = {
+    "ConditionalRouterComponent": "conditional_router",
+    "DataConditionalRouterComponent": "data_conditional_router",
+    "FlowToolComponent": "flow_tool",
+    "ListenComponent": "listen",
+    "LoopComponent": "loop",
+    "NotifyComponent": "notify",
+    "PassMessageComponent": "pass_message",
+    "RunFlowComponent": "run_flow",
+    "SubFlowComponent": "sub_flow",
+}
 
 __all__ = [
     "ConditionalRouterComponent",
@@ -19,3 +38,11 @@ __all__ = [
     "RunFlowComponent",
     "SubFlowComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,8 +1,23 @@
-from .astra_db import AstraDBChatMemory
-from .cassandra import CassandraChatMemory
-from .mem0_chat_memory import Mem0MemoryComponent
-from .redis import RedisIndexChatMemory
-from .zep import ZepChatMemory
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .astra_db import AstraDBChatMemory
+    from .cassandra import CassandraChatMemory
+    from .mem0_chat_memory import Mem0MemoryComponent
+    from .redis import RedisIndexChatMemory
+    from .zep import ZepChatMemory
+
+_dynamic_imports = {
+    "AstraDBChatMemory": "astra_db",
+    "CassandraChatMemory": "cassandra",
+    "Mem0MemoryComponent": "mem0_chat_memory",
+    "RedisIndexChatMemory": "redis",
+    "ZepChatMemory": "zep",
+}
 
 __all__ = [
     "AstraDBChatMemory",
@@ -11,3 +26,11 @@ __all__ = [
     "RedisIndexChatMemory",
     "ZepChatMemory",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
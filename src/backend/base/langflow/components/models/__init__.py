@@ -1,26 +1,59 @@
-from .aiml import AIMLModelComponent
-from .anthropic import AnthropicModelComponent
-from .azure_openai import AzureChatOpenAIComponent
-from .baidu_qianfan_chat import QianfanChatEndpointComponent
-from .cohere import CohereComponent
-from .deepseek import DeepSeekModelComponent
-from .google_generative_ai import GoogleGenerativeAIComponent
-from .groq import GroqModel
-from .huggingface import HuggingFaceEndpointsComponent
-from .language_model import LanguageModelComponent
-from .lmstudiomodel import LMStudioModelComponent
-from .maritalk import MaritalkModelComponent
-from .mistral import MistralAIModelComponent
-from .novita import NovitaModelComponent
-from .nvidia import NVIDIAModelComponent
-from .ollama import ChatOllamaComponent
-from .openai_chat_model import OpenAIModelComponent
-from .openrouter import OpenRouterComponent
-from .perplexity import PerplexityComponent
-from .sambanova import SambaNovaComponent
-from .vertexai import ChatVertexAIComponent
-from .watsonx import WatsonxAIComponent
-from .xai import XAIModelComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .aiml import AIMLModelComponent
+    from .anthropic import AnthropicModelComponent
+    from .azure_openai import AzureChatOpenAIComponent
+    from .baidu_qianfan_chat import QianfanChatEndpointComponent
+    from .cohere import CohereComponent
+    from .deepseek import DeepSeekModelComponent
+    from .google_generative_ai import GoogleGenerativeAIComponent
+    from .groq import GroqModel
+    from .huggingface import HuggingFaceEndpointsComponent
+    from .language_model import LanguageModelComponent
+    from .lmstudiomodel import LMStudioModelComponent
+    from .maritalk import MaritalkModelComponent
+    from .mistral import MistralAIModelComponent
+    from .novita import NovitaModelComponent
+    from .nvidia import NVIDIAModelComponent
+    from .ollama import ChatOllamaComponent
+    from .openai_chat_model import OpenAIModelComponent
+    from .openrouter import OpenRouterComponent
+    from .perplexity import PerplexityComponent
+    from .sambanova import SambaNovaComponent
+    from .vertexai import ChatVertexAIComponent
+    from .watsonx import WatsonxAIComponent
+    from .xai import XAIModelComponent
+
+_dynamic_imports = {
+    "AIMLModelComponent": "aiml",
+    "AnthropicModelComponent": "anthropic",
+    "AzureChatOpenAIComponent": "azure_openai",
+    "ChatOllamaComponent": "ollama",
+    "ChatVertexAIComponent": "vertexai",
+    "CohereComponent": "cohere",
+    "DeepSeekModelComponent": "deepseek",
+    "GoogleGenerativeAIComponent": "google_generative_ai",
+    "GroqModel": "groq",
+    "HuggingFaceEndpointsComponent": "huggingface",
+    "LMStudioModelComponent": "lmstudiomodel",
+    "LanguageModelComponent": "language_model",
+    "MaritalkModelComponent": "maritalk",
+    "MistralAIModelComponent": "mistral",
+    "NVIDIAModelComponent": "nvidia",
+    "NovitaModelComponent": "novita",
+    "OpenAIModelComponent": "openai_chat_model",
+    "OpenRouterComponent": "openrouter",
+    "PerplexityComponent": "perplexity",
+    "QianfanChatEndpointComponent": "baidu_qianfan_chat",
+    "SambaNovaComponent": "sambanova",
+    "WatsonxAIComponent": "watsonx",
+    "XAIModelComponent": "xai",
+}
 
 __all__ = [
     "AIMLModelComponent",
@@ -47,3 +80,11 @@ __all__ = [
     "WatsonxAIComponent",
     "XAIModelComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
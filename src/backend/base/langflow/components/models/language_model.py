@@ -4,8 +4,9 @@ from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
 from langflow.base.models.anthropic_constants import ANTHROPIC_MODELS
-from langflow.base.models.model import LCModelComponent
+from langflow.base.models.model import RESPONSE_CACHE_INPUTS, LCModelComponent
 from langflow.base.models.openai_constants import OPENAI_MODEL_NAMES
+from langflow.base.models.response_cache import use_response_cache
 from langflow.field_typing import LanguageModel
 from langflow.field_typing.range_spec import RangeSpec
 from langflow.inputs.inputs import BoolInput
@@ -71,8 +72,10 @@ class LanguageModelComponent(LCModelComponent):
             range_spec=RangeSpec(min=0, max=1, step=0.01),
             advanced=True,
         ),
+        *RESPONSE_CACHE_INPUTS,
     ]
 
+    @use_response_cache
     def build_model(self) -> LanguageModel:
         provider = self.provider
         model_name = self.model_name
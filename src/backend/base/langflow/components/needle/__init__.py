@@ -1,3 +1,24 @@
-from .needle import NeedleComponent
+from __future__ import annotations
 
-__all__ = ["NeedleComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .needle import NeedleComponent
+
+_dynamic_imports = {
+    "NeedleComponent": "needle",
+}
+
+__all__ = [
+    "NeedleComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,4 +1,27 @@
-from .nvidia_ingest import NvidiaIngestComponent
-from .nvidia_rerank import NvidiaRerankComponent
+from __future__ import annotations
 
-__all__ = ["NvidiaIngestComponent", "NvidiaRerankComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .nvidia_ingest import NvidiaIngestComponent
+    from .nvidia_rerank import NvidiaRerankComponent
+
+_dynamic_imports = {
+    "NvidiaIngestComponent": "nvidia_ingest",
+    "NvidiaRerankComponent": "nvidia_rerank",
+}
+
+__all__ = [
+    "NvidiaIngestComponent",
+    "NvidiaRerankComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,3 +1,24 @@
-from .olivya import OlivyaComponent
+from __future__ import annotations
 
-__all__ = ["OlivyaComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .olivya import OlivyaComponent
+
+_dynamic_imports = {
+    "OlivyaComponent": "olivya",
+}
+
+__all__ = [
+    "OlivyaComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,4 +1,27 @@
-from .chat import ChatOutput
-from .text import TextOutputComponent
+from __future__ import annotations
 
-__all__ = ["ChatOutput", "TextOutputComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .chat import ChatOutput
+    from .text import TextOutputComponent
+
+_dynamic_imports = {
+    "ChatOutput": "chat",
+    "TextOutputComponent": "text",
+}
+
+__all__ = [
+    "ChatOutput",
+    "TextOutputComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
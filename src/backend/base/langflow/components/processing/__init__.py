@@ -1,20 +1,49 @@
-from .alter_metadata import AlterMetadataComponent
-from .combine_text import CombineTextComponent
-from .create_data import CreateDataComponent
-from .extract_key import ExtractDataKeyComponent
-from .filter_data_values import DataFilterComponent
-from .json_cleaner import JSONCleaner
-from .lambda_filter import LambdaFilterComponent
-from .llm_router import LLMRouterComponent
-from .merge_data import MergeDataComponent
-from .message_to_data import MessageToDataComponent
-from .parse_data import ParseDataComponent
-from .parse_json_data import ParseJSONDataComponent
-from .parser import ParserComponent
-from .regex import RegexExtractorComponent
-from .select_data import SelectDataComponent
-from .split_text import SplitTextComponent
-from .update_data import UpdateDataComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .alter_metadata import AlterMetadataComponent
+    from .combine_text import CombineTextComponent
+    from .create_data import CreateDataComponent
+    from .extract_key import ExtractDataKeyComponent
+    from .filter_data_values import DataFilterComponent
+    from .json_cleaner import JSONCleaner
+    from .lambda_filter import LambdaFilterComponent
+    from .llm_router import LLMRouterComponent
+    from .merge_data import MergeDataComponent
+    from .message_to_data import MessageToDataComponent
+    from .parse_data import ParseDataComponent
+    from .parse_dataframe import ParseDataFrameComponent
+    from .parse_json_data import ParseJSONDataComponent
+    from .parser import ParserComponent
+    from .regex import RegexExtractorComponent
+    from .select_data import SelectDataComponent
+    from .split_text import SplitTextComponent
+    from .update_data import UpdateDataComponent
+
+_dynamic_imports = {
+    "AlterMetadataComponent": "alter_metadata",
+    "CombineTextComponent": "combine_text",
+    "CreateDataComponent": "create_data",
+    "DataFilterComponent": "filter_data_values",
+    "ExtractDataKeyComponent": "extract_key",
+    "JSONCleaner": "json_cleaner",
+    "LLMRouterComponent": "llm_router",
+    "LambdaFilterComponent": "lambda_filter",
+    "MergeDataComponent": "merge_data",
+    "MessageToDataComponent": "message_to_data",
+    "ParseDataComponent": "parse_data",
+    "ParseDataFrameComponent": "parse_dataframe",
+    "ParseJSONDataComponent": "parse_json_data",
+    "ParserComponent": "parser",
+    "RegexExtractorComponent": "regex",
+    "SelectDataComponent": "select_data",
+    "SplitTextComponent": "split_text",
+    "UpdateDataComponent": "update_data",
+}
 
 __all__ = [
     "AlterMetadataComponent",
@@ -36,3 +65,11 @@ __all__ = [
     "SplitTextComponent",
     "UpdateDataComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
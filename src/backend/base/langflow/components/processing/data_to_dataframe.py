@@ -12,6 +12,7 @@ class DataToDataFrameComponent(Component):
     )
     icon = "table"
     name = "DataToDataFrame"
+    memoizable = True
 
     inputs = [
         DataInput(
@@ -1,3 +1,24 @@
-from .prompt import PromptComponent
+from __future__ import annotations
 
-__all__ = ["PromptComponent"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .prompt import PromptComponent
+
+_dynamic_imports = {
+    "PromptComponent": "prompt",
+}
+
+__all__ = [
+    "PromptComponent",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,7 +1,21 @@
-from .amazon_kendra import AmazonKendraRetrieverComponent
-from .metal import MetalRetrieverComponent
-from .multi_query import MultiQueryRetrieverComponent
-from .needle import NeedleRetriever
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .amazon_kendra import AmazonKendraRetrieverComponent
+    from .metal import MetalRetrieverComponent
+    from .multi_query import MultiQueryRetrieverComponent
+    from .needle import NeedleRetriever
+
+_dynamic_imports = {
+    "AmazonKendraRetrieverComponent": "amazon_kendra",
+    "MetalRetrieverComponent": "metal",
+    "MultiQueryRetrieverComponent": "multi_query",
+    "NeedleRetriever": "needle",
+}
 
 __all__ = [
     "AmazonKendraRetrieverComponent",
@@ -9,3 +23,11 @@ __all__ = [
     "MultiQueryRetrieverComponent",
     "NeedleRetriever",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
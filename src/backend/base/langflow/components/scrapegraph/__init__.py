@@ -1,5 +1,30 @@
-from .scrapegraph_markdownify_api import ScrapeGraphMarkdownifyApi
-from .scrapegraph_search_api import ScrapeGraphSearchApi
-from .scrapegraph_smart_scraper_api import ScrapeGraphSmartScraperApi
+from __future__ import annotations
 
-__all__ = ["ScrapeGraphMarkdownifyApi", "ScrapeGraphSearchApi", "ScrapeGraphSmartScraperApi"]
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .scrapegraph_markdownify_api import ScrapeGraphMarkdownifyApi
+    from .scrapegraph_search_api import ScrapeGraphSearchApi
+    from .scrapegraph_smart_scraper_api import ScrapeGraphSmartScraperApi
+
+_dynamic_imports = {
+    "ScrapeGraphMarkdownifyApi": "scrapegraph_markdownify_api",
+    "ScrapeGraphSearchApi": "scrapegraph_search_api",
+    "ScrapeGraphSmartScraperApi": "scrapegraph_smart_scraper_api",
+}
+
+__all__ = [
+    "ScrapeGraphMarkdownifyApi",
+    "ScrapeGraphSearchApi",
+    "ScrapeGraphSmartScraperApi",
+]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,42 +1,81 @@
-import warnings
+from __future__ import annotations
 
-from langchain_core._api.deprecation import LangChainDeprecationWarning
+import warnings
+from typing import TYPE_CHECKING, Any
 
-from .arxiv import ArXivComponent
-from .bing_search_api import BingSearchAPIComponent
-from .calculator import CalculatorToolComponent
-from .calculator_core import CalculatorComponent
-from .duck_duck_go_search_run import DuckDuckGoSearchComponent
-from .exa_search import ExaSearchToolkit
-from .glean_search_api import GleanSearchAPIComponent
-from .google_search_api import GoogleSearchAPIComponent
-from .google_search_api_core import GoogleSearchAPICore
-from .google_serper_api import GoogleSerperAPIComponent
-from .google_serper_api_core import GoogleSerperAPICore
-from .mcp_component import MCPToolsComponent
-from .python_code_structured_tool import PythonCodeStructuredTool
-from .python_repl import PythonREPLToolComponent
-from .python_repl_core import PythonREPLComponent
-from .search import SearchComponent
-from .search_api import SearchAPIComponent
-from .searxng import SearXNGToolComponent
-from .serp import SerpComponent
-from .serp_api import SerpAPIComponent
-from .tavily_extract import TavilyExtractComponent
-from .tavily_search import TavilySearchComponent
-from .tavily_search_tool import TavilySearchToolComponent
-from .wikidata import WikidataComponent
-from .wikidata_api import WikidataAPIComponent
-from .wikipedia import WikipediaComponent
-from .wikipedia_api import WikipediaAPIComponent
-from .wolfram_alpha_api import WolframAlphaAPIComponent
-from .yahoo import YfinanceComponent
-from .yahoo_finance import YfinanceToolComponent
+from langflow.utils.lazy_load import import_lazy_attribute
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore", LangChainDeprecationWarning)
+if TYPE_CHECKING:
+    from .arxiv import ArXivComponent
     from .astradb import AstraDBToolComponent
     from .astradb_cql import AstraDBCQLToolComponent
+    from .bing_search_api import BingSearchAPIComponent
+    from .calculator import CalculatorToolComponent
+    from .calculator_core import CalculatorComponent
+    from .duck_duck_go_search_run import DuckDuckGoSearchComponent
+    from .exa_search import ExaSearchToolkit
+    from .glean_search_api import GleanSearchAPIComponent
+    from .google_search_api import GoogleSearchAPIComponent
+    from .google_search_api_core import GoogleSearchAPICore
+    from .google_serper_api import GoogleSerperAPIComponent
+    from .google_serper_api_core import GoogleSerperAPICore
+    from .mcp_component import MCPToolsComponent
+    from .python_code_structured_tool import PythonCodeStructuredTool
+    from .python_repl import PythonREPLToolComponent
+    from .python_repl_core import PythonREPLComponent
+    from .search import SearchComponent
+    from .search_api import SearchAPIComponent
+    from .searxng import SearXNGToolComponent
+    from .serp import SerpComponent
+    from .serp_api import SerpAPIComponent
+    from .tavily_extract import TavilyExtractComponent
+    from .tavily_search import TavilySearchComponent
+    from .tavily_search_tool import TavilySearchToolComponent
+    from .wikidata import WikidataComponent
+    from .wikidata_api import WikidataAPIComponent
+    from .wikipedia import WikipediaComponent
+    from .wikipedia_api import WikipediaAPIComponent
+    from .wolfram_alpha_api import WolframAlphaAPIComponent
+    from .yahoo import YfinanceComponent
+    from .yahoo_finance import YfinanceToolComponent
+
+_dynamic_imports = {
+    "ArXivComponent": "arxiv",
+    "AstraDBCQLToolComponent": "astradb_cql",
+    "AstraDBToolComponent": "astradb",
+    "BingSearchAPIComponent": "bing_search_api",
+    "CalculatorComponent": "calculator_core",
+    "CalculatorToolComponent": "calculator",
+    "DuckDuckGoSearchComponent": "duck_duck_go_search_run",
+    "ExaSearchToolkit": "exa_search",
+    "GleanSearchAPIComponent": "glean_search_api",
+    "GoogleSearchAPIComponent": "google_search_api",
+    "GoogleSearchAPICore": "google_search_api_core",
+    "GoogleSerperAPIComponent": "google_serper_api",
+    "GoogleSerperAPICore": "google_serper_api_core",
+    "MCPToolsComponent": "mcp_component",
+    "PythonCodeStructuredTool": "python_code_structured_tool",
+    "PythonREPLComponent": "python_repl_core",
+    "PythonREPLToolComponent": "python_repl",
+    "SearXNGToolComponent": "searxng",
+    "SearchAPIComponent": "search_api",
+    "SearchComponent": "search",
+    "SerpAPIComponent": "serp_api",
+    "SerpComponent": "serp",
+    "TavilyExtractComponent": "tavily_extract",
+    "TavilySearchComponent": "tavily_search",
+    "TavilySearchToolComponent": "tavily_search_tool",
+    "WikidataAPIComponent": "wikidata_api",
+    "WikidataComponent": "wikidata",
+    "WikipediaAPIComponent": "wikipedia_api",
+    "WikipediaComponent": "wikipedia",
+    "WolframAlphaAPIComponent": "wolfram_alpha_api",
+    "YfinanceComponent": "yahoo",
+    "YfinanceToolComponent": "yahoo_finance",
+}
+
+# Submodules importing deprecated LangChain classes
+_deprecated_modules = {"astradb", "astradb_cql"}
 
 __all__ = [
     "ArXivComponent",
@@ -72,3 +111,17 @@ __all__ = [
     "YfinanceComponent",
     "YfinanceToolComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    if _dynamic_imports.get(attr_name) in _deprecated_modules:
+        from langchain_core._api.deprecation import LangChainDeprecationWarning
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LangChainDeprecationWarning)
+            return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -1,28 +1,65 @@
-from .astradb import AstraDBVectorStoreComponent
-from .astradb_graph import AstraDBGraphVectorStoreComponent
-from .cassandra import CassandraVectorStoreComponent
-from .cassandra_graph import CassandraGraphVectorStoreComponent
-from .chroma import ChromaVectorStoreComponent
-from .clickhouse import ClickhouseVectorStoreComponent
-from .couchbase import CouchbaseVectorStoreComponent
-from .elasticsearch import ElasticsearchVectorStoreComponent
-from .faiss import FaissVectorStoreComponent
-from .graph_rag import GraphRAGComponent
-from .hcd import HCDVectorStoreComponent
-from .local_db import LocalDBComponent
-from .milvus import MilvusVectorStoreComponent
-from .mongodb_atlas import MongoVectorStoreComponent
-from .opensearch import OpenSearchVectorStoreComponent
-from .pgvector import PGVectorStoreComponent
-from .pinecone import PineconeVectorStoreComponent
-from .qdrant import QdrantVectorStoreComponent
-from .redis import RedisVectorStoreComponent
-from .supabase import SupabaseVectorStoreComponent
-from .upstash import UpstashVectorStoreComponent
-from .vectara import VectaraVectorStoreComponent
-from .vectara_rag import VectaraRagComponent
-from .vectara_self_query import VectaraSelfQueryRetriverComponent
-from .weaviate import WeaviateVectorStoreComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .astradb import AstraDBVectorStoreComponent
+    from .astradb_graph import AstraDBGraphVectorStoreComponent
+    from .cassandra import CassandraVectorStoreComponent
+    from .cassandra_graph import CassandraGraphVectorStoreComponent
+    from .chroma import ChromaVectorStoreComponent
+    from .clickhouse import ClickhouseVectorStoreComponent
+    from .couchbase import CouchbaseVectorStoreComponent
+    from .elasticsearch import ElasticsearchVectorStoreComponent
+    from .faiss import FaissVectorStoreComponent
+    from .graph_rag import GraphRAGComponent
+    from .hcd import HCDVectorStoreComponent
+    from .local_ann import LocalANNVectorStoreComponent
+    from .local_db import LocalDBComponent
+    from .milvus import MilvusVectorStoreComponent
+    from .mongodb_atlas import MongoVectorStoreComponent
+    from .opensearch import OpenSearchVectorStoreComponent
+    from .pgvector import PGVectorStoreComponent
+    from .pinecone import PineconeVectorStoreComponent
+    from .qdrant import QdrantVectorStoreComponent
+    from .redis import RedisVectorStoreComponent
+    from .supabase import SupabaseVectorStoreComponent
+    from .upstash import UpstashVectorStoreComponent
+    from .vectara import VectaraVectorStoreComponent
+    from .vectara_rag import VectaraRagComponent
+    from .vectara_self_query import VectaraSelfQueryRetriverComponent
+    from .weaviate import WeaviateVectorStoreComponent
+
+_dynamic_imports = {
+    "AstraDBGraphVectorStoreComponent": "astradb_graph",
+    "AstraDBVectorStoreComponent": "astradb",
+    "CassandraGraphVectorStoreComponent": "cassandra_graph",
+    "CassandraVectorStoreComponent": "cassandra",
+    "ChromaVectorStoreComponent": "chroma",
+    "ClickhouseVectorStoreComponent": "clickhouse",
+    "CouchbaseVectorStoreComponent": "couchbase",
+    "ElasticsearchVectorStoreComponent": "elasticsearch",
+    "FaissVectorStoreComponent": "faiss",
+    "GraphRAGComponent": "graph_rag",
+    "HCDVectorStoreComponent": "hcd",
+    "LocalANNVectorStoreComponent": "local_ann",
+    "LocalDBComponent": "local_db",
+    "MilvusVectorStoreComponent": "milvus",
+    "MongoVectorStoreComponent": "mongodb_atlas",
+    "OpenSearchVectorStoreComponent": "opensearch",
+    "PGVectorStoreComponent": "pgvector",
+    "PineconeVectorStoreComponent": "pinecone",
+    "QdrantVectorStoreComponent": "qdrant",
+    "RedisVectorStoreComponent": "redis",
+    "SupabaseVectorStoreComponent": "supabase",
+    "UpstashVectorStoreComponent": "upstash",
+    "VectaraRagComponent": "vectara_rag",
+    "VectaraSelfQueryRetriverComponent": "vectara_self_query",
+    "VectaraVectorStoreComponent": "vectara",
+    "WeaviateVectorStoreComponent": "weaviate",
+}
 
 __all__ = [
     "AstraDBGraphVectorStoreComponent",
@@ -36,6 +73,7 @@ __all__ = [
     "FaissVectorStoreComponent",
     "GraphRAGComponent",
     "HCDVectorStoreComponent",
+    "LocalANNVectorStoreComponent",
     "LocalDBComponent",
     "MilvusVectorStoreComponent",
     "MongoVectorStoreComponent",
@@ -51,3 +89,11 @@ __all__ = [
     "VectaraVectorStoreComponent",
     "WeaviateVectorStoreComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
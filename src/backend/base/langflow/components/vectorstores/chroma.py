@@ -4,7 +4,13 @@ from chromadb.config import Settings
 from langchain_chroma import Chroma
 from typing_extensions import override
 
-from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.ledger import get_collection_key
+from langflow.base.vectorstores.model import (
+    INCREMENTAL_INGESTION_INPUTS,
+    LCVectorStoreComponent,
+    check_cached_vector_store,
+)
+from langflow.base.vectorstores.pool import get_pooled_client
 from langflow.base.vectorstores.utils import chroma_collection_to_data
 from langflow.io import BoolInput, DropdownInput, HandleInput, IntInput, StrInput
 from langflow.schema import Data, DataFrame
@@ -81,14 +87,25 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             info="Limit the number of records to compare when Allow Duplicates is False.",
         ),
+        *INCREMENTAL_INGESTION_INPUTS,
     ]
 
+    def get_ingestion_collection(self) -> str | None:
+        if self.chroma_server_host:
+            location = f"{self.chroma_server_host}:{self.chroma_server_http_port or ''}"
+        elif self.persist_directory:
+            location = self.resolve_path(self.persist_directory)
+        else:
+            # In-memory collections don't outlive the build
+            return None
+        return get_collection_key(self.name, location, self.collection_name)
+
     @override
     @check_cached_vector_store
     def build_vector_store(self) -> Chroma:
         """Builds the Chroma object."""
         try:
-            from chromadb import Client
+            from chromadb import Client, PersistentClient
             from langchain_chroma import Chroma
         except ImportError as e:
             msg = "Could not import Chroma integration package. Please install it with `pip install langchain-chroma`."
@@ -97,17 +114,28 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         chroma_settings = None
         client = None
         if self.chroma_server_host:
-            chroma_settings = Settings(
-                chroma_server_cors_allow_origins=self.chroma_server_cors_allow_origins or [],
-                chroma_server_host=self.chroma_server_host,
-                chroma_server_http_port=self.chroma_server_http_port or None,
-                chroma_server_grpc_port=self.chroma_server_grpc_port or None,
-                chroma_server_ssl_enabled=self.chroma_server_ssl_enabled,
+            server_settings = {
+                "chroma_server_cors_allow_origins": self.chroma_server_cors_allow_origins or [],
+                "chroma_server_host": self.chroma_server_host,
+                "chroma_server_http_port": self.chroma_server_http_port or None,
+                "chroma_server_grpc_port": self.chroma_server_grpc_port or None,
+                "chroma_server_ssl_enabled": self.chroma_server_ssl_enabled,
+            }
+            chroma_settings = Settings(**server_settings)
+            client = get_pooled_client(
+                "chroma",
+                server_settings,
+                lambda: Client(settings=chroma_settings),
+                owner=self,
+                health_check=lambda client: client.heartbeat(),
             )
-            client = Client(settings=chroma_settings)
 
         # Check persist_directory and expand it if it is a relative path
         persist_directory = self.resolve_path(self.persist_directory) if self.persist_directory is not None else None
+        if client is None and persist_directory:
+            client = get_pooled_client(
+                "chroma", {"path": persist_directory}, lambda: PersistentClient(path=persist_directory), owner=self
+            )
 
         chroma = Chroma(
             persist_directory=persist_directory,
@@ -130,6 +158,19 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         # Convert DataFrame to Data if needed using parent's method
         ingest_data = self._prepare_ingest_data()
 
+        if self.incremental_ingestion:
+            documents = []
+            for _input in ingest_data:
+                if not isinstance(_input, Data):
+                    msg = "Vector Store Inputs must be Data objects."
+                    raise TypeError(msg)
+                documents.append(_input.to_lc_document())
+            # The ledger is out of date if the collection was deleted
+            if not vector_store.get(limit=1, include=[])["ids"]:
+                self.reset_ingestion_ledger()
+            self.ingest_documents(vector_store, documents)
+            return
+
         stored_documents_without_id = []
         if self.allow_duplicates:
             stored_data = []
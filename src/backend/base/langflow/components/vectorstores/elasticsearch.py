@@ -2,8 +2,10 @@ from typing import Any
 
 from langchain.schema import Document
 from langchain_elasticsearch import ElasticsearchStore
+from langchain_elasticsearch.client import create_elasticsearch_client
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.pool import get_pooled_client
 from langflow.io import (
     DropdownInput,
     FloatInput,
@@ -109,22 +111,28 @@ class ElasticsearchVectorStoreComponent(LCVectorStoreComponent):
             )
             raise ValueError(msg)
 
-        es_params = {
-            "index_name": self.index_name,
-            "embedding": self.embedding,
-            "es_user": self.username or None,
-            "es_password": self.password or None,
+        connection_params = {
+            "username": self.username or None,
+            "password": self.password or None,
+            "api_key": self.api_key or None,
         }
-
         if self.cloud_id:
-            es_params["es_cloud_id"] = self.cloud_id
+            connection_params["cloud_id"] = self.cloud_id
         else:
-            es_params["es_url"] = self.elasticsearch_url
-
-        if self.api_key:
-            es_params["api_key"] = self.api_key
-
-        elasticsearch = ElasticsearchStore(**es_params)
+            connection_params["url"] = self.elasticsearch_url
+
+        es_connection = get_pooled_client(
+            "elasticsearch",
+            connection_params,
+            lambda: create_elasticsearch_client(**connection_params),
+            owner=self,
+            health_check=lambda client: client.ping(),
+        )
+        elasticsearch = ElasticsearchStore(
+            index_name=self.index_name,
+            embedding=self.embedding,
+            es_connection=es_connection,
+        )
 
         # If documents are provided, add them to the store
         if self.ingest_data:
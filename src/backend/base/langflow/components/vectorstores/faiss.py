@@ -1,8 +1,15 @@
 from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
-
-from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langchain_core.documents import Document
+
+from langflow.base.vectorstores.ledger import get_collection_key
+from langflow.base.vectorstores.model import (
+    INCREMENTAL_INGESTION_INPUTS,
+    LCVectorStoreComponent,
+    check_cached_vector_store,
+)
+from langflow.base.vectorstores.pool import get_pooled_client
 from langflow.helpers.data import docs_to_data
 from langflow.io import BoolInput, HandleInput, IntInput, StrInput
 from langflow.schema import Data
@@ -44,8 +51,11 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             value=4,
         ),
+        *INCREMENTAL_INGESTION_INPUTS,
     ]
 
+    accepts_embeddings = True
+
     @staticmethod
     def resolve_path(path: str) -> str:
         """Resolve the path relative to the Langflow root.
@@ -63,9 +73,15 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             return Path(self.resolve_path(self.persist_directory))
         return Path()
 
+    def get_ingestion_collection(self) -> str | None:
+        return get_collection_key(self.name, str(self.get_persist_directory().resolve()), self.index_name)
+
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
-        """Builds the FAISS object."""
+        """Builds the FAISS object.
+
+        The index is rebuilt from the ingested data, unless incremental ingestion is enabled and the index exists.
+        """
         path = self.get_persist_directory()
         path.mkdir(parents=True, exist_ok=True)
 
@@ -79,24 +95,53 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             else:
                 documents.append(_input)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
+        if not self.incremental_ingestion:
+            self.reset_ingestion_ledger()
+            faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
+            faiss.save_local(str(path), self.index_name)
+            return faiss
+
+        faiss = None
+        if (path / f"{self.index_name}.faiss").exists():
+            faiss = FAISS.load_local(
+                folder_path=str(path),
+                embeddings=self.embedding,
+                index_name=self.index_name,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            )
+        else:
+            self.reset_ingestion_ledger()
+
+        faiss = self.ingest_documents(faiss, documents)
+        if faiss is None:
+            msg = "No documents to build the FAISS index from."
+            raise ValueError(msg)
         return faiss
 
+    def add_embedded_documents(
+        self,
+        vector_store: FAISS | None,
+        documents: list[Document],
+        embeddings: list[list[float]],
+        ids: list[str] | None,
+    ) -> FAISS:
+        texts = [document.page_content for document in documents]
+        text_embeddings = list(zip(texts, embeddings, strict=True))
+        metadatas = [document.metadata for document in documents]
+        if vector_store is None:
+            return FAISS.from_embeddings(text_embeddings, self.embedding, metadatas=metadatas, ids=ids)
+        vector_store.add_embeddings(text_embeddings, metadatas=metadatas, ids=ids)
+        return vector_store
+
+    def persist_vector_store(self, vector_store: FAISS) -> None:
+        vector_store.save_local(str(self.get_persist_directory()), self.index_name)
+
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
         path = self.get_persist_directory()
         index_path = path / f"{self.index_name}.faiss"
 
-        if not index_path.exists():
-            vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
-                folder_path=str(path),
-                embeddings=self.embedding,
-                index_name=self.index_name,
-                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-            )
+        vector_store = self._load_pooled_index(index_path) if index_path.exists() else self.build_vector_store()
 
         if not vector_store:
             msg = "Failed to load the FAISS index."
@@ -109,3 +154,33 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             )
             return docs_to_data(docs)
         return []
+
+    def _load_pooled_index(self, index_path: Path) -> FAISS:
+        """Loads the index from disk once per version of its file, and shares it with the other builds."""
+        stat = index_path.stat()
+        params = {
+            "path": str(index_path.resolve()),
+            "modified": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "allow_dangerous_deserialization": self.allow_dangerous_deserialization,
+        }
+        loaded = get_pooled_client(
+            "faiss",
+            params,
+            lambda: FAISS.load_local(
+                folder_path=str(index_path.parent),
+                embeddings=self.embedding,
+                index_name=self.index_name,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            ),
+            close=None,
+        )
+        # Searching doesn't modify the index, so it is shared with the embeddings of this build
+        return FAISS(
+            embedding_function=self.embedding,
+            index=loaded.index,
+            docstore=loaded.docstore,
+            index_to_docstore_id=loaded.index_to_docstore_id,
+            normalize_L2=loaded._normalize_L2,
+            distance_strategy=loaded.distance_strategy,
+        )
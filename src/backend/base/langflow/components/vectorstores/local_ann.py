@@ -0,0 +1,147 @@
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+from langflow.base.vectorstores.ledger import get_collection_key
+from langflow.base.vectorstores.memmap import MemmapIndex, MemmapVectorStore
+from langflow.base.vectorstores.model import (
+    INCREMENTAL_INGESTION_INPUTS,
+    LCVectorStoreComponent,
+    check_cached_vector_store,
+)
+from langflow.base.vectorstores.pool import get_pooled_client
+from langflow.helpers.data import docs_to_data
+from langflow.io import DictInput, DropdownInput, HandleInput, IntInput, StrInput
+from langflow.schema import Data
+
+
+class LocalANNVectorStoreComponent(LCVectorStoreComponent):
+    """Local vector store with approximate nearest neighbor search, without a database service."""
+
+    display_name: str = "Local ANN"
+    description: str = "Local vector store searching memory-mapped embeddings, with an IVF index for large collections"
+    name = "LocalANN"
+    icon = "database"
+
+    inputs = [
+        StrInput(
+            name="collection_name",
+            display_name="Collection Name",
+            value="langflow",
+        ),
+        StrInput(
+            name="persist_directory",
+            display_name="Persist Directory",
+            info="Base directory of the collections. Collections are stored under "
+            "'{directory}/{collection_name}'. If not specified, your system's cache folder is used.",
+            advanced=True,
+        ),
+        *LCVectorStoreComponent.inputs,
+        HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"], required=True),
+        DropdownInput(
+            name="index_type",
+            display_name="Index Type",
+            options=["Auto", "Flat", "IVF"],
+            value="Auto",
+            advanced=True,
+            info="Flat searches every chunk exactly. IVF clusters the chunks and only searches the clusters closest "
+            "to the query. Auto builds an IVF index once the collection is large.",
+        ),
+        IntInput(
+            name="n_probe",
+            display_name="IVF Probes",
+            value=16,
+            advanced=True,
+            info="The number of IVF clusters searched for each query. Higher values are slower but more accurate.",
+        ),
+        DictInput(
+            name="search_filter",
+            display_name="Metadata Filter",
+            advanced=True,
+            is_list=True,
+            info="Metadata values the results must have.",
+        ),
+        IntInput(
+            name="number_of_results",
+            display_name="Number of Results",
+            info="Number of results to return.",
+            advanced=True,
+            value=4,
+        ),
+        *INCREMENTAL_INGESTION_INPUTS,
+    ]
+
+    accepts_embeddings = True
+
+    def get_persist_directory(self) -> Path:
+        """Returns the directory of the collection."""
+        if self.persist_directory:
+            base_dir = Path(self.resolve_path(self.persist_directory))
+        else:
+            from langflow.services.cache.utils import CACHE_DIR
+
+            base_dir = Path(CACHE_DIR) / "local_ann"
+        return base_dir / self.collection_name
+
+    def get_ingestion_collection(self) -> str | None:
+        return get_collection_key(self.name, str(self.get_persist_directory().resolve()))
+
+    @check_cached_vector_store
+    def build_vector_store(self) -> MemmapVectorStore:
+        directory = self.get_persist_directory()
+        index_type = self.index_type.lower()
+        # The collection is loaded once for each index type and shared with the other builds
+        index = get_pooled_client(
+            self.name,
+            {"path": str(directory.resolve()), "index_type": index_type},
+            lambda: MemmapIndex(directory, index_type),
+            owner=self,
+            close=lambda index: index.close(),
+        )
+        vector_store = MemmapVectorStore(index, self.embedding, n_probe=self.n_probe)
+
+        # Convert DataFrame to Data if needed using parent's method
+        self.ingest_data = self._prepare_ingest_data()
+
+        documents = []
+        for _input in self.ingest_data or []:
+            if isinstance(_input, Data):
+                documents.append(_input.to_lc_document())
+            else:
+                documents.append(_input)
+
+        if not len(index):
+            # The ledger is out of date if the collection was deleted
+            self.reset_ingestion_ledger()
+        self.ingest_documents(vector_store, documents)
+        return vector_store
+
+    def add_embedded_documents(
+        self,
+        vector_store: MemmapVectorStore,
+        documents: list[Document],
+        embeddings: list[list[float]],
+        ids: list[str] | None,
+    ) -> MemmapVectorStore:
+        vector_store.add_embeddings(
+            texts=[document.page_content for document in documents],
+            embeddings=embeddings,
+            metadatas=[document.metadata for document in documents],
+            ids=ids,
+        )
+        return vector_store
+
+    def search_documents(self) -> list[Data]:
+        vector_store = self.build_vector_store()
+
+        if self.search_query and isinstance(self.search_query, str) and self.search_query.strip():
+            docs = vector_store.similarity_search(
+                query=self.search_query,
+                k=self.number_of_results,
+                filter=self.search_filter or None,
+            )
+
+            data = docs_to_data(docs)
+            self.status = data
+            return data
+        return []
@@ -5,7 +5,13 @@ from langchain_chroma import Chroma
 from loguru import logger
 from typing_extensions import override
 
-from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.ledger import get_collection_key
+from langflow.base.vectorstores.model import (
+    INCREMENTAL_INGESTION_INPUTS,
+    LCVectorStoreComponent,
+    check_cached_vector_store,
+)
+from langflow.base.vectorstores.pool import get_pooled_client
 from langflow.base.vectorstores.utils import chroma_collection_to_data
 from langflow.inputs.inputs import MultilineInput
 from langflow.io import BoolInput, DropdownInput, HandleInput, IntInput, MessageTextInput, TabInput
@@ -96,6 +102,7 @@ class LocalDBComponent(LCVectorStoreComponent):
             advanced=True,
             info="Limit the number of records to compare when Allow Duplicates is False.",
         ),
+        *INCREMENTAL_INGESTION_INPUTS,
     ]
     outputs = [
         Output(display_name="DataFrame", name="dataframe", method="as_dataframe"),
@@ -117,6 +124,20 @@ class LocalDBComponent(LCVectorStoreComponent):
 
         return str(self.get_vector_store_directory(CACHE_DIR))
 
+    def get_persist_directory(self) -> str:
+        """Get the directory of the collection, under the user-provided directory or the default cache directory."""
+        if self.persist_directory:
+            base_dir = self.resolve_path(self.persist_directory)
+            persist_directory = str(self.get_vector_store_directory(base_dir))
+            logger.debug(f"Using custom persist directory: {persist_directory}")
+        else:
+            persist_directory = self.get_default_persist_dir()
+            logger.debug(f"Using default persist directory: {persist_directory}")
+        return persist_directory
+
+    def get_ingestion_collection(self) -> str | None:
+        return get_collection_key(self.name, self.get_persist_directory(), self.collection_name)
+
     def list_existing_collections(self) -> list[str]:
         """List existing vector store collections from the persist directory."""
         from langflow.services.cache.utils import CACHE_DIR
@@ -191,6 +212,7 @@ class LocalDBComponent(LCVectorStoreComponent):
     def build_vector_store(self) -> Chroma:
         """Builds the Chroma object."""
         try:
+            from chromadb import PersistentClient
             from langchain_chroma import Chroma
         except ImportError as e:
             msg = "Could not import Chroma integration package. Please install it with `pip install langchain-chroma`."
@@ -200,18 +222,13 @@ class LocalDBComponent(LCVectorStoreComponent):
         if self.existing_collections:
             self.collection_name = self.existing_collections
 
-        # Use user-provided directory or default cache directory
-        if self.persist_directory:
-            base_dir = self.resolve_path(self.persist_directory)
-            persist_directory = str(self.get_vector_store_directory(base_dir))
-            logger.debug(f"Using custom persist directory: {persist_directory}")
-        else:
-            persist_directory = self.get_default_persist_dir()
-            logger.debug(f"Using default persist directory: {persist_directory}")
-
+        persist_directory = self.get_persist_directory()
+        client = get_pooled_client(
+            "chroma", {"path": persist_directory}, lambda: PersistentClient(path=persist_directory), owner=self
+        )
         chroma = Chroma(
             persist_directory=persist_directory,
-            client=None,
+            client=client,
             embedding_function=self.embedding,
             collection_name=self.collection_name,
         )
@@ -230,6 +247,19 @@ class LocalDBComponent(LCVectorStoreComponent):
         # Convert DataFrame to Data if needed using parent's method
         ingest_data = self._prepare_ingest_data()
 
+        if self.incremental_ingestion:
+            documents = []
+            for _input in ingest_data:
+                if not isinstance(_input, Data):
+                    msg = "Vector Store Inputs must be Data objects."
+                    raise TypeError(msg)
+                documents.append(_input.to_lc_document())
+            # The ledger is out of date if the collection was deleted
+            if not vector_store.get(limit=1, include=[])["ids"]:
+                self.reset_ingestion_ledger()
+            self.ingest_documents(vector_store, documents)
+            return
+
         stored_documents_without_id = []
         if self.allow_duplicates:
             stored_data = []
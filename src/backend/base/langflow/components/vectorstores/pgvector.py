@@ -1,6 +1,14 @@
+import sqlalchemy
 from langchain_community.vectorstores import PGVector
+from langchain_core.documents import Document
 
-from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.ledger import get_collection_key
+from langflow.base.vectorstores.model import (
+    INCREMENTAL_INGESTION_INPUTS,
+    LCVectorStoreComponent,
+    check_cached_vector_store,
+)
+from langflow.base.vectorstores.pool import get_pooled_client
 from langflow.helpers.data import docs_to_data
 from langflow.io import HandleInput, IntInput, SecretStrInput, StrInput
 from langflow.schema import Data
@@ -25,8 +33,14 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
             value=4,
             advanced=True,
         ),
+        *INCREMENTAL_INGESTION_INPUTS,
     ]
 
+    accepts_embeddings = True
+
+    def get_ingestion_collection(self) -> str | None:
+        return get_collection_key(self.name, transform_connection_string(self.pg_server_url), self.collection_name)
+
     @check_cached_vector_store
     def build_vector_store(self) -> PGVector:
         # Convert DataFrame to Data if needed using parent's method
@@ -41,22 +55,52 @@ class PGVectorStoreComponent(LCVectorStoreComponent):
 
         connection_string_parsed = transform_connection_string(self.pg_server_url)
 
-        if documents:
-            pgvector = PGVector.from_documents(
-                embedding=self.embedding,
-                documents=documents,
-                collection_name=self.collection_name,
-                connection_string=connection_string_parsed,
-            )
-        else:
-            pgvector = PGVector.from_existing_index(
-                embedding=self.embedding,
-                collection_name=self.collection_name,
-                connection_string=connection_string_parsed,
-            )
-
+        # The engine keeps a pool of connections, checked before being reused
+        engine = get_pooled_client(
+            "pgvector",
+            {"connection_string": connection_string_parsed},
+            lambda: sqlalchemy.create_engine(connection_string_parsed, pool_pre_ping=True),
+            owner=self,
+            close=lambda engine: engine.dispose(),
+        )
+        # The collection is created if it doesn't exist
+        pgvector = PGVector(
+            connection_string=connection_string_parsed,
+            embedding_function=self.embedding,
+            collection_name=self.collection_name,
+            connection=engine,
+        )
+        if self.incremental_ingestion and self._is_collection_empty(pgvector):
+            # The ledger is out of date if the collection was deleted
+            self.reset_ingestion_ledger()
+        self.ingest_documents(pgvector, documents)
         return pgvector
 
+    @staticmethod
+    def _is_collection_empty(vector_store: PGVector) -> bool:
+        with vector_store._make_session() as session:
+            collection = vector_store.get_collection(session)
+            if collection is None:
+                return True
+            embedding_store = vector_store.EmbeddingStore
+            query = session.query(embedding_store.uuid).filter(embedding_store.collection_id == collection.uuid)
+            return query.first() is None
+
+    def add_embedded_documents(
+        self,
+        vector_store: PGVector,
+        documents: list[Document],
+        embeddings: list[list[float]],
+        ids: list[str] | None,
+    ) -> PGVector:
+        vector_store.add_embeddings(
+            texts=[document.page_content for document in documents],
+            embeddings=embeddings,
+            metadatas=[document.metadata for document in documents],
+            ids=ids,
+        )
+        return vector_store
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -1,7 +1,10 @@
+from typing import TYPE_CHECKING
+
 from langchain.embeddings.base import Embeddings
 from langchain_community.vectorstores import Qdrant
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.pool import evict_pooled_client, get_pooled_client
 from langflow.helpers.data import docs_to_data
 from langflow.io import (
     DropdownInput,
@@ -12,6 +15,9 @@ from langflow.io import (
 )
 from langflow.schema import Data
 
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
 
 class QdrantVectorStoreComponent(LCVectorStoreComponent):
     display_name = "Qdrant"
@@ -84,16 +90,34 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
             msg = "Invalid embedding object"
             raise TypeError(msg)
 
-        if documents:
+        if documents and self.path:
+            # Local storage can only be opened by one client, so the pooled client is closed first
+            evict_pooled_client("qdrant", server_kwargs, owner=self)
+            qdrant = Qdrant.from_documents(documents, embedding=self.embedding, **qdrant_kwargs, **server_kwargs)
+            # The client of the store is pooled for the next builds
+            get_pooled_client(
+                "qdrant", server_kwargs, lambda: qdrant.client, owner=self, health_check=self._check_client
+            )
+        elif documents:
             qdrant = Qdrant.from_documents(documents, embedding=self.embedding, **qdrant_kwargs, **server_kwargs)
         else:
             from qdrant_client import QdrantClient
 
-            client = QdrantClient(**server_kwargs)
+            client = get_pooled_client(
+                "qdrant",
+                server_kwargs,
+                lambda: QdrantClient(**server_kwargs),
+                owner=self,
+                health_check=self._check_client,
+            )
             qdrant = Qdrant(embeddings=self.embedding, client=client, **qdrant_kwargs)
 
         return qdrant
 
+    @staticmethod
+    def _check_client(client: "QdrantClient") -> None:
+        client.get_collections()
+
     def search_documents(self) -> list[Data]:
         vector_store = self.build_vector_store()
 
@@ -1,10 +1,27 @@
-from .channel import YouTubeChannelComponent
-from .comments import YouTubeCommentsComponent
-from .playlist import YouTubePlaylistComponent
-from .search import YouTubeSearchComponent
-from .trending import YouTubeTrendingComponent
-from .video_details import YouTubeVideoDetailsComponent
-from .youtube_transcripts import YouTubeTranscriptsComponent
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+if TYPE_CHECKING:
+    from .channel import YouTubeChannelComponent
+    from .comments import YouTubeCommentsComponent
+    from .playlist import YouTubePlaylistComponent
+    from .search import YouTubeSearchComponent
+    from .trending import YouTubeTrendingComponent
+    from .video_details import YouTubeVideoDetailsComponent
+    from .youtube_transcripts import YouTubeTranscriptsComponent
+
+_dynamic_imports = {
+    "YouTubeChannelComponent": "channel",
+    "YouTubeCommentsComponent": "comments",
+    "YouTubePlaylistComponent": "playlist",
+    "YouTubeSearchComponent": "search",
+    "YouTubeTranscriptsComponent": "youtube_transcripts",
+    "YouTubeTrendingComponent": "trending",
+    "YouTubeVideoDetailsComponent": "video_details",
+}
 
 __all__ = [
     "YouTubeChannelComponent",
@@ -15,3 +32,11 @@ __all__ = [
     "YouTubeTrendingComponent",
     "YouTubeVideoDetailsComponent",
 ]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
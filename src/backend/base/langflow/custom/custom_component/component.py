@@ -95,6 +95,9 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    # Deterministic components can set this so their results are reused across runs
+    # when the `vertex_memoization` setting is enabled.
+    memoizable: ClassVar[bool] = False
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
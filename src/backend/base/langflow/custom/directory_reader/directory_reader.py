@@ -62,24 +62,31 @@ class DirectoryReader:
         return len(file_content.strip()) == 0
 
     def filter_loaded_components(self, data: dict, *, with_errors: bool) -> dict:
-        from langflow.custom.utils import build_component
-
-        items = []
-        for menu in data["menu"]:
-            components = []
-            for component in menu["components"]:
-                try:
-                    if component["error"] if with_errors else not component["error"]:
-                        component_tuple = (*build_component(component), component)
-                        components.append(component_tuple)
-                except Exception:  # noqa: BLE001
-                    logger.debug(f"Error while loading component {component['name']} from {component['file']}")
-                    continue
-            items.append({"name": menu["name"], "path": menu["path"], "components": components})
+        items = [self.build_menu(menu, with_errors=with_errors) for menu in data["menu"]]
         filtered = [menu for menu in items if menu["components"]]
         logger.debug(f"Filtered components {'with errors' if with_errors else ''}: {len(filtered)}")
         return {"menu": filtered}
 
+    def build_menu(self, menu: dict, *, with_errors: bool, failed: list[dict] | None = None) -> dict:
+        """Build the components of a menu, either the valid ones or the ones with errors.
+
+        Components whose build raised are skipped, and added to `failed` when given.
+        """
+        from langflow.custom.utils import build_component
+
+        components = []
+        for component in menu["components"]:
+            try:
+                if component["error"] if with_errors else not component["error"]:
+                    component_tuple = (*build_component(component), component)
+                    components.append(component_tuple)
+            except Exception:  # noqa: BLE001
+                logger.debug(f"Error while loading component {component['name']} from {component['file']}")
+                if failed is not None:
+                    failed.append(component)
+                continue
+        return {"name": menu["name"], "path": menu["path"], "components": components}
+
     def validate_code(self, file_content) -> bool:
         """Validate the Python code by trying to parse it with ast.parse."""
         try:
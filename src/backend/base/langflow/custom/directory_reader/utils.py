@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 from loguru import logger
 
@@ -53,12 +54,47 @@ def build_and_validate_all_files(reader: DirectoryReader, file_list):
     return valid_components, invalid_components
 
 
+def build_category(reader: DirectoryReader, menu: dict) -> tuple[dict, dict, list[dict], float]:
+    """Build the valid and invalid components of a category, timing it.
+
+    Returns:
+        The valid menu, the invalid menu, the valid components whose build raised and the elapsed seconds.
+    """
+    start_time = time.perf_counter()
+    failed: list[dict] = []
+    valid_menu = reader.build_menu(menu, with_errors=False, failed=failed)
+    invalid_menu = reader.build_menu(menu, with_errors=True)
+    return valid_menu, invalid_menu, failed, time.perf_counter() - start_time
+
+
+def retry_failed_components(reader: DirectoryReader, valid_menus: list[dict], failed: list[list[dict]]) -> None:
+    """Build again, one at a time, the components that failed while categories were built concurrently."""
+    for menu, failed_components in zip(valid_menus, failed, strict=True):
+        if failed_components:
+            retried = reader.build_menu({**menu, "components": failed_components}, with_errors=False)
+            menu["components"].extend(retried["components"])
+
+
 async def abuild_and_validate_all_files(reader: DirectoryReader, file_list):
-    """Build and validate all files."""
+    """Build and validate all files.
+
+    Categories are built concurrently in worker threads.
+    """
     data = await reader.abuild_component_menu_list(file_list)
 
-    valid_components = reader.filter_loaded_components(data=data, with_errors=False)
-    invalid_components = reader.filter_loaded_components(data=data, with_errors=True)
+    results = await asyncio.gather(*(asyncio.to_thread(build_category, reader, menu) for menu in data["menu"]))
+    valid_menus = [valid_menu for valid_menu, _, _, _ in results]
+    invalid_menus = [invalid_menu for _, invalid_menu, _, _ in results]
+    failed = [failed_components for _, _, failed_components, _ in results]
+    if any(failed):
+        # Concurrent imports can fail where sequential ones succeed, e.g. on import cycles between modules
+        await asyncio.to_thread(retry_failed_components, reader, valid_menus, failed)
+    for valid_menu, (_, _, _, seconds) in zip(valid_menus, results, strict=True):
+        count = len(valid_menu["components"])
+        logger.debug(f"Built {count} component(s) of category {valid_menu['name']} in {seconds:.2f}s")
+
+    valid_components = {"menu": [menu for menu in valid_menus if menu["components"]]}
+    invalid_components = {"menu": [menu for menu in invalid_menus if menu["components"]]}
 
     return valid_components, invalid_components
 
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import inspect
 import re
+import time
 import traceback
 from pathlib import Path
 from typing import Any
@@ -491,22 +492,20 @@ async def abuild_custom_components(components_paths: list[str]):
         return {}
 
     logger.info(f"Building custom components from {components_paths}")
+    start_time = time.perf_counter()
     custom_components_from_file: dict = {}
-    processed_paths = set()
-    for path in components_paths:
-        path_str = str(path)
-        if path_str in processed_paths:
-            continue
-
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+    paths = list(dict.fromkeys(str(path) for path in components_paths))
+    # Paths are built concurrently, then merged in order so later paths still override earlier ones
+    custom_component_dicts = await asyncio.gather(*(abuild_custom_component_list_from_path(path) for path in paths))
+    for custom_component_dict in custom_component_dicts:
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
             custom_components_from_file = merge_nested_dicts_with_renaming(
                 custom_components_from_file, custom_component_dict
             )
-        processed_paths.add(path_str)
 
+    logger.info(f"Built custom components from {len(paths)} path(s) in {time.perf_counter() - start_time:.2f}s")
     return custom_components_from_file
 
 
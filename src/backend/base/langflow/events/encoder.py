@@ -0,0 +1,99 @@
+"""JSON encoding of the events sent by the EventManager."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Any
+
+import orjson
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+
+from langflow.schema.data import Data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Budget for the tabular data of a single event. Larger DataFrames are cut to the rows that fit.
+DEFAULT_MAX_EVENT_BYTES = 1024 * 1024
+# Rows encoded to estimate the size of a DataFrame row
+_SAMPLE_ROWS = 20
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class EventEncoder:
+    """Encodes events to JSON bytes with orjson.
+
+    Values orjson can't encode natively are converted by the encoder registered for the closest class
+    in their MRO, and by FastAPI's `jsonable_encoder` when none is registered. Pre-encoded JSON can be
+    passed as `orjson.Fragment` to be embedded as is.
+
+    Args:
+        max_event_bytes: The approximate maximum size of the rows of a DataFrame in one event.
+            None disables the truncation.
+    """
+
+    def __init__(self, max_event_bytes: int | None = DEFAULT_MAX_EVENT_BYTES) -> None:
+        self.max_event_bytes = max_event_bytes
+        self._encoders: dict[type, Callable[[Any], Any]] = {}
+        self._resolved: dict[type, Callable[[Any], Any] | None] = {}
+        self.register(BaseModel, self._encode_model)
+        self.register(Data, self._encode_data)
+        self.register(pd.DataFrame, self._encode_dataframe)
+        self.register(datetime, _encode_datetime)
+        self.register(date, _encode_datetime)
+        self.register(time, _encode_datetime)
+
+    def register(self, type_: type, encoder: Callable[[Any], Any]) -> None:
+        """Register a function converting instances of `type_` (and its subclasses) to encodable values."""
+        self._encoders[type_] = encoder
+        self._resolved.clear()
+
+    def encode(self, event_type: str, data: Any) -> bytes:
+        """Encode an event in the format streamed to the client."""
+        event = {"event": event_type, "data": data}
+        return orjson.dumps(event, default=self._default, option=_ORJSON_OPTIONS) + b"\n\n"
+
+    def _default(self, obj: Any) -> Any:
+        encoder = self._resolve(type(obj))
+        if encoder is not None:
+            return encoder(obj)
+        return jsonable_encoder(obj)
+
+    def _resolve(self, type_: type) -> Callable[[Any], Any] | None:
+        if type_ not in self._resolved:
+            self._resolved[type_] = next((self._encoders[cls] for cls in type_.__mro__ if cls in self._encoders), None)
+        return self._resolved[type_]
+
+    def _encode_model(self, obj: BaseModel) -> Any:
+        try:
+            return obj.model_dump(mode="json")
+        except PydanticSerializationError:
+            return jsonable_encoder(obj)
+
+    def _encode_data(self, obj: Data) -> Any:
+        if type(obj).serialize_model is not Data.serialize_model:
+            return self._encode_model(obj)
+        # Same output as Data.serialize_model, but nested values are left to orjson and the registered encoders
+        return {key: value.to_json() if hasattr(value, "to_json") else value for key, value in obj.data.items()}
+
+    def _encode_dataframe(self, obj: pd.DataFrame) -> Any:
+        if self.max_event_bytes is not None and len(obj) > _SAMPLE_ROWS:
+            sample = obj.head(_SAMPLE_ROWS).to_dict(orient="records")
+            row_bytes = max(1, len(orjson.dumps(sample, default=self._default, option=_ORJSON_OPTIONS)) // _SAMPLE_ROWS)
+            max_rows = max(_SAMPLE_ROWS, self.max_event_bytes // row_bytes)
+            if len(obj) > max_rows:
+                logger.debug(f"Sending {max_rows} of {len(obj)} DataFrame rows to stay within the event size budget")
+                obj = obj.head(max_rows)
+        return obj.to_dict(orient="records")
+
+
+def _encode_datetime(obj: date | time) -> str:
+    # datetime subclasses such as pandas.Timestamp are not encoded natively by orjson
+    return obj.isoformat()
+
+
+default_event_encoder = EventEncoder()
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 import inspect
-import json
 import time
 import uuid
 from functools import partial
 from typing import TYPE_CHECKING, Literal
 
-from fastapi.encoders import jsonable_encoder
 from loguru import logger
 from typing_extensions import Protocol
 
+from langflow.events.encoder import EventEncoder, default_event_encoder
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
@@ -28,8 +27,9 @@ class PartialEventCallback(Protocol):
 
 
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    def __init__(self, queue: asyncio.Queue, encoder: EventEncoder | None = None):
         self.queue = queue
+        self.encoder = encoder or default_event_encoder
         self.events: dict[str, PartialEventCallback] = {}
 
     @staticmethod
@@ -73,11 +73,8 @@ class EventManager:
             logger.debug(f"Error creating playground event: {e}")
         except Exception:
             raise
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        self.queue.put_nowait((event_id, self.encoder.encode(event_type, data), time.time()))
 
     def noop(self, *, data: LoggableType) -> None:
         pass
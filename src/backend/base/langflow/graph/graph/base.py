@@ -11,7 +11,6 @@ import traceback
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -41,11 +40,11 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_tracing_service, get_variable_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Iterable
+    from collections.abc import Awaitable, Callable, Generator, Iterable
 
     from langflow.api.v1.schemas import InputValueRequest
     from langflow.custom.custom_component.component import Component
@@ -663,6 +662,31 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await self.prefetch_variables()
+
+    async def prefetch_variables(self) -> None:
+        """Loads the Global Variables referenced by every vertex with a single query.
+
+        Components resolve their load_from_db fields one at a time while building, so the values
+        are fetched up front and served from the variable service cache instead.
+        """
+        if not self.user_id:
+            return
+        names = {
+            vertex.params[field]
+            for vertex in self.vertices
+            for field in vertex.load_from_db_fields
+            if isinstance(vertex.params.get(field), str) and vertex.params[field]
+        }
+        if not names:
+            return
+        try:
+            user_id = self.user_id if isinstance(self.user_id, uuid.UUID) else uuid.UUID(self.user_id)
+            async with session_scope() as session:
+                await get_variable_service().prefetch_variables(user_id, names, session)
+        except Exception:  # noqa: BLE001
+            # Variables are still resolved one by one during the build
+            logger.opt(exception=True).debug("Error prefetching variables")
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -740,6 +764,7 @@ class Graph:
         session_id: str,
         fallback_to_env_vars: bool,
         event_manager: EventManager | None = None,
+        on_output: Callable[[Vertex], Awaitable[None]] | None = None,
     ) -> list[ResultData | None]:
         """Runs the graph with the given inputs.
 
@@ -752,6 +777,8 @@ class Graph:
             session_id (str): The session ID for the graph.
             fallback_to_env_vars (bool): Whether to fallback to environment variables.
             event_manager (EventManager | None): The event manager for the graph.
+            on_output (Callable | None): Called with each output vertex as soon as it is built. The result of
+                the vertex is released afterwards and is not part of the returned outputs.
 
         Returns:
             List[Optional["ResultData"]]: The outputs of the graph.
@@ -774,6 +801,21 @@ class Graph:
                 msg = f"Vertex {vertex_id} not found"
                 raise ValueError(msg)
             vertex.update_raw_params({"session_id": session_id})
+
+        def is_output(vertex: Vertex) -> bool:
+            return (not outputs and vertex.is_output) or (vertex.display_name in outputs or vertex.id in outputs)
+
+        sent_outputs: set[str] = set()
+
+        async def send_output(vertex: Vertex) -> None:
+            if not is_output(vertex):
+                return
+            if not vertex.result and not stream and hasattr(vertex, "consume_async_generator"):
+                await vertex.consume_async_generator()
+            await on_output(vertex)
+            vertex.result = None
+            sent_outputs.add(vertex.id)
+
         # Process the graph
         try:
             cache_service = get_chat_service()
@@ -789,6 +831,7 @@ class Graph:
                 start_component_id=start_component_id,
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                on_vertex_built=send_output if on_output is not None else None,
             )
             self.increment_run_count()
         except Exception as exc:
@@ -800,7 +843,7 @@ class Graph:
         # Get the outputs
         vertex_outputs = []
         for vertex in self.vertices:
-            if not vertex.built:
+            if not vertex.built or vertex.id in sent_outputs:
                 continue
             if vertex is None:
                 msg = f"Vertex {vertex_id} not found"
@@ -808,7 +851,7 @@ class Graph:
 
             if not vertex.result and not stream and hasattr(vertex, "consume_async_generator"):
                 await vertex.consume_async_generator()
-            if (not outputs and vertex.is_output) or (vertex.display_name in outputs or vertex.id in outputs):
+            if is_output(vertex):
                 vertex_outputs.append(vertex.result)
 
         return vertex_outputs
@@ -824,6 +867,7 @@ class Graph:
         stream: bool = False,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        on_output: Callable[[Vertex], Awaitable[None]] | None = None,
     ) -> list[RunOutputs]:
         """Runs the graph with the given inputs.
 
@@ -836,6 +880,8 @@ class Graph:
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
             fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
             event_manager (EventManager | None): The event manager for the graph.
+            on_output (Callable | None): Called with each output vertex as soon as it is built, instead of
+                returning its result in the outputs. Defaults to None.
 
         Returns:
             List[RunOutputs]: The outputs of the graph.
@@ -871,6 +917,7 @@ class Graph:
                 session_id=session_id or "",
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                on_output=on_output,
             )
             run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
             logger.debug(f"Run outputs: {run_output_object}")
@@ -1346,7 +1393,12 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        cache_key = str(self.flow_id or self._run_id)
+        if not self._call_order:
+            # The first step stores the graph structure, later steps only store what changed
+            await chat_service.set_cache(cache_key, self)
+        else:
+            await chat_service.set_graph_checkpoint(cache_key, self, vertex_ids=[vertex_id])
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
@@ -1362,6 +1414,71 @@ class Graph:
             }
         )
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns the run-state delta used to checkpoint the graph between vertex builds.
+
+        Unlike pickling the whole graph, this only contains the state that changes while
+        the graph runs, so it can be applied on top of a cached copy of the graph structure.
+        """
+        return {
+            "run_id": self._run_id,
+            "run_manager": self.run_manager.to_dict(),
+            "run_queue": list(self._run_queue),
+            "activated_vertices": list(self.activated_vertices),
+            "inactivated_vertices": set(self.inactivated_vertices),
+            "built_vertices": [vertex.id for vertex in self.vertices if vertex.built],
+            # Branches marked by conditional components are inactive until the next run
+            "vertex_states": {vertex.id: vertex.state.value for vertex in self.vertices},
+        }
+
+    def apply_run_state(self, run_state: dict[str, Any]) -> bool:
+        """Applies a run-state delta created by `get_run_state`.
+
+        Args:
+            run_state: The run state to apply.
+
+        Returns:
+            bool: True if the state was applied, False if it belongs to another run.
+        """
+        if run_state.get("run_id") != self._run_id:
+            return False
+        self.run_manager = RunnableVerticesManager.from_dict(run_state["run_manager"])
+        for vertex_id in self.cycle_vertices:
+            self.run_manager.add_to_cycle_vertices(vertex_id)
+        self._run_queue = deque(run_state["run_queue"])
+        self.activated_vertices = list(run_state["activated_vertices"])
+        self.inactivated_vertices = set(run_state["inactivated_vertices"])
+        vertex_states = run_state.get("vertex_states", {})
+        for vertex in self.vertices:
+            vertex.state = VertexStates(vertex_states.get(vertex.id, VertexStates.ACTIVE))
+        return True
+
+    @staticmethod
+    def get_vertex_checkpoint(vertex: Vertex) -> dict[str, Any]:
+        """Returns the build results of a vertex so they can be cached independently of the graph."""
+        return {
+            "built": vertex.built,
+            "results": vertex.results,
+            "artifacts": vertex.artifacts,
+            "built_object": vertex.built_object,
+            "built_result": vertex.built_result,
+            "full_data": vertex.full_data,
+        }
+
+    @staticmethod
+    def apply_vertex_checkpoint(vertex: Vertex, checkpoint: dict[str, Any]) -> None:
+        """Restores the build results of a vertex from a checkpoint created by `get_vertex_checkpoint`.
+
+        Raises:
+            KeyError: If the checkpoint is missing one of the expected keys.
+        """
+        vertex.built = checkpoint["built"]
+        vertex.artifacts = checkpoint["artifacts"]
+        vertex.built_object = checkpoint["built_object"]
+        vertex.built_result = checkpoint["built_result"]
+        vertex.full_data = checkpoint["full_data"]
+        vertex.results = checkpoint["results"]
+
     def _record_snapshot(self, vertex_id: str | None = None) -> None:
         self._snapshots.append(self.get_snapshot())
         if vertex_id:
@@ -1434,14 +1551,8 @@ class Graph:
                     should_build = True
                 else:
                     try:
-                        cached_vertex_dict = cached_result["result"]
                         # Now set update the vertex with the cached vertex
-                        vertex.built = cached_vertex_dict["built"]
-                        vertex.artifacts = cached_vertex_dict["artifacts"]
-                        vertex.built_object = cached_vertex_dict["built_object"]
-                        vertex.built_result = cached_vertex_dict["built_result"]
-                        vertex.full_data = cached_vertex_dict["full_data"]
-                        vertex.results = cached_vertex_dict["results"]
+                        self.apply_vertex_checkpoint(vertex, cached_result["result"])
                         try:
                             vertex.finalize_build()
 
@@ -1462,16 +1573,7 @@ class Graph:
                     event_manager=event_manager,
                 )
                 if set_cache is not None:
-                    vertex_dict = {
-                        "built": vertex.built,
-                        "results": vertex.results,
-                        "artifacts": vertex.artifacts,
-                        "built_object": vertex.built_object,
-                        "built_result": vertex.built_result,
-                        "full_data": vertex.full_data,
-                    }
-
-                    await set_cache(key=vertex.id, data=vertex_dict)
+                    await set_cache(key=vertex.id, data=self.get_vertex_checkpoint(vertex))
 
         except Exception as exc:
             if not isinstance(exc, ComponentBuildError):
@@ -1525,8 +1627,12 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        on_vertex_built: Callable[[Vertex], Awaitable[None]] | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph with vertices in each layer run in parallel.
+
+        `on_vertex_built` is awaited with each vertex as soon as it is built, in order of completion.
+        """
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
@@ -1541,18 +1647,18 @@ class Graph:
             tasks = []
             for vertex_id in current_batch:
                 vertex = self.get_vertex(vertex_id)
-                task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
-                        event_manager=event_manager,
-                    ),
-                    name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+                build = self.build_vertex(
+                    vertex_id=vertex_id,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=chat_service.get_cache,
+                    set_cache=chat_service.set_cache,
+                    event_manager=event_manager,
                 )
+                if on_vertex_built is not None:
+                    build = self._notify_vertex_built(build, on_vertex_built)
+                task = asyncio.create_task(build, name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}")
                 tasks.append(task)
                 vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
 
@@ -1572,6 +1678,14 @@ class Graph:
         logger.debug("Graph processing complete")
         return self
 
+    @staticmethod
+    async def _notify_vertex_built(
+        build: Awaitable[VertexBuildResult], on_vertex_built: Callable[[Vertex], Awaitable[None]]
+    ) -> VertexBuildResult:
+        result = await build
+        await on_vertex_built(result.vertex)
+        return result
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
@@ -1595,8 +1709,7 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await get_chat_service().set_graph_checkpoint(str(self.flow_id), self, vertex_ids=[v_id])
         return next_runnable_vertices
 
     async def _log_vertex_build_from_exception(self, vertex_id: str, result: Exception) -> None:
@@ -391,12 +391,16 @@ class Vertex:
                 self.custom_component.set_event_manager(event_manager)
             custom_params = initialize.loading.get_params(self.params)
 
-        await self._build_results(
-            custom_component=custom_component,
-            custom_params=custom_params,
-            fallback_to_env_vars=fallback_to_env_vars,
-            base_type=self.base_type,
-        )
+        memo_key = self._get_memo_key(custom_component, custom_params)
+        if memo_key is None or not await self._apply_memoized_results(custom_component, memo_key):
+            await self._build_results(
+                custom_component=custom_component,
+                custom_params=custom_params,
+                fallback_to_env_vars=fallback_to_env_vars,
+                base_type=self.base_type,
+            )
+            if memo_key is not None:
+                await self._memoize_results(memo_key)
 
         self._validate_built_object()
 
@@ -646,6 +650,54 @@ class Vertex:
             msg = f"Error building Component {self.display_name}: \n\n{exc}"
             raise ComponentBuildError(msg, tb) from exc
 
+    def _get_memo_key(self, custom_component, custom_params: dict) -> str | None:
+        """Returns the content-addressed key of this build, or None if it should not be memoized."""
+        from langflow.services.deps import get_settings_service
+        from langflow.services.vertex_memo.utils import build_memo_key
+
+        if (
+            not get_settings_service().settings.vertex_memoization
+            or self.base_type != "component"
+            or not getattr(custom_component, "memoizable", False)
+            or self.is_interface_component
+            or self.is_state
+            or self.id in self.graph.cycle_vertices
+            # Variables can change without the params changing
+            or any(custom_params.get(field) for field in self.load_from_db_fields)
+        ):
+            return None
+        code = custom_params.get("code") or getattr(custom_component, "_code", None) or ""
+        output_names = [output["name"] for output in self.outputs if output["name"] in self.edges_source_names]
+        return build_memo_key(code, custom_params, output_names)
+
+    async def _apply_memoized_results(self, custom_component, memo_key: str) -> bool:
+        """Restores the results memoized under `memo_key`. Returns False on a cache miss."""
+        from langflow.services.deps import get_vertex_memo_service
+
+        memoized = await asyncio.to_thread(get_vertex_memo_service().get, memo_key)
+        if not isinstance(memoized, dict):
+            return False
+        results, artifacts = memoized["results"], memoized["artifacts"]
+        custom_component._results = results
+        custom_component._artifacts = artifacts
+        for output_name, value in results.items():
+            if output_name in custom_component._outputs_map:
+                custom_component._outputs_map[output_name].value = value
+        result = (custom_component, results, artifacts)
+        self.outputs_logs = build_output_logs(self, result)
+        self._update_built_object_and_artifacts(result)
+        self.logs = memoized["logs"]
+        logger.debug(f"Reused memoized results for {self.display_name}")
+        return True
+
+    async def _memoize_results(self, memo_key: str) -> None:
+        from langflow.services.deps import get_vertex_memo_service
+
+        if not isinstance(self.built_object, dict):
+            return
+        memoized = {"results": self.built_object, "artifacts": self.artifacts, "logs": self.logs}
+        await asyncio.to_thread(get_vertex_memo_service().set, memo_key, memoized)
+
     def _update_built_object_and_artifacts(self, result: Any | tuple[Any, dict] | tuple[Component, Any, dict]) -> None:
         """Updates the built object and its artifacts."""
         if isinstance(result, tuple):
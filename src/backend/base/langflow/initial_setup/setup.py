@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import os
@@ -20,6 +21,7 @@ import orjson
 import sqlalchemy as sa
 from aiofile import async_open
 from emoji import demojize, purely_emoji
+from filelock import FileLock, Timeout
 from loguru import logger
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload
@@ -35,8 +37,12 @@ from langflow.services.database.models.folder.model import Folder, FolderCreate,
 from langflow.services.database.models.user.crud import get_user_by_username
 from langflow.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
 from langflow.template.field.prompt import DEFAULT_PROMPT_INTUT_TYPES
+from langflow.utils.concurrency import KeyedWorkerLockManager
 from langflow.utils.util import escape_json_dump
 
+STARTER_PROJECTS_STATE_FILE = "starter_projects_state.json"
+STARTER_PROJECTS_LOCK_FILE = "starter_projects"
+
 # In the folder ./starter_projects we have a few JSON files that represent
 # starter projects. We want to load these into the database so that users
 # can use them as a starting point for their own projects.
@@ -597,11 +603,13 @@ def get_project_data(project):
     )
 
 
-async def update_project_file(project_path: anyio.Path, project: dict, updated_project_data) -> None:
-    project["data"] = updated_project_data
+async def update_project_file(project_path: anyio.Path, project: dict, updated_project_data) -> dict:
+    """Write a starter project with updated data to its file and return the updated project."""
+    project = {**project, "data": updated_project_data}
     async with async_open(str(project_path), "w", encoding="utf-8") as f:
         await f.write(orjson.dumps(project, option=ORJSON_OPTIONS).decode())
     logger.info(f"Updated starter project {project['name']} file")
+    return project
 
 
 def update_existing_project(
@@ -613,15 +621,40 @@ def update_existing_project(
     project_data,
     project_icon,
     project_icon_bg_color,
+    project_gradient=None,
+    project_tags=None,
 ) -> None:
     logger.info(f"Updating starter project {project_name}")
     existing_project.data = project_data
-    existing_project.folder = STARTER_FOLDER_NAME
     existing_project.description = project_description
     existing_project.is_component = project_is_component
     existing_project.updated_at = updated_at_datetime
     existing_project.icon = project_icon
     existing_project.icon_bg_color = project_icon_bg_color
+    existing_project.gradient = project_gradient
+    existing_project.tags = project_tags
+
+
+def starter_project_changed(
+    existing_project,
+    project_description,
+    project_is_component,
+    project_data,
+    project_icon,
+    project_icon_bg_color,
+    project_gradient,
+    project_tags,
+) -> bool:
+    """Whether a starter project flow differs from its project file. `updated_at` is ignored."""
+    return (
+        existing_project.data != project_data
+        or existing_project.description != project_description
+        or bool(existing_project.is_component) != bool(project_is_component)
+        or existing_project.icon != project_icon
+        or existing_project.icon_bg_color != project_icon_bg_color
+        or existing_project.gradient != project_gradient
+        or existing_project.tags != project_tags
+    )
 
 
 def create_new_project(
@@ -868,20 +901,102 @@ async def find_existing_flow(session, flow_id, flow_endpoint_name):
     return None
 
 
-async def create_or_update_starter_projects(all_types_dict: dict, *, do_create: bool = True) -> None:
-    """Create or update starter projects.
+def get_catalog_hash(all_types_dict: dict) -> str:
+    """Hash of the component catalog the starter projects are updated against."""
+    content = orjson.dumps(all_types_dict, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_starter_project_hash(project: dict, catalog_hash: str) -> str:
+    hasher = hashlib.sha256(catalog_hash.encode())
+    hasher.update(orjson.dumps(project, default=str, option=orjson.OPT_SORT_KEYS))
+    return hasher.hexdigest()
+
+
+def get_starter_projects_state_path() -> Path | None:
+    """The file holding the hash of each starter project as of its last update, or None without a config dir."""
+    config_dir = get_settings_service().settings.config_dir
+    return Path(config_dir) / STARTER_PROJECTS_STATE_FILE if config_dir else None
+
+
+def load_starter_projects_state(path: Path) -> dict[str, str]:
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as exc:
+        logger.warning(f"Ignoring unreadable starter projects state {path}: {exc}")
+        return {}
+
+
+def save_starter_projects_state(path: Path, project_hashes: dict[str, str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(project_hashes, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(path)
+
+
+async def sync_starter_project_flows(session: AsyncSession, folder_id: UUID, projects: list[tuple]) -> None:
+    """Make the flows of the starter folder match the starter projects.
+
+    Unchanged flows are left untouched and changed ones are updated in place, so they keep their ids.
+    Nothing is committed, so the caller's session writes every change in one transaction.
 
     Args:
-        all_types_dict (dict): Dictionary containing all component types and their templates
-        do_create (bool, optional): Whether to create new projects. Defaults to True.
+        session: The database session.
+        folder_id: The id of the starter folder.
+        projects: The starter projects, as returned by `get_project_data`.
     """
-    async with session_scope() as session:
-        new_folder = await create_starter_folder(session)
-        starter_projects = await load_starter_projects()
-        await delete_start_projects(session, new_folder.id)
-        await copy_profile_pictures()
-        for project_path, project in starter_projects:
-            (
+    existing_flows: dict[str, Flow] = {}
+    for flow in await get_all_flows_similar_to_project(session, folder_id):
+        if flow.name in existing_flows:
+            # Duplicates left by earlier versions
+            await session.delete(flow)
+        else:
+            existing_flows[flow.name] = flow
+
+    created = updated = 0
+    for (
+        project_name,
+        project_description,
+        project_is_component,
+        updated_at_datetime,
+        project_data,
+        project_icon,
+        project_icon_bg_color,
+        project_gradient,
+        project_tags,
+    ) in projects:
+        if not project_name or not project_data:
+            continue
+        existing_project = existing_flows.pop(project_name, None)
+        if existing_project is None:
+            create_new_project(
+                session=session,
+                project_name=project_name,
+                project_description=project_description,
+                project_is_component=project_is_component,
+                updated_at_datetime=updated_at_datetime,
+                project_data=project_data,
+                project_icon=project_icon,
+                project_icon_bg_color=project_icon_bg_color,
+                project_gradient=project_gradient,
+                project_tags=project_tags,
+                new_folder_id=folder_id,
+            )
+            created += 1
+        elif starter_project_changed(
+            existing_project,
+            project_description,
+            project_is_component,
+            project_data,
+            project_icon,
+            project_icon_bg_color,
+            project_gradient,
+            project_tags,
+        ):
+            update_existing_project(
+                existing_project,
                 project_name,
                 project_description,
                 project_is_component,
@@ -891,35 +1006,108 @@ async def create_or_update_starter_projects(all_types_dict: dict, *, do_create:
                 project_icon_bg_color,
                 project_gradient,
                 project_tags,
-            ) = get_project_data(project)
-            do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
-            if do_update_starter_projects:
+            )
+            session.add(existing_project)
+            updated += 1
+
+    # Flows of starter projects that no longer exist
+    for flow in existing_flows.values():
+        await session.delete(flow)
+    logger.debug(f"Starter projects: {created} created, {updated} updated, {len(existing_flows)} deleted")
+
+
+def get_starter_projects_lock(timeout: float = -1) -> FileLock:
+    """The lock held by the worker updating the starter projects, shared by the workers of the host."""
+    locks_dir = KeyedWorkerLockManager().locks_dir
+    return FileLock(locks_dir / STARTER_PROJECTS_LOCK_FILE, timeout=timeout, thread_local=False)
+
+
+async def create_or_update_starter_projects(all_types_dict: dict, *, do_create: bool = True) -> None:
+    """Create or update starter projects.
+
+    Updating a project to the latest component versions is skipped when neither its file nor the component
+    catalog changed since its last update, and the database is only written for the projects that changed,
+    in one transaction. Workers update the starter projects one at a time.
+
+    Args:
+        all_types_dict (dict): Dictionary containing all component types and their templates
+        do_create (bool, optional): Whether to create new projects. Defaults to True.
+    """
+    lock = await asyncio.to_thread(get_starter_projects_lock)
+    await asyncio.to_thread(lock.acquire)
+    try:
+        await _create_or_update_starter_projects(all_types_dict, do_create=do_create)
+    finally:
+        await asyncio.to_thread(lock.release)
+
+
+async def _create_or_update_starter_projects(all_types_dict: dict, *, do_create: bool = True) -> None:
+    do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
+    starter_projects = await load_starter_projects()
+    await copy_profile_pictures()
+
+    state_path = get_starter_projects_state_path() if do_update_starter_projects else None
+    synced_hashes = await asyncio.to_thread(load_starter_projects_state, state_path) if state_path else {}
+    catalog_hash = await asyncio.to_thread(get_catalog_hash, all_types_dict) if do_update_starter_projects else ""
+    project_hashes: dict[str, str] = {}
+    projects = []
+    skipped = 0
+    for project_path, starter_project in starter_projects:
+        project = starter_project
+        if do_update_starter_projects:
+            project_hash = get_starter_project_hash(project, catalog_hash)
+            if synced_hashes.get(project_path.name) == project_hash:
+                skipped += 1
+            else:
+                project_data = project.get("data")
+                # Deep copy, so changes made in place by the updates are detected
                 updated_project_data = update_projects_components_with_latest_component_versions(
-                    project_data.copy(), all_types_dict
+                    copy.deepcopy(project_data), all_types_dict
                 )
                 updated_project_data = update_edges_with_latest_component_versions(updated_project_data)
                 if updated_project_data != project_data:
-                    project_data = updated_project_data
                     # We also need to update the project data in the file
-                    await update_project_file(project_path, project, updated_project_data)
-            if do_create and project_name and project_data:
-                existing_flows = await get_all_flows_similar_to_project(session, new_folder.id)
-                for existing_project in existing_flows:
-                    await session.delete(existing_project)
-
-                create_new_project(
-                    session=session,
-                    project_name=project_name,
-                    project_description=project_description,
-                    project_is_component=project_is_component,
-                    updated_at_datetime=updated_at_datetime,
-                    project_data=project_data,
-                    project_icon=project_icon,
-                    project_icon_bg_color=project_icon_bg_color,
-                    project_gradient=project_gradient,
-                    project_tags=project_tags,
-                    new_folder_id=new_folder.id,
-                )
+                    project = await update_project_file(project_path, project, updated_project_data)
+                    project_hash = get_starter_project_hash(project, catalog_hash)
+            project_hashes[project_path.name] = project_hash
+        projects.append(get_project_data(project))
+    if skipped:
+        logger.debug(f"Skipped updating {skipped} unchanged starter project(s)")
+
+    if do_create:
+        async with session_scope() as session:
+            starter_folder = await create_starter_folder(session)
+            await sync_starter_project_flows(session, starter_folder.id, projects)
+
+    if state_path:
+        try:
+            await asyncio.to_thread(save_starter_projects_state, state_path, project_hashes)
+        except OSError as exc:
+            logger.warning(f"Could not save the starter projects state in {state_path}: {exc}")
+
+
+async def starter_projects_exist() -> bool:
+    async with session_scope() as session:
+        return await folder_exists(session, STARTER_FOLDER_NAME)
+
+
+async def update_starter_projects_in_background(all_types_dict: dict) -> None:
+    """Run `create_or_update_starter_projects`, logging errors instead of raising them.
+
+    The update is skipped when another worker is already running it.
+    """
+    lock = await asyncio.to_thread(get_starter_projects_lock, 0)
+    try:
+        await asyncio.to_thread(lock.acquire)
+    except Timeout:
+        logger.debug("Starter projects are being updated by another worker")
+        return
+    try:
+        await _create_or_update_starter_projects(all_types_dict)
+    except Exception:  # noqa: BLE001
+        logger.exception("Error updating starter projects")
+    finally:
+        await asyncio.to_thread(lock.release)
 
 
 async def initialize_super_user_if_needed() -> None:
@@ -0,0 +1,147 @@
+"""On-disk cache of the component catalog, shared across restarts and worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from importlib import metadata
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from filelock import FileLock, Timeout
+from loguru import logger
+
+from langflow.utils.version import get_version_info
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+CATALOG_FILE_PREFIX = "catalog-"
+# How long a worker waits for another worker building the catalog before building it itself
+BUILD_LOCK_TIMEOUT = 600
+# Packages the component templates are built from, besides the components themselves
+TEMPLATE_PACKAGES = ("langflow.base", "langflow.custom", "langflow.inputs", "langflow.template")
+
+
+def get_catalog_fingerprint(components_paths: list[str]) -> str:
+    """Returns a key that changes when the components, their paths or the installed packages change.
+
+    Component files are identified by their path, size and modification time, which is much cheaper than
+    hashing their content and changes whenever they are edited. The packages the component templates are
+    built from, like the base classes and input types, are identified the same way. Installed packages are
+    part of the key because components that fail to import a missing dependency are cached as invalid.
+    """
+    hasher = hashlib.sha256(get_version_info()["version"].encode())
+    distributions = sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions())
+    hasher.update("\n".join(distributions).encode())
+    for path in dict.fromkeys(str(path) for path in components_paths):
+        hasher.update(f"\0{path}\0".encode())
+        _update_with_files(hasher, Path(path))
+    for package in TEMPLATE_PACKAGES:
+        spec = find_spec(package)
+        for path in (spec.submodule_search_locations or []) if spec else []:
+            hasher.update(f"\0{package}\0".encode())
+            _update_with_files(hasher, Path(path))
+    return hasher.hexdigest()[:32]
+
+
+def _update_with_files(hasher: hashlib._Hash, root: Path) -> None:
+    """Adds the paths, sizes and modification times of the Python files under `root` to a hash."""
+    if not root.is_dir():
+        return
+    for file_path in sorted(root.rglob("*.py")):
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        hasher.update(f"{file_path.relative_to(root)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+
+
+class CatalogCache:
+    """Stores built component catalogs as JSON files named after their fingerprint.
+
+    Args:
+        cache_dir: The directory holding the catalog files.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def get_path(self, fingerprint: str) -> Path:
+        return self.cache_dir / f"{CATALOG_FILE_PREFIX}{fingerprint}.json"
+
+    def load(self, fingerprint: str) -> dict[str, Any] | None:
+        path = self.get_path(fingerprint)
+        try:
+            return orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as exc:
+            logger.warning(f"Ignoring unreadable component catalog cache {path}: {exc}")
+            return None
+
+    def save(self, fingerprint: str, catalog: dict[str, Any]) -> None:
+        """Writes a catalog atomically and removes the catalogs of other fingerprints."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        content = orjson.dumps(catalog, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+        path = self.get_path(fingerprint)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".catalog-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            # Readers in other workers see either no file or the complete one
+            Path(tmp_path).replace(path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        for stale_path in self.cache_dir.glob(f"{CATALOG_FILE_PREFIX}*.json"):
+            if stale_path != path:
+                stale_path.unlink(missing_ok=True)
+
+    def get_lock(self) -> FileLock:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # The lock is acquired and released from different threads
+        return FileLock(self.cache_dir / "catalog.lock", timeout=BUILD_LOCK_TIMEOUT, thread_local=False)
+
+
+async def aload_or_build_catalog(
+    components_paths: list[str],
+    cache_dir: str | Path,
+    build: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Loads the catalog of the components from the cache, or builds and caches it.
+
+    Only one worker process builds a missing catalog; the others wait for it and load the result.
+    """
+    cache = CatalogCache(cache_dir)
+    fingerprint = await asyncio.to_thread(get_catalog_fingerprint, components_paths)
+    catalog = await asyncio.to_thread(cache.load, fingerprint)
+    if catalog is not None:
+        logger.debug(f"Loaded component catalog {fingerprint} from {cache.cache_dir}")
+        return catalog
+
+    lock = await asyncio.to_thread(cache.get_lock)
+    try:
+        await asyncio.to_thread(lock.acquire)
+    except Timeout:
+        logger.warning("Timed out waiting for another worker to build the component catalog, building it here")
+        return await build()
+    try:
+        # Another worker may have built the catalog while this one was waiting for the lock
+        catalog = await asyncio.to_thread(cache.load, fingerprint)
+        if catalog is not None:
+            logger.debug(f"Loaded component catalog {fingerprint} built by another worker")
+            return catalog
+        catalog = await build()
+        try:
+            await asyncio.to_thread(cache.save, fingerprint, catalog)
+        except OSError as exc:
+            logger.warning(f"Could not save the component catalog cache in {cache.cache_dir}: {exc}")
+        return catalog
+    finally:
+        await asyncio.to_thread(lock.release)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -7,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.custom.utils import abuild_custom_components
+from langflow.interface.catalog_cache import aload_or_build_catalog
+from langflow.utils.compression import PrecompressedJSON
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
@@ -17,6 +20,15 @@ class ComponentCache:
     def __init__(self):
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Serialized and compressed catalog, keyed by category (None is the whole catalog).
+        # Bumping the version drops them, so they are rebuilt on the next request.
+        self.version = 0
+        self.payloads: dict[str | None, PrecompressedJSON] = {}
+        self.payloads_lock = asyncio.Lock()
+
+    def bump_version(self) -> None:
+        self.version += 1
+        self.payloads = {}
 
 
 # Singleton instance
@@ -36,18 +48,62 @@ async def get_and_cache_all_types_dict(
             component_cache.all_types_dict = await aget_component_metadata(settings_service.settings.components_path)
         else:
             # Traditional full loading
-            component_cache.all_types_dict = await aget_all_types_dict(settings_service.settings.components_path)
+            component_cache.all_types_dict = await aget_all_types_dict(
+                settings_service.settings.components_path, cache_dir=get_catalog_cache_dir(settings_service)
+            )
 
         # Log loading stats
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.get("components", {}).values())
         logger.debug(f"Loaded {component_count} components")
+        component_cache.bump_version()
 
     return component_cache.all_types_dict
 
 
-async def aget_all_types_dict(components_paths: list[str]):
-    """Get all types dictionary with full component loading."""
-    return await abuild_custom_components(components_paths=components_paths)
+async def get_catalog_payload(
+    settings_service: SettingsService, category: str | None = None
+) -> PrecompressedJSON | None:
+    """Get the serialized and compressed types dictionary, or one of its categories.
+
+    The payload is built once per catalog version in a worker thread and reused by every request.
+    Returns None if the category doesn't exist.
+    """
+    all_types = await get_and_cache_all_types_dict(settings_service)
+    if category is not None and category not in all_types:
+        return None
+    payload = component_cache.payloads.get(category)
+    if payload is not None:
+        return payload
+    async with component_cache.payloads_lock:
+        payload = component_cache.payloads.get(category)
+        if payload is None:
+            version = component_cache.version
+            data = all_types if category is None else {category: all_types[category]}
+            payload = await asyncio.to_thread(PrecompressedJSON, data)
+            # The catalog may have changed while serializing; don't keep a stale payload
+            if version == component_cache.version:
+                component_cache.payloads[category] = payload
+    return payload
+
+
+def get_catalog_cache_dir(settings_service: SettingsService) -> Path | None:
+    """Get the directory of the on-disk component catalog cache, or None if it is disabled."""
+    settings = settings_service.settings
+    if not settings.component_catalog_cache or not settings.config_dir:
+        return None
+    return Path(settings.config_dir) / "component_catalog"
+
+
+async def aget_all_types_dict(components_paths: list[str], cache_dir: Path | None = None):
+    """Get all types dictionary with full component loading.
+
+    With a `cache_dir`, the catalog is loaded from the on-disk cache while the components are unchanged.
+    """
+    if cache_dir is None:
+        return await abuild_custom_components(components_paths=components_paths)
+    return await aload_or_build_catalog(
+        components_paths, cache_dir, lambda: abuild_custom_components(components_paths=components_paths)
+    )
 
 
 async def aget_component_metadata(components_paths: list[str]):
@@ -204,6 +260,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.bump_version()
             logger.debug(f"Component {component_type}:{component_name} fully loaded")
         else:
             logger.warning(f"Failed to fully load component {component_type}:{component_name}")
@@ -23,13 +23,17 @@ from pydantic_core import PydanticSerializationError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
 from langflow.api import health_check_router, log_router, router
+from langflow.api.build import BUILD_FLOW_JOB_HANDLER, run_flow_build_job
 from langflow.api.v1.mcp_projects import init_mcp_servers
+from langflow.api.v1.runs import RUN_FLOW_JOB_HANDLER, run_flow_job
 from langflow.initial_setup.setup import (
     create_or_update_starter_projects,
     initialize_super_user_if_needed,
     load_bundles_from_urls,
     load_flows_from_directory,
+    starter_projects_exist,
     sync_flows_from_fs,
+    update_starter_projects_in_background,
 )
 from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
@@ -124,6 +128,7 @@ def get_lifespan(*, fix_migration=False, version=None):
 
         temp_dirs: list[TemporaryDirectory] = []
         sync_flows_from_fs_task = None
+        starter_projects_task = None
         try:
             start_time = asyncio.get_event_loop().time()
 
@@ -153,9 +158,14 @@ def get_lifespan(*, fix_migration=False, version=None):
             logger.debug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
-            logger.debug("Creating/updating starter projects")
-            await create_or_update_starter_projects(all_types_dict)
-            logger.debug(f"Starter projects updated in {asyncio.get_event_loop().time() - current_time:.2f}s")
+            if await starter_projects_exist():
+                # Existing starter projects stay usable while they are updated, so this doesn't delay startup
+                logger.debug("Updating starter projects in the background")
+                starter_projects_task = asyncio.create_task(update_starter_projects_in_background(all_types_dict))
+            else:
+                logger.debug("Creating starter projects")
+                await create_or_update_starter_projects(all_types_dict)
+                logger.debug(f"Starter projects created in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Starting telemetry service")
@@ -167,6 +177,8 @@ def get_lifespan(*, fix_migration=False, version=None):
             await load_flows_from_directory()
             sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
             queue_service = get_queue_service()
+            queue_service.register_handler(BUILD_FLOW_JOB_HANDLER, run_flow_build_job)
+            queue_service.register_handler(RUN_FLOW_JOB_HANDLER, run_flow_job)
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
             logger.debug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
@@ -190,6 +202,9 @@ def get_lifespan(*, fix_migration=False, version=None):
             if sync_flows_from_fs_task:
                 sync_flows_from_fs_task.cancel()
                 await asyncio.wait([sync_flows_from_fs_task])
+            if starter_projects_task:
+                starter_projects_task.cancel()
+                await asyncio.wait([starter_projects_task])
             await teardown_services()
 
             await asyncio.sleep(0.1)  # let logger flush async logs
@@ -12,6 +12,8 @@ from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.deps import get_settings_service
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from langflow.api.v1.schemas import InputValueRequest
     from langflow.graph.graph.base import Graph
     from langflow.graph.schema import RunOutputs
@@ -32,8 +34,12 @@ async def run_graph_internal(
     inputs: list[InputValueRequest] | None = None,
     outputs: list[str] | None = None,
     event_manager: EventManager | None = None,
+    on_output: Callable[[Vertex], Awaitable[None]] | None = None,
 ) -> tuple[list[RunOutputs], str]:
-    """Run the graph and generate the result."""
+    """Run the graph and generate the result.
+
+    With `on_output`, each output vertex is passed to it as soon as it is built instead of being returned.
+    """
     inputs = inputs or []
     effective_session_id = session_id or flow_id
     components = []
@@ -58,6 +64,7 @@ async def run_graph_internal(
         session_id=effective_session_id or "",
         fallback_to_env_vars=fallback_to_env_vars,
         event_manager=event_manager,
+        on_output=on_output,
     )
     return run_outputs, effective_session_id
 
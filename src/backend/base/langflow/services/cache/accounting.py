@@ -0,0 +1,219 @@
+"""Memory accounting and size-aware eviction for the in-memory cache services."""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections import OrderedDict
+    from collections.abc import Callable, Hashable
+
+DEFAULT_NAMESPACE = "default"
+GRAPHS_NAMESPACE = "graphs"
+VERTEX_RESULTS_NAMESPACE = "vertex_results"
+
+# Vertex ids look like `ChatInput-abc12`, see `Component.__init__`
+_VERTEX_ID_PATTERN = re.compile(r"^[A-Za-z][\w ]*-[\w-]{5}$")
+# Walking very large object graphs is expensive, so sizes are approximated past this many objects
+_MAX_OBJECTS_VISITED = 10_000
+# Graphs are cached by reference and keep changing while they run, so their sizes are measured again
+# when they are older than the interval, in seconds
+_REMEASURED_NAMESPACES = frozenset({GRAPHS_NAMESPACE})
+_REMEASURE_INTERVAL = 5.0
+
+
+def get_cache_namespace(key: Hashable) -> str:
+    """Returns the namespace of a cache key.
+
+    Graphs are cached under their flow id (and their checkpoints under `<flow_id>:run_state`),
+    vertex results under the vertex id or `<flow_id>:vertex:<vertex_id>`.
+    """
+    key = str(key)
+    if ":vertex:" in key or _VERTEX_ID_PATTERN.match(key):
+        return VERTEX_RESULTS_NAMESPACE
+    if key.endswith(":run_state"):
+        return GRAPHS_NAMESPACE
+    try:
+        uuid.UUID(key)
+    except ValueError:
+        return DEFAULT_NAMESPACE
+    return GRAPHS_NAMESPACE
+
+
+def get_size(value: Any) -> int:
+    """Approximates the deep size of a value in bytes.
+
+    NumPy arrays and pandas objects report their buffer sizes; other objects are walked through
+    their containers and `__dict__`. Objects shared between values are only counted once.
+    """
+    seen: set[int] = set()
+    stack = [value]
+    size = 0
+    visited = 0
+    while stack and visited < _MAX_OBJECTS_VISITED:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        visited += 1
+        shallow_size, is_leaf = _get_shallow_size(obj)
+        size += shallow_size
+        if is_leaf:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return size
+
+
+def _get_shallow_size(obj: Any) -> tuple[int, bool]:
+    """Returns the size of an object without its children, and whether it has no children to walk."""
+    if isinstance(obj, str | bytes | bytearray | int | float | bool) or obj is None:
+        return sys.getsizeof(obj), True
+    if hasattr(obj, "memory_usage") and hasattr(obj, "columns"):
+        # pandas DataFrame (including langflow's DataFrame subclass)
+        try:
+            return int(obj.memory_usage(deep=True).sum()), True
+        except Exception:  # noqa: BLE001
+            return sys.getsizeof(obj), True
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        # NumPy arrays and pandas Series
+        return nbytes, True
+    try:
+        return sys.getsizeof(obj), False
+    except TypeError:
+        return 0, False
+
+
+@dataclass
+class NamespaceStats:
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class CacheAccounting:
+    """Tracks entries, bytes, hits and evictions per namespace and picks entries to evict.
+
+    Sizes are only measured in namespaces with a limit, so caches without limits report 0 bytes.
+
+    Args:
+        max_bytes: The maximum number of bytes stored across all namespaces. None means unlimited.
+        namespace_quotas: The maximum number of bytes stored per namespace.
+        namespace_resolver: Returns the namespace of a key.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        namespace_quotas: dict[str, int] | None = None,
+        namespace_resolver: Callable[[Hashable], str] = get_cache_namespace,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.namespace_quotas = namespace_quotas or {}
+        self.namespace_resolver = namespace_resolver
+        self._stats: dict[str, NamespaceStats] = defaultdict(NamespaceStats)
+        self.total_bytes = 0
+
+    def namespace(self, key: Hashable) -> str:
+        return self.namespace_resolver(key)
+
+    def is_limited(self, namespace: str) -> bool:
+        return self.max_bytes is not None or namespace in self.namespace_quotas
+
+    def measure(self, namespace: str, value: Any) -> int:
+        """Returns the size of a value stored in a namespace, or 0 if no limit applies to the namespace."""
+        return get_size(value) if self.is_limited(namespace) else 0
+
+    def record_hit(self, namespace: str) -> None:
+        self._stats[namespace].hits += 1
+
+    def record_miss(self, namespace: str) -> None:
+        self._stats[namespace].misses += 1
+
+    def add(self, namespace: str, size: int) -> None:
+        stats = self._stats[namespace]
+        stats.entries += 1
+        stats.bytes += size
+        self.total_bytes += size
+
+    def remove(self, namespace: str, size: int, *, evicted: bool = False) -> None:
+        stats = self._stats[namespace]
+        stats.entries -= 1
+        stats.bytes -= size
+        self.total_bytes -= size
+        if evicted:
+            stats.evictions += 1
+
+    def clear(self) -> None:
+        for stats in self._stats.values():
+            stats.entries = 0
+            stats.bytes = 0
+        self.total_bytes = 0
+
+    def keys_to_evict(self, cache: OrderedDict, namespace: str, incoming_size: int) -> list[Hashable]:
+        """Returns the least recently used keys to evict so an item of `incoming_size` bytes fits.
+
+        The namespace quota is enforced first, then the global limit. The incoming item is always
+        stored, even when it is larger than the limits on its own.
+        """
+        self._remeasure(cache)
+        to_evict: dict[Hashable, None] = {}
+        quota = self.namespace_quotas.get(namespace)
+        if quota is not None:
+            excess = self._stats[namespace].bytes + incoming_size - quota
+            for key, item in cache.items():
+                if excess <= 0:
+                    break
+                if item["namespace"] == namespace:
+                    to_evict[key] = None
+                    excess -= item["size"]
+        if self.max_bytes is not None:
+            evicted_bytes = sum(cache[key]["size"] for key in to_evict)
+            excess = self.total_bytes - evicted_bytes + incoming_size - self.max_bytes
+            for key, item in cache.items():
+                if excess <= 0:
+                    break
+                if key not in to_evict:
+                    to_evict[key] = None
+                    excess -= item["size"]
+        return list(to_evict)
+
+    def _remeasure(self, cache: OrderedDict) -> None:
+        """Updates the sizes of the entries whose values may have changed since they were measured."""
+        now = time.time()
+        for item in cache.values():
+            namespace = item["namespace"]
+            if namespace not in _REMEASURED_NAMESPACES or not self.is_limited(namespace):
+                continue
+            if now - item.get("measured", item["time"]) < _REMEASURE_INTERVAL:
+                continue
+            item["measured"] = now
+            size = get_size(item["value"])
+            self._stats[namespace].bytes += size - item["size"]
+            self.total_bytes += size - item["size"]
+            item["size"] = size
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {namespace: stats.to_dict() for namespace, stats in self._stats.items()}
@@ -1,5 +1,4 @@
 import asyncio
-import pickle
 import time
 from typing import Generic
 
@@ -7,11 +6,12 @@ from diskcache import Cache
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.serializers import CacheCodec
 from langflow.services.cache.utils import CACHE_MISS
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
+    def __init__(self, cache_dir, max_size=None, expiration_time=3600, codec: CacheCodec | None = None) -> None:
         self.cache = Cache(cache_dir)
         # Let's clear the cache for now to maintain a similar
         # behavior as the in-memory cache
@@ -22,23 +22,33 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.codec = codec or CacheCodec(serializer="pickle")
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         if not lock:
             async with self.lock:
-                return await asyncio.to_thread(self._get, key)
+                return await self._aget(key)
         else:
-            return await asyncio.to_thread(self._get, key)
-
-    def _get(self, key):
+            return await self._aget(key)
+
+    async def _aget(self, key):
+        item = await asyncio.to_thread(self._get_item, key)
+        if item is None:
+            return CACHE_MISS
+        if not isinstance(item["value"], bytes):
+            # Strings were stored as is by earlier versions
+            return item["value"]
+        return await self.codec.aloads(key, item["value"])
+
+    def _get_item(self, key):
         item = self.cache.get(key, default=None)
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.touch(key)  # Refresh the expiry time
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                return item
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             self.cache.delete(key)  # Log before deleting the expired item
-        return CACHE_MISS
+        return None
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
         if not lock:
@@ -50,7 +60,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
     async def _set(self, key, value) -> None:
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
-        item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
+        item = {"value": await self.codec.adumps(key, value), "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
@@ -81,7 +91,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             await self._upsert(key, value)
 
     async def _upsert(self, key, value) -> None:
-        existing_value = await asyncio.to_thread(self._get, key)
+        existing_value = await self._aget(key)
         if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
             value = existing_value
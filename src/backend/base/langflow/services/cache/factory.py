@@ -6,6 +6,7 @@ from typing_extensions import override
 
 from langflow.logging.logger import logger
 from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.serializers import CacheCodec
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
 from langflow.services.factory import ServiceFactory
 
@@ -22,6 +23,15 @@ class CacheServiceFactory(ServiceFactory):
         # Here you would have logic to create and configure a CacheService
         # based on the settings_service
 
+        settings = settings_service.settings
+        if settings.cache_type in {"redis", "disk"}:
+            codec = CacheCodec(
+                serializer=settings.cache_serializer,
+                compression=settings.cache_compression,
+                compression_threshold=settings.cache_compression_threshold,
+                offload_threshold=settings.cache_offload_threshold,
+            )
+
         if settings_service.settings.cache_type == "redis":
             logger.debug("Creating Redis cache")
             return RedisCache(
@@ -30,15 +40,25 @@ class CacheServiceFactory(ServiceFactory):
                 db=settings_service.settings.redis_db,
                 url=settings_service.settings.redis_url,
                 expiration_time=settings_service.settings.redis_cache_expire,
+                codec=codec,
             )
 
         if settings_service.settings.cache_type == "memory":
-            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return ThreadingInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire,
+                max_bytes=settings.cache_max_bytes,
+                namespace_quotas=settings.cache_namespace_quotas,
+            )
         if settings_service.settings.cache_type == "async":
-            return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return AsyncInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire,
+                max_bytes=settings.cache_max_bytes,
+                namespace_quotas=settings.cache_namespace_quotas,
+            )
         if settings_service.settings.cache_type == "disk":
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
                 expiration_time=settings_service.settings.cache_expire,
+                codec=codec,
             )
         return None
@@ -0,0 +1,339 @@
+"""Serialization and compression of values stored by the external cache services.
+
+Every encoded value starts with a two byte header holding the serializer and compressor ids,
+so values written with one configuration can still be read after the configuration changes.
+Values written before the header was introduced are plain dill or pickle streams, and are still read.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import pickle
+import struct
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Literal
+
+import dill
+from loguru import logger
+
+SerializerName = Literal["dill", "pickle", "msgpack"]
+CompressionName = Literal["none", "zstd", "lz4"]
+
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+# The first byte of pickle streams (the PROTO opcode), never used as a serializer id
+PICKLE_PROTOCOL_OPCODE = 0x80
+
+
+class CacheSerializer(abc.ABC):
+    """Turns cached values into bytes and back."""
+
+    id: int
+    name: str
+
+    @abc.abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value.
+
+        Raises:
+            TypeError: If the value is not supported by this serializer.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize a value created by `dumps`."""
+
+
+class DillSerializer(CacheSerializer):
+    id = 1
+    name = "dill"
+
+    def dumps(self, value: Any) -> bytes:
+        return dill.dumps(value, recurse=True)
+
+    def loads(self, data: bytes) -> Any:
+        return dill.loads(data)
+
+
+class PickleSerializer(CacheSerializer):
+    """Pickle protocol 5 with out-of-band buffers.
+
+    Large contiguous buffers (NumPy arrays, pandas blocks, bytes-like objects) are written after the
+    pickle stream instead of being copied into it.
+    """
+
+    id = 2
+    name = "pickle"
+    _length = struct.Struct("!Q")
+
+    def dumps(self, value: Any) -> bytes:
+        buffers: list[pickle.PickleBuffer] = []
+        payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        parts = [self._length.pack(len(raw_buffers)), self._length.pack(len(payload)), payload]
+        for raw in raw_buffers:
+            parts.append(self._length.pack(raw.nbytes))
+            parts.append(raw)
+        return b"".join(parts)
+
+    def loads(self, data: bytes) -> Any:
+        view = memoryview(data)
+        offset = self._length.size
+        (num_buffers,) = self._length.unpack_from(view, 0)
+        (payload_length,) = self._length.unpack_from(view, offset)
+        offset += self._length.size
+        payload = view[offset : offset + payload_length]
+        offset += payload_length
+        buffers = []
+        for _ in range(num_buffers):
+            (length,) = self._length.unpack_from(view, offset)
+            offset += self._length.size
+            buffers.append(view[offset : offset + length])
+            offset += length
+        return pickle.loads(payload, buffers=buffers)
+
+
+class MsgpackSerializer(CacheSerializer):
+    """Msgpack for values made only of primitives (str, numbers, lists and dicts)."""
+
+    id = 3
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError as exc:
+            msg = "The msgpack cache serializer requires the msgpack package. Please install it: pip install msgpack"
+            raise ImportError(msg) from exc
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class Compressor(abc.ABC):
+    id: int
+    name: str
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes: ...
+
+    @abc.abstractmethod
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+class NoCompressor(Compressor):
+    id = 0
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class ZstdCompressor(Compressor):
+    id = 1
+    name = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        try:
+            import zstandard
+        except ImportError as exc:
+            msg = "zstd cache compression requires the zstandard package. Please install it: pip install zstandard"
+            raise ImportError(msg) from exc
+        self._level = level
+        self._zstandard = zstandard
+
+    def compress(self, data: bytes) -> bytes:
+        # Compressor objects are not thread safe, so one is created per call
+        return self._zstandard.ZstdCompressor(level=self._level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._zstandard.ZstdDecompressor().decompress(data)
+
+
+class Lz4Compressor(Compressor):
+    id = 2
+    name = "lz4"
+
+    def __init__(self) -> None:
+        try:
+            import lz4.frame
+        except ImportError as exc:
+            msg = "lz4 cache compression requires the lz4 package. Please install it: pip install lz4"
+            raise ImportError(msg) from exc
+        self._lz4_frame = lz4.frame
+
+    def compress(self, data: bytes) -> bytes:
+        return self._lz4_frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._lz4_frame.decompress(data)
+
+
+SERIALIZERS: dict[str, type[CacheSerializer]] = {
+    DillSerializer.name: DillSerializer,
+    PickleSerializer.name: PickleSerializer,
+    MsgpackSerializer.name: MsgpackSerializer,
+}
+COMPRESSORS: dict[str, type[Compressor]] = {
+    NoCompressor.name: NoCompressor,
+    ZstdCompressor.name: ZstdCompressor,
+    Lz4Compressor.name: Lz4Compressor,
+}
+
+
+def get_key_prefix(key: Any) -> str:
+    """Groups cache keys for metrics without creating one series per key.
+
+    Keys such as `<flow_id>:run_state` are grouped by their suffix, flow ids are grouped under `flow`
+    and vertex ids (e.g. `ChatInput-abc12`) under their component name.
+    """
+    key = str(key)
+    if ":" in key:
+        return key.split(":")[1] or "unknown"
+    try:
+        uuid.UUID(key)
+    except ValueError:
+        return key.split("-")[0] or "unknown"
+    return "flow"
+
+
+class CacheCodec:
+    """Encodes cached values with a configurable serializer and compression.
+
+    Values whose serialized size is above `offload_threshold` are serialized in a worker thread by the
+    async helpers, so large graphs or DataFrames don't block the event loop. Serialized bytes and
+    serialization time are aggregated per key prefix and exported as OpenTelemetry histograms.
+
+    Args:
+        serializer: The serializer to use. `msgpack` falls back to `pickle` for values it can't pack.
+        compression: The compression to apply to values larger than `compression_threshold`.
+        compression_threshold: Minimum serialized size in bytes before compressing.
+        offload_threshold: Serialized size in bytes above which (de)serialization runs in a thread.
+    """
+
+    def __init__(
+        self,
+        serializer: SerializerName = "dill",
+        compression: CompressionName = "none",
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
+        if serializer not in SERIALIZERS:
+            msg = f"Unknown cache serializer '{serializer}'. Expected one of {list(SERIALIZERS)}"
+            raise ValueError(msg)
+        if compression not in COMPRESSORS:
+            msg = f"Unknown cache compression '{compression}'. Expected one of {list(COMPRESSORS)}"
+            raise ValueError(msg)
+        self.serializer = SERIALIZERS[serializer]()
+        self.fallback_serializer = PickleSerializer()
+        self.compressor = COMPRESSORS[compression]()
+        self.compression_threshold = compression_threshold
+        self.offload_threshold = offload_threshold
+        self._serializers: dict[int, CacheSerializer] = {self.serializer.id: self.serializer}
+        self._compressors: dict[int, Compressor] = {
+            self.compressor.id: self.compressor,
+            NoCompressor.id: NoCompressor(),
+        }
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"dumps": 0, "loads": 0, "bytes": 0, "seconds": 0.0, "last_size": 0}
+        )
+
+    def dumps(self, key: Any, value: Any) -> bytes:
+        start = time.perf_counter()
+        serializer = self.serializer
+        try:
+            data = serializer.dumps(value)
+        except TypeError:
+            if serializer is self.fallback_serializer:
+                raise
+            serializer = self.fallback_serializer
+            data = serializer.dumps(value)
+        compressor = self.compressor if len(data) >= self.compression_threshold else self._compressors[NoCompressor.id]
+        data = bytes((serializer.id, compressor.id)) + compressor.compress(data)
+        self._record(key, "dumps", len(data), time.perf_counter() - start)
+        return data
+
+    def loads(self, key: Any, data: bytes) -> Any:
+        start = time.perf_counter()
+        if data[0] == PICKLE_PROTOCOL_OPCODE:
+            # Written without a header by earlier versions, dill reads plain pickles too
+            value = self._get_serializer(DillSerializer.id).loads(data)
+        else:
+            serializer = self._get_serializer(data[0])
+            compressor = self._get_compressor(data[1])
+            value = serializer.loads(compressor.decompress(data[2:]))
+        self._record(key, "loads", len(data), time.perf_counter() - start)
+        return value
+
+    async def adumps(self, key: Any, value: Any) -> bytes:
+        if self._should_offload(key, value):
+            return await asyncio.to_thread(self.dumps, key, value)
+        return self.dumps(key, value)
+
+    async def aloads(self, key: Any, data: bytes) -> Any:
+        if len(data) >= self.offload_threshold:
+            return await asyncio.to_thread(self.loads, key, data)
+        return self.loads(key, data)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Returns the serialization counters aggregated per key prefix."""
+        with self._stats_lock:
+            return {prefix: dict(values) for prefix, values in self._stats.items()}
+
+    def _should_offload(self, key: Any, value: Any) -> bool:
+        if isinstance(value, str | bytes):
+            return len(value) >= self.offload_threshold
+        # The size is only known after serializing, so rely on the last value stored under the same prefix.
+        # Prefixes never seen before are offloaded to be safe.
+        with self._stats_lock:
+            stats = self._stats.get(get_key_prefix(key))
+            return stats is None or stats["last_size"] >= self.offload_threshold
+
+    def _get_serializer(self, serializer_id: int) -> CacheSerializer:
+        if serializer_id not in self._serializers:
+            serializer_class = next((cls for cls in SERIALIZERS.values() if cls.id == serializer_id), None)
+            if serializer_class is None:
+                msg = f"Unknown cache serializer id {serializer_id}"
+                raise ValueError(msg)
+            self._serializers[serializer_id] = serializer_class()
+        return self._serializers[serializer_id]
+
+    def _get_compressor(self, compressor_id: int) -> Compressor:
+        if compressor_id not in self._compressors:
+            compressor_class = next((cls for cls in COMPRESSORS.values() if cls.id == compressor_id), None)
+            if compressor_class is None:
+                msg = f"Unknown cache compression id {compressor_id}"
+                raise ValueError(msg)
+            self._compressors[compressor_id] = compressor_class()
+        return self._compressors[compressor_id]
+
+    def _record(self, key: Any, operation: str, size: int, seconds: float) -> None:
+        prefix = get_key_prefix(key)
+        with self._stats_lock:
+            stats = self._stats[prefix]
+            stats[operation] += 1
+            stats["bytes"] += size
+            stats["seconds"] += seconds
+            if operation == "dumps":
+                stats["last_size"] = size
+        try:
+            from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+            labels = {"key_prefix": prefix, "operation": operation}
+            ot = OpenTelemetry()
+            ot.observe_histogram("cache_serialized_bytes", size, labels)
+            ot.observe_histogram("cache_serialization_seconds", seconds, labels)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).trace("Error recording cache serialization metrics")
@@ -5,10 +5,10 @@ import time
 from collections import OrderedDict
 from typing import Generic, Union
 
-import dill
 from loguru import logger
 from typing_extensions import override
 
+from langflow.services.cache.accounting import CacheAccounting, get_cache_namespace
 from langflow.services.cache.base import (
     AsyncBaseCacheService,
     AsyncLockType,
@@ -16,6 +16,7 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.serializers import CacheCodec
 from langflow.services.cache.utils import CACHE_MISS
 
 
@@ -29,6 +30,9 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
     Attributes:
         max_size (int, optional): Maximum number of items to store in the cache.
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        max_bytes (int, optional): Maximum approximate size in bytes of all the items in the cache.
+        namespace_quotas (dict, optional): Maximum approximate size in bytes per namespace
+            (e.g. "graphs", "vertex_results").
 
     Example:
         cache = InMemoryCache(max_size=3, expiration_time=5)
@@ -43,17 +47,31 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, max_size=None, expiration_time=60 * 60) -> None:
+    def __init__(self, max_size=None, expiration_time=60 * 60, max_bytes=None, namespace_quotas=None) -> None:
         """Initialize a new InMemoryCache instance.
 
         Args:
             max_size (int, optional): Maximum number of items to store in the cache.
             expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            max_bytes (int, optional): Maximum approximate size in bytes of all the items in the cache.
+            namespace_quotas (dict, optional): Maximum approximate size in bytes per namespace.
         """
         self._cache: OrderedDict = OrderedDict()
         self._lock = threading.RLock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self._accounting = CacheAccounting(
+            max_bytes=max_bytes, namespace_quotas=namespace_quotas, namespace_resolver=self.get_namespace
+        )
+
+    def get_namespace(self, key) -> str:
+        """Return the namespace used to account for a key."""
+        return get_cache_namespace(key)
+
+    def get_stats(self) -> dict[str, dict]:
+        """Return the entries, bytes, hit rate and evictions per namespace."""
+        with self._lock:
+            return self._accounting.stats()
 
     def get(self, key, lock: Union[threading.Lock, None] = None):  # noqa: UP007
         """Retrieve an item from the cache.
@@ -74,11 +92,19 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             if self.expiration_time is None or time.time() - item["time"] < self.expiration_time:
                 # Move the key to the end to make it recently used
                 self._cache.move_to_end(key)
+                self._accounting.record_hit(item["namespace"])
                 # Check if the value is pickled
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             self.delete(key)
+        self._accounting.record_miss(self._accounting.namespace(key))
         return CACHE_MISS
 
+    def _pop(self, key, *, evicted: bool = False) -> None:
+        """Remove an item from the cache without acquiring the lock, keeping the accounting up to date."""
+        item = self._cache.pop(key, None)
+        if item is not None:
+            self._accounting.remove(item["namespace"], item["size"], evicted=evicted)
+
     def set(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Add an item to the cache.
 
@@ -95,10 +121,14 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
                 self.delete(key)
             elif self.max_size and len(self._cache) >= self.max_size:
                 # Remove least recently used item
-                self._cache.popitem(last=False)
-            # pickle locally to mimic Redis
+                self._pop(next(iter(self._cache)), evicted=True)
+            namespace = self._accounting.namespace(key)
+            size = self._accounting.measure(namespace, value)
+            for evicted_key in self._accounting.keys_to_evict(self._cache, namespace, size):
+                self._pop(evicted_key, evicted=True)
 
-            self._cache[key] = {"value": value, "time": time.time()}
+            self._cache[key] = {"value": value, "time": time.time(), "namespace": namespace, "size": size}
+            self._accounting.add(namespace, size)
 
     def upsert(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Inserts or updates a value in the cache.
@@ -139,12 +169,13 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
 
     def delete(self, key, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         with lock or self._lock:
-            self._cache.pop(key, None)
+            self._pop(key)
 
     def clear(self, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Clear all items from the cache."""
         with lock or self._lock:
             self._cache.clear()
+            self._accounting.clear()
 
     def contains(self, key) -> bool:
         """Check if the key is in the cache."""
@@ -196,7 +227,9 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60, codec: CacheCodec | None = None
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -206,6 +239,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            codec (CacheCodec, optional): The codec used to serialize values. Defaults to dill without compression.
         """
         try:
             from redis.asyncio import StrictRedis
@@ -224,6 +258,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.codec = codec or CacheCodec()
 
     async def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
@@ -242,12 +277,12 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         if key is None:
             return CACHE_MISS
         value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        return await self.codec.aloads(key, value) if value else CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
         try:
-            if pickled := dill.dumps(value, recurse=True):
+            if pickled := await self.codec.adumps(key, value):
                 result = await self._client.setex(str(key), self.expiration_time, pickled)
                 if not result:
                     msg = "RedisCache could not set the value."
@@ -297,12 +332,17 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
 
 
 class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, max_size=None, expiration_time=3600) -> None:
+    def __init__(self, max_size=None, expiration_time=3600, max_bytes=None, namespace_quotas=None) -> None:
         self.cache: OrderedDict = OrderedDict()
 
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self._accounting = CacheAccounting(max_bytes=max_bytes, namespace_quotas=namespace_quotas)
+
+    def get_stats(self) -> dict[str, dict]:
+        """Return the entries, bytes, hit rate and evictions per namespace."""
+        return self._accounting.stats()
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         async with lock or self.lock:
@@ -313,9 +353,11 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.move_to_end(key)
+                self._accounting.record_hit(item["namespace"])
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             await self._delete(key)  # Log before deleting the expired item
+        self._accounting.record_miss(self._accounting.namespace(key))
         return CACHE_MISS
 
     async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
@@ -326,18 +368,27 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             )
 
     async def _set(self, key, value) -> None:
+        self._pop(key)
         if self.max_size and len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
-        self.cache[key] = {"value": value, "time": time.time()}
-        self.cache.move_to_end(key)
+            self._pop(next(iter(self.cache)), evicted=True)
+        namespace = self._accounting.namespace(key)
+        size = self._accounting.measure(namespace, value)
+        for evicted_key in self._accounting.keys_to_evict(self.cache, namespace, size):
+            self._pop(evicted_key, evicted=True)
+        self.cache[key] = {"value": value, "time": time.time(), "namespace": namespace, "size": size}
+        self._accounting.add(namespace, size)
+
+    def _pop(self, key, *, evicted: bool = False) -> None:
+        item = self.cache.pop(key, None)
+        if item is not None:
+            self._accounting.remove(item["namespace"], item["size"], evicted=evicted)
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
             await self._delete(key)
 
     async def _delete(self, key) -> None:
-        if key in self.cache:
-            del self.cache[key]
+        self._pop(key)
 
     async def clear(self, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
@@ -345,6 +396,7 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def _clear(self) -> None:
         self.cache.clear()
+        self._accounting.clear()
 
     async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
         await self._upsert(key, value, lock)
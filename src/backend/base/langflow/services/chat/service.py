@@ -1,12 +1,23 @@
+from __future__ import annotations
+
 import asyncio
 from collections import defaultdict
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.utils import CacheMiss
 from langflow.services.deps import get_cache_service
 
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+
+RUN_STATE_KEY_SUFFIX = ":run_state"
+VERTEX_KEY_INFIX = ":vertex:"
+
 
 class ChatService(Service):
     """Service class for managing chat-related operations."""
@@ -58,10 +69,86 @@ class ChatService(Service):
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
 
+        The checkpoints of a graph cached under `key` (see `set_graph_checkpoint`) are cleared with it.
+
         Args:
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
+        vertex_ids: set[str] = set()
+        cached = await self.get_cache(key, lock=lock)
+        if isinstance(cached, dict) and hasattr(cached.get("result"), "vertices"):
+            vertex_ids.update(vertex.id for vertex in cached["result"].vertices)
+        run_state = await self.get_cache(f"{key}{RUN_STATE_KEY_SUFFIX}", lock=lock)
+        if isinstance(run_state, dict) and isinstance(run_state.get("result"), dict):
+            vertex_ids.update(run_state["result"].get("built_vertices", []))
+        for cache_key in (
+            key,
+            f"{key}{RUN_STATE_KEY_SUFFIX}",
+            *(f"{key}{VERTEX_KEY_INFIX}{vertex_id}" for vertex_id in vertex_ids),
+        ):
+            await self._delete_cache(cache_key, lock=lock)
+
+    async def _delete_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    async def set_graph_checkpoint(
+        self,
+        key: str,
+        graph: Graph,
+        vertex_ids: list[str] | None = None,
+        lock: asyncio.Lock | None = None,
+    ) -> bool:
+        """Checkpoint a running graph without serializing the whole graph.
+
+        The graph structure is expected to be cached under `key` already (see `set_cache`).
+        This only stores the run state of the graph and the build results of `vertex_ids`,
+        so the cost of each checkpoint depends on the vertices that changed instead of the graph size.
+
+        Args:
+            key (str): The cache key of the graph.
+            graph (Graph): The graph to checkpoint.
+            vertex_ids (Optional[list[str]], optional): The vertices built since the last checkpoint.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            bool: True if the run state was set successfully, False otherwise.
+        """
+        for vertex_id in vertex_ids or []:
+            vertex = graph.get_vertex(vertex_id)
+            if vertex.built:
+                await self.set_cache(
+                    f"{key}{VERTEX_KEY_INFIX}{vertex_id}", graph.get_vertex_checkpoint(vertex), lock=lock
+                )
+        return await self.set_cache(f"{key}{RUN_STATE_KEY_SUFFIX}", graph.get_run_state(), lock=lock)
+
+    async def get_cached_graph(self, key: str, lock: asyncio.Lock | None = None) -> Any:
+        """Get a cached graph with its latest checkpoint applied.
+
+        Args:
+            key (str): The cache key of the graph.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            Any: The cached data, in the same format as `get_cache`.
+        """
+        cached = await self.get_cache(key, lock=lock)
+        if isinstance(cached, CacheMiss) or not isinstance(cached, dict):
+            return cached
+        graph = cached.get("result")
+        run_state = await self.get_cache(f"{key}{RUN_STATE_KEY_SUFFIX}", lock=lock)
+        if isinstance(run_state, CacheMiss) or not graph.apply_run_state(run_state["result"]):
+            return cached
+        for vertex_id in run_state["result"]["built_vertices"]:
+            checkpoint = await self.get_cache(f"{key}{VERTEX_KEY_INFIX}{vertex_id}", lock=lock)
+            if isinstance(checkpoint, CacheMiss):
+                continue
+            vertex = graph.get_vertex(vertex_id)
+            try:
+                graph.apply_vertex_checkpoint(vertex, checkpoint["result"])
+                vertex.finalize_build()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug(f"Error restoring checkpoint for vertex {vertex_id}")
+        return cached
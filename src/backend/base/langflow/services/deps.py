@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from langflow.services.telemetry.service import TelemetryService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.vertex_memo.service import VertexMemoService
 
 
 def get_service(service_type: ServiceType, default=None):
@@ -201,6 +202,17 @@ def get_shared_component_cache_service() -> CacheService:
     return get_service(ServiceType.SHARED_COMPONENT_CACHE_SERVICE, SharedComponentCacheServiceFactory())
 
 
+def get_vertex_memo_service() -> VertexMemoService:
+    """Retrieves the vertex memoization service from the service manager.
+
+    Returns:
+        The vertex memoization service instance.
+    """
+    from langflow.services.vertex_memo.factory import VertexMemoServiceFactory
+
+    return get_service(ServiceType.VERTEX_MEMO_SERVICE, VertexMemoServiceFactory())
+
+
 def get_session_service() -> SessionService:
     """Retrieves the session service from the service manager.
 
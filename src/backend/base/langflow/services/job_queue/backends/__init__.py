@@ -0,0 +1,5 @@
+from langflow.services.job_queue.backends.base import JobQueueBackend, JobRecord, JobStatus
+from langflow.services.job_queue.backends.memory import MemoryJobQueueBackend
+from langflow.services.job_queue.backends.sqlite import SQLiteJobQueueBackend
+
+__all__ = ["JobQueueBackend", "JobRecord", "JobStatus", "MemoryJobQueueBackend", "SQLiteJobQueueBackend"]
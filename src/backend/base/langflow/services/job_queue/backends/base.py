@@ -0,0 +1,169 @@
+"""Storage of the jobs and events shared by the workers of the job queue service."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+# (sequence number, event id, encoded event). A None event marks the end of the stream.
+StoredEvent = tuple[int, str | None, bytes | None]
+
+STALE_JOB_ERROR = "The worker running the job stopped responding"
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in {JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+@dataclass
+class JobRecord:
+    job_id: str
+    handler: str
+    payload: dict[str, Any]
+    user_id: str | None = None
+    status: JobStatus = JobStatus.PENDING
+    worker_id: str | None = None
+    cancel_requested: bool = False
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    heartbeat_at: float | None = None
+    consumer_offset: int = 0
+    dedup_key: str | None = None
+    ttl: float | None = None
+    error: str | None = None
+    events: list[StoredEvent] = field(default_factory=list)
+
+
+class JobQueueBackend(ABC):
+    """Stores jobs and their events so that any worker can run a job and any worker can stream its events.
+
+    Jobs are submitted as the name of a handler registered on every worker plus a JSON serializable
+    payload. Workers claim pending jobs, publish the events of the jobs they run and report their
+    liveness with heartbeats. Clients read the events of a job from any worker. Jobs can also store a
+    result, kept until the job is deleted.
+    """
+
+    name: str
+    # Whether other worker processes see the jobs, so that they can run them and read their events
+    shared: bool = True
+
+    async def start(self) -> None:  # noqa: B027
+        """Prepare the backend, e.g. create tables. Called when the service starts."""
+
+    async def stop(self) -> None:  # noqa: B027
+        """Release the resources of the backend. Called when the service stops."""
+
+    @abstractmethod
+    async def submit(
+        self,
+        job_id: str,
+        handler: str,
+        payload: dict[str, Any],
+        user_id: str | None = None,
+        *,
+        dedup_key: str | None = None,
+        ttl: float | None = None,
+    ) -> str:
+        """Add a pending job, unless an unfinished job with the same `dedup_key` exists.
+
+        Args:
+            job_id: The id of the new job.
+            handler: The name of the handler running the job.
+            payload: The JSON serializable arguments of the handler.
+            user_id: The user the job runs for.
+            dedup_key: Identifies jobs doing the same work. None never matches another job.
+            ttl: How long the job and its result are kept once finished, in seconds. None uses the
+                retention passed to `delete_finished_jobs`.
+
+        Returns:
+            The id of the job doing the work: `job_id`, or the id of the existing job with the same `dedup_key`.
+
+        Raises:
+            ValueError: If a job with the same id already exists.
+        """
+
+    @abstractmethod
+    async def claim(self, worker_id: str) -> JobRecord | None:
+        """Mark the next pending job as running on `worker_id` and return it, or None if there is none.
+
+        Jobs of the users with the fewest running jobs are claimed first, and the oldest job among them,
+        so one user submitting many jobs can't starve the others.
+        """
+
+    @abstractmethod
+    async def publish(self, job_id: str, events: list[tuple[str | None, bytes | None]]) -> None:
+        """Append events to a job. A None value marks the end of the stream."""
+
+    @abstractmethod
+    async def read_events(self, job_id: str, after: int | None = None, limit: int = 1000) -> list[StoredEvent]:
+        """Return the events of a job with a sequence number greater than `after`.
+
+        When `after` is None, reading resumes from the last sequence number acknowledged with `ack`.
+        """
+
+    @abstractmethod
+    async def ack(self, job_id: str, seq: int) -> None:
+        """Record that the events of a job up to `seq` have been delivered to the client."""
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> JobRecord | None:
+        """Return a job without its events, or None if it doesn't exist."""
+
+    @abstractmethod
+    async def set_status(self, job_id: str, status: JobStatus, error: str | None = None) -> None:
+        """Update the status of a job, with the error that made it fail if any."""
+
+    @abstractmethod
+    async def set_result(self, job_id: str, result: bytes) -> None:
+        """Store the encoded result of a job."""
+
+    @abstractmethod
+    async def get_result(self, job_id: str) -> bytes | None:
+        """Return the encoded result of a job, or None if it has none or doesn't exist."""
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> bool:
+        """Ask the worker running a job to cancel it. Pending jobs are cancelled right away.
+
+        Returns:
+            False if the job doesn't exist.
+        """
+
+    @abstractmethod
+    async def get_cancel_requests(self, job_ids: list[str]) -> list[str]:
+        """Return the ids of the given running jobs whose cancellation was requested."""
+
+    @abstractmethod
+    async def heartbeat(self, worker_id: str, job_ids: list[str]) -> None:
+        """Record that `worker_id` is still running the given jobs."""
+
+    @abstractmethod
+    async def fail_stale_jobs(self, stale_after: float) -> list[str]:
+        """Mark as failed the running jobs without a heartbeat in the last `stale_after` seconds.
+
+        The end of their event stream is published so clients stop waiting.
+
+        Returns:
+            The ids of the jobs marked as failed.
+        """
+
+    @abstractmethod
+    async def delete_finished_jobs(self, older_than: float) -> int:
+        """Delete the finished jobs, with their events and results, once their retention is over.
+
+        The retention is the `ttl` of the job, or `older_than` seconds since its last update for the jobs
+        submitted without one.
+
+        Returns:
+            The number of jobs deleted.
+        """
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import override
+
+from langflow.services.job_queue.backends.base import STALE_JOB_ERROR, JobQueueBackend, JobRecord, JobStatus
+
+if TYPE_CHECKING:
+    from langflow.services.job_queue.backends.base import StoredEvent
+
+
+class MemoryJobQueueBackend(JobQueueBackend):
+    """Keeps jobs and events in the memory of the current process.
+
+    Used for the jobs submitted to a single worker, e.g. asynchronous runs when the job queue backend is
+    `local`, and to run the distributed code path in tests.
+    """
+
+    name = "memory"
+    shared = False
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, JobRecord] = {}
+        self._results: dict[str, bytes] = {}
+        self._next_seq = 0
+        self._lock = asyncio.Lock()
+
+    @override
+    async def submit(
+        self,
+        job_id: str,
+        handler: str,
+        payload: dict[str, Any],
+        user_id: str | None = None,
+        *,
+        dedup_key: str | None = None,
+        ttl: float | None = None,
+    ) -> str:
+        if job_id in self._jobs:
+            msg = f"Job {job_id} already exists"
+            raise ValueError(msg)
+        if dedup_key is not None:
+            for job in self._jobs.values():
+                if job.dedup_key == dedup_key and not job.status.finished:
+                    return job.job_id
+        now = time.time()
+        self._jobs[job_id] = JobRecord(
+            job_id=job_id,
+            handler=handler,
+            payload=payload,
+            user_id=user_id,
+            created_at=now,
+            updated_at=now,
+            dedup_key=dedup_key,
+            ttl=ttl,
+        )
+        return job_id
+
+    @override
+    async def claim(self, worker_id: str) -> JobRecord | None:
+        async with self._lock:
+            running = Counter(job.user_id for job in self._jobs.values() if job.status == JobStatus.RUNNING)
+            pending = [job for job in self._jobs.values() if job.status == JobStatus.PENDING]
+            if not pending:
+                return None
+            job = min(pending, key=lambda job: (running[job.user_id], job.created_at))
+            job.status = JobStatus.RUNNING
+            job.worker_id = worker_id
+            job.updated_at = job.heartbeat_at = time.time()
+            return self._copy(job)
+
+    @override
+    async def publish(self, job_id: str, events: list[tuple[str | None, bytes | None]]) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        for event_id, value in events:
+            self._next_seq += 1
+            job.events.append((self._next_seq, event_id, value))
+
+    @override
+    async def read_events(self, job_id: str, after: int | None = None, limit: int = 1000) -> list[StoredEvent]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return []
+        if after is None:
+            after = job.consumer_offset
+        return [event for event in job.events if event[0] > after][:limit]
+
+    @override
+    async def ack(self, job_id: str, seq: int) -> None:
+        if (job := self._jobs.get(job_id)) is not None:
+            job.consumer_offset = max(job.consumer_offset, seq)
+            # Delivered events are not read again, so they don't need to be kept
+            job.events = [event for event in job.events if event[0] > job.consumer_offset]
+
+    @override
+    async def get_job(self, job_id: str) -> JobRecord | None:
+        job = self._jobs.get(job_id)
+        return self._copy(job) if job is not None else None
+
+    @override
+    async def set_status(self, job_id: str, status: JobStatus, error: str | None = None) -> None:
+        if (job := self._jobs.get(job_id)) is not None:
+            job.status = status
+            job.error = error
+            job.updated_at = time.time()
+
+    @override
+    async def set_result(self, job_id: str, result: bytes) -> None:
+        if job_id in self._jobs:
+            self._results[job_id] = result
+
+    @override
+    async def get_result(self, job_id: str) -> bytes | None:
+        return self._results.get(job_id)
+
+    @override
+    async def request_cancel(self, job_id: str) -> bool:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        if job.status == JobStatus.PENDING:
+            job.status = JobStatus.CANCELLED
+            await self.publish(job_id, [(None, None)])
+        job.cancel_requested = True
+        job.updated_at = time.time()
+        return True
+
+    @override
+    async def get_cancel_requests(self, job_ids: list[str]) -> list[str]:
+        return [job_id for job_id in job_ids if (job := self._jobs.get(job_id)) is not None and job.cancel_requested]
+
+    @override
+    async def heartbeat(self, worker_id: str, job_ids: list[str]) -> None:
+        now = time.time()
+        for job_id in job_ids:
+            if (job := self._jobs.get(job_id)) is not None and job.worker_id == worker_id:
+                job.heartbeat_at = now
+
+    @override
+    async def fail_stale_jobs(self, stale_after: float) -> list[str]:
+        deadline = time.time() - stale_after
+        stale = [
+            job.job_id
+            for job in self._jobs.values()
+            if job.status == JobStatus.RUNNING and (job.heartbeat_at or 0) < deadline
+        ]
+        for job_id in stale:
+            await self.set_status(job_id, JobStatus.FAILED, error=STALE_JOB_ERROR)
+            await self.publish(job_id, [(None, None)])
+        return stale
+
+    @override
+    async def delete_finished_jobs(self, older_than: float) -> int:
+        now = time.time()
+        finished = [
+            job.job_id
+            for job in self._jobs.values()
+            if job.status.finished and job.updated_at < now - (job.ttl if job.ttl is not None else older_than)
+        ]
+        for job_id in finished:
+            del self._jobs[job_id]
+            self._results.pop(job_id, None)
+        return len(finished)
+
+    @staticmethod
+    def _copy(job: JobRecord) -> JobRecord:
+        return dataclasses.replace(job, payload=dict(job.payload), events=[])
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from typing_extensions import override
+
+from langflow.services.job_queue.backends.base import STALE_JOB_ERROR, JobQueueBackend, JobRecord, JobStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langflow.services.job_queue.backends.base import StoredEvent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job (
+    job_id TEXT PRIMARY KEY,
+    handler TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    user_id TEXT,
+    status TEXT NOT NULL,
+    worker_id TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    consumer_offset INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    heartbeat_at REAL,
+    dedup_key TEXT,
+    ttl REAL,
+    error TEXT,
+    result BLOB
+);
+CREATE INDEX IF NOT EXISTS ix_job_status_created_at ON job (status, created_at);
+CREATE TABLE IF NOT EXISTS job_event (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    event_id TEXT,
+    value BLOB
+);
+CREATE INDEX IF NOT EXISTS ix_job_event_job_id_seq ON job_event (job_id, seq);
+"""
+# Columns added after the first version of the schema, added to existing databases on connection
+_ADDED_JOB_COLUMNS = {"dedup_key": "TEXT", "ttl": "REAL", "error": "TEXT", "result": "BLOB"}
+_INDEXES = "CREATE INDEX IF NOT EXISTS ix_job_dedup_key ON job (dedup_key);"
+
+_JOB_COLUMNS = (
+    "job_id, handler, payload, user_id, status, worker_id, cancel_requested, consumer_offset, "
+    "created_at, updated_at, heartbeat_at, dedup_key, ttl, error"
+)
+_FINISHED_STATUSES = tuple(status.value for status in JobStatus if status.finished)
+_FINISHED_PLACEHOLDERS = ", ".join("?" * len(_FINISHED_STATUSES))
+
+
+class SQLiteJobQueueBackend(JobQueueBackend):
+    """Stores jobs and events in a SQLite database shared by the workers of a single host.
+
+    This is a local stand-in for a networked broker: every worker process started with the same database
+    path can claim jobs and stream events of jobs run by the other workers. The database uses WAL mode so
+    readers don't block the writer, and queries run in a worker thread to keep the event loop free.
+
+    Args:
+        path: The path of the database file.
+        busy_timeout: How long a connection waits for a lock held by another process, in seconds.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str | Path, busy_timeout: float = 5.0) -> None:
+        self.path = Path(path)
+        self.busy_timeout = busy_timeout
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @override
+    async def start(self) -> None:
+        await asyncio.to_thread(self._connect)
+
+    @override
+    async def stop(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._connection is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Transactions are handled explicitly, hence isolation_level=None
+                connection = sqlite3.connect(
+                    self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.executescript(_SCHEMA)
+                columns = {row[1] for row in connection.execute("PRAGMA table_info(job)")}
+                for column, column_type in _ADDED_JOB_COLUMNS.items():
+                    if column not in columns:
+                        connection.execute(f"ALTER TABLE job ADD COLUMN {column} {column_type}")
+                connection.executescript(_INDEXES)
+                self._connection = connection
+            return self._connection
+
+    async def _run(self, func: Callable[[sqlite3.Connection], Any], *, write: bool = True) -> Any:
+        def run() -> Any:
+            connection = self._connect()
+            with self._lock:
+                # Writers take the database lock up front so concurrent claims can't pick the same job
+                connection.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+                try:
+                    result = func(connection)
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+                connection.execute("COMMIT")
+                return result
+
+        return await asyncio.to_thread(run)
+
+    @override
+    async def submit(
+        self,
+        job_id: str,
+        handler: str,
+        payload: dict[str, Any],
+        user_id: str | None = None,
+        *,
+        dedup_key: str | None = None,
+        ttl: float | None = None,
+    ) -> str:
+        now = time.time()
+
+        def submit(connection: sqlite3.Connection) -> str:
+            # The write transaction makes the lookup and the insert atomic across workers
+            if dedup_key is not None:
+                row = connection.execute(
+                    f"SELECT job_id FROM job WHERE dedup_key = ? AND status NOT IN ({_FINISHED_PLACEHOLDERS}) "  # noqa: S608
+                    "ORDER BY created_at LIMIT 1",
+                    (dedup_key, *_FINISHED_STATUSES),
+                ).fetchone()
+                if row is not None:
+                    return row[0]
+            try:
+                connection.execute(
+                    "INSERT INTO job "
+                    "(job_id, handler, payload, user_id, status, created_at, updated_at, dedup_key, ttl) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job_id,
+                        handler,
+                        orjson.dumps(payload).decode(),
+                        user_id,
+                        JobStatus.PENDING.value,
+                        now,
+                        now,
+                        dedup_key,
+                        ttl,
+                    ),
+                )
+            except sqlite3.IntegrityError as exc:
+                msg = f"Job {job_id} already exists"
+                raise ValueError(msg) from exc
+            return job_id
+
+        return await self._run(submit)
+
+    @override
+    async def claim(self, worker_id: str) -> JobRecord | None:
+        # Workers poll the queue, so only take the write lock when there is a job to claim
+        has_pending = await self._run(
+            lambda connection: connection.execute(
+                "SELECT 1 FROM job WHERE status = ? LIMIT 1", (JobStatus.PENDING.value,)
+            ).fetchone(),
+            write=False,
+        )
+        if has_pending is None:
+            return None
+
+        def claim(connection: sqlite3.Connection) -> JobRecord | None:
+            row = connection.execute(
+                f"SELECT {_JOB_COLUMNS} FROM job AS pending "  # noqa: S608
+                "WHERE status = :pending "
+                "ORDER BY (SELECT COUNT(*) FROM job AS running "
+                "WHERE running.status = :running AND running.user_id IS pending.user_id), created_at, rowid "
+                "LIMIT 1",
+                {"pending": JobStatus.PENDING.value, "running": JobStatus.RUNNING.value},
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            connection.execute(
+                "UPDATE job SET status = ?, worker_id = ?, updated_at = ?, heartbeat_at = ? WHERE job_id = ?",
+                (JobStatus.RUNNING.value, worker_id, now, now, row[0]),
+            )
+            job = self._to_record(row)
+            job.status = JobStatus.RUNNING
+            job.worker_id = worker_id
+            job.updated_at = job.heartbeat_at = now
+            return job
+
+        return await self._run(claim)
+
+    @override
+    async def publish(self, job_id: str, events: list[tuple[str | None, bytes | None]]) -> None:
+        if not events:
+            return
+        await self._run(
+            lambda connection: connection.executemany(
+                "INSERT INTO job_event (job_id, event_id, value) VALUES (?, ?, ?)",
+                [(job_id, event_id, value) for event_id, value in events],
+            )
+        )
+
+    @override
+    async def read_events(self, job_id: str, after: int | None = None, limit: int = 1000) -> list[StoredEvent]:
+        def read(connection: sqlite3.Connection) -> list[StoredEvent]:
+            offset = after
+            if offset is None:
+                row = connection.execute("SELECT consumer_offset FROM job WHERE job_id = ?", (job_id,)).fetchone()
+                offset = row[0] if row else 0
+            rows = connection.execute(
+                "SELECT seq, event_id, value FROM job_event WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, offset, limit),
+            ).fetchall()
+            return [(seq, event_id, bytes(value) if value is not None else None) for seq, event_id, value in rows]
+
+        return await self._run(read, write=False)
+
+    @override
+    async def ack(self, job_id: str, seq: int) -> None:
+        def ack(connection: sqlite3.Connection) -> None:
+            connection.execute(
+                "UPDATE job SET consumer_offset = MAX(consumer_offset, ?) WHERE job_id = ?", (seq, job_id)
+            )
+            # Delivered events are not read again, so they don't need to be kept
+            connection.execute("DELETE FROM job_event WHERE job_id = ? AND seq <= ?", (job_id, seq))
+
+        await self._run(ack)
+
+    @override
+    async def get_job(self, job_id: str) -> JobRecord | None:
+        def get_job(connection: sqlite3.Connection) -> JobRecord | None:
+            row = connection.execute(
+                f"SELECT {_JOB_COLUMNS} FROM job WHERE job_id = ?",  # noqa: S608
+                (job_id,),
+            ).fetchone()
+            return self._to_record(row) if row else None
+
+        return await self._run(get_job, write=False)
+
+    @override
+    async def set_status(self, job_id: str, status: JobStatus, error: str | None = None) -> None:
+        await self._run(
+            lambda connection: connection.execute(
+                "UPDATE job SET status = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                (status.value, error, time.time(), job_id),
+            )
+        )
+
+    @override
+    async def set_result(self, job_id: str, result: bytes) -> None:
+        await self._run(
+            lambda connection: connection.execute("UPDATE job SET result = ? WHERE job_id = ?", (result, job_id))
+        )
+
+    @override
+    async def get_result(self, job_id: str) -> bytes | None:
+        def get_result(connection: sqlite3.Connection) -> bytes | None:
+            row = connection.execute("SELECT result FROM job WHERE job_id = ?", (job_id,)).fetchone()
+            return bytes(row[0]) if row and row[0] is not None else None
+
+        return await self._run(get_result, write=False)
+
+    @override
+    async def request_cancel(self, job_id: str) -> bool:
+        def request_cancel(connection: sqlite3.Connection) -> bool:
+            row = connection.execute("SELECT status FROM job WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return False
+            status = JobStatus(row[0])
+            if status == JobStatus.PENDING:
+                status = JobStatus.CANCELLED
+                connection.execute("INSERT INTO job_event (job_id, event_id, value) VALUES (?, NULL, NULL)", (job_id,))
+            connection.execute(
+                "UPDATE job SET cancel_requested = 1, status = ?, updated_at = ? WHERE job_id = ?",
+                (status.value, time.time(), job_id),
+            )
+            return True
+
+        return await self._run(request_cancel)
+
+    @override
+    async def get_cancel_requests(self, job_ids: list[str]) -> list[str]:
+        if not job_ids:
+            return []
+        placeholders = ", ".join("?" * len(job_ids))
+
+        def get_cancel_requests(connection: sqlite3.Connection) -> list[str]:
+            rows = connection.execute(
+                f"SELECT job_id FROM job WHERE cancel_requested = 1 AND job_id IN ({placeholders})",  # noqa: S608
+                job_ids,
+            ).fetchall()
+            return [row[0] for row in rows]
+
+        return await self._run(get_cancel_requests, write=False)
+
+    @override
+    async def heartbeat(self, worker_id: str, job_ids: list[str]) -> None:
+        if not job_ids:
+            return
+        now = time.time()
+        await self._run(
+            lambda connection: connection.executemany(
+                "UPDATE job SET heartbeat_at = ? WHERE job_id = ? AND worker_id = ?",
+                [(now, job_id, worker_id) for job_id in job_ids],
+            )
+        )
+
+    @override
+    async def fail_stale_jobs(self, stale_after: float) -> list[str]:
+        now = time.time()
+
+        def fail_stale_jobs(connection: sqlite3.Connection) -> list[str]:
+            rows = connection.execute(
+                "SELECT job_id FROM job WHERE status = ? AND COALESCE(heartbeat_at, 0) < ?",
+                (JobStatus.RUNNING.value, now - stale_after),
+            ).fetchall()
+            stale = [row[0] for row in rows]
+            connection.executemany(
+                "UPDATE job SET status = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                [(JobStatus.FAILED.value, STALE_JOB_ERROR, now, job_id) for job_id in stale],
+            )
+            connection.executemany(
+                "INSERT INTO job_event (job_id, event_id, value) VALUES (?, NULL, NULL)",
+                [(job_id,) for job_id in stale],
+            )
+            return stale
+
+        return await self._run(fail_stale_jobs)
+
+    @override
+    async def delete_finished_jobs(self, older_than: float) -> int:
+        now = time.time()
+
+        def delete_finished_jobs(connection: sqlite3.Connection) -> int:
+            condition = f"status IN ({_FINISHED_PLACEHOLDERS}) AND updated_at < ? - COALESCE(ttl, ?)"
+            parameters = (*_FINISHED_STATUSES, now, older_than)
+            connection.execute(
+                f"DELETE FROM job_event WHERE job_id IN (SELECT job_id FROM job WHERE {condition})",  # noqa: S608
+                parameters,
+            )
+            deleted = connection.execute(f"DELETE FROM job WHERE {condition}", parameters)  # noqa: S608
+            return deleted.rowcount
+
+        return await self._run(delete_finished_jobs)
+
+    @staticmethod
+    def _to_record(row: tuple) -> JobRecord:
+        (
+            job_id,
+            handler,
+            payload,
+            user_id,
+            status,
+            worker_id,
+            cancel_requested,
+            consumer_offset,
+            created_at,
+            updated_at,
+            heartbeat_at,
+            dedup_key,
+            ttl,
+            error,
+        ) = row
+        return JobRecord(
+            job_id=job_id,
+            handler=handler,
+            payload=orjson.loads(payload),
+            user_id=user_id,
+            status=JobStatus(status),
+            worker_id=worker_id,
+            cancel_requested=bool(cancel_requested),
+            consumer_offset=consumer_offset,
+            created_at=created_at,
+            updated_at=updated_at,
+            heartbeat_at=heartbeat_at,
+            dedup_key=dedup_key,
+            ttl=ttl,
+            error=error,
+        )
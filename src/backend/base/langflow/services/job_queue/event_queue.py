@@ -0,0 +1,197 @@
+"""Bounded queue for the events streamed to the client of a job."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Literal
+
+from loguru import logger
+
+QueuePolicy = Literal["block", "drop_oldest", "coalesce"]
+QueueItem = tuple[str | None, bytes | None, float]
+
+TOKEN_EVENT_PREFIX = "token-"  # noqa: S105
+
+
+def _is_token_event(event_id: str | None) -> bool:
+    return event_id is not None and event_id.startswith(TOKEN_EVENT_PREFIX)
+
+
+class EventQueue(asyncio.Queue):
+    """An asyncio queue bounded by number of events and bytes, with a policy for when it is full.
+
+    Events are the `(event_id, data, put_time)` tuples produced by the `EventManager`. Only token events
+    are ever discarded: the other events (`end_vertex`, `add_message`, `error`, `end`...) drive the build
+    state of the client, so they are always accepted, even past the limits, once no token event is left
+    to drop. A `None` data marks the end of the stream and is always accepted too.
+
+    Policies:
+      - `block`: producers running in worker threads (the `EventManager` is called through
+        `asyncio.to_thread`) wait up to `block_timeout` seconds for the consumer to make room.
+        Producers on the event loop can't wait, so they fall back to `drop_oldest`.
+      - `drop_oldest`: the oldest token events are dropped to make room for new events.
+      - `coalesce`: token events are merged into the previous token event of the same message while it
+        is still waiting in the queue, so a slow client receives fewer, larger chunks. When the queue is
+        full, it falls back to `drop_oldest`.
+
+    Args:
+        max_events: The maximum number of events in the queue. None means unlimited.
+        max_bytes: The maximum number of bytes held by the events in the queue. None means unlimited.
+        policy: What to do when the queue is full.
+        block_timeout: How long a blocked producer waits before falling back to `drop_oldest`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_events: int | None = None,
+        max_bytes: int | None = None,
+        policy: QueuePolicy = "coalesce",
+        block_timeout: float = 30.0,
+    ) -> None:
+        super().__init__()
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._closed = False
+        try:
+            self._owner_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._owner_loop = None
+
+    def put_nowait(self, item: QueueItem) -> None:
+        if self._owner_loop is None:
+            self._owner_loop = asyncio.get_running_loop()
+        if self._on_owner_loop():
+            self._enqueue(item)
+            return
+        # asyncio queues are not thread safe, so events sent from worker threads are handed to the loop
+        if self.policy == "block" and item[1] is not None:
+            self._wait_for_space(len(item[1]))
+        self._owner_loop.call_soon_threadsafe(self._enqueue, item)
+
+    async def put(self, item: QueueItem) -> None:
+        self.put_nowait(item)
+
+    def get_nowait(self) -> QueueItem:
+        item = super().get_nowait()
+        if item[1] is not None:
+            with self._lock:
+                self.bytes -= len(item[1])
+                self._space.notify_all()
+        return item
+
+    def close(self) -> None:
+        """Wake up blocked producers and drop the queued events."""
+        with self._lock:
+            self._closed = True
+            self._space.notify_all()
+        while not self.empty():
+            self.get_nowait()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "events": self.qsize(),
+                "bytes": self.bytes,
+                "peak_bytes": self.peak_bytes,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+            }
+
+    def _on_owner_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._owner_loop
+        except RuntimeError:
+            return False
+
+    def _is_full(self, incoming_size: int) -> bool:
+        if self.max_events is not None and self.qsize() + 1 > self.max_events:
+            return True
+        return self.max_bytes is not None and self.bytes + incoming_size > self.max_bytes
+
+    def _wait_for_space(self, size: int) -> None:
+        with self._space:
+            if not self._space.wait_for(lambda: self._closed or not self._is_full(size), timeout=self.block_timeout):
+                logger.warning(f"Event queue still full after {self.block_timeout}s, dropping the oldest token events")
+
+    def _enqueue(self, item: QueueItem) -> None:
+        event_id, value, _ = item
+        if value is None:
+            super().put_nowait(item)
+            return
+        with self._lock:
+            if self._closed:
+                return
+            is_token = _is_token_event(event_id)
+            if is_token and self.policy == "coalesce" and self._coalesce(value):
+                self._record("coalesced")
+                return
+            while self._is_full(len(value)) and self._drop_oldest_token():
+                pass
+            if is_token and self._is_full(len(value)):
+                self.dropped += 1
+                self._record("dropped")
+                return
+            self.bytes += len(value)
+            self.peak_bytes = max(self.peak_bytes, self.bytes)
+            super().put_nowait(item)
+        self._observe_depth()
+
+    def _drop_oldest_token(self) -> bool:
+        """Drop the oldest queued token event, returning False if there is none."""
+        for index, (event_id, value, _) in enumerate(self._queue):
+            if value is not None and _is_token_event(event_id):
+                del self._queue[index]
+                self.bytes -= len(value)
+                self.dropped += 1
+                self._record("dropped")
+                return True
+        return False
+
+    def _coalesce(self, value: bytes) -> bool:
+        """Merge a token event into the last queued event if it is a token of the same message."""
+        if self.empty():
+            return False
+        last_id, last_value, last_time = self._queue[-1]
+        if not _is_token_event(last_id) or last_value is None:
+            return False
+        last_event = json.loads(last_value)
+        event = json.loads(value)
+        if last_event["data"].get("id") != event["data"].get("id"):
+            return False
+        last_event["data"]["chunk"] += event["data"]["chunk"]
+        merged = (json.dumps(last_event) + "\n\n").encode("utf-8")
+        self._queue[-1] = (last_id, merged, last_time)
+        self.bytes += len(merged) - len(last_value)
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        self.coalesced += 1
+        return True
+
+    def _record(self, reason: str) -> None:
+        try:
+            from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+            OpenTelemetry().increment_counter("job_queue_events_discarded", {"policy": self.policy, "reason": reason})
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).trace("Error recording job queue metrics")
+
+    def _observe_depth(self) -> None:
+        try:
+            from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+            labels = {"policy": self.policy}
+            ot = OpenTelemetry()
+            ot.observe_histogram("job_queue_depth", self.qsize(), labels)
+            ot.observe_histogram("job_queue_bytes", self.bytes, labels)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).trace("Error recording job queue metrics")
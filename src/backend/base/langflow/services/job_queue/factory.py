@@ -1,11 +1,38 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
+from langflow.services.job_queue.backends import JobQueueBackend, MemoryJobQueueBackend, SQLiteJobQueueBackend
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
-        return JobQueueService()
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        backend: JobQueueBackend
+        if settings.job_queue_backend == "sqlite":
+            path = settings.job_queue_database_path or Path(settings.config_dir or ".") / "job_queue.db"
+            backend = SQLiteJobQueueBackend(path)
+        else:
+            # Builds run in the worker that received them, the backend only holds the submitted jobs
+            backend = MemoryJobQueueBackend()
+        return JobQueueService(
+            max_events=settings.job_queue_max_events,
+            max_bytes=settings.job_queue_max_bytes,
+            policy=settings.job_queue_policy,
+            block_timeout=settings.job_queue_block_timeout,
+            backend=backend,
+            max_concurrency=settings.job_queue_max_concurrency,
+            poll_interval=settings.job_queue_poll_interval,
+        )
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 import asyncio
-
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import orjson
 from loguru import logger
 
 from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.services.base import Service
+from langflow.services.job_queue.backends.base import JobQueueBackend, JobRecord, JobStatus
+from langflow.services.job_queue.event_queue import EventQueue, QueuePolicy
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    JobHandler = Callable[[dict[str, Any], EventManager], Awaitable[Any]]
 
 
 class JobQueueNotFoundError(Exception):
@@ -48,6 +62,16 @@ class JobQueueService(Service):
               * Inspection or recovery if needed
             Default is 300 seconds (5 minutes).
 
+    Each job queue is an EventQueue bounded by `max_events` and `max_bytes`, so slow or disconnected
+    clients can't make the events of long builds accumulate in memory. `policy` decides what happens
+    when a queue is full (see EventQueue).
+
+    With a `backend`, jobs can also be submitted with `submit_job` and run by any worker sharing the
+    backend. Each worker claims up to `max_concurrency` jobs, runs them with the handler registered under
+    the job's handler name and publishes their events to the backend, where `iter_job_events` and
+    `read_job_events` read them from any worker. What the handler returns is stored as the result of the
+    job, read with `get_job_result`.
+
     Example:
         service = JobQueueService()
         await service.start()
@@ -61,17 +85,53 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_events: int | None = None,
+        max_bytes: int | None = None,
+        policy: QueuePolicy = "coalesce",
+        block_timeout: float = 30.0,
+        backend: JobQueueBackend | None = None,
+        max_concurrency: int = 8,
+        poll_interval: float = 0.1,
+        stale_job_timeout: float = 60.0,
+    ) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            max_events: The maximum number of events in each job queue. None means unlimited.
+            max_bytes: The maximum size in bytes of the events in each job queue. None means unlimited.
+            policy: What to do when a job queue is full.
+            block_timeout: How long producers wait for room with the `block` policy.
+            backend: The storage shared by the workers for the jobs submitted with `submit_job`.
+            max_concurrency: The maximum number of jobs of the backend run by this worker at the same time.
+            poll_interval: The number of seconds between checks of the backend for jobs and events.
+            stale_job_timeout: The number of seconds without a heartbeat after which a running job is
+                considered lost, e.g. because its worker died, and marked as failed.
         """
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.policy: QueuePolicy = policy
+        self.block_timeout = block_timeout
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
         self.CLEANUP_GRACE_PERIOD = 300  # 5 minutes before cleaning up marked tasks
+        self.backend = backend
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self.stale_job_timeout = stale_job_timeout
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, JobHandler] = {}
+        self._running_jobs: dict[str, asyncio.Task] = {}
+        self._dispatch_task: asyncio.Task | None = None
+        self._heartbeat_thread: threading.Thread | None = None
+        self._heartbeat_stopped = threading.Event()
 
     def is_started(self) -> bool:
         """Check if the JobQueueService has started.
@@ -94,6 +154,8 @@ class JobQueueService(Service):
         """
         self._closed = False
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+        if self.backend is not None:
+            self._dispatch_task = asyncio.create_task(self._dispatch_jobs())
         logger.debug("JobQueueService started: periodic cleanup task initiated.")
 
     async def stop(self) -> None:
@@ -117,11 +179,35 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            await asyncio.wait([self._dispatch_task])
+        self._heartbeat_stopped.set()
+        if self._heartbeat_thread is not None:
+            await asyncio.to_thread(self._heartbeat_thread.join)
+            self._heartbeat_thread = None
+        running_jobs = list(self._running_jobs.values())
+        for task in running_jobs:
+            task.cancel()
+        if running_jobs:
+            await asyncio.wait(running_jobs)
+        if self.backend is not None:
+            await self.backend.stop()
         logger.info("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
         await self.stop()
 
+    def create_event_queue(self) -> EventQueue:
+        """Create an event queue with the limits and policy of this service, without registering it."""
+        return EventQueue(
+            max_events=self.max_events,
+            max_bytes=self.max_bytes,
+            policy=self.policy,
+            block_timeout=self.block_timeout,
+        )
+
     def create_queue(self, job_id: str) -> tuple[asyncio.Queue, EventManager]:
         """Create and register a new queue along with its corresponding event manager for a job.
 
@@ -143,7 +229,7 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
+        main_queue = self.create_event_queue()
         event_manager = create_default_event_manager(main_queue)
 
         # Register the queue without an active task.
@@ -240,6 +326,9 @@ class JobQueueService(Service):
 
         # Clear the queue since we just cancelled the task or it has completed
         items_cleared = 0
+        if isinstance(main_queue, EventQueue):
+            items_cleared = main_queue.qsize()
+            main_queue.close()
         while not main_queue.empty():
             try:
                 main_queue.get_nowait()
@@ -252,6 +341,244 @@ class JobQueueService(Service):
         self._queues.pop(job_id, None)
         logger.info(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Returns the number of events, bytes, dropped and coalesced events of each job queue."""
+        return {
+            job_id: main_queue.stats()
+            for job_id, (main_queue, *_rest) in self._queues.items()
+            if isinstance(main_queue, EventQueue)
+        }
+
+    @property
+    def is_distributed(self) -> bool:
+        """Whether jobs are shared with the other workers through a backend."""
+        return self.backend is not None and self.backend.shared
+
+    def register_handler(self, name: str, handler: JobHandler) -> None:
+        """Register the coroutine function running the jobs submitted under `name`.
+
+        The handler is called with the payload of the job and an event manager whose events are published to
+        the backend. Every worker sharing the backend must register the same handlers.
+        """
+        self._handlers[name] = handler
+
+    async def submit_job(
+        self,
+        job_id: str,
+        handler: str,
+        payload: dict[str, Any],
+        user_id: str | None = None,
+        *,
+        dedup_key: str | None = None,
+        ttl: float | None = None,
+    ) -> str:
+        """Submit a job to be run by any worker sharing the backend.
+
+        Args:
+            job_id: Unique identifier for the job.
+            handler: The name the handler of the job was registered under.
+            payload: The JSON serializable arguments of the handler.
+            user_id: The user the job runs for, used to schedule the jobs of different users fairly.
+            dedup_key: Identifies jobs doing the same work. While a job with the same key is pending or
+                running, no job is added and the id of that job is returned instead.
+            ttl: How long the job and its result are kept once finished, in seconds. Defaults to
+                `CLEANUP_GRACE_PERIOD`.
+
+        Returns:
+            The id of the job doing the work.
+        """
+        if self.backend is None:
+            msg = "Jobs can only be submitted when the queue service has a backend"
+            raise RuntimeError(msg)
+        if self._closed:
+            msg = "Queue service is closed"
+            raise RuntimeError(msg)
+        if handler not in self._handlers:
+            msg = f"No job handler registered under {handler}"
+            raise ValueError(msg)
+        submitted_id = await self.backend.submit(job_id, handler, payload, user_id, dedup_key=dedup_key, ttl=ttl)
+        if submitted_id != job_id:
+            logger.debug(f"Job {job_id} joined job {submitted_id} running the same work")
+        else:
+            logger.debug(f"Job {job_id} submitted to the {self.backend.name} job queue backend")
+        return submitted_id
+
+    async def get_submitted_job(self, job_id: str) -> JobRecord | None:
+        """Return a job submitted with `submit_job`, or None if it doesn't exist or was deleted."""
+        return await self._get_backend(job_id).get_job(job_id)
+
+    async def get_job_result(self, job_id: str) -> Any:
+        """Return the result of a job submitted with `submit_job`, or None if it has none yet."""
+        result = await self._get_backend(job_id).get_result(job_id)
+        return orjson.loads(result) if result is not None else None
+
+    async def read_job_events(self, job_id: str) -> list[tuple[str | None, bytes | None]]:
+        """Wait for events of a job submitted with `submit_job` and return all the available ones.
+
+        Returned events are marked as delivered and won't be returned again. A None value marks the end of
+        the stream.
+
+        Raises:
+            JobQueueNotFoundError: If the job doesn't exist.
+        """
+        backend = self._get_backend(job_id)
+        while True:
+            job = await backend.get_job(job_id)
+            if job is None:
+                raise JobQueueNotFoundError(job_id)
+            events = await backend.read_events(job_id)
+            if events:
+                await backend.ack(job_id, events[-1][0])
+                return [(event_id, value) for _, event_id, value in events]
+            if job.status.finished:
+                # The end of the stream was already delivered
+                return [(None, None)]
+            await asyncio.sleep(self.poll_interval)
+
+    async def iter_job_events(self, job_id: str) -> AsyncIterator[tuple[str | None, bytes]]:
+        """Yield the events of a job submitted with `submit_job` until the end of its stream.
+
+        Raises:
+            JobQueueNotFoundError: If the job doesn't exist.
+        """
+        while True:
+            for event_id, value in await self.read_job_events(job_id):
+                if value is None:
+                    return
+                yield event_id, value
+
+    async def cancel_submitted_job(self, job_id: str) -> bool:
+        """Cancel a job submitted with `submit_job`, whichever worker runs it.
+
+        Returns:
+            False if the job doesn't exist.
+        """
+        backend = self._get_backend(job_id)
+        if not await backend.request_cancel(job_id):
+            return False
+        if (task := self._running_jobs.get(job_id)) is not None:
+            task.cancel()
+        return True
+
+    def _get_backend(self, job_id: str) -> JobQueueBackend:
+        if self._closed:
+            msg = f"Queue service is closed for job_id: {job_id}"
+            raise RuntimeError(msg)
+        if self.backend is None:
+            raise JobQueueNotFoundError(job_id)
+        return self.backend
+
+    async def _dispatch_jobs(self) -> None:
+        """Claim jobs from the backend while this worker has capacity, and keep the running jobs alive."""
+        if self.backend is None:
+            return
+        await self.backend.start()
+        maintenance_interval = self.stale_job_timeout / 3
+        # Heartbeats are sent from a thread so a blocked event loop doesn't get the running jobs marked as stale
+        self._heartbeat_stopped.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._send_heartbeats, args=(maintenance_interval,), name="job-queue-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+        last_maintenance = 0.0
+        while not self._closed:
+            try:
+                claimed = False
+                # Jobs are only claimed once the handlers are registered at startup
+                while self._handlers and len(self._running_jobs) < self.max_concurrency:
+                    job = await self.backend.claim(self.worker_id)
+                    if job is None:
+                        break
+                    claimed = True
+                    self._running_jobs[job.job_id] = asyncio.create_task(self._run_job(job))
+                now = time.monotonic()
+                if now - last_maintenance >= maintenance_interval:
+                    last_maintenance = now
+                    await self._maintain_jobs()
+                if not claimed:
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                logger.debug("Job dispatch task received cancellation signal.")
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Exception encountered while dispatching jobs: {exc}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _maintain_jobs(self) -> None:
+        if self.backend is None:
+            return
+        running = list(self._running_jobs)
+        # Cancellations requested through another worker
+        for job_id in await self.backend.get_cancel_requests(running):
+            if (task := self._running_jobs.get(job_id)) is not None:
+                task.cancel()
+        if stale := await self.backend.fail_stale_jobs(self.stale_job_timeout):
+            logger.warning(f"Marked jobs without a heartbeat for {self.stale_job_timeout}s as failed: {stale}")
+        await self.backend.delete_finished_jobs(self.CLEANUP_GRACE_PERIOD)
+
+    def _send_heartbeats(self, interval: float) -> None:
+        """Record the jobs run by this worker as alive every `interval` seconds, until the service stops."""
+        if self.backend is None:
+            return
+        loop = asyncio.new_event_loop()
+        try:
+            while not self._heartbeat_stopped.is_set():
+                try:
+                    loop.run_until_complete(self.backend.heartbeat(self.worker_id, list(self._running_jobs)))
+                except Exception as exc:  # noqa: BLE001
+                    logger.error(f"Exception encountered while sending job heartbeats: {exc}")
+                self._heartbeat_stopped.wait(interval)
+        finally:
+            loop.close()
+
+    async def _run_job(self, job: JobRecord) -> None:
+        if self.backend is None:
+            return
+        queue = self.create_event_queue()
+        event_manager = create_default_event_manager(queue)
+        forwarder = asyncio.create_task(self._forward_events(job.job_id, queue))
+        status = JobStatus.DONE
+        error = None
+        try:
+            handler = self._handlers.get(job.handler)
+            if handler is None:
+                msg = f"No job handler registered under {job.handler}"
+                raise ValueError(msg)
+            result = await handler(job.payload, event_manager)
+            if result is not None:
+                await self.backend.set_result(job.job_id, orjson.dumps(result))
+        except asyncio.CancelledError:
+            logger.info(f"Job {job.job_id} was cancelled")
+            status = JobStatus.CANCELLED
+        except Exception as exc:  # noqa: BLE001
+            logger.exception(f"Error running job {job.job_id}")
+            status = JobStatus.FAILED
+            error = str(exc)
+        finally:
+            await queue.put((None, None, time.time()))
+            try:
+                await forwarder
+                await self.backend.set_status(job.job_id, status, error)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Error finishing job {job.job_id}: {exc}")
+            queue.close()
+            self._running_jobs.pop(job.job_id, None)
+
+    async def _forward_events(self, job_id: str, queue: EventQueue) -> None:
+        """Publish the events of a running job to the backend in batches, until the end of the stream."""
+        if self.backend is None:
+            return
+        while True:
+            batch: list[tuple[str | None, bytes | None]] = []
+            event_id, value, _ = await queue.get()
+            batch.append((event_id, value))
+            while value is not None and not queue.empty():
+                event_id, value, _ = queue.get_nowait()
+                batch.append((event_id, value))
+            await self.backend.publish(job_id, batch)
+            if value is None:
+                return
+
     async def _periodic_cleanup(self) -> None:
         """Execute a periodic task that cleans up completed or cancelled job queues.
 
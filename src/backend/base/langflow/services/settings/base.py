@@ -126,8 +126,80 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_bytes: int | None = None
+    """The maximum approximate size in bytes of the in-memory caches ('async' and 'memory'). None means unlimited."""
+    cache_namespace_quotas: dict[str, int] = {}
+    """The maximum approximate size in bytes per namespace of the in-memory caches.
+    Namespaces are 'graphs', 'vertex_results', 'shared_component_cache' and 'default'."""
+    cache_serializer: Literal["dill", "pickle", "msgpack"] = "dill"
+    """The serializer used by the redis and disk caches. 'pickle' uses protocol 5 with out-of-band buffers,
+    'msgpack' falls back to 'pickle' for values that are not made of primitives."""
+    cache_compression: Literal["none", "zstd", "lz4"] = "none"
+    """The compression applied to values stored by the redis and disk caches."""
+    cache_compression_threshold: int = 64 * 1024
+    """The minimum serialized size in bytes of a cached value before it is compressed."""
+    cache_offload_threshold: int = 256 * 1024
+    """The serialized size in bytes above which cache values are (de)serialized in a thread
+    instead of on the event loop."""
+    job_queue_max_events: int | None = 10_000
+    """The maximum number of events waiting to be sent to the client of a build job. None means unlimited."""
+    job_queue_max_bytes: int | None = 64 * 1024 * 1024
+    """The maximum size in bytes of the events waiting to be sent to the client of a build job."""
+    job_queue_policy: Literal["block", "drop_oldest", "coalesce"] = "coalesce"
+    """What to do when a job queue is full: 'block' makes the build wait for the client, 'drop_oldest' drops
+    the oldest token events and 'coalesce' merges consecutive token events before dropping the oldest token events.
+    Other events are never dropped."""
+    job_queue_block_timeout: float = 30.0
+    """The number of seconds a build waits for room in a full job queue with the 'block' policy."""
+    job_queue_backend: Literal["local", "sqlite"] = "local"
+    """Where build jobs and their events are stored. 'local' keeps them in the memory of the worker that started
+    the build, so its events can only be read from that worker. 'sqlite' stores them in a database shared by the
+    workers of the host, so any worker can run a build and stream its events."""
+    job_queue_database_path: str | None = None
+    """The path of the database of the 'sqlite' job queue backend. Defaults to job_queue.db in the config dir."""
+    job_queue_max_concurrency: int = 8
+    """The maximum number of jobs submitted to the job queue, e.g. builds with a shared backend and asynchronous
+    runs, run at the same time by each worker."""
+    job_queue_poll_interval: float = 0.1
+    """The number of seconds between checks for new jobs and events with a shared job queue backend."""
+    run_result_ttl: int = 3600
+    """The number of seconds the results of flows run with the asynchronous run API are kept once the run ends."""
+    embedding_cache: bool = False
+    """If set to True, the vectors computed by embedding components are cached on disk under a hash of their
+    provider, settings, user and text, so unchanged texts are not embedded again."""
+    embedding_cache_dir: str | None = None
+    """The directory of the embedding cache. Defaults to embedding_cache in the config dir."""
+    embedding_cache_hot_size: int = 10_000
+    """The number of recently used vectors the embedding cache keeps in memory."""
+    embedding_cache_max_bytes: int | None = 2 * 1024 * 1024 * 1024
+    """The maximum size in bytes of the vectors stored for each embedding model. New vectors of a model are
+    no longer stored once its store is full. None means unlimited."""
+    vector_store_client_pool: bool = True
+    """If set to True, the clients of vector store components are kept in a pool shared by the builds of all
+    flows, instead of connecting again on every build."""
+    vector_store_client_pool_size: int = 32
+    """The maximum number of clients in the vector store client pool."""
+    vector_store_client_idle_timeout: int = 600
+    """The number of seconds after which an unused vector store client is closed."""
+    vector_store_client_health_check_interval: int = 30
+    """The minimum number of seconds between health checks of a pooled vector store client."""
+    llm_response_cache_dir: str | None = None
+    """The directory of the cache of language model responses. Defaults to llm_response_cache in the config dir."""
+    llm_response_cache_max_entries: int | None = 100_000
+    """The maximum number of responses in the cache of language model responses. The oldest responses are deleted
+    beyond it. None means unlimited."""
+    vertex_memoization: bool = False
+    """If set to True, the results of memoizable components are cached under a hash of their code,
+    parameters and upstream results, and reused across runs even when the component is not frozen."""
+    vertex_memoization_max_size: int = 512
+    """The maximum number of memoized vertex results kept in memory."""
+    vertex_memoization_disk_size_limit: int = 1024 * 1024 * 1024
+    """The maximum size in bytes of the on-disk tier of memoized vertex results. Set to 0 to disable it."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    variable_cache_ttl: float = 30
+    """Number of seconds decrypted Global Variables are cached per user by the database variable store.
+    Set to 0 to disable the cache."""
 
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
@@ -247,6 +319,9 @@ class Settings(BaseSettings):
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    component_catalog_cache: bool = True
+    """If set to True, the catalog of components built at startup is saved in the config dir and loaded on the next
+    starts and by the other workers, until a component file, the Langflow version or the installed packages change."""
 
     @field_validator("event_delivery", mode="before")
     @classmethod
@@ -15,4 +15,7 @@ class SharedComponentCacheServiceFactory(ServiceFactory):
 
     @override
     def create(self, settings_service: "SettingsService"):
-        return SharedComponentCacheService(expiration_time=settings_service.settings.cache_expire)
+        return SharedComponentCacheService(
+            expiration_time=settings_service.settings.cache_expire,
+            namespace_quotas=settings_service.settings.cache_namespace_quotas,
+        )
@@ -5,3 +5,6 @@ class SharedComponentCacheService(ThreadingInMemoryCache):
     """A caching service shared across components."""
 
     name = "shared_component_cache_service"
+
+    def get_namespace(self, key) -> str:  # noqa: ARG002
+        return "shared_component_cache"
@@ -140,6 +140,62 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="cache_serialized_bytes",
+            description="The size in bytes of values serialized or deserialized by the cache service",
+            unit="bytes",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"key_prefix": mandatory_label, "operation": mandatory_label},
+        )
+        self._add_metric(
+            name="cache_serialization_seconds",
+            description="The time spent serializing or deserializing values in the cache service",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"key_prefix": mandatory_label, "operation": mandatory_label},
+        )
+        self._add_metric(
+            name="job_queue_depth",
+            description="The number of events waiting in a job queue when an event is queued",
+            unit="",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"policy": mandatory_label},
+        )
+        self._add_metric(
+            name="job_queue_bytes",
+            description="The size in bytes of the events waiting in a job queue when an event is queued",
+            unit="bytes",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"policy": mandatory_label},
+        )
+        self._add_metric(
+            name="job_queue_events_discarded",
+            description="The number of job queue events dropped or merged into another event",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"policy": mandatory_label, "reason": mandatory_label},
+        )
+        self._add_metric(
+            name="embedding_cache_lookups",
+            description="The number of texts looked up in the embedding cache, by where their vector was found",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"provider": mandatory_label, "result": mandatory_label},
+        )
+        self._add_metric(
+            name="embedding_cache_bytes",
+            description="The size in bytes of the vectors read from or written to the embedding cache on disk",
+            unit="bytes",
+            metric_type=MetricType.COUNTER,
+            labels={"provider": mandatory_label, "operation": mandatory_label},
+        )
+        self._add_metric(
+            name="llm_cache_lookups",
+            description="The number of prompts looked up in the response caches of model components, by result",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"provider": mandatory_label, "mode": mandatory_label, "result": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,17 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def prefetch_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> None:
+        """Load several variables at once so later `get_variable` calls don't hit the store.
+
+        The default implementation does nothing.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
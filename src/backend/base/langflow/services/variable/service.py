@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -15,7 +16,7 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -26,6 +27,51 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # Decrypted values per user: {user_id: {name: (expires_at, type, value)}}
+        self._cache: dict[str, dict[str, tuple[float, str | None, str]]] = {}
+
+    @property
+    def cache_ttl(self) -> float:
+        return self.settings_service.settings.variable_cache_ttl
+
+    def _get_cached(self, user_id: UUID | str, name: str) -> tuple[str | None, str] | None:
+        user_cache = self._cache.get(str(user_id))
+        if not user_cache or name not in user_cache:
+            return None
+        expires_at, type_, value = user_cache[name]
+        if expires_at <= time.monotonic():
+            del user_cache[name]
+            return None
+        return type_, value
+
+    def _set_cached(self, user_id: UUID | str, variable: Variable) -> str:
+        value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if self.cache_ttl > 0:
+            user_cache = self._cache.setdefault(str(user_id), {})
+            user_cache[variable.name] = (time.monotonic() + self.cache_ttl, variable.type, value)
+        return value
+
+    def invalidate_cache(self, user_id: UUID | str | None = None) -> None:
+        """Drop the cached values of a user, or of every user if no user is given."""
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(user_id), None)
+
+    @override
+    async def prefetch_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> None:
+        missing = {name for name in names if name and self._get_cached(user_id, name) is None}
+        if not missing or self.cache_ttl <= 0:
+            return
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                self._set_cached(user_id, variable)
+            except Exception as e:  # noqa: BLE001
+                # get_variable will raise the error when the value is actually needed
+                logger.debug(f"Error decrypting variable '{variable.name}': {e}")
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -61,24 +107,30 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
+        cached = self._get_cached(user_id, name)
+        if cached is not None:
+            type_, value = cached
+        else:
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
+
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+            type_ = variable.type
+            value = None
 
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if value is None:
+            # we decrypt the value
+            value = self._set_cached(user_id, variable)
+        return value
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -121,6 +173,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
 
@@ -145,6 +198,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -162,6 +216,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -172,6 +227,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     async def create_variable(
         self,
@@ -192,5 +248,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
@@ -0,0 +1,3 @@
+from langflow.services.vertex_memo.service import VertexMemoService
+
+__all__ = ["VertexMemoService"]
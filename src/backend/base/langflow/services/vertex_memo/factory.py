@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.vertex_memo.service import VertexMemoService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class VertexMemoServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(VertexMemoService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        cache_dir = None
+        if settings.vertex_memoization_disk_size_limit and settings.config_dir:
+            cache_dir = Path(settings.config_dir) / "vertex_memo"
+        return VertexMemoService(
+            max_size=settings.vertex_memoization_max_size,
+            cache_dir=cache_dir,
+            disk_size_limit=settings.vertex_memoization_disk_size_limit,
+        )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class VertexMemoService(Service):
+    """A content-addressed cache of vertex results shared across runs.
+
+    Results are kept in a bounded in-memory LRU and, if a cache directory is configured,
+    in a size-limited disk tier so they survive restarts and are shared between workers.
+    """
+
+    name = "vertex_memo_service"
+
+    def __init__(self, max_size: int = 512, cache_dir: Path | None = None, disk_size_limit: int = 0) -> None:
+        self._memory = ThreadingInMemoryCache(max_size=max_size, expiration_time=None)
+        self._disk = None
+        if cache_dir is not None:
+            from diskcache import Cache
+
+            self._disk = Cache(str(cache_dir), size_limit=disk_size_limit)
+
+    def get(self, key: str) -> Any:
+        """Retrieve the results memoized under `key`, or CACHE_MISS."""
+        value = self._memory.get(key)
+        if value is not CACHE_MISS or self._disk is None:
+            return value
+        try:
+            value = self._disk.get(key, default=CACHE_MISS)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Error reading memoized result {key}")
+            return CACHE_MISS
+        if value is not CACHE_MISS:
+            self._memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Memoize `value` under `key`.
+
+        Values that cannot be pickled are only kept in memory.
+        """
+        self._memory.set(key, value)
+        if self._disk is None:
+            return
+        try:
+            self._disk.set(key, value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug(f"Result {key} cannot be pickled, keeping it in memory only")
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    async def teardown(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
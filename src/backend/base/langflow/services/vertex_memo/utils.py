@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class UnfingerprintableValueError(TypeError):
+    """Raised when a value cannot be fingerprinted deterministically."""
+
+
+def _update_fingerprint(hasher, value: Any) -> None:
+    """Feeds a deterministic representation of `value` into `hasher`.
+
+    Raises:
+        UnfingerprintableValueError: If the value has no stable representation (e.g. clients, models).
+    """
+    import pandas as pd
+
+    hasher.update(type(value).__qualname__.encode())
+    if value is None or isinstance(value, bool | int | float | str):
+        hasher.update(repr(value).encode())
+    elif isinstance(value, bytes):
+        hasher.update(value)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=str):
+            hasher.update(str(key).encode())
+            _update_fingerprint(hasher, value[key])
+    elif isinstance(value, list | tuple):
+        for item in value:
+            _update_fingerprint(hasher, item)
+    elif isinstance(value, set | frozenset):
+        for item in sorted(value, key=repr):
+            _update_fingerprint(hasher, item)
+    elif isinstance(value, pd.DataFrame):
+        hasher.update(json.dumps([str(column) for column in value.columns]).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, BaseModel):
+        try:
+            hasher.update(value.model_dump_json().encode())
+        except Exception as exc:
+            msg = f"Cannot fingerprint {type(value).__name__}"
+            raise UnfingerprintableValueError(msg) from exc
+    else:
+        msg = f"Cannot fingerprint {type(value).__name__}"
+        raise UnfingerprintableValueError(msg)
+
+
+def build_memo_key(code: str, params: dict[str, Any], output_names: list[str]) -> str | None:
+    """Builds a content-addressed key for the results of a component.
+
+    The key covers the component code, its resolved parameters (which include the results of
+    upstream vertices) and the outputs that will be computed.
+
+    Args:
+        code: The source code of the component.
+        params: The resolved parameters of the component.
+        output_names: The names of the outputs that will be built.
+
+    Returns:
+        The key, or None if one of the parameters cannot be fingerprinted.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(code.encode())
+    hasher.update(json.dumps(sorted(output_names)).encode())
+    try:
+        _update_fingerprint(hasher, params)
+    except UnfingerprintableValueError:
+        return None
+    return hasher.hexdigest()
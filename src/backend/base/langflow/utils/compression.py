@@ -1,10 +1,17 @@
 import gzip
+import hashlib
 import json
+import threading
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
+import orjson
 from fastapi import Response
 from fastapi.encoders import jsonable_encoder
 
+IDENTITY_ENCODING = "identity"
+
 
 def compress_response(data: Any) -> Response:
     """Compress data and return it as a FastAPI Response with appropriate headers."""
@@ -17,3 +24,156 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+async def stream_gzip_json_array(
+    items: AsyncIterable[Any], *, chunk_size: int = 64 * 1024, compresslevel: int = 6
+) -> AsyncIterator[bytes]:
+    """Encode items as a gzip compressed JSON array, yielding compressed chunks as they fill up.
+
+    Only one chunk of encoded items is held in memory at a time.
+    """
+    # wbits=31 produces the gzip container instead of a raw zlib stream
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)
+    buffer = bytearray(b"[")
+    first = True
+    async for item in items:
+        if not first:
+            buffer += b","
+        first = False
+        buffer += orjson.dumps(jsonable_encoder(item))
+        if len(buffer) >= chunk_size:
+            compressed = compressor.compress(bytes(buffer))
+            buffer.clear()
+            if compressed:
+                yield compressed
+    buffer += b"]"
+    yield compressor.compress(bytes(buffer)) + compressor.flush()
+
+
+def _brotli_compress(data: bytes) -> bytes:
+    import brotli
+
+    return brotli.compress(data, quality=11)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=19).compress(data)
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9)
+
+
+def get_available_encodings() -> dict[str, Any]:
+    """Returns the supported content encodings, in order of preference.
+
+    Brotli and zstd are only offered when the `brotli` and `zstandard` packages are installed.
+    """
+    encodings: dict[str, Any] = {}
+    try:
+        import brotli  # noqa: F401
+
+        encodings["br"] = _brotli_compress
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: F401
+
+        encodings["zstd"] = _zstd_compress
+    except ImportError:
+        pass
+    encodings["gzip"] = _gzip_compress
+    return encodings
+
+
+def parse_accept_encoding(accept_encoding: str | None) -> dict[str, float]:
+    """Parses an Accept-Encoding header into a mapping of encoding to quality."""
+    accepted: dict[str, float] = {}
+    if not accept_encoding:
+        return accepted
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+class PrecompressedJSON:
+    """A JSON document serialized once and compressed once per content encoding.
+
+    The gzip variant is built eagerly; brotli and zstd variants are built the first time a client
+    asks for them. Each variant is only built once: concurrent requests wait for the one building it.
+    Each variant has its own strong ETag derived from the content hash.
+
+    Args:
+        data: The data to serialize.
+    """
+
+    def __init__(self, data: Any) -> None:
+        self.body = json.dumps(jsonable_encoder(data)).encode("utf-8")
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self._encoders = get_available_encodings()
+        self._variants: dict[str, bytes] = {IDENTITY_ENCODING: self.body}
+        self._variant_locks = {encoding: threading.Lock() for encoding in self._encoders}
+        self.get_variant("gzip")
+
+    def etag(self, encoding: str) -> str:
+        if encoding == IDENTITY_ENCODING:
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def get_variant(self, encoding: str) -> bytes:
+        if encoding not in self._variants:
+            with self._variant_locks[encoding]:
+                if encoding not in self._variants:
+                    self._variants[encoding] = self._encoders[encoding](self.body)
+        return self._variants[encoding]
+
+    def has_variant(self, encoding: str) -> bool:
+        return encoding in self._variants
+
+    def select_encoding(self, accept_encoding: str | None) -> str:
+        """Picks the preferred encoding accepted by the client, falling back to identity."""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        qualities = {encoding: accepted.get(encoding, wildcard) for encoding in self._encoders}
+        candidates = [encoding for encoding, quality in qualities.items() if quality > 0]
+        if not candidates:
+            return IDENTITY_ENCODING
+        # max keeps the first candidate on ties, so the server preference order breaks them
+        return max(candidates, key=qualities.__getitem__)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an If-None-Match header matches any variant of this document."""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return any(tag.strip('"').split("-")[0] == self.digest for tag in tags)
+
+    def to_response(self, encoding: str, *, not_modified: bool = False) -> Response:
+        headers = {
+            "ETag": self.etag(encoding),
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "private, no-cache",
+        }
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        content = self.get_variant(encoding)
+        if encoding != IDENTITY_ENCODING:
+            headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(content))
+        return Response(content=content, media_type="application/json", headers=headers)
@@ -1,3 +1,8 @@
+import importlib
+import sys
+from typing import Any
+
+
 class LazyLoadDictBase:
     def __init__(self) -> None:
         self._all_types_dict = None
@@ -13,3 +18,27 @@ class LazyLoadDictBase:
 
     def get_type_dict(self):
         raise NotImplementedError
+
+
+def import_lazy_attribute(package: str, attr_name: str, dynamic_imports: dict[str, str]) -> Any:
+    """Import an attribute of a package from the submodule defining it, on first access.
+
+    Meant to be called from the module-level `__getattr__` of a package (PEP 562), so importing the package
+    doesn't import the dependencies of every submodule. The attribute is then set on the package, so later
+    accesses don't go through `__getattr__`.
+
+    Args:
+        package: The `__name__` of the package.
+        attr_name: The name of the attribute being accessed.
+        dynamic_imports: Maps the attribute names to the submodules, relative to the package, defining them.
+
+    Raises:
+        AttributeError: If the attribute is not in `dynamic_imports`.
+    """
+    module_name = dynamic_imports.get(attr_name)
+    if module_name is None:
+        msg = f"module {package!r} has no attribute {attr_name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{module_name}", package), attr_name)
+    setattr(sys.modules[package], attr_name, value)
+    return value
@@ -0,0 +1,84 @@
+"""Import time budgets, measured with `python -X importtime` in a fresh interpreter."""
+
+import subprocess
+import sys
+from collections import defaultdict
+
+import pytest
+
+# Budget in milliseconds for the modules of each top-level package imported when the server starts.
+# Generous on purpose: they catch a heavy dependency becoming eager, not small regressions.
+SERVER_IMPORT_BUDGETS_MS = {
+    "langflow": 4000,
+    "langchain_core": 2000,
+    "langchain": 1500,
+    "pandas": 1500,
+    "numpy": 800,
+    "fastapi": 800,
+    "sqlalchemy": 1000,
+    "pydantic": 1000,
+}
+
+# Provider SDKs that must only be imported when a component using them is loaded
+PROVIDER_PACKAGES = {
+    "anthropic",
+    "astrapy",
+    "cassandra",
+    "chromadb",
+    "cohere",
+    "elasticsearch",
+    "google",
+    "groq",
+    "langchain_anthropic",
+    "langchain_astradb",
+    "langchain_chroma",
+    "langchain_google_genai",
+    "langchain_groq",
+    "langchain_mistralai",
+    "langchain_openai",
+    "langchain_pinecone",
+    "openai",
+    "pinecone",
+    "pymilvus",
+    "qdrant_client",
+    "weaviate",
+}
+
+
+def measure_import_time(statement: str) -> dict[str, float]:
+    """Run `statement` in a fresh interpreter and return the import time of each top-level package, in ms.
+
+    Each module's own import time ("self" column) is attributed to its top-level package, so packages
+    imported by other packages are not counted twice.
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative_us, module = line.removeprefix("import time:").split("|")
+        times[module.strip().split(".")[0]] += int(self_us) / 1000
+    return dict(times)
+
+
+@pytest.mark.parametrize("category", ["embeddings", "models", "tools", "vectorstores"])
+def test_component_categories_import_provider_sdks_lazily(category):
+    imported = measure_import_time(f"import langflow.components.{category}")
+
+    assert not PROVIDER_PACKAGES & set(imported)
+
+
+def test_server_import_time_budgets():
+    imported = measure_import_time("import langflow.main")
+
+    over_budget = {
+        package: f"{imported[package]:.0f}ms > {budget}ms"
+        for package, budget in SERVER_IMPORT_BUDGETS_MS.items()
+        if imported.get(package, 0) > budget
+    }
+    assert not over_budget
@@ -67,6 +67,36 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flows_headers_keyset_pagination(client: AsyncClient, logged_in_headers):
+    created_ids = set()
+    for i in range(3):
+        flow = {"name": f"header_flow_{i}", "data": {"nodes": [], "edges": []}, "is_component": False}
+        response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+        created_ids.add(response.json()["id"])
+
+    params = {"get_all": True, "header_flows": True, "limit": 2}
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    first_page = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(first_page) == 2
+    assert all(header["data"] is None for header in first_page)
+    assert [header["id"] for header in first_page] == sorted(header["id"] for header in first_page)
+
+    seen_ids = [header["id"] for header in first_page]
+    cursor = first_page[-1]["id"]
+    while True:
+        response = await client.get("api/v1/flows/", params={**params, "cursor": cursor}, headers=logged_in_headers)
+        page = response.json()
+        if not page:
+            break
+        seen_ids.extend(header["id"] for header in page)
+        cursor = page[-1]["id"]
+
+    assert len(seen_ids) == len(set(seen_ids))
+    assert created_ids <= set(seen_ids)
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
@@ -0,0 +1,45 @@
+import asyncio
+
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def wait_for_run(client: AsyncClient, run_id: str, headers: dict) -> dict:
+    while True:
+        response = await client.get(f"api/v1/runs/{run_id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        if response.json()["status"] not in {"pending", "running"}:
+            return response.json()
+        await asyncio.sleep(0.05)
+
+
+async def test_submit_run_and_fetch_result(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    payload = {"input_value": "hello", "output_type": "chat"}
+
+    responses = await asyncio.gather(
+        *(client.post(f"api/v1/runs/{simple_api_test['id']}", headers=headers, json=payload) for _ in range(3))
+    )
+
+    assert all(response.status_code == status.HTTP_202_ACCEPTED for response in responses)
+    run_ids = {response.json()["run_id"] for response in responses}
+    # Identical requests submitted while the first one is in flight share its run
+    assert len(run_ids) == 1
+    run_id = run_ids.pop()
+    assert (await wait_for_run(client, run_id, headers))["status"] == "done"
+
+    response = await client.get(f"api/v1/runs/{run_id}/result", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    result = response.json()
+    assert result["session_id"]
+    assert result["outputs"][0]["outputs"][0]["component_display_name"] == "Chat Output"
+
+
+async def test_get_unknown_run(client: AsyncClient, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+
+    response = await client.get("api/v1/runs/missing", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.get("api/v1/runs/missing/result", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,104 @@
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from langflow.base.data import csv_reader
+from langflow.base.data.csv_reader import concat_batches, iter_csv_batches
+from langflow.schema.dataframe import DataFrame
+
+CSV_TEXT = "id,name,score\n" + "\n".join(f"{index},name{index},{index * 1.5}" for index in range(10))
+
+
+def test_iter_csv_batches_projects_and_filters_rows():
+    batches = list(
+        iter_csv_batches(io.StringIO(CSV_TEXT), batch_size=4, columns=["id", "name"], row_filter="id >= 3 and id != 5")
+    )
+
+    assert all(isinstance(batch, DataFrame) for batch in batches)
+    assert [batch.index.tolist() for batch in batches] == [[3], [4, 6, 7], [8, 9]]
+    dataframe = concat_batches(batches)
+    assert dataframe.columns.tolist() == ["id", "name"]
+    assert dataframe["id"].tolist() == [3, 4, 6, 7, 8, 9]
+    assert dataframe["name"].tolist()[0] == "name3"
+
+
+def test_iter_csv_batches_keeps_inferred_types():
+    text = "id,comment\n1,\n2,\n3,late comment\n"
+
+    dataframe = concat_batches(iter_csv_batches(io.StringIO(text), batch_size=2))
+
+    assert dataframe["id"].tolist() == [1, 2, 3]
+    assert dataframe["comment"].tolist()[2] == "late comment"
+    assert dataframe["id"].dtype == next(iter_csv_batches(io.StringIO(text), batch_size=2))["id"].dtype
+
+
+@pytest.fixture(params=["numpy_nullable", "pyarrow"])
+def dtype_backend(request, monkeypatch):
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(csv_reader, "get_dtype_backend", lambda: request.param)
+    return request.param
+
+
+@pytest.mark.usefixtures("dtype_backend")
+def test_iter_csv_batches_widens_conflicting_types():
+    text = "count,value,flag\n1,1,true\n2,2,false\n5.5,three,\n"
+
+    batches = list(iter_csv_batches(io.StringIO(text), batch_size=2))
+    dataframe = concat_batches(batches)
+
+    # The same types as reading the whole file at once
+    assert str(batches[1]["count"].dtype) in {"Float64", "double[pyarrow]"}
+    assert dataframe["count"].tolist() == [1.0, 2.0, 5.5]
+    assert pd.api.types.is_float_dtype(dataframe["count"].dtype)
+    assert dataframe["value"].tolist() == ["1", "2", "three"]
+    assert pd.api.types.is_string_dtype(dataframe["value"].dtype)
+    # Missing values don't change the type of a column
+    assert pd.api.types.is_bool_dtype(dataframe["flag"].dtype)
+    assert dataframe["flag"].tolist()[:2] == [True, False]
+
+    batches = list(iter_csv_batches(io.StringIO(text), batch_size=2, dtypes={"value": "string"}))
+    assert concat_batches(batches)["value"].tolist() == ["1", "2", "three"]
+
+
+def test_concat_batches_without_rows():
+    assert concat_batches([]).empty
+
+
+def load_dataframe(paths: list[Path]) -> pd.DataFrame:
+    from langflow.components.data import FileComponent
+
+    component = FileComponent()
+    component.set_attributes({"path": [str(path) for path in paths], "silent_errors": False})
+    return component.load_dataframe()
+
+
+@pytest.mark.usefixtures("dtype_backend")
+def test_load_dataframe_combines_csv_files_with_different_columns_and_types(tmp_path):
+    first = tmp_path / "first.csv"
+    first.write_text("x,y\n1,a\n2,b\n", encoding="utf-8")
+    second = tmp_path / "second.csv"
+    second.write_text("x,z\n5.5,true\n", encoding="utf-8")
+
+    dataframe = load_dataframe([first, second])
+
+    assert dataframe["x"].tolist() == [1.0, 2.0, 5.5]
+    assert pd.api.types.is_float_dtype(dataframe["x"].dtype)
+    assert dataframe["y"].tolist()[:2] == ["a", "b"]
+    assert dataframe["y"].isna().tolist() == [False, False, True]
+    assert dataframe["z"].isna().tolist() == [True, True, False]
+
+
+@pytest.mark.usefixtures("dtype_backend")
+def test_load_dataframe_combines_csv_and_text_files(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("x\n1\n2\n", encoding="utf-8")
+    text_file = tmp_path / "notes.txt"
+    text_file.write_text("some notes", encoding="utf-8")
+
+    dataframe = load_dataframe([csv_file, text_file])
+
+    assert dataframe["x"].tolist()[:2] == [1, 2]
+    assert dataframe["text"].tolist()[2] == "some notes"
+    assert dataframe["text"].isna().tolist() == [True, True, False]
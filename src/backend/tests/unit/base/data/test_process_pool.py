@@ -0,0 +1,107 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+from langflow.base.data.process_pool import parse_files_in_processes
+from langflow.base.data.utils import parse_text_file_to_data
+from langflow.schema import Data
+
+
+def test_parse_files_in_processes_keeps_order(tmp_path):
+    file_paths = []
+    for index in range(5):
+        file_path = tmp_path / f"test{index}.txt"
+        file_path.write_text(f"content{index}", encoding="utf-8")
+        file_paths.append(str(file_path))
+
+    results = parse_files_in_processes(file_paths, parse_text_file_to_data, max_workers=2, timeout=60)
+
+    assert [result.path for result in results] == file_paths
+    assert [result.data.text for result in results] == [f"content{index}" for index in range(5)]
+    assert all(result.status == "ok" and result.seconds >= 0 for result in results)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Requires named pipes")
+def test_parse_files_in_processes_times_out(tmp_path):
+    # Reading a named pipe without a writer blocks forever
+    blocking_path = tmp_path / "blocking.txt"
+    os.mkfifo(blocking_path)
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("content", encoding="utf-8")
+
+    results = parse_files_in_processes(
+        [str(blocking_path), str(file_path)],
+        parse_text_file_to_data,
+        max_workers=1,
+        timeout=1,
+        silent_errors=True,
+    )
+
+    assert results[0].status == "timeout"
+    assert results[0].data is None
+    assert results[1].status == "ok"
+    assert results[1].data.text == "content"
+
+
+def test_parse_files_in_processes_raises_errors(tmp_path):
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("content", encoding="utf-8")
+    missing_path = str(tmp_path / "missing.txt")
+
+    with pytest.raises(ValueError, match="missing.txt"):
+        parse_files_in_processes([str(file_path), missing_path], parse_text_file_to_data, max_workers=2)
+
+    results = parse_files_in_processes(
+        [str(file_path), missing_path], parse_text_file_to_data, max_workers=2, silent_errors=True
+    )
+    assert results[0].data.text == "content"
+    assert results[1].status == "error"
+    assert isinstance(results[1].error, ValueError)
+
+
+def load_process_id(path: str, *, silent_errors: bool) -> Data:  # noqa: ARG001
+    return Data(data={"file_path": path, "pid": os.getpid()})
+
+
+def load_with_large_memory(path: str, *, silent_errors: bool) -> Data:  # noqa: ARG001
+    memory = b"x" * (256 * 1024 * 1024)
+    time.sleep(5)
+    return Data(data={"file_path": path, "size": len(memory)})
+
+
+def test_parse_pool_reuses_workers(tmp_path):
+    file_path = str(tmp_path / "test.txt")
+    first = parse_files_in_processes([file_path] * 3, load_process_id, max_workers=1)
+    second = parse_files_in_processes([file_path], load_process_id, max_workers=1)
+
+    process_ids = {result.data.data["pid"] for result in [*first, *second]}
+    assert len(process_ids) == 1
+    assert os.getpid() not in process_ids
+
+
+def test_parse_pool_reads_other_file_types_in_threads(tmp_path):
+    results = parse_files_in_processes(
+        [str(tmp_path / "test.txt"), str(tmp_path / "test.PDF")],
+        load_process_id,
+        max_workers=2,
+        process_file_types=["pdf"],
+    )
+
+    assert results[0].data.data["pid"] == os.getpid()
+    assert results[1].data.data["pid"] != os.getpid()
+
+
+@pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="Requires a /proc filesystem")
+def test_parse_pool_kills_workers_exceeding_the_memory_limit(tmp_path):
+    file_path = str(tmp_path / "test.txt")
+    results = parse_files_in_processes(
+        [file_path, file_path],
+        load_with_large_memory,
+        max_workers=1,
+        memory_limit=128 * 1024 * 1024,
+        silent_errors=True,
+    )
+
+    assert all(isinstance(result.error, MemoryError) for result in results)
+    assert parse_files_in_processes([file_path], load_process_id, max_workers=1)[0].status == "ok"
@@ -0,0 +1,126 @@
+import pickle
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.embeddings.fake import DeterministicFakeEmbedding
+from langflow.base.embeddings.cache import CachedEmbeddings, EmbeddingCache, get_embeddings_identity
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "test-model", size: int = 4):
+        self.model = model
+        self.size = size
+        self.embedded: list[str] = []
+
+    def _embed(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return [float(len(text) + index) for index in range(self.size)]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [-value for value in self._embed(text)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path, hot_size=2)
+    yield cache
+    cache.close()
+
+
+def cached(embeddings: Embeddings, cache: EmbeddingCache) -> CachedEmbeddings:
+    return CachedEmbeddings(embeddings, cache, get_embeddings_identity(embeddings))
+
+
+def test_get_embeddings_identity():
+    identity = get_embeddings_identity(CountingEmbeddings("a"))
+    assert identity["model"] == "a"
+    assert identity["provider"].endswith("CountingEmbeddings")
+    assert get_embeddings_identity(CountingEmbeddings("b")) != identity
+    # Without a model name, vectors of different models can't be told apart
+    assert get_embeddings_identity(DeterministicFakeEmbedding(size=4)) is None
+
+
+def test_embeddings_identity_includes_settings_and_user():
+    embeddings = CountingEmbeddings()
+    embeddings.encode_kwargs = {"normalize_embeddings": True}
+    embeddings.api_key = "secret"
+    identity = get_embeddings_identity(embeddings, user_id="user")
+
+    assert identity["encode_kwargs"] == {"normalize_embeddings": True}
+    assert "api_key" not in identity
+    assert identity["user_id"] == "user"
+    assert get_embeddings_identity(embeddings, user_id="other-user") != identity
+    embeddings.encode_kwargs = {"normalize_embeddings": False}
+    assert get_embeddings_identity(embeddings, user_id="user") != identity
+
+
+def test_cached_embeddings_only_embed_missing_texts(cache):
+    embeddings = CountingEmbeddings()
+    cached_embeddings = cached(embeddings, cache)
+
+    assert cached_embeddings.embed_documents(["a", "bb", "a"]) == embeddings.embed_documents(["a", "bb", "a"])
+    embeddings.embedded.clear()
+    assert cached_embeddings.embed_documents(["bb", "ccc"]) == [[2.0, 3.0, 4.0, 5.0], [3.0, 4.0, 5.0, 6.0]]
+    assert embeddings.embedded == ["ccc"]
+
+    # Queries are cached apart from documents
+    assert cached_embeddings.embed_query("a") == [-1.0, -2.0, -3.0, -4.0]
+    assert cached_embeddings.embed_query("a") == [-1.0, -2.0, -3.0, -4.0]
+    assert embeddings.embedded == ["ccc", "a"]
+    assert cached_embeddings.model == "test-model"
+
+
+def test_cached_vectors_persist_on_disk(tmp_path, cache):
+    cached(CountingEmbeddings(), cache).embed_documents([str(index) * index for index in range(10)])
+    stats = cache.stats()
+    assert stats["miss"] == 10
+    assert stats["bytes_written"] == 10 * 4 * 4
+
+    other_cache = EmbeddingCache(tmp_path, hot_size=0)
+    embeddings = CountingEmbeddings()
+    try:
+        vectors = cached(embeddings, other_cache).embed_documents(["1", "22", "new"])
+    finally:
+        other_cache.close()
+    assert vectors == [[1.0, 2.0, 3.0, 4.0], [2.0, 3.0, 4.0, 5.0], [3.0, 4.0, 5.0, 6.0]]
+    assert embeddings.embedded == ["new"]
+    assert other_cache.stats()["disk"] == 2
+
+    # Another model doesn't reuse the vectors
+    embeddings = CountingEmbeddings("other-model")
+    cached(embeddings, cache).embed_documents(["1"])
+    assert embeddings.embedded == ["1"]
+
+
+def test_full_store_stops_caching(tmp_path):
+    cache = EmbeddingCache(tmp_path, hot_size=0, max_bytes=2 * 4 * 4)
+    embeddings = CountingEmbeddings()
+    cached_embeddings = cached(embeddings, cache)
+    try:
+        cached_embeddings.embed_documents(["a", "b"])
+        cached_embeddings.embed_documents(["c"])
+        embeddings.embedded.clear()
+        assert cached_embeddings.embed_documents(["a", "b", "c"]) == embeddings.embed_documents(["a", "b", "c"])
+        assert embeddings.embedded == ["c", "a", "b", "c"]
+    finally:
+        cache.close()
+
+
+async def test_cached_embeddings_async(cache):
+    embeddings = CountingEmbeddings()
+    cached_embeddings = cached(embeddings, cache)
+
+    assert await cached_embeddings.aembed_documents(["a"]) == [[1.0, 2.0, 3.0, 4.0]]
+    assert await cached_embeddings.aembed_query("a") == [-1.0, -2.0, -3.0, -4.0]
+    assert await cached_embeddings.aembed_documents(["a"]) == [[1.0, 2.0, 3.0, 4.0]]
+    assert embeddings.embedded == ["a", "a"]
+
+
+def test_cached_embeddings_pickle(cache):
+    cached_embeddings = cached(CountingEmbeddings(), cache)
+    loaded = pickle.loads(pickle.dumps(cached_embeddings))  # noqa: S301
+    assert loaded.model == "test-model"
+    assert loaded.cache.directory == cache.directory
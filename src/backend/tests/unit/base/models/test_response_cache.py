@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langflow.base.models import response_cache
+from langflow.base.models.response_cache import (
+    LLMResponseCache,
+    ResponseCache,
+    get_model_identity,
+    get_prompt_text,
+    get_response_key,
+    use_response_cache,
+    with_llm_response_cache,
+)
+
+
+class LetterEmbeddings(Embeddings):
+    """Embeds texts as their letter counts, so texts with the same letters are similar."""
+
+    model = "letters"
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(text.lower().count(letter)) for letter in "abcdefghijklmnopqrstuvwxyz"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResponseCache(tmp_path / "responses.db")
+    yield store
+    store.close()
+
+
+def test_exact_cache_reuses_responses(store):
+    llm_cache = LLMResponseCache(store)
+    model = FakeListChatModel(responses=["first", "second", "third"], cache=llm_cache)
+
+    assert model.invoke("hello").content == "first"
+    assert model.invoke("hello").content == "first"
+    assert model.invoke("hello there").content == "second"
+    assert llm_cache.stats == {"hit": 1, "miss": 2}
+
+    # Another model configuration doesn't reuse the responses
+    other_model = FakeListChatModel(responses=["other"], cache=LLMResponseCache(store))
+    assert other_model.invoke("hello").content == "other"
+
+
+def test_semantic_cache_reuses_responses_of_similar_prompts(store):
+    llm_cache = LLMResponseCache(store, embeddings=LetterEmbeddings(), similarity_threshold=0.95)
+    model = FakeListChatModel(responses=["first", "second"], cache=llm_cache)
+
+    assert model.invoke("What is the capital of France?").content == "first"
+    assert model.invoke("what is the capital of france").content == "first"
+    assert model.invoke("Tell me a joke").content == "second"
+    assert llm_cache.stats == {"semantic_hit": 1, "miss": 2}
+
+
+def test_responses_are_not_shared_across_users(store):
+    def build_model(user_id: str) -> FakeListChatModel:
+        llm_cache = LLMResponseCache(
+            store, scope={"user_id": user_id, "flow_id": "flow"}, embeddings=LetterEmbeddings()
+        )
+        return FakeListChatModel(responses=["response"], cache=llm_cache)
+
+    build_model("user").invoke("Hello there")
+    model = build_model("user")
+    model.invoke("Hello there")
+    model.invoke("hello there!")
+    assert model.cache.stats == {"hit": 1, "semantic_hit": 1}
+    # Neither exact nor semantic lookups return the responses of another user
+    other_model = build_model("other-user")
+    other_model.invoke("Hello there")
+    assert other_model.cache.stats == {"miss": 1}
+
+
+def test_use_response_cache_scopes_responses_to_the_component(store, monkeypatch):
+    monkeypatch.setattr(response_cache, "get_default_response_cache", lambda: store)
+
+    class ModelComponent:
+        user_id = "user"
+        flow_id = "flow"
+        response_cache = "Exact"
+
+        @use_response_cache
+        def build_model(self):
+            return FakeListChatModel(responses=["a"])
+
+    component = ModelComponent()
+    component.build_model()
+    assert component._llm_response_cache.scope == {"user_id": "user", "flow_id": "flow"}
+
+
+def test_ttl(store, monkeypatch):
+    store.put_many({"key": "response"})
+    assert store.get_many(["key"], max_age=60) == {"key": "response"}
+
+    now = response_cache.time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 120)
+    assert store.get_many(["key"], max_age=60) == {}
+    assert store.get_many(["key"]) == {"key": "response"}
+
+
+def test_max_entries(tmp_path):
+    store = ResponseCache(tmp_path / "responses.db", max_entries=10)
+    store.put_many({f"key-{index}": index for index in range(150)})
+    assert len(store) == 10
+    store.close()
+
+
+def test_get_model_identity_excludes_secrets():
+    model = FakeListChatModel(responses=["a"]).bind(stop=["\n"], api_token="secret")  # noqa: S106
+    identity = get_model_identity(model)
+
+    assert identity["stop"] == ["\n"]
+    assert "api_token" not in identity
+    assert identity["provider"].endswith("FakeListChatModel")
+
+
+def test_max_tokens_changes_the_response_key():
+    model = FakeListChatModel(responses=["a"])
+    identities = [get_model_identity(model.bind(max_tokens=max_tokens, api_key="secret")) for max_tokens in (10, 20)]
+
+    assert [identity["max_tokens"] for identity in identities] == [10, 20]
+    assert all("api_key" not in identity for identity in identities)
+    assert get_response_key(identities[0], "", "hello") != get_response_key(identities[1], "", "hello")
+
+
+def test_get_prompt_text():
+    from langchain_core.load import dumps
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    prompt = dumps([SystemMessage(content="Be brief"), HumanMessage(content="Hello")])
+    assert get_prompt_text(prompt) == "Be brief\n\nHello"
+    assert get_prompt_text("plain text") == "plain text"
+
+
+def test_with_llm_response_cache(store, monkeypatch):
+    monkeypatch.setattr(response_cache, "get_default_response_cache", lambda: store)
+    model = FakeListChatModel(responses=["a"])
+
+    llm_cache = with_llm_response_cache(model.bind(stop=["\n"]))
+    assert model.cache is llm_cache
+    assert llm_cache.mode == "exact"
+
+    with pytest.raises(ValueError, match="requires an embedding model"):
+        with_llm_response_cache(model, semantic=True)
+
+
+def test_find_similar_compares_the_most_recent_prompts(store, monkeypatch):
+    now = response_cache.time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now)
+    store.put_vector("scope", "old", np.array([1.0, 0.0], dtype=np.float32))
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 1)
+    store.put_vector("scope", "new", np.array([0.0, 1.0], dtype=np.float32))
+    store.put_vector("other-scope", "other", np.array([1.0, 0.0], dtype=np.float32))
+
+    assert store.find_similar("scope", np.array([1.0, 0.0]), 0.9) == "old"
+    assert store.find_similar("scope", np.array([1.0, 0.0]), 0.9, limit=1) is None
+    assert store.find_similar("scope", np.array([0.0, 1.0]), 0.9, limit=1) == "new"
+    # Vectors of another size are never compared
+    assert store.find_similar("scope", np.array([1.0, 0.0, 0.0]), 0.0) is None
+
+
+def test_response_cache_is_opt_in_per_component():
+    from langflow.base.models.model import LCModelComponent
+    from langflow.components.models.language_model import LanguageModelComponent
+
+    assert "response_cache" not in {component_input.name for component_input in LCModelComponent._base_inputs}
+    assert "response_cache" in {component_input.name for component_input in LanguageModelComponent.inputs}
@@ -0,0 +1,105 @@
+import gc
+import time
+
+from langflow.base.vectorstores.pool import VectorStoreClientPool, get_client_key
+
+
+class Client:
+    def __init__(self, name: str):
+        self.name = name
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+
+def test_get_reuses_clients_by_params():
+    pool = VectorStoreClientPool()
+    first = pool.get("qdrant", {"url": "http://a", "api_key": "secret"}, lambda: Client("a"))
+
+    assert pool.get("qdrant", {"api_key": "secret", "url": "http://a"}, lambda: Client("b")) is first
+    assert pool.get("qdrant", {"url": "http://a", "api_key": "other"}, lambda: Client("c")).name == "c"
+    assert pool.get("chroma", {"url": "http://a", "api_key": "secret"}, lambda: Client("d")).name == "d"
+    assert "secret" not in get_client_key("qdrant", {"api_key": "secret"})
+
+
+def test_full_pool_closes_least_recently_used_clients():
+    pool = VectorStoreClientPool(max_size=2)
+    first = pool.get("store", {"index": 1}, lambda: Client("1"))
+    second = pool.get("store", {"index": 2}, lambda: Client("2"))
+    pool.get("store", {"index": 1}, lambda: Client("unused"))
+    pool.get("store", {"index": 3}, lambda: Client("3"))
+
+    assert len(pool) == 2
+    assert second.closed
+    assert not first.closed
+
+
+def test_idle_clients_are_closed(monkeypatch):
+    pool = VectorStoreClientPool(idle_timeout=10)
+    client = pool.get("store", {}, lambda: Client("idle"))
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert pool.get("store", {}, lambda: Client("new")).name == "new"
+    assert client.closed
+
+
+def test_unhealthy_clients_are_recreated():
+    pool = VectorStoreClientPool(health_check_interval=0)
+    client = pool.get("store", {}, lambda: Client("old"), health_check=lambda client: client.healthy)
+    assert pool.get("store", {}, lambda: Client("new"), health_check=lambda client: client.healthy) is client
+
+    client.healthy = False
+    assert pool.get("store", {}, lambda: Client("new"), health_check=lambda client: client.healthy).name == "new"
+    assert client.closed
+
+
+def test_evict_and_clear():
+    pool = VectorStoreClientPool()
+    client = pool.get("store", {}, lambda: Client("a"))
+    pool.evict("store", {})
+    assert client.closed
+    assert len(pool) == 0
+
+    client = pool.get("store", {}, lambda: Client("b"), close=None)
+    pool.clear()
+    assert not client.closed
+    assert len(pool) == 0
+
+
+class Owner:
+    pass
+
+
+def test_clients_in_use_are_closed_when_their_owners_are_gone():
+    pool = VectorStoreClientPool(max_size=1)
+    owner = Owner()
+    client = pool.get("store", {"index": 1}, lambda: Client("1"), owner=owner)
+    pool.get("store", {"index": 2}, lambda: Client("2"))
+    pool.evict("store", {"index": 2})
+
+    assert len(pool) == 0
+    assert not client.closed
+    del owner
+    gc.collect()
+    assert client.closed
+
+
+def test_evict_releases_the_client_of_its_owner():
+    pool = VectorStoreClientPool()
+    owner, other_owner = Owner(), Owner()
+    client = pool.get("store", {}, lambda: Client("a"), owner=owner)
+    assert pool.get("store", {}, lambda: Client("b"), owner=owner) is client
+
+    pool.evict("store", {}, owner=owner)
+    assert client.closed
+
+    client = pool.get("store", {}, lambda: Client("c"), owner=owner)
+    pool.get("store", {}, lambda: Client("d"), owner=other_owner)
+    pool.evict("store", {}, owner=owner)
+    assert not client.closed
+    del other_owner
+    gc.collect()
+    assert client.closed
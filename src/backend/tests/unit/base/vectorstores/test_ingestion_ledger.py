@@ -0,0 +1,84 @@
+import hashlib
+
+import pytest
+from langchain_core.documents import Document
+from langflow.base.vectorstores import ledger as ledger_module
+from langflow.base.vectorstores.ledger import IngestionLedger, get_collection_key
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = IngestionLedger(tmp_path / "ledger.db")
+    yield ledger
+    ledger.close()
+
+
+def ingest(ledger: IngestionLedger, collection: str, documents: list[Document], **kwargs):
+    plan = ledger.plan(collection, documents, **kwargs)
+    ledger.record(collection, plan)
+    return plan
+
+
+def test_plan_skips_ingested_and_duplicate_documents(ledger, tmp_path):
+    collection = get_collection_key("FAISS", str(tmp_path / "index"), "langflow_index")
+    documents = [
+        Document(page_content="a", metadata={"source": "1.txt"}),
+        Document(page_content="a", metadata={"source": "1.txt"}),
+        Document(page_content="b", metadata={"source": "1.txt"}),
+    ]
+
+    plan = ingest(ledger, collection, documents)
+    assert [document.page_content for document in plan.documents] == ["a", "b"]
+    assert plan.unchanged == 1
+    assert ledger.count(collection) == 2
+
+    plan = ledger.plan(collection, documents)
+    assert plan.documents == []
+    assert plan.stale_ids == []
+    # Ids are derived from the content so they are stable across builds
+    assert ledger.plan(collection + "-other", documents).ids == ingest(ledger, "copy", documents).ids
+
+
+def test_plan_deletes_removed_chunks_of_changed_sources(ledger):
+    first = [
+        Document(page_content="a", metadata={"source": "1.txt"}),
+        Document(page_content="b", metadata={"source": "1.txt"}),
+        Document(page_content="c", metadata={"source": "2.txt"}),
+    ]
+    added = ingest(ledger, "collection", first)
+
+    # 2.txt is not part of this ingestion so its chunks are kept
+    plan = ledger.plan("collection", [Document(page_content="b2", metadata={"source": "1.txt"})])
+    assert [document.page_content for document in plan.documents] == ["b2"]
+    assert sorted(plan.stale_ids) == sorted(added.ids[:2])
+
+    plan = ingest(
+        ledger, "collection", [Document(page_content="a", metadata={"source": "1.txt"})], delete_missing_sources=True
+    )
+    assert plan.documents == []
+    assert sorted(plan.stale_ids) == sorted(added.ids[1:])
+    assert ledger.count("collection") == 1
+
+
+def test_chunks_shared_by_sources_are_deleted_with_the_last_one(ledger, monkeypatch):
+    # Ids only depend on the text, so both sources produce the same chunk
+    monkeypatch.setattr(
+        ledger_module, "get_document_hash", lambda document: hashlib.sha256(document.page_content.encode()).hexdigest()
+    )
+    ingest(ledger, "collection", [Document(page_content="a", metadata={"source": "1.txt"})])
+    plan = ingest(ledger, "collection", [Document(page_content="a", metadata={"source": "2.txt"})])
+    assert plan.documents == []
+    assert ledger.count("collection") == 1
+
+    plan = ingest(ledger, "collection", [Document(page_content="b", metadata={"source": "1.txt"})])
+    assert plan.stale_ids == []
+    plan = ingest(ledger, "collection", [Document(page_content="c", metadata={"source": "2.txt"})])
+    assert len(plan.stale_ids) == 1
+    assert ledger.count("collection") == 2
+
+
+def test_reset(ledger):
+    ingest(ledger, "collection", [Document(page_content="a")])
+    ledger.reset("collection")
+    assert ledger.count("collection") == 0
+    assert len(ledger.plan("collection", [Document(page_content="a")]).documents) == 1
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+from langchain_core.embeddings.fake import DeterministicFakeEmbedding
+from langflow.base.vectorstores import memmap
+from langflow.base.vectorstores.memmap import MemmapIndex, MemmapVectorStore
+
+
+@pytest.fixture
+def vector_store(tmp_path):
+    index = MemmapIndex(tmp_path / "collection")
+    yield MemmapVectorStore(index, DeterministicFakeEmbedding(size=8))
+    index.close()
+
+
+def test_add_search_and_delete(vector_store):
+    ids = vector_store.add_texts(["apple", "banana", "cherry"], [{"kind": "a"}, {"kind": "b"}, {"kind": "b"}])
+
+    results = vector_store.similarity_search_with_score("banana", k=2)
+    assert results[0][0].page_content == "banana"
+    assert results[0][1] == pytest.approx(1.0)
+    assert len(results) == 2
+
+    filtered = vector_store.similarity_search("apple", k=3, filter={"kind": "b"})
+    assert {document.page_content for document in filtered} == {"banana", "cherry"}
+    assert vector_store.similarity_search("apple", k=1, filter={"kind": ["a", "c"]})[0].page_content == "apple"
+
+    vector_store.delete([ids[1]])
+    assert [document.page_content for document in vector_store.get_by_ids(ids)] == ["apple", "cherry"]
+    assert "banana" not in [document.page_content for document in vector_store.similarity_search("banana", k=3)]
+
+
+def test_add_replaces_chunks_with_the_same_id(vector_store):
+    vector_store.add_texts(["old"], ids=["1"])
+    vector_store.add_texts(["new"], ids=["1"])
+
+    assert len(vector_store.index) == 1
+    assert vector_store.similarity_search("new", k=5)[0].page_content == "new"
+
+
+def test_collection_is_persisted_and_compacted(tmp_path):
+    embedding = DeterministicFakeEmbedding(size=8)
+    index = MemmapIndex(tmp_path)
+    vector_store = MemmapVectorStore(index, embedding)
+    ids = vector_store.add_texts([f"text {number}" for number in range(10)])
+    vector_store.delete(ids[:6])
+    index.close()
+
+    index = MemmapIndex(tmp_path)
+    try:
+        assert len(index) == 4
+        # Deleted rows are removed once they are the majority
+        assert (tmp_path / "vectors.f32").stat().st_size == 4 * 8 * 4
+        results = MemmapVectorStore(index, embedding).similarity_search("text 7", k=1)
+        assert results[0].page_content == "text 7"
+    finally:
+        index.close()
+
+
+def test_ivf_search_finds_nearest_neighbors(tmp_path, monkeypatch):
+    monkeypatch.setattr(memmap, "EXACT_SEARCH_LIMIT", 0)
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 16))
+    vectors = centers[rng.integers(0, 20, 2000)] + 0.1 * rng.normal(size=(2000, 16))
+    index = MemmapIndex(tmp_path, index_type="ivf")
+    try:
+        ids = [str(number) for number in range(2000)]
+        index.add(ids, ids, [{} for _ in ids], vectors)
+        assert index.ivf_path.exists()
+
+        results = index.search(vectors[:20], k=1, n_probe=4)
+        assert [result[0][0].id for result in results] == ids[:20]
+    finally:
+        index.close()
+
+
+def test_indexes_of_a_collection_reload_changes_of_each_other(tmp_path):
+    embedding = DeterministicFakeEmbedding(size=8)
+    # Each index stands for a process sharing the collection
+    first, second = MemmapIndex(tmp_path), MemmapIndex(tmp_path)
+    try:
+        ids = MemmapVectorStore(first, embedding).add_texts([f"text {number}" for number in range(10)])
+        MemmapVectorStore(second, embedding).add_texts(["other"])
+        assert len(first) == len(second) == 11
+
+        # Deleting most chunks compacts the collection, moving the rows of the others
+        first.delete(ids[:8])
+        results = MemmapVectorStore(second, embedding).similarity_search("text 9", k=1)
+        assert results[0].page_content == "text 9"
+        assert [document.page_content for document in second.get([ids[8], ids[0]])] == ["text 8"]
+    finally:
+        first.close()
+        second.close()
+
+
+@pytest.mark.parametrize("index_type", ["auto", "flat"])
+def test_ivf_index_stays_in_line_when_opened_with_another_index_type(tmp_path, monkeypatch, index_type):
+    monkeypatch.setattr(memmap, "EXACT_SEARCH_LIMIT", 0)
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 16))
+    vectors = centers[rng.integers(0, 20, 5000)] + 0.1 * rng.normal(size=(5000, 16))
+    ids = [str(number) for number in range(5000)]
+    index = MemmapIndex(tmp_path, index_type="ivf")
+    index.add(ids[:2000], ids[:2000], [{} for _ in range(2000)], vectors[:2000])
+    index.close()
+
+    # The collection grows past the retraining threshold while it isn't opened as IVF
+    index = MemmapIndex(tmp_path, index_type=index_type)
+    index.add(ids[2000:], ids[2000:], [{} for _ in range(3000)], vectors[2000:])
+    index.close()
+
+    index = MemmapIndex(tmp_path, index_type="ivf")
+    try:
+        results = index.search(vectors[-20:], k=1, n_probe=4)
+        assert [result[0][0].id for result in results] == ids[-20:]
+        index.delete(ids[:100])
+        index.compact()
+        assert len(index) == 4900
+        assert index.search(vectors[-1:], k=1, n_probe=4)[0][0][0].id == ids[-1]
+    finally:
+        index.close()
@@ -3,6 +3,8 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from langflow.base.data.manifest import DirectoryManifest
+from langflow.base.data.utils import iter_load_data, parse_text_file_to_data
 from langflow.components.data import DirectoryComponent
 from langflow.schema import Data, DataFrame
 
@@ -376,3 +378,102 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
             actual_texts = [r.text for r in results]
             expected_texts = ["content1", "content2"]
             assert actual_texts == expected_texts, f"Expected texts {expected_texts}, got {actual_texts}"
+
+    def test_directory_incremental(self, tmp_path):
+        """Test that incremental runs output all files, but only parse new or modified ones."""
+        manifest = DirectoryManifest(tmp_path / "manifest.db")
+        directory = tmp_path / "files"
+        directory.mkdir()
+        (directory / "a.txt").write_text("a", encoding="utf-8")
+        (directory / "b.txt").write_text("b", encoding="utf-8")
+        component = DirectoryComponent(_id="Directory-test")
+        component.set_attributes(
+            {"path": str(directory), "types": ["txt"], "incremental": True, "silent_errors": False}
+        )
+
+        def load() -> tuple[list[str], list[str]]:
+            with (
+                patch.object(DirectoryComponent, "_get_manifest", return_value=manifest),
+                patch(
+                    "langflow.components.data.directory.parse_text_file_to_data", wraps=parse_text_file_to_data
+                ) as parse,
+            ):
+                texts = sorted(data.text for data in component.load_directory())
+            return texts, sorted(Path(call.args[0]).name for call in parse.call_args_list)
+
+        assert load() == (["a", "b"], ["a.txt", "b.txt"])
+        # The same component instance scans the directory again, and both outputs get every file
+        assert load() == (["a", "b"], [])
+        assert sorted(data.text for data in component.as_dataframe().to_data_list()) == ["a", "b"]
+
+        (directory / "a.txt").write_text("modified", encoding="utf-8")
+        (directory / "c.txt").write_text("c", encoding="utf-8")
+        assert load() == (["b", "c", "modified"], ["a.txt", "c.txt"])
+
+        # Touching a file without modifying it doesn't parse it again
+        (directory / "b.txt").write_text("b", encoding="utf-8")
+        assert load() == (["b", "c", "modified"], [])
+
+        # Deleted files are forgotten, so they are parsed again if they come back
+        (directory / "c.txt").unlink()
+        assert load() == (["b", "modified"], [])
+        (directory / "c.txt").write_text("c", encoding="utf-8")
+        assert load() == (["b", "c", "modified"], ["c.txt"])
+        manifest.close()
+
+    def test_directory_with_process_pool(self):
+        """Test DirectoryComponent parsing documents in processes."""
+        directory_component = DirectoryComponent()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(5):
+                (Path(temp_dir) / f"test{index}.txt").write_text(f"content{index}", encoding="utf-8")
+
+            directory_component.set_attributes(
+                {
+                    "path": str(temp_dir),
+                    "use_process_pool": True,
+                    "max_concurrency": 2,
+                    "batch_size": 2,
+                    "types": ["txt"],
+                    "silent_errors": False,
+                }
+            )
+            results = directory_component.load_directory()
+            assert sorted(result.text for result in results) == [f"content{index}" for index in range(5)]
+
+    def test_iter_load_data_in_processes_keeps_order(self, tmp_path):
+        file_paths = []
+        for index in range(6):
+            file_path = tmp_path / f"test{index}.{'MD' if index % 2 else 'txt'}"
+            file_path.write_text(f"content{index}", encoding="utf-8")
+            file_paths.append(str(file_path))
+
+        results = list(
+            iter_load_data(
+                file_paths,
+                silent_errors=False,
+                max_concurrency=2,
+                load_function=parse_text_file_to_data,
+                process_file_types=["md"],
+            )
+        )
+        assert [result.text for result in results] == [f"content{index}" for index in range(6)]
+
+    def test_iter_load_data_raises_parse_errors_and_closes_cleanly(self, tmp_path):
+        file_paths = []
+        for index in range(6):
+            file_path = tmp_path / f"test{index}.txt"
+            file_path.write_text(f"content{index}", encoding="utf-8")
+            file_paths.append(str(file_path))
+        file_paths.insert(1, str(tmp_path / "missing.txt"))
+
+        loaded = iter_load_data(file_paths, silent_errors=False, max_concurrency=1)
+        assert next(loaded).text == "content0"
+        with pytest.raises(ValueError, match="missing.txt"):
+            next(loaded)
+
+        # Closing the generator early doesn't raise
+        loaded = iter_load_data(file_paths[2:], silent_errors=False, max_concurrency=1)
+        assert next(loaded).text == "content1"
+        loaded.close()
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from langflow.components.embeddings.similarity import EmbeddingSimilarityComponent
+from langflow.schema import Data, DataFrame
+
+from tests.base import ComponentTestBaseWithoutClient
+
+
+class TestEmbeddingSimilarityComponent(ComponentTestBaseWithoutClient):
+    @pytest.fixture
+    def component_class(self):
+        return EmbeddingSimilarityComponent
+
+    @pytest.fixture
+    def default_kwargs(self):
+        return {
+            "embedding_vectors": [
+                Data(data={"text": "a", "embeddings": [1.0, 0.0]}),
+                Data(data={"text": "b", "embeddings": [1.0, 1.0]}),
+                Data(data={"text": "c", "embeddings": [0.0, 1.0]}),
+            ],
+            "similarity_metric": "Cosine Similarity",
+        }
+
+    @pytest.fixture
+    def file_names_mapping(self):
+        return []
+
+    def test_similarity_matrix_of_all_pairs(self, component_class, default_kwargs):
+        component = component_class(**default_kwargs, chunk_size=2)
+        result = component.compute_similarity_matrix()
+
+        assert list(zip(result["source_index"], result["target_index"], strict=True)) == [(0, 1), (0, 2), (1, 2)]
+        assert result["cosine_similarity"].to_numpy() == pytest.approx([np.sqrt(0.5), 0.0, np.sqrt(0.5)], abs=1e-6)
+
+    @pytest.mark.parametrize(
+        ("metric", "column"),
+        [("Euclidean Distance", "euclidean_distance"), ("Manhattan Distance", "manhattan_distance")],
+    )
+    def test_similarity_matrix_top_k(self, component_class, metric, column):
+        vectors = [Data(data={"text": str(x), "embeddings": [x, 0.0]}) for x in (0.0, 1.0, 3.0)]
+        component = component_class(embedding_vectors=vectors, similarity_metric=metric, top_k=1)
+        result = component.compute_similarity_matrix()
+
+        # The closest vector of each vector, other than itself
+        assert list(result["target_index"]) == [1, 0, 1]
+        assert result[column].to_numpy() == pytest.approx([1.0, 1.0, 2.0])
+
+    def test_similarity_matrix_of_queries(self, component_class, default_kwargs):
+        queries = DataFrame([{"text": "q", "embeddings": [0.0, 2.0]}])
+        component = component_class(**default_kwargs, query_vectors=[queries], top_k=2)
+        result = component.compute_similarity_matrix()
+
+        assert list(result["target_text"]) == ["c", "b"]
+        assert list(result["source_text"]) == ["q", "q"]
@@ -1,6 +1,9 @@
+import asyncio
 import re
 
 import pytest
+from langflow.base.models.response_cache import ResponseCache
+from langflow.components.helpers import batch_run
 from langflow.components.helpers.batch_run import BatchRunComponent
 from langflow.schema import DataFrame
 
@@ -8,7 +11,37 @@ from tests.base import ComponentTestBaseWithoutClient
 from tests.unit.mock_language_model import MockLanguageModel
 
 
+class CountingModel(MockLanguageModel):
+    """A mock model failing the rows listed in `failures` with the given errors, once per error."""
+
+    calls: list = []
+    failures: dict = {}
+    active: int = 0
+    max_active: int = 0
+
+    async def abatch(self, messages, *args, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            content = messages[0][-1]["content"]
+            self.calls.append(content)
+            if self.failures.get(content):
+                raise self.failures[content].pop(0)
+            return await super().abatch(messages, *args, **kwargs)
+        finally:
+            self.active -= 1
+
+
 class TestBatchRunComponent(ComponentTestBaseWithoutClient):
+    @pytest.fixture(autouse=True)
+    def response_cache(self, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path / "responses.db")
+        monkeypatch.setattr(batch_run, "get_default_response_cache", lambda: cache)
+        monkeypatch.setattr(batch_run, "get_retry_delay", lambda *_: 0)
+        yield cache
+        cache.close()
+
     @pytest.fixture
     def component_class(self):
         """Return the component class to test."""
@@ -256,3 +289,83 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_responses_are_cached(self, response_cache):
+        model = CountingModel(calls=[])
+        kwargs = {"df": DataFrame({"text": ["a", "b", "a"]}), "column_name": "text", "enable_metadata": True}
+
+        # Responses are only cached on request
+        await BatchRunComponent(model=model, **kwargs).run_batch()
+        assert await asyncio.to_thread(len, response_cache) == 0
+        model.calls.clear()
+
+        kwargs["use_cache"] = True
+        first = await BatchRunComponent(model=model, **kwargs).run_batch()
+        # Identical rows are sent once
+        assert sorted(model.calls) == ["a", "b"]
+        assert await asyncio.to_thread(len, response_cache) == 2
+
+        model.calls.clear()
+        second = await BatchRunComponent(model=model, **kwargs).run_batch()
+        assert model.calls == []
+        assert second["model_response"].tolist() == first["model_response"].tolist()
+        assert all(metadata["cached"] for metadata in second["metadata"])
+
+        # A different system message is a different prompt
+        await BatchRunComponent(model=model, system_message="Be brief", **kwargs).run_batch()
+        assert sorted(model.calls) == ["a", "b"]
+
+        # Responses are not shared with other users
+        model.calls.clear()
+        component = BatchRunComponent(model=model, **kwargs)
+        component._user_id = "other-user"
+        await component.run_batch()
+        assert sorted(model.calls) == ["a", "b"]
+
+    async def test_failed_run_resumes_from_the_cache(self):
+        model = CountingModel(calls=[], failures={"c": [ValueError("bad row")]})
+        kwargs = {
+            "df": DataFrame({"text": ["a", "b", "c", "d"]}),
+            "column_name": "text",
+            "chunk_size": 1,
+            "max_retries": 3,
+            "use_cache": True,
+        }
+
+        with pytest.raises(ValueError, match="bad row"):
+            await BatchRunComponent(model=model, **kwargs).run_batch()
+        # Errors that are not transient are not retried
+        assert model.calls == ["a", "b", "c"]
+
+        model.calls.clear()
+        result = await BatchRunComponent(model=model, **kwargs).run_batch()
+        assert model.calls == ["c", "d"]
+        assert result["model_response"].tolist() == [f"Response for {text}" for text in "abcd"]
+
+    async def test_transient_errors_are_retried(self):
+        model = CountingModel(calls=[], failures={"a": [TimeoutError(), ConnectionError()]})
+        component = BatchRunComponent(model=model, df=DataFrame({"text": ["a"]}), column_name="text", max_retries=2)
+
+        result = await component.run_batch()
+        assert model.calls == ["a", "a", "a"]
+        assert result["model_response"].tolist() == ["Response for a"]
+
+        model = CountingModel(calls=[], failures={"b": [TimeoutError(), TimeoutError()]})
+        component = BatchRunComponent(model=model, df=DataFrame({"text": ["b"]}), column_name="text", max_retries=1)
+        with pytest.raises(TimeoutError):
+            await component.run_batch()
+
+    async def test_max_concurrency(self):
+        model = CountingModel(calls=[])
+        component = BatchRunComponent(
+            model=model,
+            df=DataFrame({"text": [str(index) for index in range(20)]}),
+            column_name="text",
+            max_concurrency=3,
+            chunk_size=10,
+        )
+
+        result = await component.run_batch()
+        assert len(result) == 20
+        assert result["batch_index"].tolist() == list(range(20))
+        assert model.max_active == 3
@@ -0,0 +1,55 @@
+import json
+
+import orjson
+from langflow.events.encoder import EventEncoder
+from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame
+from langflow.schema.message import Message
+
+
+def decode(encoded: bytes) -> dict:
+    assert encoded.endswith(b"\n\n")
+    return json.loads(encoded)
+
+
+def test_encode_data_matches_model_serializer():
+    data = Data(data={"text": "hello", "count": 1})
+    event = decode(EventEncoder().encode("add_message", data))
+
+    assert event == {"event": "add_message", "data": data.model_dump(mode="json")}
+
+
+def test_encode_message():
+    message = Message(text="hello", sender="User", sender_name="User")
+    event = decode(EventEncoder().encode("add_message", {"message": message}))
+
+    assert event["data"]["message"]["text"] == "hello"
+
+
+def test_encode_dataframe_within_budget():
+    dataframe = DataFrame([{"value": "x" * 100, "index": i} for i in range(1000)])
+    encoder = EventEncoder(max_event_bytes=10_000)
+    event = decode(encoder.encode("end_vertex", {"df": dataframe}))
+
+    assert 20 <= len(event["data"]["df"]) < 1000
+    assert event["data"]["df"][0] == {"value": "x" * 100, "index": 0}
+
+
+def test_encode_dataframe_without_budget():
+    dataframe = DataFrame([{"index": i} for i in range(1000)])
+    event = decode(EventEncoder(max_event_bytes=None).encode("end_vertex", dataframe))
+
+    assert len(event["data"]) == 1000
+
+
+def test_encode_fragment_is_embedded_as_is():
+    fragment = orjson.Fragment(b'{"already": "encoded"}')
+    event = decode(EventEncoder().encode("end_vertex", {"build_data": fragment}))
+
+    assert event["data"]["build_data"] == {"already": "encoded"}
+
+
+def test_encode_falls_back_to_jsonable_encoder():
+    event = decode(EventEncoder().encode("info", {"tags": {"a"}}))
+
+    assert event["data"] == {"tags": ["a"]}
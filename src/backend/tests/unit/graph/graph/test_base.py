@@ -1,13 +1,38 @@
 import logging
+import uuid
 from collections import deque
 
 import pytest
 from langflow.components.inputs import ChatInput
+from langflow.components.inputs.text import TextInputComponent
 from langflow.components.langchain_utilities import ToolCallingAgentComponent
+from langflow.components.logic.conditional_router import ConditionalRouterComponent
 from langflow.components.outputs import ChatOutput, TextOutputComponent
 from langflow.components.tools import YfinanceToolComponent
+from langflow.custom import Component
 from langflow.graph import Graph
 from langflow.graph.graph.constants import Finish
+from langflow.graph.vertex.base import VertexStates
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.chat.service import RUN_STATE_KEY_SUFFIX, VERTEX_KEY_INFIX, ChatService
+
+
+class Join(Component):
+    display_name = "Join"
+    description = "Joins two strings"
+
+    inputs = [
+        MessageTextInput(name="first", display_name="First"),
+        MessageTextInput(name="second", display_name="Second"),
+    ]
+    outputs = [
+        Output(display_name="Message", name="joined", method="join"),
+    ]
+
+    def join(self) -> Message:
+        return Message(text=f"{self.first}{self.second}")
 
 
 async def test_graph_not_prepared():
@@ -136,3 +161,92 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+async def test_graph_run_state_checkpoint():
+    chat_input = ChatInput()
+    chat_output = ChatOutput()
+    graph = Graph()
+    input_id = graph.add_component(chat_input)
+    output_id = graph.add_component(chat_output)
+    graph.add_component_edge(input_id, (chat_input.outputs[0].name, chat_input.inputs[0].name), output_id)
+    graph.prepare()
+    graph.set_run_id("run-1")
+    await graph.astep()
+    run_state = graph.get_run_state()
+    assert run_state["run_queue"] == [output_id]
+    assert run_state["built_vertices"] == [input_id]
+
+    graph._run_queue = deque()
+    assert graph.apply_run_state(run_state)
+    assert graph._run_queue == deque([output_id])
+
+    graph.set_run_id("run-2")
+    assert not graph.apply_run_state(run_state)
+
+
+def build_branching_graph() -> Graph:
+    text_input = TextInputComponent(_id="text_input", input_value="no")
+    router = ConditionalRouterComponent(_id="router")
+    router.set(
+        input_text=text_input.text_response,
+        match_text="yes",
+        operator="equals",
+        message=text_input.text_response,
+    )
+    # Two inputs, so the inactive branch is not reset after the step building the router
+    join = Join(_id="join")
+    join.set(first=router.true_response, second=text_input.text_response)
+    false_output = TextOutputComponent(_id="false_output")
+    false_output.set(input_value=router.false_response)
+    graph = Graph()
+    graph.add_component(join)
+    graph.add_component(false_output)
+    graph.prepare()
+    graph.set_run_id("run-1")
+    return graph
+
+
+async def test_graph_run_state_checkpoint_keeps_inactive_branches():
+    graph = build_branching_graph()
+    while not graph.get_vertex("router").built:
+        await graph.astep()
+    assert graph.get_vertex("join").state == VertexStates.INACTIVE
+
+    run_state = graph.get_run_state()
+    checkpoints = {
+        vertex_id: Graph.get_vertex_checkpoint(graph.get_vertex(vertex_id)) for vertex_id in run_state["built_vertices"]
+    }
+
+    # Resume from the checkpoint on a copy of the graph structure, as with an external cache
+    restored = build_branching_graph()
+    assert restored.apply_run_state(run_state)
+    for vertex_id, checkpoint in checkpoints.items():
+        vertex = restored.get_vertex(vertex_id)
+        Graph.apply_vertex_checkpoint(vertex, checkpoint)
+        vertex.finalize_build()
+    assert restored.get_vertex("join").state == VertexStates.INACTIVE
+
+    while not isinstance(await graph.astep(), Finish):
+        pass
+    while not isinstance(await restored.astep(), Finish):
+        pass
+    built_vertices = {vertex.id for vertex in graph.vertices if vertex.built}
+    assert "false_output" in built_vertices
+    assert {vertex.id for vertex in restored.vertices if vertex.built} == built_vertices
+    assert restored.get_vertex("join").state == VertexStates.INACTIVE
+
+
+async def test_clear_cache_clears_graph_checkpoints():
+    chat_service = ChatService()
+    graph = build_branching_graph()
+    await graph.astep()
+    built_vertex_id = next(vertex.id for vertex in graph.vertices if vertex.built)
+    key = f"flow-{uuid.uuid4()}"
+    await chat_service.set_cache(key, graph)
+    await chat_service.set_graph_checkpoint(key, graph, vertex_ids=[built_vertex_id])
+
+    await chat_service.clear_cache(key)
+
+    for cache_key in (key, f"{key}{RUN_STATE_KEY_SUFFIX}", f"{key}{VERTEX_KEY_INFIX}{built_vertex_id}"):
+        assert isinstance(await chat_service.get_cache(cache_key), CacheMiss)
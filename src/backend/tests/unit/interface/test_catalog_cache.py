@@ -0,0 +1,68 @@
+import asyncio
+import os
+
+import pytest
+from langflow.interface import catalog_cache
+from langflow.interface.catalog_cache import CatalogCache, aload_or_build_catalog, get_catalog_fingerprint
+
+
+def test_fingerprint_changes_when_a_component_changes(tmp_path):
+    component = tmp_path / "inputs" / "my_input.py"
+    component.parent.mkdir()
+    component.write_text("class MyInput: ...")
+    fingerprint = get_catalog_fingerprint([str(tmp_path)])
+
+    assert get_catalog_fingerprint([str(tmp_path)]) == fingerprint
+
+    component.write_text("class MyInput:\n    display_name = 'Changed'")
+    os.utime(component, ns=(0, 0))
+    assert get_catalog_fingerprint([str(tmp_path)]) != fingerprint
+
+
+def test_fingerprint_changes_when_a_base_package_changes(tmp_path, monkeypatch):
+    package = tmp_path / "site" / "my_base"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "model.py").write_text("class MyBase: ...")
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+    monkeypatch.setattr(catalog_cache, "TEMPLATE_PACKAGES", ("my_base",))
+    components_path = tmp_path / "components"
+    components_path.mkdir()
+    fingerprint = get_catalog_fingerprint([str(components_path)])
+
+    (package / "model.py").write_text("class MyBase:\n    display_name = 'Changed'")
+    assert get_catalog_fingerprint([str(components_path)]) != fingerprint
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    components_path = tmp_path / "components"
+    (components_path / "inputs").mkdir(parents=True)
+    (components_path / "inputs" / "my_input.py").write_text("class MyInput: ...")
+    return components_path
+
+
+async def test_catalog_is_built_once_and_loaded_from_cache(tmp_path, components_path):
+    cache_dir = tmp_path / "cache"
+    builds = 0
+
+    async def build():
+        nonlocal builds
+        builds += 1
+        return {"inputs": {"MyInput": {"display_name": "My Input"}}}
+
+    first = await aload_or_build_catalog([str(components_path)], cache_dir, build)
+    second = await aload_or_build_catalog([str(components_path)], cache_dir, build)
+
+    assert builds == 1
+    assert first == second == {"inputs": {"MyInput": {"display_name": "My Input"}}}
+    assert len(await asyncio.to_thread(list, cache_dir.glob("catalog-*.json"))) == 1
+
+
+def test_saving_a_catalog_removes_stale_ones(tmp_path):
+    cache = CatalogCache(tmp_path)
+    cache.save("old", {"a": {}})
+    cache.save("new", {"b": {}})
+
+    assert cache.load("old") is None
+    assert cache.load("new") == {"b": {}}
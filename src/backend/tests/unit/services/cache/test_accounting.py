@@ -0,0 +1,83 @@
+import numpy as np
+from langflow.services.cache import accounting
+from langflow.services.cache.accounting import get_cache_namespace, get_size
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+FLOW_ID = "0b9b6e0e-4b8e-4c1a-9a5e-0d2f7a3c1b22"
+
+
+def test_get_cache_namespace():
+    assert get_cache_namespace(FLOW_ID) == "graphs"
+    assert get_cache_namespace(f"{FLOW_ID}:run_state") == "graphs"
+    assert get_cache_namespace(f"{FLOW_ID}:vertex:ChatInput-abc12") == "vertex_results"
+    assert get_cache_namespace("ChatInput-abc12") == "vertex_results"
+    assert get_cache_namespace("health_check") == "default"
+
+
+def test_get_size_counts_buffers():
+    array = np.zeros(100_000, dtype=np.float32)
+
+    assert get_size({"array": array}) >= array.nbytes
+    # Shared objects are only counted once
+    assert get_size([array, array]) < 2 * array.nbytes
+
+
+def test_threading_cache_evicts_by_namespace_quota():
+    array = np.zeros(1000, dtype=np.uint8)
+    cache = ThreadingInMemoryCache(namespace_quotas={"vertex_results": 2500})
+
+    cache.set(FLOW_ID, array.copy())
+    for name in ("A-aaaaa", "B-bbbbb", "C-ccccc"):
+        cache.set(name, array.copy())
+
+    assert cache.get("A-aaaaa") is CACHE_MISS
+    assert cache.get("C-ccccc") is not CACHE_MISS
+    # Other namespaces are not affected by the quota
+    assert cache.get(FLOW_ID) is not CACHE_MISS
+
+    stats = cache.get_stats()
+    assert stats["vertex_results"]["entries"] == 2
+    assert stats["vertex_results"]["evictions"] == 1
+    assert stats["vertex_results"]["hits"] == 1
+    assert stats["vertex_results"]["misses"] == 1
+    assert stats["graphs"]["entries"] == 1
+
+
+async def test_async_cache_evicts_by_max_bytes():
+    array = np.zeros(1000, dtype=np.uint8)
+    cache = AsyncInMemoryCache(max_bytes=2500)
+
+    await cache.set("a", array.copy())
+    await cache.set("b", array.copy())
+    await cache.set("c", array.copy())
+
+    assert await cache.get("a") is CACHE_MISS
+    assert await cache.get("c") is not CACHE_MISS
+    stats = cache.get_stats()["default"]
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 2500
+
+
+def test_cache_without_limits_does_not_measure_values():
+    cache = ThreadingInMemoryCache()
+
+    cache.set("a", np.zeros(1000, dtype=np.uint8))
+
+    assert cache.get_stats()["default"]["bytes"] == 0
+
+
+async def test_async_cache_remeasures_graphs_before_evicting(monkeypatch):
+    monkeypatch.setattr(accounting, "_REMEASURE_INTERVAL", 0)
+    # Graphs are cached by reference and grow while they run
+    graph = {"results": []}
+    cache = AsyncInMemoryCache(max_bytes=5000)
+    await cache.set(FLOW_ID, graph)
+    graph["results"].append(np.zeros(4000, dtype=np.uint8))
+
+    await cache.set("a", np.zeros(2000, dtype=np.uint8))
+
+    assert await cache.get(FLOW_ID) is CACHE_MISS
+    assert await cache.get("a") is not CACHE_MISS
+    assert cache.get_stats()["graphs"]["bytes"] == 0
@@ -0,0 +1,46 @@
+import dill
+import numpy as np
+import pytest
+from langflow.services.cache.serializers import CacheCodec, get_key_prefix
+
+
+@pytest.mark.parametrize("serializer", ["dill", "pickle"])
+def test_codec_roundtrip(serializer):
+    codec = CacheCodec(serializer=serializer)
+    value = {"array": np.arange(10_000, dtype=np.float32), "text": "hello"}
+
+    loaded = codec.loads("flow:run_state", codec.dumps("flow:run_state", value))
+
+    assert loaded["text"] == "hello"
+    np.testing.assert_array_equal(loaded["array"], value["array"])
+
+
+def test_codec_reads_values_written_with_another_serializer():
+    data = CacheCodec(serializer="pickle").dumps("key", [1, 2, 3])
+
+    assert CacheCodec(serializer="dill").loads("key", data) == [1, 2, 3]
+
+
+def test_codec_reads_values_written_without_header():
+    # Values cached by earlier versions are headerless dill streams
+    data = dill.dumps({"text": "hello"}, recurse=True)
+
+    assert CacheCodec(serializer="pickle").loads("key", data) == {"text": "hello"}
+
+
+async def test_codec_offloads_and_records_stats():
+    codec = CacheCodec(serializer="pickle", offload_threshold=1024)
+
+    data = await codec.adumps("ChatInput-abc12", "x" * 4096)
+    assert await codec.aloads("ChatInput-abc12", data) == "x" * 4096
+
+    stats = codec.stats()["ChatInput"]
+    assert stats["dumps"] == 1
+    assert stats["loads"] == 1
+    assert stats["bytes"] == 2 * len(data)
+
+
+def test_get_key_prefix():
+    assert get_key_prefix("ChatInput-abc12") == "ChatInput"
+    assert get_key_prefix("0b9b6e0e-4b8e-4c1a-9a5e-0d2f7a3c1b22") == "flow"
+    assert get_key_prefix("0b9b6e0e-4b8e-4c1a-9a5e-0d2f7a3c1b22:run_state") == "run_state"
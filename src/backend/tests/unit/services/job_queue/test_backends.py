@@ -0,0 +1,194 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langflow.services.job_queue.backends import (
+    JobQueueBackend,
+    JobStatus,
+    MemoryJobQueueBackend,
+    SQLiteJobQueueBackend,
+)
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+
+
+async def wait_until_finished(service: JobQueueService, job_id: str, timeout: float = 5) -> None:
+    for _ in range(int(timeout / 0.01)):
+        if (await service.get_submitted_job(job_id)).status.finished:
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail(f"Job {job_id} did not finish in {timeout}s")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+async def backend(request, tmp_path):
+    backend = MemoryJobQueueBackend() if request.param == "memory" else SQLiteJobQueueBackend(tmp_path / "jobs.db")
+    await backend.start()
+    yield backend
+    await backend.stop()
+
+
+async def test_claim_is_fair_across_users(backend: JobQueueBackend):
+    await backend.submit("a1", "handler", {}, user_id="a")
+    await backend.submit("a2", "handler", {}, user_id="a")
+    await backend.submit("b1", "handler", {"x": 1}, user_id="b")
+
+    claimed = [await backend.claim("worker") for _ in range(4)]
+
+    assert [job.job_id if job else None for job in claimed] == ["a1", "b1", "a2", None]
+    assert claimed[1].payload == {"x": 1}
+    assert claimed[1].status == JobStatus.RUNNING
+    assert claimed[1].worker_id == "worker"
+
+
+async def test_submit_rejects_duplicate_job_ids(backend: JobQueueBackend):
+    await backend.submit("job", "handler", {})
+    with pytest.raises(ValueError, match="already exists"):
+        await backend.submit("job", "handler", {})
+
+
+async def test_events_resume_after_the_acknowledged_offset(backend: JobQueueBackend):
+    await backend.submit("job", "handler", {})
+    await backend.publish("job", [("a", b"1"), ("b", b"2")])
+
+    events = await backend.read_events("job")
+    assert [(event_id, value) for _, event_id, value in events] == [("a", b"1"), ("b", b"2")]
+    await backend.ack("job", events[0][0])
+
+    await backend.publish("job", [(None, None)])
+    events = await backend.read_events("job")
+    assert [(event_id, value) for _, event_id, value in events] == [("b", b"2"), (None, None)]
+
+
+async def test_cancel(backend: JobQueueBackend):
+    await backend.submit("running", "handler", {})
+    await backend.claim("worker")
+    await backend.submit("pending", "handler", {})
+
+    assert await backend.request_cancel("running")
+    assert await backend.request_cancel("pending")
+    assert not await backend.request_cancel("missing")
+
+    assert await backend.get_cancel_requests(["running"]) == ["running"]
+    pending = await backend.get_job("pending")
+    assert pending.status == JobStatus.CANCELLED
+    assert [value for _, _, value in await backend.read_events("pending")] == [None]
+
+
+async def test_stale_jobs_are_failed_and_deleted(backend: JobQueueBackend):
+    await backend.submit("job", "handler", {})
+    await backend.claim("worker")
+
+    assert await backend.fail_stale_jobs(stale_after=-1) == ["job"]
+    assert (await backend.get_job("job")).status == JobStatus.FAILED
+    assert [value for _, _, value in await backend.read_events("job")] == [None]
+
+    assert await backend.delete_finished_jobs(older_than=-1) == 1
+    assert await backend.get_job("job") is None
+
+
+async def test_submit_joins_unfinished_jobs_with_the_same_dedup_key(backend: JobQueueBackend):
+    assert await backend.submit("first", "handler", {}, dedup_key="key") == "first"
+    assert await backend.submit("second", "handler", {}, dedup_key="key") == "first"
+    assert await backend.submit("other", "handler", {}, dedup_key="other") == "other"
+    assert await backend.get_job("second") is None
+
+    await backend.set_status("first", JobStatus.DONE)
+    assert await backend.submit("third", "handler", {}, dedup_key="key") == "third"
+
+
+async def test_results_are_kept_for_the_ttl_of_the_job(backend: JobQueueBackend):
+    await backend.submit("kept", "handler", {}, ttl=3600)
+    await backend.submit("expired", "handler", {}, ttl=-1)
+    for job_id in ("kept", "expired"):
+        await backend.set_result(job_id, b'{"ok": true}')
+        await backend.set_status(job_id, JobStatus.FAILED, error="boom")
+
+    assert (await backend.get_job("kept")).error == "boom"
+    assert await backend.get_result("kept") == b'{"ok": true}'
+
+    assert await backend.delete_finished_jobs(older_than=3600) == 1
+    assert await backend.get_job("expired") is None
+    assert await backend.get_result("expired") is None
+    assert await backend.get_result("kept") == b'{"ok": true}'
+
+
+async def test_service_runs_submitted_jobs():
+    service = JobQueueService(backend=MemoryJobQueueBackend(), poll_interval=0.01)
+
+    async def handler(payload, event_manager):
+        event_manager.on_token(data={"chunk": payload["text"]})
+
+    service.register_handler("echo", handler)
+    service.start()
+    try:
+        await service.submit_job("job", "echo", {"text": "hello"}, user_id="user")
+        events = [value async for _, value in service.iter_job_events("job")]
+        assert len(events) == 1
+        assert b"hello" in events[0]
+
+        with pytest.raises(JobQueueNotFoundError):
+            await service.read_job_events("missing")
+    finally:
+        await service.stop()
+
+
+async def test_service_stores_the_results_of_jobs():
+    service = JobQueueService(backend=MemoryJobQueueBackend(), poll_interval=0.01)
+
+    async def handler(payload, event_manager):  # noqa: ARG001
+        if payload.get("fail"):
+            msg = "boom"
+            raise ValueError(msg)
+        return {"text": payload["text"]}
+
+    service.register_handler("echo", handler)
+    service.start()
+    try:
+        await service.submit_job("job", "echo", {"text": "hello"})
+        await service.submit_job("failing", "echo", {"fail": True})
+        for job_id in ("job", "failing"):
+            await wait_until_finished(service, job_id)
+
+        assert (await service.get_submitted_job("job")).status == JobStatus.DONE
+        assert await service.get_job_result("job") == {"text": "hello"}
+        failing = await service.get_submitted_job("failing")
+        assert failing.status == JobStatus.FAILED
+        assert failing.error == "boom"
+    finally:
+        await service.stop()
+
+
+async def test_heartbeats_are_sent_while_the_event_loop_is_blocked(tmp_path):
+    service = JobQueueService(
+        backend=SQLiteJobQueueBackend(tmp_path / "jobs.db"), poll_interval=0.01, stale_job_timeout=0.3
+    )
+    other_worker = SQLiteJobQueueBackend(tmp_path / "jobs.db")
+    failed_by_other_worker: list[str] = []
+    stopped = threading.Event()
+
+    def fail_stale_jobs() -> None:
+        # Another worker, whose event loop is not blocked, looks for lost jobs
+        while not stopped.wait(0.05):
+            failed_by_other_worker.extend(asyncio.run(other_worker.fail_stale_jobs(0.3)))
+
+    async def handler(payload, event_manager):  # noqa: ARG001
+        # CPU-bound work blocks the event loop
+        deadline = time.monotonic() + 1
+        while time.monotonic() < deadline:
+            pass
+
+    service.register_handler("blocking", handler)
+    service.start()
+    thread = threading.Thread(target=fail_stale_jobs)
+    thread.start()
+    try:
+        await service.submit_job("job", "blocking", {})
+        await wait_until_finished(service, "job")
+    finally:
+        stopped.set()
+        await asyncio.to_thread(thread.join)
+        await service.stop()
+        await other_worker.stop()
+
+    assert failed_by_other_worker == []
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import time
+
+from langflow.services.job_queue.event_queue import EventQueue
+
+
+def make_event(event_type: str, data: dict) -> tuple[str, bytes, float]:
+    value = (json.dumps({"event": event_type, "data": data}) + "\n\n").encode("utf-8")
+    return f"{event_type}-{time.monotonic_ns()}", value, time.time()
+
+
+async def test_drop_oldest_keeps_the_latest_tokens():
+    queue = EventQueue(max_events=2, policy="drop_oldest")
+    for i in range(3):
+        queue.put_nowait(make_event("token", {"chunk": str(i), "id": "1"}))
+
+    assert queue.qsize() == 2
+    assert queue.stats()["dropped"] == 1
+    _, value, _ = queue.get_nowait()
+    assert json.loads(value)["data"]["chunk"] == "1"
+
+
+async def test_full_queue_keeps_events_other_than_tokens():
+    queue = EventQueue(max_events=2, policy="coalesce")
+    queue.put_nowait(make_event("token", {"chunk": "a", "id": "1"}))
+    queue.put_nowait(make_event("token", {"chunk": "b", "id": "2"}))
+    queue.put_nowait(make_event("end_vertex", {"index": 0}))
+    queue.put_nowait(make_event("end_vertex", {"index": 1}))
+    # No token is left to make room, so the new token is dropped
+    queue.put_nowait(make_event("token", {"chunk": "c", "id": "3"}))
+    # The queue is full of events that can't be dropped, so it grows past its limit
+    queue.put_nowait(make_event("end", {}))
+
+    events = [json.loads(queue.get_nowait()[1]) for _ in range(queue.qsize())]
+    assert [event["event"] for event in events] == ["end_vertex", "end_vertex", "end"]
+    assert [event["data"].get("index") for event in events[:2]] == [0, 1]
+    assert queue.stats()["dropped"] == 3
+
+
+async def test_end_of_stream_is_never_dropped():
+    queue = EventQueue(max_events=1, policy="drop_oldest")
+    queue.put_nowait(make_event("end_vertex", {}))
+    await queue.put((None, None, time.time()))
+    queue.put_nowait(make_event("end_vertex", {}))
+
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert any(value is None for _, value, _ in items)
+
+
+async def test_coalesce_merges_queued_tokens_of_the_same_message():
+    queue = EventQueue(policy="coalesce")
+    queue.put_nowait(make_event("token", {"chunk": "Hel", "id": "1"}))
+    queue.put_nowait(make_event("token", {"chunk": "lo", "id": "1"}))
+    queue.put_nowait(make_event("token", {"chunk": "Other", "id": "2"}))
+
+    assert queue.qsize() == 2
+    assert queue.stats()["coalesced"] == 1
+    _, value, _ = queue.get_nowait()
+    assert json.loads(value)["data"]["chunk"] == "Hello"
+
+
+async def test_bytes_are_accounted():
+    queue = EventQueue()
+    event = make_event("token", {"chunk": "a", "id": "1"})
+    queue.put_nowait(event)
+    assert queue.stats()["bytes"] == len(event[1])
+
+    await queue.get()
+    assert queue.stats()["bytes"] == 0
+    assert queue.stats()["peak_bytes"] == len(event[1])
+
+
+async def test_block_waits_for_the_consumer():
+    queue = EventQueue(max_events=1, policy="block", block_timeout=5)
+    queue.put_nowait(make_event("end_vertex", {"index": 0}))
+
+    producer = asyncio.create_task(asyncio.to_thread(queue.put_nowait, make_event("end_vertex", {"index": 1})))
+    await asyncio.sleep(0.1)
+    assert not producer.done()
+
+    await queue.get()
+    await asyncio.wait_for(producer, timeout=5)
+    _, value, _ = await asyncio.wait_for(queue.get(), timeout=5)
+    assert json.loads(value)["data"]["index"] == 1
+    assert queue.stats()["dropped"] == 0
@@ -240,3 +240,29 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_prefetch_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name1", "value1", session=session)
+    await service.create_variable(user_id, "name2", "value2", session=session)
+
+    await service.prefetch_variables(user_id, ["name1", "name2", "missing"], session=session)
+
+    with patch.object(session, "exec", side_effect=AssertionError("cached values should not be queried")):
+        assert await service.get_variable(user_id, "name1", "", session=session) == "value1"
+        assert await service.get_variable(user_id, "name2", "", session=session) == "value2"
+        with pytest.raises(TypeError):
+            await service.get_variable(user_id, "name1", "session_id", session=session)
+
+
+async def test_get_variable__cache_invalidated_on_update(service, session: AsyncSession):
+    user_id = uuid4()
+    name = "name"
+    field = ""
+
+    await service.create_variable(user_id, name, "value", session=session)
+    assert await service.get_variable(user_id, name, field, session=session) == "value"
+    await service.update_variable(user_id, name, "new_value", session=session)
+
+    assert await service.get_variable(user_id, name, field, session=session) == "new_value"
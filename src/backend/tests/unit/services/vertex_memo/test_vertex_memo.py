@@ -0,0 +1,29 @@
+import pandas as pd
+from langflow.schema import Data
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.vertex_memo.service import VertexMemoService
+from langflow.services.vertex_memo.utils import build_memo_key
+
+
+def test_build_memo_key_is_deterministic():
+    params = {"data": Data(data={"text": "hello"}), "separator": "\n", "df": pd.DataFrame({"a": [1, 2]})}
+    key = build_memo_key("code", params, ["output"])
+
+    assert key == build_memo_key("code", dict(reversed(params.items())), ["output"])
+    assert key != build_memo_key("other code", params, ["output"])
+    assert key != build_memo_key("code", {**params, "separator": ","}, ["output"])
+    assert key != build_memo_key("code", {**params, "df": pd.DataFrame({"a": [1, 3]})}, ["output"])
+
+
+def test_build_memo_key_unfingerprintable_params():
+    assert build_memo_key("code", {"client": object()}, ["output"]) is None
+
+
+def test_vertex_memo_service_disk_tier(tmp_path):
+    service = VertexMemoService(max_size=1, cache_dir=tmp_path, disk_size_limit=1024 * 1024)
+    service.set("a", {"results": {"output": 1}})
+    service.set("b", {"results": {"output": 2}})
+
+    # "a" was evicted from memory but is still on disk
+    assert service.get("a") == {"results": {"output": 1}}
+    assert service.get("missing") is CACHE_MISS
@@ -128,6 +128,24 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "ChatOutput" in json_response["outputs"]
 
 
+async def test_get_all_etag_and_category(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/all", headers=logged_in_headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    response = await client.get("api/v1/all", params={"category": "inputs"}, headers=logged_in_headers)
+    assert response.status_code == 200
+    assert list(response.json()) == ["inputs"]
+    assert "ChatInput" in response.json()["inputs"]
+
+    response = await client.get("api/v1/all", params={"category": "not_a_category"}, headers=logged_in_headers)
+    assert response.status_code == 404
+
+
 @pytest.mark.usefixtures("active_user")
 async def test_post_validate_code(client: AsyncClient, logged_in_headers):
     # Test case with a valid import and function
@@ -510,6 +528,45 @@ async def test_successful_run_with_input_type_any(client, simple_api_test, creat
     )
 
 
+async def test_run_with_output_stream(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {"output_type": "debug"}
+    async with client.stream(
+        "POST", f"/api/v1/run/{flow_id}?output_stream=ndjson", headers=headers, json=payload
+    ) as response:
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) async for line in response.aiter_lines() if line]
+
+    assert [event["event"] for event in events] == ["output"] * 3 + ["end"], events
+    output_ids = [event["data"]["id"] for event in events[:-1]]
+    assert all(event["data"]["result"]["component_id"] == event["data"]["id"] for event in events[:-1])
+    assert events[-1]["data"]["outputs"] == output_ids
+    assert events[-1]["data"]["session_id"]
+
+
+async def test_run_with_output_stream_rejects_unknown_outputs(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    response = await client.post(
+        f"/api/v1/run/{flow_id}?output_stream=ndjson", headers=headers, json={"output_ids": ["Missing"]}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+
+async def test_run_with_output_ids(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json={"output_ids": ["Chat Output"]})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    outputs = response.json()["outputs"][0]["outputs"]
+    assert [output["component_display_name"] for output in outputs] == ["Chat Output"]
+
+    response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json={"output_ids": ["Missing"]})
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+
 async def test_invalid_flow_id(client, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     flow_id = "invalid-flow-id"
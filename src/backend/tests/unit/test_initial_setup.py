@@ -9,13 +9,17 @@ import pytest
 from anyio import Path
 from httpx import AsyncClient
 from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
+from langflow.initial_setup import setup
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.initial_setup.setup import (
+    create_or_update_starter_projects,
     detect_github_url,
     get_project_data,
+    get_starter_projects_lock,
     load_bundles_from_urls,
     load_starter_projects,
     update_projects_components_with_latest_component_versions,
+    update_starter_projects_in_background,
 )
 from langflow.interface.components import aget_all_types_dict
 from langflow.services.database.models import Flow
@@ -76,6 +80,41 @@ async def test_create_or_update_starter_projects():
         assert num_db_projects == num_projects
 
 
+@pytest.mark.usefixtures("client")
+async def test_create_or_update_starter_projects_keeps_unchanged_flows():
+    async def get_starter_flows():
+        async with session_scope() as session:
+            stmt = select(Folder).options(selectinload(Folder.flows)).where(Folder.name == STARTER_FOLDER_NAME)
+            folder = (await session.exec(stmt)).first()
+            return {flow.name: (flow.id, flow.updated_at) for flow in folder.flows}
+
+    before = await get_starter_flows()
+    await create_or_update_starter_projects(await aget_all_types_dict(get_settings_service().settings.components_path))
+
+    assert await get_starter_flows() == before
+
+
+async def test_starter_projects_are_updated_in_the_background_by_one_worker(monkeypatch):
+    updates = 0
+
+    async def create_or_update_starter_projects(all_types_dict):  # noqa: ARG001
+        nonlocal updates
+        updates += 1
+
+    monkeypatch.setattr(setup, "_create_or_update_starter_projects", create_or_update_starter_projects)
+    # Another worker is updating the starter projects
+    lock = await asyncio.to_thread(get_starter_projects_lock)
+    await asyncio.to_thread(lock.acquire)
+    try:
+        await update_starter_projects_in_background({})
+    finally:
+        await asyncio.to_thread(lock.release)
+    assert updates == 0
+
+    await update_starter_projects_in_background({})
+    assert updates == 1
+
+
 # Some starter projects require integration
 # async def test_starter_projects_can_run_successfully(client):
 #     with session_scope() as session:
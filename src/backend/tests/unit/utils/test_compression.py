@@ -0,0 +1,30 @@
+import gzip
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langflow.utils import compression
+from langflow.utils.compression import PrecompressedJSON
+
+
+def test_precompressed_json_builds_each_variant_once(monkeypatch):
+    calls = []
+
+    def slow_compress(data: bytes) -> bytes:
+        calls.append(data)
+        time.sleep(0.05)
+        return data[::-1]
+
+    monkeypatch.setattr(
+        compression,
+        "get_available_encodings",
+        lambda: {"slow": slow_compress, "gzip": compression._gzip_compress},
+    )
+    payload = PrecompressedJSON({"components": ["a", "b"]})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        variants = list(executor.map(lambda _: payload.get_variant("slow"), range(8)))
+
+    assert len(calls) == 1
+    assert all(variant == payload.body[::-1] for variant in variants)
+    assert json.loads(gzip.decompress(payload.get_variant("gzip"))) == {"components": ["a", "b"]}
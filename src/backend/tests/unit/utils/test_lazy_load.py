@@ -0,0 +1,45 @@
+import importlib
+import sys
+
+import pytest
+
+LAZY_PACKAGE_INIT = """
+from typing import Any
+
+from langflow.utils.lazy_load import import_lazy_attribute
+
+_dynamic_imports = {"Heavy": "heavy"}
+
+__all__ = ["Heavy"]
+
+
+def __getattr__(attr_name: str) -> Any:
+    return import_lazy_attribute(__name__, attr_name, _dynamic_imports)
+"""
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    package_dir = tmp_path / "lazy_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(LAZY_PACKAGE_INIT)
+    (package_dir / "heavy.py").write_text("class Heavy: ...\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("lazy_package")
+    for name in ("lazy_package", "lazy_package.heavy"):
+        sys.modules.pop(name, None)
+
+
+def test_attributes_are_imported_on_first_access(lazy_package):
+    assert "lazy_package.heavy" not in sys.modules
+
+    heavy_class = lazy_package.Heavy
+
+    assert heavy_class.__module__ == "lazy_package.heavy"
+    # Set on the package, so later accesses don't go through __getattr__
+    assert vars(lazy_package)["Heavy"] is heavy_class
+
+
+def test_unknown_attributes_raise_attribute_error(lazy_package):
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        _ = lazy_package.Missing